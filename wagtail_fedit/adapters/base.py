@@ -17,7 +17,6 @@ from django.http import (
 )
 from wagtail import hooks
 from ..settings import (
-    SIGN_SHARED_CONTEXT,
     SHARE_WITH_SESSIONS,
     USE_ADAPTER_SESSION_ID,
     TRACK_LOCALES,
@@ -29,13 +28,18 @@ from ..utils import (
 from ..hooks import (
     REGISTER_ADAPTER_URLS,
 )
+from . import codecs
+from .codecs import (
+    Base85_json_dumps,
+    Base85_json_loads,
+)
 
 if TYPE_CHECKING:
     from ..toolbar import (
         FeditToolbarComponent,
     )
 
-import json, base64, uuid
+import uuid
 
 
 class AdapterError(Exception):
@@ -45,12 +49,6 @@ class AdapterError(Exception):
 def content_id_from_parts(*parts: Any) -> str:
     return "-".join(map(slugify, map(str, parts)))
 
-def Base85_json_dumps(obj):
-    return base64.b85encode(json.dumps(obj).encode("utf-8")).decode("utf-8")
-
-def Base85_json_loads(data):
-    return json.loads(base64.b85decode(data).decode("utf-8"))
-
 def _get_keywords(bases, attrs):
     if "keywords" in attrs:
         return list(attrs["keywords"])
@@ -216,12 +214,9 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
     def __init__(self, object: models.Model, field_name: str, request: HttpRequest, **kwargs):
         self.object           = object
         self.request          = request
-        self.kwargs           = self._defaults.copy() | kwargs
+        self.kwargs           = self.resolve_kwargs(request, kwargs)
 
         if hasattr(request, "LANGUAGE_CODE") and TRACK_LOCALES:
-            if "LANGUAGE_CODE" not in self.kwargs:
-                self.kwargs["LANGUAGE_CODE"] = request.LANGUAGE_CODE
-
             if self.kwargs["LANGUAGE_CODE"] != request.LANGUAGE_CODE:
                 translation.activate(self.kwargs["LANGUAGE_CODE"])
 
@@ -232,6 +227,20 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
             self.field_name     = None
             self.meta_field     = None
 
+    @classmethod
+    def resolve_kwargs(cls, request: HttpRequest, kwargs: dict) -> dict:
+        """
+        Return the keyword arguments of the adapter for the request;
+        the defaults and the language of the request are filled in.
+        """
+        kwargs = cls._defaults.copy() | kwargs
+
+        if hasattr(request, "LANGUAGE_CODE") and TRACK_LOCALES:
+            if "LANGUAGE_CODE" not in kwargs:
+                kwargs["LANGUAGE_CODE"] = request.LANGUAGE_CODE
+
+        return kwargs
+
     @classmethod
     def on_register(cls, registry):
         """
@@ -346,6 +355,14 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
             }
         }
     
+    @classmethod
+    def prefetch_response_data(cls, request: HttpRequest, adapters: list["BaseAdapter"]):
+        """
+        Called before `get_response_data` when many adapters of this class
+        are refetched at once; load data the adapters share in bulk.
+        """
+        pass
+
     def get_admin_url(self) -> str:
         """
         Return the admin URL for the object.
@@ -415,6 +432,23 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
         """
         raise AdapterError("Cannot render {} from kwargs".format(cls.__name__))
 
+    @classmethod
+    def render_read_only(cls, request: HttpRequest, object: models.Model, field_name: str, context: dict, **kwargs) -> str | None:
+        """
+        Render the content for a user who cannot edit it, without constructing the adapter.
+        This should NOT include the wagtail-fedit wrapper.
+        Return None if an adapter instance is required; `render_content` is then used instead.
+        """
+        return None
+
+    @classmethod
+    def _renders_content_with(cls, base: Type["BaseAdapter"]) -> bool:
+        """
+        Check if `render_content` was not overridden since `base`;
+        if it was, `render_read_only` of `base` no longer applies.
+        """
+        return cls.render_content is base.render_content
+
     def render_content(self, parent_context: dict = None) -> str:
         """
         Render the content for the field.
@@ -447,16 +481,7 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
             self.request.session.modified = True
             return id
         
-        if SIGN_SHARED_CONTEXT:
-            return self.signer.sign_object(
-                self.kwargs,
-                compress=True,
-                # serializer=SharedContextSerializer(
-                #     self,
-                # ),
-            )
-        
-        return Base85_json_dumps(self.kwargs)
+        return codecs.encode(type(self), self.kwargs)
 
 
     @classmethod
@@ -469,14 +494,7 @@ class BaseAdapter(FeditIFrameMixin, metaclass=AdapterMeta):
                 return {}
             return request.session.get(context, {})
         
-        if SIGN_SHARED_CONTEXT:
-            return cls.signer.unsign_object(context)# , serializer=PickleBlockSerializer)
-        
-        try:
-            return Base85_json_loads(context)
-        except json.JSONDecodeError:
-            pass
-        return {}
+        return codecs.decode(cls, context)
     
         
 class URLMixin:
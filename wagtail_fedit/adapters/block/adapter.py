@@ -30,6 +30,10 @@ from ...forms import (
     blocks as block_forms,
 )
 from ... import utils
+from ...utils import (
+    accepts_context_view,
+    as_context_view,
+)
 from wagtail.admin.admin_url_finder import (
     AdminURLFinder,
 )
@@ -226,6 +230,7 @@ class BlockAdapter(URLMixin, BlockFieldReplacementAdapter):
             )
 
     @classmethod
+    @accepts_context_view
     def render_from_kwargs(cls, context, **kwargs):
         if "block" not in kwargs:
             raise AdapterError("Block is required")
@@ -234,14 +239,33 @@ class BlockAdapter(URLMixin, BlockFieldReplacementAdapter):
         if not hasattr(block, "render"):
             raise AdapterError("Invalid block type, missing render method")
         
-        return block.render(context)
+        return block.render(as_context_view(context))
 
-    def render_content(self, parent_context: dict = None) -> str:
-        parent_context = parent_context or {}
-        if hasattr(parent_context, "flatten"):
-            parent_context = parent_context.flatten()
+    @classmethod
+    @accepts_context_view
+    def render_read_only(cls, request, object, field_name, context, **kwargs):
+        if not cls._renders_content_with(BlockAdapter):
+            return None
+
+        block = kwargs.get("block")
+        if not block:
+            block_id = kwargs.get("block_id")
+            if block_id is None:
+                raise AdapterError("Block ID is required")
 
-        return self.block.render(parent_context)
+            block, _, _, block_index = utils.find_block(
+                block_id,
+                getattr(object, field_name),
+            )
+            if block_index == -1:
+                raise AdapterError("Block not found; did you provide the correct block ID?")
+
+        # Blocks copy the context they are rendered with.
+        return block.render(as_context_view(context))
+
+    @accepts_context_view
+    def render_content(self, parent_context: dict = None) -> str:
+        return self.block.render(as_context_view(parent_context or {}))
     
 class DomPositionedBlockAdapter(DomPositionedMixin, BlockAdapter):
     identifier = "dom-block"
@@ -30,8 +30,11 @@ from wagtail.models import (
     RevisionMixin,
 )
 from ...utils import (
+    find_block,
     insert_many,
     save_revision,
+    invalidate_block_index,
+    reindex_blocks,
 )
 from ...views import (
     BaseAdapterView,
@@ -42,44 +45,115 @@ if TYPE_CHECKING:
         BlockAdapter,
     )
 
+import json
+
+
+MOVE_ACTIONS = ("up", "down")
+
+
+def move_block(parent: StreamValue | ListValue, idx: int, action: str) -> bool:
+    """
+    Swap the block at `idx` with its previous ("up") or next ("down") sibling.
+    Returns False if the block cannot be moved in that direction.
+    """
+    other = idx - 1 if action == "up" else idx + 1
+    if idx < 0 or idx >= len(parent) or other < 0 or other >= len(parent):
+        return False
+
+    if isinstance(parent, StreamValue):
+        parent._raw_data[idx], parent._raw_data[other] = parent._raw_data[other], parent._raw_data[idx]
+        parent[idx], parent[other] = parent[other], parent[idx]
+    elif isinstance(parent, ListValue):
+        parent.bound_blocks[idx], parent.bound_blocks[other] = parent.bound_blocks[other], parent.bound_blocks[idx]
+    else:
+        return False
+
+    return True
+
 
 class BlockMoveAdapterView(BaseAdapterView):
+    """
+    Move blocks up or down inside their parent.
+
+    A single move is given with the `action` query parameter.
+    A batch of moves can be posted as JSON:
+
+        {"moves": [{"action": "up"}, {"action": "down"}]}
+
+    Moves apply to the adapter's block; a `block_id` other than the
+    adapter's own is rejected. All moves are applied in order and
+    saved as a single revision; if any move fails, or the moves cancel
+    out, nothing is saved.
+    """
     adapter: "BlockAdapter"
-    
+
+    def get_moves(self) -> list[dict] | None:
+        moves = None
+        if self.request.body:
+            try:
+                data = json.loads(self.request.body)
+            except ValueError:
+                data = None
+
+            if isinstance(data, dict) and "moves" in data:
+                moves = data["moves"]
+
+        if moves is None:
+            moves = [{"action": self.request.GET.get("action")}]
+
+        if not isinstance(moves, list) or not moves:
+            return None
+
+        for move in moves:
+            if not isinstance(move, dict)\
+                    or not isinstance(move.get("action"), str)\
+                    or move["action"].lower() not in MOVE_ACTIONS:
+                return None
+            move["action"] = move["action"].lower()
+
+        return moves
+
     def post(self, request, *args, **kwargs):
 
         if not self.adapter.kwargs["movable"]:
             return JsonResponse({
                 "error": "Block is not movable"
             })
-        
-        action = self.request.GET.get("action")
-        idx = self.adapter.block_index
-        parent = self.adapter.parent
-        if action.lower() == "up":
-            if idx > 0 and idx < len(parent):
-                if isinstance(parent, StreamValue):
-                    parent._raw_data[idx], parent._raw_data[idx - 1] = parent._raw_data[idx - 1], parent._raw_data[idx]
-                    parent[idx], parent[idx - 1] = parent[idx - 1], parent[idx]
-                elif isinstance(parent, ListValue):
-                    parent.bound_blocks[idx], parent.bound_blocks[idx - 1] = parent.bound_blocks[idx - 1], parent.bound_blocks[idx]
-            else:
-                return JsonResponse({"error": "Cannot move block up"})
-
-        elif action.lower() == "down":
-            if idx < len(parent) - 1 and idx >= 0:
-                if isinstance(parent, StreamValue):
-                    parent._raw_data[idx], parent._raw_data[idx + 1] = parent._raw_data[idx + 1], parent._raw_data[idx]
-                    parent[idx], parent[idx + 1] = parent[idx + 1], parent[idx]
-                elif isinstance(parent, ListValue):
-                    parent.bound_blocks[idx], parent.bound_blocks[idx + 1] = parent.bound_blocks[idx + 1], parent.bound_blocks[idx]
-                # if isinstance(parent, StreamValue):
-                    # parent._raw_data[idx], parent._raw_data[idx + 1] = parent._raw_data[idx + 1], parent._raw_data[idx]
-            else:
-                return JsonResponse({"error": "Cannot move block down"})
-        else:
+
+        moves = self.get_moves()
+        if moves is None:
             return JsonResponse({"error": "Invalid action"})
-        
+
+        block_id = self.adapter.kwargs["block_id"]
+
+        # Permissions and `movable` only apply to the adapter's own block.
+        if any(move.get("block_id") not in (None, block_id) for move in moves):
+            return JsonResponse({"error": "Only this block can be moved"})
+
+        field_value = self.adapter.field_value
+        block, _, parent, idx = find_block(block_id, field_value)
+        if block is None:
+            return JsonResponse({"error": "Block not found"})
+
+        steps = 0
+        for move in moves:
+            if not move_block(parent, idx, move["action"]):
+                return JsonResponse({"error": f"Cannot move block {move['action']}"})
+
+            other = idx - 1 if move["action"] == "up" else idx + 1
+            reindex_blocks(field_value, parent, idx, other)
+            if parent is not field_value:
+                reindex_blocks(parent, parent, idx, other)
+
+            idx = other
+            steps += -1 if move["action"] == "up" else 1
+
+        # The moves cancel out; the content did not change.
+        if not steps:
+            return JsonResponse({
+                "success": True,
+            })
+
         self.adapter.object = save_revision(
             self.adapter.object,
             self.request.user,
@@ -95,9 +169,10 @@ class BlockMoveAdapterView(BaseAdapterView):
                     "model_name": self.adapter.object._meta.model_name,
                     "app_label": self.adapter.object._meta.app_label,
                     "field_name": self.adapter.meta_field.verbose_name,
-                    "block_label": self.adapter.block.block.label,
-                    "block_id": self.adapter.kwargs["block_id"],
-                    "direction": action,
+                    "block_label": block.block.label,
+                    "block_id": block_id,
+                    "direction": "up" if steps < 0 else "down",
+                    "steps": abs(steps),
                 },
                 content_changed=True,
             )
@@ -171,6 +246,7 @@ class BlockAddAdapterView(BaseAdapterView):
             self.adapter.block_index,
             value,
         )
+        invalidate_block_index(self.adapter.field_value)
 
         self.adapter.object = save_revision(
             self.adapter.object,
@@ -0,0 +1,425 @@
+from typing import (
+    TYPE_CHECKING, Any, Type,
+)
+from django.core.signing import (
+    BadSignature,
+    b64_encode,
+    b64_decode,
+)
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.crypto import salted_hmac
+from django.utils.module_loading import import_string
+from ..utils import (
+    LRUCache,
+)
+from ..errors import (
+    SharedContextExpired,
+)
+from ..settings import (
+    SIGN_SHARED_CONTEXT,
+    SHARED_CONTEXT_CODEC,
+    SHARED_CONTEXT_CACHE_SIZE,
+    SHARED_CONTEXT_STORE,
+    SHARED_CONTEXT_STORE_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from .base import BaseAdapter
+
+import json, base64, logging, re, struct, zlib
+
+logger = logging.getLogger(__name__)
+
+
+def Base85_json_dumps(obj):
+    return base64.b85encode(json.dumps(obj).encode("utf-8")).decode("utf-8")
+
+def Base85_json_loads(data):
+    return json.loads(base64.b85decode(data).decode("utf-8"))
+
+
+class SharedContextCodec:
+    """
+    Turns the keyword arguments of an adapter into a string and back.
+    The adapter class is passed along so codecs can make use of its keywords.
+    """
+    # Whether encoded strings may be re-used for equal keyword arguments.
+    cacheable = True
+
+    def dumps(self, adapter_class: Type["BaseAdapter"], kwargs: dict) -> str:
+        raise NotImplementedError
+
+    def loads(self, adapter_class: Type["BaseAdapter"], data: str) -> dict:
+        raise NotImplementedError
+
+
+class SignedJSONCodec(SharedContextCodec):
+    """
+    JSON, compressed with zlib and signed with the adapter's `signer`.
+    """
+    def dumps(self, adapter_class, kwargs):
+        return adapter_class.signer.sign_object(
+            kwargs,
+            compress=True,
+        )
+
+    def loads(self, adapter_class, data):
+        return adapter_class.signer.unsign_object(data)
+
+
+class Base85JSONCodec(SharedContextCodec):
+    """
+    Unsigned JSON, encoded with Base85.
+    """
+    def dumps(self, adapter_class, kwargs):
+        return Base85_json_dumps(kwargs)
+
+    def loads(self, adapter_class, data):
+        try:
+            return Base85_json_loads(data)
+        except json.JSONDecodeError:
+            pass
+        return {}
+
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT, _KEYWORD = range(9)
+
+_VERSION = 0x10
+_FLAG_ZLIB = 0x01
+
+# zlib never wins on payloads this small
+_COMPRESS_MIN_SIZE = 64
+
+
+def _write_uint(out: bytearray, n: int):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_uint(data: bytes, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return n, pos
+        shift += 7
+
+
+def _write_value(out: bytearray, value: Any):
+    if value is None:
+        out.append(_NONE)
+    elif value is False:
+        out.append(_FALSE)
+    elif value is True:
+        out.append(_TRUE)
+    elif type(value) is int:
+        out.append(_INT)
+        # Zigzag; small negative numbers stay small.
+        _write_uint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif type(value) is float:
+        out.append(_FLOAT)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        out.append(_STR)
+        _write_uint(out, len(encoded))
+        out += encoded
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_uint(out, len(value))
+        for item in value:
+            _write_value(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_uint(out, len(value))
+        for k, v in value.items():
+            if not isinstance(k, str):
+                raise TypeError(f"Keys must be str, not {type(k).__name__}")
+            _write_value(out, k)
+            _write_value(out, v)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _read_value(data: bytes, pos: int, keywords: tuple[str]) -> tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _INT:
+        n, pos = _read_uint(data, pos)
+        return (n >> 1) if not n & 1 else -((n + 1) >> 1), pos
+    if tag == _FLOAT:
+        return struct.unpack_from(">d", data, pos)[0], pos + 8
+    if tag == _STR:
+        length, pos = _read_uint(data, pos)
+        if pos + length > len(data):
+            raise ValueError("Truncated string")
+        return data[pos:pos + length].decode("utf-8"), pos + length
+    if tag == _LIST:
+        length, pos = _read_uint(data, pos)
+        items = []
+        for _ in range(length):
+            item, pos = _read_value(data, pos, keywords)
+            items.append(item)
+        return items, pos
+    if tag == _DICT:
+        length, pos = _read_uint(data, pos)
+        d = {}
+        for _ in range(length):
+            k, pos = _read_value(data, pos, keywords)
+            d[k], pos = _read_value(data, pos, keywords)
+        return d, pos
+    if tag == _KEYWORD:
+        idx, pos = _read_uint(data, pos)
+        return keywords[idx], pos
+    raise ValueError(f"Unknown tag {tag}")
+
+
+class CompactCodec(SharedContextCodec):
+    """
+    A compact binary format.
+    Keys which are keywords of the adapter are written as their index,
+    keyword arguments equal to the keyword's default are left out
+    (the adapter fills them back in) and the payload is only compressed
+    if that makes it smaller. Signed with the adapter's `signer` if `sign` is true.
+    """
+    def __init__(self, sign: bool = True):
+        self.sign = sign
+
+    @staticmethod
+    def _keyword_names(adapter_class) -> tuple[str]:
+        return tuple(keyword.name for keyword in adapter_class.keywords)
+
+    def dumps(self, adapter_class, kwargs):
+        keywords = self._keyword_names(adapter_class)
+        defaults = adapter_class._defaults
+        missing = object()
+
+        items = [
+            (k, v) for k, v in kwargs.items()
+            if defaults.get(k, missing) != v or type(defaults[k]) is not type(v)
+        ]
+
+        out = bytearray()
+        _write_uint(out, len(items))
+        for k, v in items:
+            if k in keywords:
+                out.append(_KEYWORD)
+                _write_uint(out, keywords.index(k))
+            else:
+                _write_value(out, k)
+            _write_value(out, v)
+
+        flags = 0
+        body = bytes(out)
+        if len(body) > _COMPRESS_MIN_SIZE:
+            compressed = zlib.compress(body)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= _FLAG_ZLIB
+
+        data = b64_encode(bytes([_VERSION | flags]) + body).decode("ascii")
+        if self.sign:
+            return adapter_class.signer.sign(data)
+        return data
+
+    def loads(self, adapter_class, data):
+        if self.sign:
+            data = adapter_class.signer.unsign(data)
+
+        # Unsigned data can be anything; malformed data is treated like a bad signature.
+        try:
+            return self._read(adapter_class, data)
+        except (IndexError, KeyError, TypeError, ValueError, RecursionError, struct.error, zlib.error) as e:
+            raise BadSignature("Malformed shared context") from e
+
+    def _read(self, adapter_class, data: str) -> dict:
+        raw = b64_decode(data.encode("ascii"))
+        header, body = raw[0], raw[1:]
+        if header & 0xF0 != _VERSION:
+            raise ValueError("Unsupported shared context version")
+
+        if header & _FLAG_ZLIB:
+            body = zlib.decompress(body)
+
+        keywords = self._keyword_names(adapter_class)
+        length, pos = _read_uint(body, 0)
+        kwargs = {}
+        for _ in range(length):
+            k, pos = _read_value(body, pos, keywords)
+            kwargs[k], pos = _read_value(body, pos, keywords)
+
+        if pos != len(body):
+            raise ValueError("Trailing data")
+        return kwargs
+
+
+class CacheStoreCodec(SharedContextCodec):
+    """
+    Stores the keyword arguments in a Django cache; only a short key is passed along.
+    The key is a keyed hash of the adapter and its keyword arguments,
+    so equal keyword arguments share one entry. The entry is written every time
+    it is encoded; the timeout counts from the last time the adapter was rendered.
+    The cache must be shared by all processes which serve the editor.
+    """
+    cacheable = False
+    key_prefix = "wagtail_fedit:shared_context:"
+    key_length = 32
+
+    def __init__(self, alias: str = "default", timeout: int = 60 * 60 * 24):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, adapter_class, payload: str) -> str:
+        return salted_hmac(
+            self.key_prefix,
+            f"{adapter_class.identifier}:{payload}",
+            algorithm="sha256",
+        ).hexdigest()[:self.key_length]
+
+    def dumps(self, adapter_class, kwargs):
+        payload = json.dumps(kwargs, sort_keys=True, separators=(",", ":"))
+        key = self.make_key(adapter_class, payload)
+        # Always written; the entry may have been evicted or never been
+        # written to the cache this process shares with the others.
+        self.cache.set(f"{self.key_prefix}{key}", payload, self.timeout)
+        return key
+
+    def loads(self, adapter_class, data):
+        if not _STORE_KEY_RE.fullmatch(data or ""):
+            raise BadSignature("Malformed shared context key")
+
+        payload = self.cache.get(f"{self.key_prefix}{data}")
+        if payload is None:
+            raise SharedContextExpired(data)
+
+        return json.loads(payload)
+
+
+_STORE_KEY_RE = re.compile(r"[0-9a-f]{%d}" % CacheStoreCodec.key_length)
+
+
+CODECS = {
+    "signed": lambda: SignedJSONCodec(),
+    "base85": lambda: Base85JSONCodec(),
+    "compact": lambda: CompactCodec(sign=SIGN_SHARED_CONTEXT),
+    "store": lambda: _store_codec(),
+}
+
+
+def _store_codec() -> CacheStoreCodec:
+    codec = CacheStoreCodec(
+        alias=SHARED_CONTEXT_STORE,
+        timeout=SHARED_CONTEXT_STORE_TIMEOUT,
+    )
+    if isinstance(codec.cache, LocMemCache):
+        logger.warning(
+            "The shared context store uses the per-process cache %r; "
+            "editors served by other processes will not find their shared context. "
+            "Set WAGTAIL_FEDIT_SHARED_CONTEXT_STORE to a cache shared by all processes.",
+            SHARED_CONTEXT_STORE,
+        )
+    return codec
+
+
+_codec = None
+
+
+def get_codec() -> SharedContextCodec:
+    """
+    Return the codec configured with `WAGTAIL_FEDIT_SHARED_CONTEXT_CODEC`.
+    """
+    global _codec
+    if _codec is not None:
+        return _codec
+
+    name = SHARED_CONTEXT_CODEC
+    if name is None:
+        name = "signed" if SIGN_SHARED_CONTEXT else "base85"
+
+    if name in CODECS:
+        _codec = CODECS[name]()
+    else:
+        _codec = import_string(name)()
+
+    return _codec
+
+
+def _cache_key(value):
+    """
+    Hashable representation of plain data, including types;
+    `True`, `1` and `1.0` encode differently.
+    Returns `None` for anything which should not be cached.
+    """
+    if value is None or type(value) in (bool, int, float, str):
+        return (type(value), value)
+
+    if type(value) is dict:
+        items = []
+        for k, v in value.items():
+            v = _cache_key(v)
+            if v is None or type(k) is not str:
+                return None
+            items.append((k, v))
+        return (dict, tuple(items))
+
+    if type(value) in (list, tuple):
+        items = []
+        for v in value:
+            v = _cache_key(v)
+            if v is None:
+                return None
+            items.append(v)
+        return (list, tuple(items))
+
+    return None
+
+
+# Encoding (and signing) is deterministic; equal keyword arguments
+# for the same adapter class always encode to the same string.
+_encoding_cache = LRUCache(SHARED_CONTEXT_CACHE_SIZE)
+
+
+def encode(adapter_class: Type["BaseAdapter"], kwargs: dict) -> str:
+    codec = get_codec()
+
+    key = None
+    if SHARED_CONTEXT_CACHE_SIZE and codec.cacheable:
+        key = _cache_key(kwargs)
+
+    if key is not None:
+        key = (adapter_class, key)
+        encoded = _encoding_cache.get(key)
+        if encoded is not None:
+            return encoded
+
+    encoded = codec.dumps(adapter_class, kwargs)
+
+    if key is not None:
+        _encoding_cache.set(key, encoded)
+
+    return encoded
+
+
+def decode(adapter_class: Type["BaseAdapter"], data: str) -> dict:
+    return get_codec().loads(adapter_class, data)
+
+
+def clear_caches():
+    global _codec
+    _codec = None
+    _encoding_cache.clear()
@@ -23,6 +23,7 @@ from ..utils import (
     model_diff,
     get_model_string,
     get_field_content,
+    accepts_context_view,
     is_draft_capable,
     FeditIFrameMixin,
 )
@@ -215,6 +216,25 @@ class FieldAdapter(BlockFieldReplacementAdapter):
                 **extra_log_kwargs,
             )
 
+    @classmethod
+    @accepts_context_view
+    def render_read_only(cls, request, object, field_name, context, **kwargs):
+        if not cls._renders_content_with(FieldAdapter):
+            return None
+
+        meta_field = object._meta.get_field(field_name)
+        if meta_field.is_relation and use_related_form(meta_field):
+            # The related object is the adapter's instance in the context.
+            return None
+
+        return get_field_content(
+            request,
+            object,
+            meta_field,
+            context,
+        )
+
+    @accepts_context_view
     def render_content(self, parent_context=None):
         return get_field_content(
             self.request,
@@ -7,12 +7,27 @@ from .field import (
 from .funcs import (
     BaseFieldFuncAdapter,
 )
+from ..utils import (
+    accepts_context_view,
+)
+from ..settings import (
+    WARM_RENDITIONS_ON_SAVE,
+)
+from ..renditions import (
+    find_renditions,
+    prefetch_renditions,
+    warm_renditions,
+)
 
 from wagtail.images.models import Filter
 from wagtail.images.utils import to_svg_safe_spec
-from wagtail.images.shortcuts import (
-    get_rendition_or_not_found,
-)
+
+import mimetypes
+
+
+def css_url(url: str) -> str:
+    url = url.replace("\\", "\\\\").replace('"', '\\"')
+    return f'url("{url}")'
 
 
 class BackgroundImageFieldAdapter(BaseFieldFuncAdapter):
@@ -43,6 +58,13 @@ class BackgroundImageFieldAdapter(BaseFieldFuncAdapter):
             default="original",
             help_text="The filter spec to apply to the image.",
         ),
+        Keyword(
+            "filter_specs",
+            optional=True,
+            default=None,
+            help_text="Several filter specs, such as \"fill-{800x450,1600x900}\"; the CSS value becomes an image-set() of the renditions, with pixel densities relative to the narrowest one. Browsers choose by device pixel ratio, not viewport width. Takes precedence over filter_spec.",
+            type_hint="str | list[str]",
+        ),
         Keyword(
             "preserve_svg",
             absolute=True,
@@ -52,30 +74,109 @@ class BackgroundImageFieldAdapter(BaseFieldFuncAdapter):
     js_constructor = "wagtail_fedit.editors.WagtailFeditFuncEditor"
     js_function = "wagtail_fedit.funcs.backgroundImageFunc"
 
+    @classmethod
+    @accepts_context_view
+    def render_read_only(cls, request, object, field_name, context, **kwargs):
+        if not cls._renders_content_with(BackgroundImageFieldAdapter):
+            return None
+        return ""
+
+    @accepts_context_view
     def render_content(self, parent_context=None):
         return ""
     
+    def get_filter_specs(self) -> list[str]:
+        filter_specs = self.kwargs["filter_specs"]
+        if not filter_specs:
+            filter_spec = self.kwargs["filter_spec"]
+            if not isinstance(filter_spec, str):
+                filter_spec = "|".join(filter_spec)
+            return [filter_spec]
+
+        if isinstance(filter_specs, str):
+            return Filter.expand_spec(filter_specs)
+
+        return [
+            spec for pattern in filter_specs
+            for spec in Filter.expand_spec(pattern)
+        ]
+
+    def get_filters(self, image) -> list[Filter]:
+        if image.is_svg() or self.kwargs["preserve_svg"]:
+            return [
+                Filter(to_svg_safe_spec(spec.split("|")))
+                for spec in self.get_filter_specs()
+            ]
+
+        return [
+            Filter(spec=spec) for spec in self.get_filter_specs()
+        ]
+
+    def get_css_value(self, image, renditions: list) -> str:
+        """
+        Return the CSS value for the renditions; `url()` for a single rendition
+        and `image-set()` with resolutions relative to the smallest rendition for several.
+        The original image is used while any of the renditions is not ready.
+
+        `image-set()` is chosen by device pixel ratio, not by the size of the viewport;
+        `width-{800,1600,2400}` makes a phone with a 3x display load the 2400 pixel
+        rendition. List the densities which should be served, or switch images with
+        media queries in the page's own CSS for viewport based sizes.
+        """
+        if not all(rendition and rendition.width for rendition in renditions):
+            return css_url(image.file.url)
+
+        if len(renditions) == 1:
+            return css_url(renditions[0].url)
+
+        smallest = min(rendition.width for rendition in renditions)
+        types = [
+            mimetypes.guess_type(rendition.file.name)[0]
+            for rendition in renditions
+        ]
+
+        options = []
+        for rendition, mime_type in zip(renditions, types):
+            option = f"{css_url(rendition.url)} {round(rendition.width / smallest, 2):g}x"
+            if mime_type and len(set(types)) > 1:
+                option = f'{option} type("{mime_type}")'
+            options.append(option)
+
+        return f"image-set({', '.join(options)})"
+
+    @classmethod
+    def prefetch_response_data(cls, request: HttpRequest, adapters: list["BackgroundImageFieldAdapter"]):
+        # The images were loaded when the adapters were constructed.
+        images, filters = [], []
+        for adapter in adapters:
+            image = getattr(adapter.object, adapter.field_name, None)
+            if image:
+                images.append(image)
+                filters.extend(adapter.get_filters(image))
+
+        prefetch_renditions(images, filters)
+
+    def form_valid(self, form):
+        super().form_valid(form)
+
+        # The editor does not refetch after a save; without warming, the renditions
+        # are queued by `get_response_data` and the original image is shown until then.
+        image = getattr(self.object, self.field_name, None)
+        if image and WARM_RENDITIONS_ON_SAVE:
+            warm_renditions(image, self.get_filters(image))
+
     def get_response_data(self, parent_context=None):
         data = super().get_response_data(parent_context)
         image = getattr(self.object, self.field_name, None)
         if not image:
             return data
 
-        filter_spec = self.kwargs["filter_spec"]
-        if not isinstance(filter_spec, str):
-            filter_spec = "|".join(filter_spec)
-
-        if image.is_svg() or self.kwargs["preserve_svg"]:
-            filter = Filter(to_svg_safe_spec(filter_spec.split("|")))
-        else:
-            filter = Filter(spec=filter_spec)
-
-        rendition = get_rendition_or_not_found(
-            image,
-            filter,
-        )
+        filters = self.get_filters(image)
+        renditions = find_renditions(image, filters)
+        renditions = [renditions[filter.spec] for filter in filters]
 
         return data | {
-            "url": rendition.url,
+            "url": renditions[0].url if renditions[0] else image.file.url,
+            "css_value": self.get_css_value(image, renditions),
             "css_variable_name": self.kwargs["css_variable_name"],
         }
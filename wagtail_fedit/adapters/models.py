@@ -1,13 +1,13 @@
 from django.utils.translation import gettext_lazy as _
 from django.http import HttpRequest
 from django.utils import translation
+from django.utils.functional import cached_property
 
 from wagtail.log_actions import log
 from wagtail.models import (
     Page, RevisionMixin
 )
 from wagtail.admin.panels import (
-    page_utils,
     model_utils,
     TabbedInterface,
 )
@@ -20,6 +20,7 @@ from .base import (
 )
 from ..forms import (
     PossibleRevisionFormMixin,
+    cached_form_class,
 )
 from ..utils import (
     get_model_string,
@@ -60,14 +61,21 @@ class ModelAdapter(BlockFieldReplacementAdapter):
 
     def __init__(self, object, field_name: str, request: HttpRequest, **kwargs):
         super().__init__(object, field_name, request, **kwargs)
-        if isinstance(self.object, Page):
-            self.edit_handler = page_utils._get_page_edit_handler(
-                self.object.__class__,
-            )
-        else:
-            self.edit_handler = model_utils.get_edit_handler(
-                self.object.__class__,
-            )
+
+    @classmethod
+    def get_edit_handler(cls, model):
+        """
+        Return the edit handler for the model class.
+        Wagtail keeps these per model class; they are bound to the model only once.
+        """
+        if issubclass(model, Page):
+            return model.get_edit_handler()
+        return model_utils.get_edit_handler(model)
+
+    @cached_property
+    def edit_handler(self):
+        # Resolved on first use; adapters rendered on a page do not need it.
+        return self.get_edit_handler(self.object.__class__)
 
     def get_admin_url(self) -> str:
         finder = AdminURLFinder(self.request.user)
@@ -94,18 +102,24 @@ class ModelAdapter(BlockFieldReplacementAdapter):
     
     def get_form_context(self, **kwargs):
         context = super().get_form_context(**kwargs)
-        bound_panel = self.edit_handler.get_bound_panel(
+        context["edit_handler"] = self.edit_handler.get_bound_panel(
             instance=self.object, request=self.request, form=kwargs["form"],
         )
-        context["edit_handler"] = bound_panel
         return context
 
     @property
     def form_class(self):
-        cls = self.edit_handler.get_form_class()
-        class RevisionModelForm(PossibleRevisionFormMixin, cls):
-            pass
-        return RevisionModelForm
+        def factory():
+            cls = self.edit_handler.get_form_class()
+            class RevisionModelForm(PossibleRevisionFormMixin, cls):
+                pass
+            return RevisionModelForm
+
+        return cached_form_class(
+            ("edit_handler", id(self.edit_handler)),
+            self.edit_handler,
+            factory,
+        )
 
     def form_valid(self, form):
         self.object = form.save()
@@ -150,23 +164,46 @@ class ModelAdapter(BlockFieldReplacementAdapter):
     def form_valid(self, form):
         self.object = form.save()
 
-    def render_content(self, parent_context=None):
-        if hasattr(parent_context, "flatten"):
-            parent_context = parent_context.flatten()
+    @classmethod
+    def render_object(cls, request, object, method_name, context=None):
+        """
+        Render the object with its render method.
+        """
+        if hasattr(context, "flatten"):
+            context = context.flatten()
 
-        method_name = self.kwargs["render_method"]
-        if not hasattr(self.object, method_name):
+        if not hasattr(object, method_name):
             raise AdapterError(
                 "Object '%s' does not have any method named '%s'" % (
-                    self.object.__class__.__name__,
+                    object.__class__.__name__,
                     method_name,
                 )
             )
         method = getattr(
-            self.object,
+            object,
             method_name
         )
         return method(
-            request=self.request,
-            context=parent_context,
+            request=request,
+            context=context,
+        )
+
+    @classmethod
+    def render_read_only(cls, request, object, field_name, context, **kwargs):
+        if not cls._renders_content_with(ModelAdapter):
+            return None
+
+        return cls.render_object(
+            request,
+            object,
+            kwargs.get("render_method") or cls._defaults["render_method"],
+            context,
+        )
+
+    def render_content(self, parent_context=None):
+        return self.render_object(
+            self.request,
+            self.object,
+            self.kwargs["render_method"],
+            parent_context,
         )
@@ -1,5 +1,12 @@
 from django.utils.translation import gettext_lazy as _
 
+
+class SharedContextExpired(Exception):
+    """
+    The shared context is no longer available on the server.
+    """
+
+
 class Formatter:
     def __init__(self, *messages):
         self.messages = messages
@@ -29,6 +36,7 @@ INVALID_ACTION = _("Invalid action specified: {}")
 MISSING_REQUIRED_SUPERCLASSES = _("Model {} does not inherit from {}")
 NO_UNPUBLISHED_CHANGES = _("Object has no unpublished changes")
 MODEL_NOT_FOUND = _("Model not found")
+SHARED_CONTEXT_EXPIRED = _("The shared context has expired, reload the page to continue editing")
 INVALID = Formatter(
     _("Invalid {}"),
     _("for object {}"),
@@ -7,4 +7,6 @@ from .fields import (
     PossibleRevisionForm,
     get_form_class_for_fields,
     get_widget_for_field,
+    cached_form_class,
+    clear_form_class_cache,
 )
\ No newline at end of file
@@ -8,6 +8,10 @@ from wagtail.blocks.base import (
 )
 from wagtail import blocks
 
+from .fields import (
+    cached_form_class,
+)
+
 import warnings
 
 
@@ -36,10 +40,17 @@ def get_block_form_class(block: blocks.Block):
     if isinstance(block, blocks.BoundBlock):
         block = block.block
 
-    class BlockForm(BlockEditForm):
-        value = BlockField(block=block, widget=BlockWidgetWithErrors(block))
+    def factory():
+        class BlockForm(BlockEditForm):
+            value = BlockField(block=block, widget=BlockWidgetWithErrors(block))
+
+        return BlockForm
 
-    return BlockForm
+    return cached_form_class(
+        ("block", id(block)),
+        block,
+        factory,
+    )
 
 
 class BlockEditForm(forms.Form):
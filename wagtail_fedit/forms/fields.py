@@ -16,6 +16,12 @@ from wagtail.models import (
 from ..hooks import (
     REGISTER_FIELD_WIDGETS,
 )
+from ..settings import (
+    FORM_CLASS_CACHE_SIZE,
+)
+from ..utils import (
+    LRUCache,
+)
 
 from wagtail import hooks
 
@@ -24,6 +30,30 @@ from wagtail import hooks
 _looked_for_widgets = False
 _widgets = {}
 
+# Form classes built by the factories in this package.
+# Creating a form class runs the (model)form metaclass and field construction;
+# this only has to happen once per model/block and list of fields.
+form_class_cache = LRUCache(FORM_CLASS_CACHE_SIZE)
+
+
+def clear_form_class_cache():
+    form_class_cache.clear()
+
+
+def cached_form_class(key, owner, factory):
+    """
+    Return the form class stored for `key`, or build and store it with `factory`.
+    `owner` is the object the key was derived from by identity;
+    it is kept alive with the entry so the identity cannot be re-used.
+    """
+    entry = form_class_cache.get(key)
+    if entry is not None and entry[0] is owner:
+        return entry[1]
+
+    form_class = factory()
+    form_class_cache.set(key, (owner, form_class))
+    return form_class
+
 
 def _look_for_widgets():
     global _looked_for_widgets
@@ -80,21 +110,28 @@ def get_form_class_for_fields(form_model: models.Model, form_fields: list[str])
     
     if form_fields == "__all__" or tuple(form_fields) == ("__all__", ):
         form_fields = [f.name for f in form_model._meta.fields]
-    
-    form_widgets = {}
-    for field_name in form_fields:
-        field = form_model._meta.get_field(field_name)
-        widget = get_widget_for_field(field)
-        if widget:
-            form_widgets[field_name] = widget
-
-    class RevisionForm(PossibleRevisionForm):
-        class Meta:
-            model = form_model
-            fields = form_fields
-            widgets = form_widgets
-
-    return RevisionForm
+
+    def factory():
+        form_widgets = {}
+        for field_name in form_fields:
+            field = form_model._meta.get_field(field_name)
+            widget = get_widget_for_field(field)
+            if widget:
+                form_widgets[field_name] = widget
+
+        class RevisionForm(PossibleRevisionForm):
+            class Meta:
+                model = form_model
+                fields = list(form_fields)
+                widgets = form_widgets
+
+        return RevisionForm
+
+    return cached_form_class(
+        ("fields", form_model, tuple(form_fields)),
+        form_model,
+        factory,
+    )
 
 
 class PossibleRevisionFormMixin:
@@ -18,6 +18,7 @@ REGISTER_TYPE_RENDERER   = prefix("register_type_renderer")
 """
 ### wagtail_fedit.register_type_renderer
 Register a custom renderer for a type.
+The renderer registered for the closest class in the MRO of the value is used.
 
 Example of how this type of renderer can be used:
 
@@ -78,6 +79,7 @@ REGISTER_FIELD_RENDERER  = prefix("register_field_renderer")
 """
 ### wagtail_fedit.register_field_renderer
 Register a custom renderer for a field.
+The renderer registered for the closest class in the MRO of the field is used.
 
 Example of how this type of renderer is used in wagtail_hooks/renderers.py:
 
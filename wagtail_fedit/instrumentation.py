@@ -0,0 +1,265 @@
+from contextlib import contextmanager, ExitStack, nullcontext
+from typing import Callable
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from .settings import (
+    INSTRUMENT_QUERIES,
+    QUERY_BUDGETS,
+)
+
+import functools
+import hashlib
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# Request variable
+QUERY_LOG_VAR = "_wagtail_fedit_query_log"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Return a short fingerprint for an SQL statement.
+    Parameters are not part of the statement; the same query with
+    different parameters (the typical N+1 pattern) has the same fingerprint.
+    """
+    normalized = _WHITESPACE_RE.sub(" ", sql).strip()
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+class QueryStats:
+    """
+    The queries executed in a single scope, such as a view or a template tag invocation.
+    Used as a database execute wrapper.
+    """
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = {}
+        self.statements = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+            key = fingerprint(sql)
+            self.fingerprints[key] = self.fingerprints.get(key, 0) + 1
+            self.statements.setdefault(key, sql)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        """
+        Fingerprints of statements which were executed more than once.
+        """
+        return {
+            key: count for key, count in self.fingerprints.items()
+            if count > 1
+        }
+
+    def over_budget(self, budgets: dict[str, int] = None) -> bool:
+        if budgets is None:
+            budgets = QUERY_BUDGETS
+
+        budget = budgets.get(self.name)
+        return budget is not None and self.count > budget
+
+    def __repr__(self):
+        return f"<QueryStats {self.kind} {self.name!r}: {self.count} queries, {self.duration_ms:.2f}ms>"
+
+
+class QueryLog:
+    """
+    All scopes recorded during a request, in the order they were entered.
+    Scopes may be nested; the queries of a template tag are also
+    counted by the view it was rendered in.
+    """
+    def __init__(self):
+        self.stats: list[QueryStats] = []
+
+    def add(self, stats: QueryStats):
+        self.stats.append(stats)
+
+    def for_kind(self, kind: str) -> list[QueryStats]:
+        return [stats for stats in self.stats if stats.kind == kind]
+
+    @property
+    def views(self) -> list[QueryStats]:
+        return self.for_kind("view")
+
+    @property
+    def tags(self) -> list[QueryStats]:
+        return self.for_kind("tag")
+
+    def summary(self) -> dict[tuple[str, str], dict]:
+        """
+        Scopes aggregated by kind and name.
+        """
+        summary = {}
+        for stats in self.stats:
+            entry = summary.setdefault((stats.kind, stats.name), {
+                "calls": 0,
+                "queries": 0,
+                "duration_ms": 0.0,
+                "duplicates": 0,
+            })
+            entry["calls"] += 1
+            entry["queries"] += stats.count
+            entry["duration_ms"] += stats.duration_ms
+            entry["duplicates"] += sum(stats.duplicates.values())
+        return summary
+
+    def server_timing(self) -> str:
+        """
+        Return the log as the value of a `Server-Timing` header.
+        """
+        metrics = []
+        for (kind, name), entry in self.summary().items():
+            token = _TOKEN_RE.sub("-", name).strip("-")
+            description = f"{name}: {entry['queries']} queries"
+            if entry["duplicates"]:
+                description += f", {entry['duplicates']} duplicate"
+            if entry["calls"] > 1:
+                description += f", {entry['calls']} calls"
+
+            metrics.append(
+                f'fedit-{kind}-{token};desc="{description}";dur={entry["duration_ms"]:.2f}'
+            )
+        return ", ".join(metrics)
+
+
+def get_query_log(request: HttpRequest, create: bool = False) -> QueryLog:
+    """
+    Return the query log of the request.
+    Returns None if nothing was recorded and `create` is false.
+    """
+    log = getattr(request, QUERY_LOG_VAR, None)
+    if log is None and create:
+        log = QueryLog()
+        setattr(request, QUERY_LOG_VAR, log)
+    return log
+
+
+@contextmanager
+def record_queries(name: str, kind: str = "block", request: HttpRequest = None):
+    """
+    Record the queries executed on any database inside the block.
+    If a request is given, the stats are added to its query log.
+
+        with record_queries("my-block") as stats:
+            ...
+        print(stats.count, stats.duplicates)
+    """
+    stats = QueryStats(name, kind)
+    if request is not None:
+        get_query_log(request, create=True).add(stats)
+
+    with _execute_wrappers(stats):
+        yield stats
+
+
+@contextmanager
+def _execute_wrappers(stats: QueryStats):
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield
+
+
+def _record_streaming(content, stats: QueryStats, done: Callable):
+    """
+    Record the queries made while the chunks of a streaming response are produced.
+    Only the production of each chunk is recorded; not the code consuming them.
+    """
+    content = iter(content)
+    while True:
+        with _execute_wrappers(stats):
+            chunk = next(content, None)
+        if chunk is None:
+            break
+        yield chunk
+    done()
+
+
+def _check_budget(stats: QueryStats):
+    if stats.over_budget():
+        logger.warning(
+            "%s executed %d queries, the budget is %d",
+            stats.name, stats.count, QUERY_BUDGETS[stats.name],
+        )
+
+
+def instrument(request: HttpRequest, name: str, kind: str):
+    """
+    `record_queries` for the request if `WAGTAIL_FEDIT_INSTRUMENT_QUERIES` is enabled.
+    """
+    if not INSTRUMENT_QUERIES or request is None:
+        return nullcontext()
+
+    return record_queries(name, kind, request)
+
+
+def instrument_view(view: Callable, name: str = None) -> Callable:
+    """
+    Decorate a view to record its queries if `WAGTAIL_FEDIT_INSTRUMENT_QUERIES` is enabled.
+    Template responses are rendered inside the view so their queries are included.
+    Streaming responses are recorded while they are streamed; the `Server-Timing`
+    header only includes the queries made before the first chunk, the budget is
+    checked once the whole response has been streamed.
+    """
+    if name is None:
+        name = view.__name__
+
+    @functools.wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if not INSTRUMENT_QUERIES:
+            return view(request, *args, **kwargs)
+
+        with record_queries(name, "view", request) as stats:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+
+        if getattr(response, "streaming", False):
+            response.streaming_content = _record_streaming(
+                response.streaming_content, stats,
+                functools.partial(_check_budget, stats),
+            )
+        else:
+            _check_budget(stats)
+
+        server_timing = get_query_log(request).server_timing()
+        if response.has_header("Server-Timing"):
+            server_timing = f"{response['Server-Timing']}, {server_timing}"
+        response["Server-Timing"] = server_timing
+
+        return response
+
+    return wrapper
+
+
+class QueryInstrumentationMixin:
+    """
+    Record the queries of a class based view; see `instrument_view`.
+    """
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return instrument_view(
+            super().as_view(**initkwargs),
+            name=cls.__name__,
+        )
@@ -0,0 +1,93 @@
+from typing import Any, Callable, Iterable
+from django.db import models
+from django.http import HttpRequest
+from .settings import (
+    USE_RENDER_CACHE,
+)
+
+
+# Request variable
+PERMISSION_MATRIX_VAR = "_wagtail_fedit_permission_matrix"
+
+
+class PermissionMatrix:
+    """
+    Request-scoped store of permission and lock checks.
+
+    Results are kept per set of permissions, per model class and
+    (for `LockableMixin`) per instance; a page with many adapters for
+    the same models only checks each of them once.
+    `checks` counts the checks which were actually run,
+    `lookups` counts how often a result was asked for.
+    """
+    def __init__(self, user):
+        self.user = user
+        self.results = {}
+        self.checks = 0
+        self.lookups = 0
+
+    def get(self, key: tuple, check: Callable[[], Any]) -> Any:
+        self.lookups += 1
+        try:
+            return self.results[key]
+        except KeyError:
+            pass
+
+        self.checks += 1
+        value = check()
+        self.results[key] = value
+        return value
+
+    def has_perms(self, perms: Iterable[str]) -> bool:
+        """
+        Cached `user.has_perms(perms)`.
+        """
+        perms = tuple(perms)
+        return self.get(
+            ("perms", perms),
+            lambda: self.user.has_perms(perms),
+        )
+
+    def model_check(self, name: str, model: Any, check: Callable[[], Any]) -> Any:
+        """
+        Cache the result of `check` for a model class (or an instance of it).
+        """
+        return self.get(
+            (name, model._meta.label_lower),
+            check,
+        )
+
+    def instance_check(self, name: str, instance: models.Model, check: Callable[[], Any]) -> Any:
+        """
+        Cache the result of `check` for a single model instance.
+        """
+        return self.get(
+            (name, instance._meta.label_lower, instance.pk),
+            check,
+        )
+
+    def clear(self):
+        self.results.clear()
+        self.checks = 0
+        self.lookups = 0
+
+
+def get_permission_matrix(request: HttpRequest) -> PermissionMatrix:
+    """
+    Return the permission matrix for the request.
+    Returns None if there is no request or user, or if request-scoped caching is disabled.
+    """
+    if not USE_RENDER_CACHE or request is None:
+        return None
+
+    user = getattr(request, "user", None)
+    if user is None:
+        return None
+
+    matrix = getattr(request, PERMISSION_MATRIX_VAR, None)
+    if matrix is not None and matrix.user is user:
+        return matrix
+
+    matrix = PermissionMatrix(user)
+    setattr(request, PERMISSION_MATRIX_VAR, matrix)
+    return matrix
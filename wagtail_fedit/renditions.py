@@ -0,0 +1,165 @@
+"""
+Image renditions for adapters.
+
+Renditions for many images are prefetched with a single query per image model.
+Renditions which do not exist yet are generated in a thread pool, off the request path;
+the URL of the original image is used until they are ready.
+Renditions of a newly saved image can be generated right away; see `WARM_RENDITIONS_ON_SAVE`.
+"""
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import Iterable
+from django.db import connections
+from django.db.models import (
+    Prefetch,
+    prefetch_related_objects,
+)
+from wagtail.images.models import (
+    AbstractImage,
+    AbstractRendition,
+    Filter,
+    SourceImageIOError,
+)
+from wagtail.images.shortcuts import (
+    get_renditions_or_not_found,
+)
+
+from .settings import (
+    RENDITION_WORKERS,
+)
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class RenditionGenerator:
+    """
+    Generates renditions in a thread pool.
+    A rendition (image and filter spec) is queued at most once until it has been generated.
+    The pool is started when the first rendition is queued.
+    """
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self.pending: set[tuple] = set()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="wagtail_fedit_renditions",
+                )
+            return self._executor
+
+    def submit(self, image: AbstractImage, filters: list[Filter]) -> Future | None:
+        """
+        Queue the renditions of the image which are not queued yet.
+        Returns None if all of them already are.
+        """
+        model = type(image)
+        with self._lock:
+            specs = [
+                filter.spec for filter in filters
+                if (model, image.pk, filter.spec) not in self.pending
+            ]
+            self.pending.update(
+                (model, image.pk, spec) for spec in specs
+            )
+
+        if not specs:
+            return None
+
+        future = self.executor.submit(self.generate, model, image.pk, specs)
+        # Runs in this thread if the future is already done; the lock is not held here.
+        future.add_done_callback(lambda _future: self.done(model, image.pk, specs))
+        return future
+
+    def generate(self, model: type[AbstractImage], pk, specs: list[str]):
+        # Model instances are not shared with the request's thread.
+        try:
+            image = model._default_manager.get(pk=pk)
+            image.get_renditions(*specs)
+        except (model.DoesNotExist, SourceImageIOError):
+            pass
+        except Exception:
+            logger.exception("Could not generate renditions %s for image %s", specs, pk)
+        finally:
+            connections.close_all()
+
+    def done(self, model: type[AbstractImage], pk, specs: list[str]):
+        with self._lock:
+            self.pending.difference_update(
+                (model, pk, spec) for spec in specs
+            )
+
+
+rendition_generator = RenditionGenerator(
+    workers=RENDITION_WORKERS,
+)
+
+
+def prefetch_renditions(images: Iterable[AbstractImage], filters: Iterable[Filter]):
+    """
+    Prefetch the renditions for the filters of all images; one query per image model.
+    Like `ImageQuerySet.prefetch_renditions`, for images which were already loaded.
+    """
+    specs = {filter.spec for filter in filters}
+    if not specs:
+        return
+
+    by_model: dict[type, list[AbstractImage]] = {}
+    for image in images:
+        by_model.setdefault(type(image), []).append(image)
+
+    for model, instances in by_model.items():
+        prefetch_related_objects(instances, Prefetch(
+            "renditions",
+            queryset=model.get_rendition_model().objects.filter(
+                filter_spec__in=specs,
+            ),
+            to_attr="prefetched_renditions",
+        ))
+
+
+def _unique(filters: Iterable[Filter]) -> list[Filter]:
+    return list({filter.spec: filter for filter in filters}.values())
+
+
+def _find_or_queue(image: AbstractImage, filters: list[Filter]) -> tuple[dict[Filter, AbstractRendition], Future | None]:
+    found = image.find_existing_renditions(*filters)
+    missing = [filter for filter in filters if filter not in found]
+    if not missing:
+        return found, None
+    return found, rendition_generator.submit(image, missing)
+
+
+def find_renditions(image: AbstractImage, filters: Iterable[Filter]) -> dict[str, AbstractRendition | None]:
+    """
+    Return the rendition for each filter, keyed by filter spec.
+    Missing renditions are queued for the rendition generator and are `None` in the meantime.
+    """
+    filters = _unique(filters)
+
+    if not rendition_generator.workers:
+        return get_renditions_or_not_found(image, filters)
+
+    found, _future = _find_or_queue(image, filters)
+    return {
+        filter.spec: found.get(filter)
+        for filter in filters
+    }
+
+
+def warm_renditions(image: AbstractImage, filters: Iterable[Filter]) -> dict[str, AbstractRendition]:
+    """
+    Generate the missing renditions for the filters while handling the request,
+    regardless of the rendition workers.
+    """
+    return get_renditions_or_not_found(image, _unique(filters))
@@ -0,0 +1,198 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from wagtail.models import (
+    DraftStateMixin,
+    RevisionMixin,
+    Revision,
+)
+from wagtail.signals import (
+    published,
+    unpublished,
+    page_published,
+    page_unpublished,
+)
+
+from .settings import (
+    USE_REVISION_CACHE,
+    REVISION_CACHE,
+    REVISION_CACHE_SIZE,
+    REVISION_CACHE_TIMEOUT,
+)
+
+import hashlib
+import logging
+import pickle
+
+logger = logging.getLogger(__name__)
+
+
+PRESERVED_FIELDS = (
+    "latest_revision_id",
+    "latest_revision_created_at",
+    "live",
+    "has_unpublished_changes",
+    "first_published_at",
+    "locked",
+    "locked_at",
+    "locked_by_id",
+    "translation_key",
+    "locale_id",
+    "draft_title",
+    "owner_id",
+    "alias_of_id",
+    "path",
+    "depth",
+    "numchild",
+    "url_path",
+)
+"""
+Fields which Wagtail's `with_content_json` preserves from the live object.
+These are part of the cache key; if any of them change on the live object
+the cached revision object is no longer used.
+"""
+
+
+class RevisionObjectCache:
+    """
+    Cache for `latest_revision.as_object()`.
+
+    Entries are keyed on the content type, primary key and revision id of the object.
+    Values are stored pickled; each lookup returns a fresh copy which is safe to modify.
+    By default an in-process LRU cache bounded by `WAGTAIL_FEDIT_REVISION_CACHE_SIZE` is used;
+    any Django cache alias can be configured with `WAGTAIL_FEDIT_REVISION_CACHE`.
+    """
+    prefix = "wagtail_fedit:revision"
+
+    def __init__(self, alias: str = None, size: int = 128, timeout: int = 3600):
+        self.alias = alias
+        self.size = size
+        self.timeout = timeout
+        self._local = None
+
+    @property
+    def backend(self):
+        if self.alias:
+            return caches[self.alias]
+
+        if self._local is None:
+            self._local = LocMemCache(self.prefix, {
+                "TIMEOUT": self.timeout,
+                "OPTIONS": {
+                    "MAX_ENTRIES": self.size,
+                    "CULL_FREQUENCY": self.size,
+                },
+            })
+
+        return self._local
+
+    def index_key(self, content_type_id: int, object_id) -> str:
+        return f"{self.prefix}:{content_type_id}:{object_id}"
+
+    def index_key_for(self, instance: models.Model) -> str:
+        content_type = ContentType.objects.get_for_model(instance)
+        return self.index_key(content_type.pk, instance.pk)
+
+    def make_key(self, instance: models.Model) -> str:
+        fingerprint = repr(tuple(
+            getattr(instance, name, None) for name in PRESERVED_FIELDS
+        ))
+        digest = hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+        return f"{self.index_key_for(instance)}:{instance.latest_revision_id}:{digest}"
+
+    def get(self, instance: models.Model) -> models.Model | None:
+        value = self.backend.get(self.make_key(instance))
+        if value is None:
+            return None
+        return pickle.loads(value)
+
+    def set(self, instance: models.Model, obj: models.Model):
+        try:
+            value = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug("Could not cache revision object for %r: %s", instance, e)
+            return
+
+        key = self.make_key(instance)
+        backend = self.backend
+        backend.set(key, value, self.timeout)
+        backend.set(self.index_key_for(instance), key, self.timeout)
+
+    def invalidate(self, instance: models.Model):
+        self.invalidate_key(self.index_key_for(instance))
+
+    def invalidate_key(self, index_key: str):
+        backend = self.backend
+        key = backend.get(index_key)
+        if key:
+            backend.delete_many([key, index_key])
+
+    def clear(self):
+        if self.alias:
+            # Shared caches cannot be cleared without affecting other entries;
+            # they rely on invalidation and the cache key.
+            return
+        if self._local is not None:
+            self._local.clear()
+
+
+revision_cache = RevisionObjectCache(
+    alias=REVISION_CACHE,
+    size=REVISION_CACHE_SIZE,
+    timeout=REVISION_CACHE_TIMEOUT,
+)
+
+
+def get_revision_as_object(instance: RevisionMixin) -> models.Model:
+    """
+    Return `instance.latest_revision.as_object()`, using the revision cache if enabled.
+    The instance should be fresh from the database.
+    """
+    if not USE_REVISION_CACHE:
+        return instance.latest_revision.as_object()
+
+    obj = revision_cache.get(instance)
+    if obj is not None:
+        return obj
+
+    obj = instance.latest_revision.as_object()
+    revision_cache.set(instance, obj)
+    return obj
+
+
+def get_latest_revision_as_object(instance: RevisionMixin) -> models.Model:
+    """
+    Cached equivalent of `instance.get_latest_revision_as_object()`.
+    """
+    if isinstance(instance, DraftStateMixin) and not instance.has_unpublished_changes:
+        return instance
+
+    if not instance.latest_revision_id:
+        return instance
+
+    return get_revision_as_object(instance)
+
+
+@receiver(post_save, sender=Revision, dispatch_uid="wagtail_fedit_revision_saved")
+def _invalidate_on_revision_saved(sender, instance: Revision, **kwargs):
+    revision_cache.invalidate_key(revision_cache.index_key(
+        instance.content_type_id, instance.object_id,
+    ))
+
+
+@receiver(published, dispatch_uid="wagtail_fedit_revision_published")
+@receiver(unpublished, dispatch_uid="wagtail_fedit_revision_unpublished")
+@receiver(page_published, dispatch_uid="wagtail_fedit_revision_page_published")
+@receiver(page_unpublished, dispatch_uid="wagtail_fedit_revision_page_unpublished")
+def _invalidate_on_publish(sender, instance: models.Model, **kwargs):
+    revision_cache.invalidate(instance)
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(*, setting, **kwargs):
+    if setting == "CACHES":
+        revision_cache.clear()
@@ -40,3 +40,114 @@ TIPPY_ENABLED = getattr(settings, "WAGTAIL_FEDIT_TIPPY_ENABLED", True)
 Enable Tippy.js tooltips for toolbar buttons.
 """
 
+
+USE_RENDER_CACHE = getattr(settings, "WAGTAIL_FEDIT_USE_RENDER_CACHE", True)
+"""
+Cache adapters and their toolbars for the duration of a request.
+Repeated `{% fedit %}` tags for the same object, field and keyword arguments
+will re-use the adapter, the encoded shared context, the URLs and the rendered toolbar buttons.
+The content itself is always rendered with the current template context.
+Permission and lock checks are also kept for the duration of the request.
+"""
+
+
+USE_REVISION_CACHE = getattr(settings, "WAGTAIL_FEDIT_USE_REVISION_CACHE", True)
+"""
+Cache the deserialized latest revision of objects in the editing views.
+Entries are keyed on the content type, primary key and revision id of the object
+and are invalidated when a revision is saved or the object is (un)published.
+"""
+
+REVISION_CACHE = getattr(settings, "WAGTAIL_FEDIT_REVISION_CACHE", None)
+"""
+Alias of a cache in `CACHES` to store revision objects in.
+If `None`, an in-process LRU cache is used.
+"""
+
+REVISION_CACHE_SIZE = getattr(settings, "WAGTAIL_FEDIT_REVISION_CACHE_SIZE", 128)
+"""
+Maximum number of revision objects kept in the in-process cache.
+Does not apply if `WAGTAIL_FEDIT_REVISION_CACHE` is set.
+"""
+
+REVISION_CACHE_TIMEOUT = getattr(settings, "WAGTAIL_FEDIT_REVISION_CACHE_TIMEOUT", 60 * 60)
+"""
+Time in seconds a revision object is kept in the cache.
+"""
+
+SHARED_CONTEXT_CODEC = getattr(settings, "WAGTAIL_FEDIT_SHARED_CONTEXT_CODEC", None)
+"""
+The codec used to encode the shared context.
+One of `"signed"`, `"base85"`, `"compact"`, `"store"` or a dotted path to a
+`wagtail_fedit.adapters.codecs.SharedContextCodec` subclass.
+If `None`, `"signed"` or `"base85"` is used depending on `WAGTAIL_FEDIT_SIGN_SHARED_CONTEXT`.
+The `"compact"` codec is signed if `WAGTAIL_FEDIT_SIGN_SHARED_CONTEXT` is `True`.
+"""
+
+SHARED_CONTEXT_CACHE_SIZE = getattr(settings, "WAGTAIL_FEDIT_SHARED_CONTEXT_CACHE_SIZE", 1024)
+"""
+Number of encoded shared contexts kept in memory.
+Adapters with the same keyword arguments re-use the cached encoding
+instead of serializing and signing again. Set to `0` to disable.
+"""
+
+SHARED_CONTEXT_STORE = getattr(settings, "WAGTAIL_FEDIT_SHARED_CONTEXT_STORE", "default")
+"""
+Alias of the cache in `CACHES` used by the `"store"` shared context codec.
+The store keeps the shared context on the server and only passes a short key
+to the iFrame; unlike `WAGTAIL_FEDIT_SHARE_WITH_SESSIONS` it does not write to the session.
+The cache must be shared by all processes, such as the database, file based or Redis cache;
+with the per-process local memory cache other processes cannot find the shared context
+and the editor answers with an error asking to reload the page.
+"""
+
+SHARED_CONTEXT_STORE_TIMEOUT = getattr(settings, "WAGTAIL_FEDIT_SHARED_CONTEXT_STORE_TIMEOUT", 60 * 60 * 24)
+"""
+Time in seconds a shared context is kept in the store.
+Entries are written again every time the adapter is rendered.
+"""
+
+FORM_CLASS_CACHE_SIZE = getattr(settings, "WAGTAIL_FEDIT_FORM_CLASS_CACHE_SIZE", 256)
+"""
+Number of form classes kept in memory.
+Form classes for fields, blocks and models are built once and re-used for every request.
+"""
+
+INSTRUMENT_QUERIES = getattr(settings, "WAGTAIL_FEDIT_INSTRUMENT_QUERIES", False)
+"""
+Record the SQL queries executed by the wagtail_fedit views and by each `{% fedit %}` tag.
+Query counts, durations and duplicate queries are added to the `Server-Timing` header
+of the views and are available with `wagtail_fedit.instrumentation.get_query_log(request)`.
+Meant for development; this adds overhead to every query.
+"""
+
+QUERY_BUDGETS = getattr(settings, "WAGTAIL_FEDIT_QUERY_BUDGETS", {})
+"""
+Maximum number of queries per view or template tag, keyed by the view's class name
+or `"tag:<adapter identifier>"`. Only applies if `WAGTAIL_FEDIT_INSTRUMENT_QUERIES` is enabled;
+a warning is logged whenever a budget is exceeded.
+"""
+
+STREAM_PREVIEW = getattr(settings, "WAGTAIL_FEDIT_STREAM_PREVIEW", False)
+"""
+Stream the editable view of an object to the browser while it is being rendered.
+The page is sent in chunks (per top-level template node) so the browser can start
+loading the stylesheets and scripts in the `<head>` before all adapters are rendered.
+Errors raised while rendering can no longer change the response status once streaming started,
+and middleware which rewrites the response content does not apply to the streamed body.
+"""
+
+RENDITION_WORKERS = getattr(settings, "WAGTAIL_FEDIT_RENDITION_WORKERS", 2)
+"""
+Number of threads generating image renditions for adapters, such as the background image adapter.
+Renditions which do not exist yet are generated off the request path;
+the URL of the original image is returned until they are ready.
+Set to `0` to generate renditions while handling the request.
+"""
+
+WARM_RENDITIONS_ON_SAVE = getattr(settings, "WAGTAIL_FEDIT_WARM_RENDITIONS_ON_SAVE", False)
+"""
+Generate the renditions of a newly saved image before responding to the save,
+even with rendition workers. The editor then shows the renditions right away,
+but saving takes as long as generating all of them.
+"""
@@ -1 +1,5 @@
-(()=>{"use strict";var e={2:(e,t,n)=>{n.d(t,{A:()=>s});var i=n(601),r=n.n(i),o=n(314),a=n.n(o)()(r());a.push([e.id,'.tippy-box[data-animation=fade][data-state=hidden]{opacity:0}[data-tippy-root]{max-width:calc(100vw - 10px)}.tippy-box{position:relative;background-color:#333;color:#fff;border-radius:4px;font-size:14px;line-height:1.4;white-space:normal;outline:0;transition-property:transform,visibility,opacity}.tippy-box[data-placement^=top]>.tippy-arrow{bottom:0}.tippy-box[data-placement^=top]>.tippy-arrow:before{bottom:-7px;left:0;border-width:8px 8px 0;border-top-color:initial;transform-origin:center top}.tippy-box[data-placement^=bottom]>.tippy-arrow{top:0}.tippy-box[data-placement^=bottom]>.tippy-arrow:before{top:-7px;left:0;border-width:0 8px 8px;border-bottom-color:initial;transform-origin:center bottom}.tippy-box[data-placement^=left]>.tippy-arrow{right:0}.tippy-box[data-placement^=left]>.tippy-arrow:before{border-width:8px 0 8px 8px;border-left-color:initial;right:-7px;transform-origin:center left}.tippy-box[data-placement^=right]>.tippy-arrow{left:0}.tippy-box[data-placement^=right]>.tippy-arrow:before{left:-7px;border-width:8px 8px 8px 0;border-right-color:initial;transform-origin:center right}.tippy-box[data-inertia][data-state=visible]{transition-timing-function:cubic-bezier(.54,1.5,.38,1.11)}.tippy-arrow{width:16px;height:16px;color:#333}.tippy-arrow:before{content:"";position:absolute;border-color:transparent;border-style:solid}.tippy-content{position:relative;padding:5px 9px;z-index:1}',""]);const s=a},314:e=>{e.exports=function(e){var t=[];return t.toString=function(){return this.map((function(t){var n="",i=void 0!==t[5];return t[4]&&(n+="@supports (".concat(t[4],") {")),t[2]&&(n+="@media ".concat(t[2]," {")),i&&(n+="@layer".concat(t[5].length>0?" ".concat(t[5]):""," {")),n+=e(t),i&&(n+="}"),t[2]&&(n+="}"),t[4]&&(n+="}"),n})).join("")},t.i=function(e,n,i,r,o){"string"==typeof e&&(e=[[null,e,void 0]]);var a={};if(i)for(var s=0;s<this.length;s++){var c=this[s][0];null!=c&&(a[c]=!0)}for(var l=0;l<e.length;l++){var d=[].concat(e[l]);i&&a[d[0]]||(void 0!==o&&(void 0===d[5]||(d[1]="@layer".concat(d[5].length>0?" ".concat(d[5]):""," {").concat(d[1],"}")),d[5]=o),n&&(d[2]?(d[1]="@media ".concat(d[2]," {").concat(d[1],"}"),d[2]=n):d[2]=n),r&&(d[4]?(d[1]="@supports (".concat(d[4],") {").concat(d[1],"}"),d[4]=r):d[4]="".concat(r)),t.push(d))}},t}},601:e=>{e.exports=function(e){return e[1]}},72:e=>{var t=[];function n(e){for(var n=-1,i=0;i<t.length;i++)if(t[i].identifier===e){n=i;break}return n}function i(e,i){for(var o={},a=[],s=0;s<e.length;s++){var c=e[s],l=i.base?c[0]+i.base:c[0],d=o[l]||0,p="".concat(l," ").concat(d);o[l]=d+1;var u=n(p),f={css:c[1],media:c[2],sourceMap:c[3],supports:c[4],layer:c[5]};if(-1!==u)t[u].references++,t[u].updater(f);else{var h=r(f,i);i.byIndex=s,t.splice(s,0,{identifier:p,updater:h,references:1})}a.push(p)}return a}function r(e,t){var n=t.domAPI(t);return n.update(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap&&t.supports===e.supports&&t.layer===e.layer)return;n.update(e=t)}else n.remove()}}e.exports=function(e,r){var o=i(e=e||[],r=r||{});return function(e){e=e||[];for(var a=0;a<o.length;a++){var s=n(o[a]);t[s].references--}for(var c=i(e,r),l=0;l<o.length;l++){var d=n(o[l]);0===t[d].references&&(t[d].updater(),t.splice(d,1))}o=c}}},659:e=>{var t={};e.exports=function(e,n){var i=function(e){if(void 0===t[e]){var n=document.querySelector(e);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}t[e]=n}return t[e]}(e);if(!i)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");i.appendChild(n)}},540:e=>{e.exports=function(e){var t=document.createElement("style");return e.setAttributes(t,e.attributes),e.insert(t,e.options),t}},56:(e,t,n)=>{e.exports=function(e){var t=n.nc;t&&e.setAttribute("nonce",t)}},825:e=>{e.exports=function(e){if("undefined"==typeof document)return{update:function(){},remove:function(){}};var t=e.insertStyleElement(e);return{update:function(n){!function(e,t,n){var i="";n.supports&&(i+="@supports (".concat(n.supports,") {")),n.media&&(i+="@media ".concat(n.media," {"));var r=void 0!==n.layer;r&&(i+="@layer".concat(n.layer.length>0?" ".concat(n.layer):""," {")),i+=n.css,r&&(i+="}"),n.media&&(i+="}"),n.supports&&(i+="}");var o=n.sourceMap;o&&"undefined"!=typeof btoa&&(i+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(o))))," */")),t.styleTagTransform(i,e,t.options)}(t,e,n)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(t)}}}},113:e=>{e.exports=function(e,t){if(t.styleSheet)t.styleSheet.cssText=e;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(e))}}}},t={};function n(i){var r=t[i];if(void 0!==r)return r.exports;var o=t[i]={id:i,exports:{}};return e[i](o,o.exports,n),o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var i in t)n.o(t,i)&&!n.o(e,i)&&Object.defineProperty(e,i,{enumerable:!0,get:t[i]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.nc=void 0;var i={};(()=>{function e(e){if(null==e)return window;if("[object Window]"!==e.toString()){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function t(t){return t instanceof e(t).Element||t instanceof Element}function r(t){return t instanceof e(t).HTMLElement||t instanceof HTMLElement}function o(t){return"undefined"!=typeof ShadowRoot&&(t instanceof e(t).ShadowRoot||t instanceof ShadowRoot)}n.d(i,{DU:()=>Dt});var a=Math.max,s=Math.min,c=Math.round;function l(){var e=navigator.userAgentData;return null!=e&&e.brands&&Array.isArray(e.brands)?e.brands.map((function(e){return e.brand+"/"+e.version})).join(" "):navigator.userAgent}function d(){return!/^((?!chrome|android).)*safari/i.test(l())}function p(n,i,o){void 0===i&&(i=!1),void 0===o&&(o=!1);var a=n.getBoundingClientRect(),s=1,l=1;i&&r(n)&&(s=n.offsetWidth>0&&c(a.width)/n.offsetWidth||1,l=n.offsetHeight>0&&c(a.height)/n.offsetHeight||1);var p=(t(n)?e(n):window).visualViewport,u=!d()&&o,f=(a.left+(u&&p?p.offsetLeft:0))/s,h=(a.top+(u&&p?p.offsetTop:0))/l,m=a.width/s,v=a.height/l;return{width:m,height:v,top:h,right:f+m,bottom:h+v,left:f,x:f,y:h}}function u(t){var n=e(t);return{scrollLeft:n.pageXOffset,scrollTop:n.pageYOffset}}function f(e){return e?(e.nodeName||"").toLowerCase():null}function h(e){return((t(e)?e.ownerDocument:e.document)||window.document).documentElement}function m(e){return p(h(e)).left+u(e).scrollLeft}function v(t){return e(t).getComputedStyle(t)}function g(e){var t=v(e),n=t.overflow,i=t.overflowX,r=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+i)}function w(t,n,i){void 0===i&&(i=!1);var o,a,s=r(n),l=r(n)&&function(e){var t=e.getBoundingClientRect(),n=c(t.width)/e.offsetWidth||1,i=c(t.height)/e.offsetHeight||1;return 1!==n||1!==i}(n),d=h(n),v=p(t,l,i),w={scrollLeft:0,scrollTop:0},y={x:0,y:0};return(s||!s&&!i)&&(("body"!==f(n)||g(d))&&(w=(o=n)!==e(o)&&r(o)?{scrollLeft:(a=o).scrollLeft,scrollTop:a.scrollTop}:u(o)),r(n)?((y=p(n,!0)).x+=n.clientLeft,y.y+=n.clientTop):d&&(y.x=m(d))),{x:v.left+w.scrollLeft-y.x,y:v.top+w.scrollTop-y.y,width:v.width,height:v.height}}function y(e){var t=p(e),n=e.offsetWidth,i=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-i)<=1&&(i=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:i}}function b(e){return"html"===f(e)?e:e.assignedSlot||e.parentNode||(o(e)?e.host:null)||h(e)}function E(e){return["html","body","#document"].indexOf(f(e))>=0?e.ownerDocument.body:r(e)&&g(e)?e:E(b(e))}function x(t,n){var i;void 0===n&&(n=[]);var r=E(t),o=r===(null==(i=t.ownerDocument)?void 0:i.body),a=e(r),s=o?[a].concat(a.visualViewport||[],g(r)?r:[]):r,c=n.concat(s);return o?c:c.concat(x(b(s)))}function O(e){return["table","td","th"].indexOf(f(e))>=0}function L(e){return r(e)&&"fixed"!==v(e).position?e.offsetParent:null}function T(t){for(var n=e(t),i=L(t);i&&O(i)&&"static"===v(i).position;)i=L(i);return i&&("html"===f(i)||"body"===f(i)&&"static"===v(i).position)?n:i||function(e){var t=/firefox/i.test(l());if(/Trident/i.test(l())&&r(e)&&"fixed"===v(e).position)return null;var n=b(e);for(o(n)&&(n=n.host);r(n)&&["html","body"].indexOf(f(n))<0;){var i=v(n);if("none"!==i.transform||"none"!==i.perspective||"paint"===i.contain||-1!==["transform","perspective"].indexOf(i.willChange)||t&&"filter"===i.willChange||t&&i.filter&&"none"!==i.filter)return n;n=n.parentNode}return null}(t)||n}var A="top",S="bottom",C="right",D="left",M="auto",I=[A,S,C,D],k="start",R="end",P="viewport",j="popper",H=I.reduce((function(e,t){return e.concat([t+"-"+k,t+"-"+R])}),[]),N=[].concat(I,[M]).reduce((function(e,t){return e.concat([t,t+"-"+k,t+"-"+R])}),[]),F=["beforeRead","read","afterRead","beforeMain","main","afterMain","beforeWrite","write","afterWrite"];function W(e){var t=new Map,n=new Set,i=[];function r(e){n.add(e.name),[].concat(e.requires||[],e.requiresIfExists||[]).forEach((function(e){if(!n.has(e)){var i=t.get(e);i&&r(i)}})),i.push(e)}return e.forEach((function(e){t.set(e.name,e)})),e.forEach((function(e){n.has(e.name)||r(e)})),i}var q={placement:"bottom",modifiers:[],strategy:"absolute"};function B(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some((function(e){return!(e&&"function"==typeof e.getBoundingClientRect)}))}function _(e){void 0===e&&(e={});var n=e,i=n.defaultModifiers,r=void 0===i?[]:i,o=n.defaultOptions,a=void 0===o?q:o;return function(e,n,i){void 0===i&&(i=a);var o,s,c={placement:"bottom",orderedModifiers:[],options:Object.assign({},q,a),modifiersData:{},elements:{reference:e,popper:n},attributes:{},styles:{}},l=[],d=!1,p={state:c,setOptions:function(i){var o="function"==typeof i?i(c.options):i;u(),c.options=Object.assign({},a,c.options,o),c.scrollParents={reference:t(e)?x(e):e.contextElement?x(e.contextElement):[],popper:x(n)};var s,d,f=function(e){var t=W(e);return F.reduce((function(e,n){return e.concat(t.filter((function(e){return e.phase===n})))}),[])}((s=[].concat(r,c.options.modifiers),d=s.reduce((function(e,t){var n=e[t.name];return e[t.name]=n?Object.assign({},n,t,{options:Object.assign({},n.options,t.options),data:Object.assign({},n.data,t.data)}):t,e}),{}),Object.keys(d).map((function(e){return d[e]}))));return c.orderedModifiers=f.filter((function(e){return e.enabled})),c.orderedModifiers.forEach((function(e){var t=e.name,n=e.options,i=void 0===n?{}:n,r=e.effect;if("function"==typeof r){var o=r({state:c,name:t,instance:p,options:i});l.push(o||function(){})}})),p.update()},forceUpdate:function(){if(!d){var e=c.elements,t=e.reference,n=e.popper;if(B(t,n)){c.rects={reference:w(t,T(n),"fixed"===c.options.strategy),popper:y(n)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach((function(e){return c.modifiersData[e.name]=Object.assign({},e.data)}));for(var i=0;i<c.orderedModifiers.length;i++)if(!0!==c.reset){var r=c.orderedModifiers[i],o=r.fn,a=r.options,s=void 0===a?{}:a,l=r.name;"function"==typeof o&&(c=o({state:c,options:s,name:l,instance:p})||c)}else c.reset=!1,i=-1}}},update:(o=function(){return new Promise((function(e){p.forceUpdate(),e(c)}))},function(){return s||(s=new Promise((function(e){Promise.resolve().then((function(){s=void 0,e(o())}))}))),s}),destroy:function(){u(),d=!0}};if(!B(e,n))return p;function u(){l.forEach((function(e){return e()})),l=[]}return p.setOptions(i).then((function(e){!d&&i.onFirstUpdate&&i.onFirstUpdate(e)})),p}}var V={passive:!0};const $={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(t){var n=t.state,i=t.instance,r=t.options,o=r.scroll,a=void 0===o||o,s=r.resize,c=void 0===s||s,l=e(n.elements.popper),d=[].concat(n.scrollParents.reference,n.scrollParents.popper);return a&&d.forEach((function(e){e.addEventListener("scroll",i.update,V)})),c&&l.addEventListener("resize",i.update,V),function(){a&&d.forEach((function(e){e.removeEventListener("scroll",i.update,V)})),c&&l.removeEventListener("resize",i.update,V)}},data:{}};function U(e){return e.split("-")[0]}function z(e){return e.split("-")[1]}function X(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function Y(e){var t,n=e.reference,i=e.element,r=e.placement,o=r?U(r):null,a=r?z(r):null,s=n.x+n.width/2-i.width/2,c=n.y+n.height/2-i.height/2;switch(o){case A:t={x:s,y:n.y-i.height};break;case S:t={x:s,y:n.y+n.height};break;case C:t={x:n.x+n.width,y:c};break;case D:t={x:n.x-i.width,y:c};break;default:t={x:n.x,y:n.y}}var l=o?X(o):null;if(null!=l){var d="y"===l?"height":"width";switch(a){case k:t[l]=t[l]-(n[d]/2-i[d]/2);break;case R:t[l]=t[l]+(n[d]/2-i[d]/2)}}return t}var J={top:"auto",right:"auto",bottom:"auto",left:"auto"};function G(t){var n,i=t.popper,r=t.popperRect,o=t.placement,a=t.variation,s=t.offsets,l=t.position,d=t.gpuAcceleration,p=t.adaptive,u=t.roundOffsets,f=t.isFixed,m=s.x,g=void 0===m?0:m,w=s.y,y=void 0===w?0:w,b="function"==typeof u?u({x:g,y}):{x:g,y};g=b.x,y=b.y;var E=s.hasOwnProperty("x"),x=s.hasOwnProperty("y"),O=D,L=A,M=window;if(p){var I=T(i),k="clientHeight",P="clientWidth";I===e(i)&&"static"!==v(I=h(i)).position&&"absolute"===l&&(k="scrollHeight",P="scrollWidth"),(o===A||(o===D||o===C)&&a===R)&&(L=S,y-=(f&&I===M&&M.visualViewport?M.visualViewport.height:I[k])-r.height,y*=d?1:-1),o!==D&&(o!==A&&o!==S||a!==R)||(O=C,g-=(f&&I===M&&M.visualViewport?M.visualViewport.width:I[P])-r.width,g*=d?1:-1)}var j,H=Object.assign({position:l},p&&J),N=!0===u?function(e,t){var n=e.x,i=e.y,r=t.devicePixelRatio||1;return{x:c(n*r)/r||0,y:c(i*r)/r||0}}({x:g,y},e(i)):{x:g,y};return g=N.x,y=N.y,d?Object.assign({},H,((j={})[L]=x?"0":"",j[O]=E?"0":"",j.transform=(M.devicePixelRatio||1)<=1?"translate("+g+"px, "+y+"px)":"translate3d("+g+"px, "+y+"px, 0)",j)):Object.assign({},H,((n={})[L]=x?y+"px":"",n[O]=E?g+"px":"",n.transform="",n))}const K={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(e){var t=e.state,n=e.options,i=n.gpuAcceleration,r=void 0===i||i,o=n.adaptive,a=void 0===o||o,s=n.roundOffsets,c=void 0===s||s,l={placement:U(t.placement),variation:z(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:r,isFixed:"fixed"===t.options.strategy};null!=t.modifiersData.popperOffsets&&(t.styles.popper=Object.assign({},t.styles.popper,G(Object.assign({},l,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:a,roundOffsets:c})))),null!=t.modifiersData.arrow&&(t.styles.arrow=Object.assign({},t.styles.arrow,G(Object.assign({},l,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:c})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})},data:{}},Q={name:"applyStyles",enabled:!0,phase:"write",fn:function(e){var t=e.state;Object.keys(t.elements).forEach((function(e){var n=t.styles[e]||{},i=t.attributes[e]||{},o=t.elements[e];r(o)&&f(o)&&(Object.assign(o.style,n),Object.keys(i).forEach((function(e){var t=i[e];!1===t?o.removeAttribute(e):o.setAttribute(e,!0===t?"":t)})))}))},effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach((function(e){var i=t.elements[e],o=t.attributes[e]||{},a=Object.keys(t.styles.hasOwnProperty(e)?t.styles[e]:n[e]).reduce((function(e,t){return e[t]="",e}),{});r(i)&&f(i)&&(Object.assign(i.style,a),Object.keys(o).forEach((function(e){i.removeAttribute(e)})))}))}},requires:["computeStyles"]},Z={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(e){var t=e.state,n=e.options,i=e.name,r=n.offset,o=void 0===r?[0,0]:r,a=N.reduce((function(e,n){return e[n]=function(e,t,n){var i=U(e),r=[D,A].indexOf(i)>=0?-1:1,o="function"==typeof n?n(Object.assign({},t,{placement:e})):n,a=o[0],s=o[1];return a=a||0,s=(s||0)*r,[D,C].indexOf(i)>=0?{x:s,y:a}:{x:a,y:s}}(n,t.rects,o),e}),{}),s=a[t.placement],c=s.x,l=s.y;null!=t.modifiersData.popperOffsets&&(t.modifiersData.popperOffsets.x+=c,t.modifiersData.popperOffsets.y+=l),t.modifiersData[i]=a}};var ee={left:"right",right:"left",bottom:"top",top:"bottom"};function te(e){return e.replace(/left|right|bottom|top/g,(function(e){return ee[e]}))}var ne={start:"end",end:"start"};function ie(e){return e.replace(/start|end/g,(function(e){return ne[e]}))}function re(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&o(n)){var i=t;do{if(i&&e.isSameNode(i))return!0;i=i.parentNode||i.host}while(i)}return!1}function oe(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function ae(n,i,r){return i===P?oe(function(t,n){var i=e(t),r=h(t),o=i.visualViewport,a=r.clientWidth,s=r.clientHeight,c=0,l=0;if(o){a=o.width,s=o.height;var p=d();(p||!p&&"fixed"===n)&&(c=o.offsetLeft,l=o.offsetTop)}return{width:a,height:s,x:c+m(t),y:l}}(n,r)):t(i)?function(e,t){var n=p(e,!1,"fixed"===t);return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}(i,r):oe(function(e){var t,n=h(e),i=u(e),r=null==(t=e.ownerDocument)?void 0:t.body,o=a(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),s=a(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),c=-i.scrollLeft+m(e),l=-i.scrollTop;return"rtl"===v(r||n).direction&&(c+=a(n.clientWidth,r?r.clientWidth:0)-o),{width:o,height:s,x:c,y:l}}(h(n)))}function se(e){return Object.assign({},{top:0,right:0,bottom:0,left:0},e)}function ce(e,t){return t.reduce((function(t,n){return t[n]=e,t}),{})}function le(e,n){void 0===n&&(n={});var i=n,o=i.placement,c=void 0===o?e.placement:o,l=i.strategy,d=void 0===l?e.strategy:l,u=i.boundary,m=void 0===u?"clippingParents":u,g=i.rootBoundary,w=void 0===g?P:g,y=i.elementContext,E=void 0===y?j:y,O=i.altBoundary,L=void 0!==O&&O,D=i.padding,M=void 0===D?0:D,k=se("number"!=typeof M?M:ce(M,I)),R=E===j?"reference":j,H=e.rects.popper,N=e.elements[L?R:E],F=function(e,n,i,o){var c="clippingParents"===n?function(e){var n=x(b(e)),i=["absolute","fixed"].indexOf(v(e).position)>=0&&r(e)?T(e):e;return t(i)?n.filter((function(e){return t(e)&&re(e,i)&&"body"!==f(e)})):[]}(e):[].concat(n),l=[].concat(c,[i]),d=l[0],p=l.reduce((function(t,n){var i=ae(e,n,o);return t.top=a(i.top,t.top),t.right=s(i.right,t.right),t.bottom=s(i.bottom,t.bottom),t.left=a(i.left,t.left),t}),ae(e,d,o));return p.width=p.right-p.left,p.height=p.bottom-p.top,p.x=p.left,p.y=p.top,p}(t(N)?N:N.contextElement||h(e.elements.popper),m,w,d),W=p(e.elements.reference),q=Y({reference:W,element:H,strategy:"absolute",placement:c}),B=oe(Object.assign({},H,q)),_=E===j?B:W,V={top:F.top-_.top+k.top,bottom:_.bottom-F.bottom+k.bottom,left:F.left-_.left+k.left,right:_.right-F.right+k.right},$=e.modifiersData.offset;if(E===j&&$){var U=$[c];Object.keys(V).forEach((function(e){var t=[C,S].indexOf(e)>=0?1:-1,n=[A,S].indexOf(e)>=0?"y":"x";V[e]+=U[n]*t}))}return V}const de={name:"flip",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,i=e.name;if(!t.modifiersData[i]._skip){for(var r=n.mainAxis,o=void 0===r||r,a=n.altAxis,s=void 0===a||a,c=n.fallbackPlacements,l=n.padding,d=n.boundary,p=n.rootBoundary,u=n.altBoundary,f=n.flipVariations,h=void 0===f||f,m=n.allowedAutoPlacements,v=t.options.placement,g=U(v),w=c||(g!==v&&h?function(e){if(U(e)===M)return[];var t=te(e);return[ie(e),t,ie(t)]}(v):[te(v)]),y=[v].concat(w).reduce((function(e,n){return e.concat(U(n)===M?function(e,t){void 0===t&&(t={});var n=t,i=n.placement,r=n.boundary,o=n.rootBoundary,a=n.padding,s=n.flipVariations,c=n.allowedAutoPlacements,l=void 0===c?N:c,d=z(i),p=d?s?H:H.filter((function(e){return z(e)===d})):I,u=p.filter((function(e){return l.indexOf(e)>=0}));0===u.length&&(u=p);var f=u.reduce((function(t,n){return t[n]=le(e,{placement:n,boundary:r,rootBoundary:o,padding:a})[U(n)],t}),{});return Object.keys(f).sort((function(e,t){return f[e]-f[t]}))}(t,{placement:n,boundary:d,rootBoundary:p,padding:l,flipVariations:h,allowedAutoPlacements:m}):n)}),[]),b=t.rects.reference,E=t.rects.popper,x=new Map,O=!0,L=y[0],T=0;T<y.length;T++){var R=y[T],P=U(R),j=z(R)===k,F=[A,S].indexOf(P)>=0,W=F?"width":"height",q=le(t,{placement:R,boundary:d,rootBoundary:p,altBoundary:u,padding:l}),B=F?j?C:D:j?S:A;b[W]>E[W]&&(B=te(B));var _=te(B),V=[];if(o&&V.push(q[P]<=0),s&&V.push(q[B]<=0,q[_]<=0),V.every((function(e){return e}))){L=R,O=!1;break}x.set(R,V)}if(O)for(var $=function(e){var t=y.find((function(t){var n=x.get(t);if(n)return n.slice(0,e).every((function(e){return e}))}));if(t)return L=t,"break"},X=h?3:1;X>0&&"break"!==$(X);X--);t.placement!==L&&(t.modifiersData[i]._skip=!0,t.placement=L,t.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}};function pe(e,t,n){return a(e,s(t,n))}const ue={name:"preventOverflow",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,i=e.name,r=n.mainAxis,o=void 0===r||r,c=n.altAxis,l=void 0!==c&&c,d=n.boundary,p=n.rootBoundary,u=n.altBoundary,f=n.padding,h=n.tether,m=void 0===h||h,v=n.tetherOffset,g=void 0===v?0:v,w=le(t,{boundary:d,rootBoundary:p,padding:f,altBoundary:u}),b=U(t.placement),E=z(t.placement),x=!E,O=X(b),L="x"===O?"y":"x",M=t.modifiersData.popperOffsets,I=t.rects.reference,R=t.rects.popper,P="function"==typeof g?g(Object.assign({},t.rects,{placement:t.placement})):g,j="number"==typeof P?{mainAxis:P,altAxis:P}:Object.assign({mainAxis:0,altAxis:0},P),H=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,N={x:0,y:0};if(M){if(o){var F,W="y"===O?A:D,q="y"===O?S:C,B="y"===O?"height":"width",_=M[O],V=_+w[W],$=_-w[q],Y=m?-R[B]/2:0,J=E===k?I[B]:R[B],G=E===k?-R[B]:-I[B],K=t.elements.arrow,Q=m&&K?y(K):{width:0,height:0},Z=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},ee=Z[W],te=Z[q],ne=pe(0,I[B],Q[B]),ie=x?I[B]/2-Y-ne-ee-j.mainAxis:J-ne-ee-j.mainAxis,re=x?-I[B]/2+Y+ne+te+j.mainAxis:G+ne+te+j.mainAxis,oe=t.elements.arrow&&T(t.elements.arrow),ae=oe?"y"===O?oe.clientTop||0:oe.clientLeft||0:0,se=null!=(F=null==H?void 0:H[O])?F:0,ce=_+re-se,de=pe(m?s(V,_+ie-se-ae):V,_,m?a($,ce):$);M[O]=de,N[O]=de-_}if(l){var ue,fe="x"===O?A:D,he="x"===O?S:C,me=M[L],ve="y"===L?"height":"width",ge=me+w[fe],we=me-w[he],ye=-1!==[A,D].indexOf(b),be=null!=(ue=null==H?void 0:H[L])?ue:0,Ee=ye?ge:me-I[ve]-R[ve]-be+j.altAxis,xe=ye?me+I[ve]+R[ve]-be-j.altAxis:we,Oe=m&&ye?function(e,t,n){var i=pe(e,t,n);return i>n?n:i}(Ee,me,xe):pe(m?Ee:ge,me,m?xe:we);M[L]=Oe,N[L]=Oe-me}t.modifiersData[i]=N}},requiresIfExists:["offset"]},fe={name:"arrow",enabled:!0,phase:"main",fn:function(e){var t,n=e.state,i=e.name,r=e.options,o=n.elements.arrow,a=n.modifiersData.popperOffsets,s=U(n.placement),c=X(s),l=[D,C].indexOf(s)>=0?"height":"width";if(o&&a){var d=function(e,t){return se("number"!=typeof(e="function"==typeof e?e(Object.assign({},t.rects,{placement:t.placement})):e)?e:ce(e,I))}(r.padding,n),p=y(o),u="y"===c?A:D,f="y"===c?S:C,h=n.rects.reference[l]+n.rects.reference[c]-a[c]-n.rects.popper[l],m=a[c]-n.rects.reference[c],v=T(o),g=v?"y"===c?v.clientHeight||0:v.clientWidth||0:0,w=h/2-m/2,b=d[u],E=g-p[l]-d[f],x=g/2-p[l]/2+w,O=pe(b,x,E),L=c;n.modifiersData[i]=((t={})[L]=O,t.centerOffset=O-x,t)}},effect:function(e){var t=e.state,n=e.options.element,i=void 0===n?"[data-popper-arrow]":n;null!=i&&("string"!=typeof i||(i=t.elements.popper.querySelector(i)))&&re(t.elements.popper,i)&&(t.elements.arrow=i)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function he(e,t,n){return void 0===n&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function me(e){return[A,C,S,D].some((function(t){return e[t]>=0}))}var ve=_({defaultModifiers:[$,{name:"popperOffsets",enabled:!0,phase:"read",fn:function(e){var t=e.state,n=e.name;t.modifiersData[n]=Y({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})},data:{}},K,Q,Z,de,ue,fe,{name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(e){var t=e.state,n=e.name,i=t.rects.reference,r=t.rects.popper,o=t.modifiersData.preventOverflow,a=le(t,{elementContext:"reference"}),s=le(t,{altBoundary:!0}),c=he(a,i),l=he(s,r,o),d=me(c),p=me(l);t.modifiersData[n]={referenceClippingOffsets:c,popperEscapeOffsets:l,isReferenceHidden:d,hasPopperEscaped:p},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":d,"data-popper-escaped":p})}}]}),ge="tippy-content",we="tippy-backdrop",ye="tippy-arrow",be="tippy-svg-arrow",Ee={passive:!0,capture:!0},xe=function(){return document.body};function Oe(e,t,n){if(Array.isArray(e)){var i=e[t];return null==i?Array.isArray(n)?n[t]:n:i}return e}function Le(e,t){var n={}.toString.call(e);return 0===n.indexOf("[object")&&n.indexOf(t+"]")>-1}function Te(e,t){return"function"==typeof e?e.apply(void 0,t):e}function Ae(e,t){return 0===t?e:function(i){clearTimeout(n),n=setTimeout((function(){e(i)}),t)};var n}function Se(e){return[].concat(e)}function Ce(e,t){-1===e.indexOf(t)&&e.push(t)}function De(e){return[].slice.call(e)}function Me(e){return Object.keys(e).reduce((function(t,n){return void 0!==e[n]&&(t[n]=e[n]),t}),{})}function Ie(){return document.createElement("div")}function ke(e){return["Element","Fragment"].some((function(t){return Le(e,t)}))}function Re(e,t){e.forEach((function(e){e&&(e.style.transitionDuration=t+"ms")}))}function Pe(e,t){e.forEach((function(e){e&&e.setAttribute("data-state",t)}))}function je(e,t,n){var i=t+"EventListener";["transitionend","webkitTransitionEnd"].forEach((function(t){e[i](t,n)}))}function He(e,t){for(var n=t;n;){var i;if(e.contains(n))return!0;n=null==n.getRootNode||null==(i=n.getRootNode())?void 0:i.host}return!1}var Ne={isTouch:!1},Fe=0;function We(){Ne.isTouch||(Ne.isTouch=!0,window.performance&&document.addEventListener("mousemove",qe))}function qe(){var e=performance.now();e-Fe<20&&(Ne.isTouch=!1,document.removeEventListener("mousemove",qe)),Fe=e}function Be(){var e,t=document.activeElement;if((e=t)&&e._tippy&&e._tippy.reference===e){var n=t._tippy;t.blur&&!n.state.isVisible&&t.blur()}}var _e=!("undefined"==typeof window||"undefined"==typeof document||!window.msCrypto),Ve=Object.assign({appendTo:xe,aria:{content:"auto",expanded:"auto"},delay:0,duration:[300,250],getReferenceClientRect:null,hideOnClick:!0,ignoreAttributes:!1,interactive:!1,interactiveBorder:2,interactiveDebounce:0,moveTransition:"",offset:[0,10],onAfterUpdate:function(){},onBeforeUpdate:function(){},onCreate:function(){},onDestroy:function(){},onHidden:function(){},onHide:function(){},onMount:function(){},onShow:function(){},onShown:function(){},onTrigger:function(){},onUntrigger:function(){},onClickOutside:function(){},placement:"top",plugins:[],popperOptions:{},render:null,showOnCreate:!1,touch:!0,trigger:"mouseenter focus",triggerTarget:null},{animateFill:!1,followCursor:!1,inlinePositioning:!1,sticky:!1},{allowHTML:!1,animation:"fade",arrow:!0,content:"",inertia:!1,maxWidth:350,role:"tooltip",theme:"",zIndex:9999}),$e=Object.keys(Ve);function Ue(e){var t=(e.plugins||[]).reduce((function(t,n){var i,r=n.name,o=n.defaultValue;return r&&(t[r]=void 0!==e[r]?e[r]:null!=(i=Ve[r])?i:o),t}),{});return Object.assign({},e,t)}function ze(e,t){var n=Object.assign({},t,{content:Te(t.content,[e])},t.ignoreAttributes?{}:function(e,t){return(t?Object.keys(Ue(Object.assign({},Ve,{plugins:t}))):$e).reduce((function(t,n){var i=(e.getAttribute("data-tippy-"+n)||"").trim();if(!i)return t;if("content"===n)t[n]=i;else try{t[n]=JSON.parse(i)}catch(e){t[n]=i}return t}),{})}(e,t.plugins));return n.aria=Object.assign({},Ve.aria,n.aria),n.aria={expanded:"auto"===n.aria.expanded?t.interactive:n.aria.expanded,content:"auto"===n.aria.content?t.interactive?null:"describedby":n.aria.content},n}var Xe=function(){return"innerHTML"};function Ye(e,t){e[Xe()]=t}function Je(e){var t=Ie();return!0===e?t.className=ye:(t.className=be,ke(e)?t.appendChild(e):Ye(t,e)),t}function Ge(e,t){ke(t.content)?(Ye(e,""),e.appendChild(t.content)):"function"!=typeof t.content&&(t.allowHTML?Ye(e,t.content):e.textContent=t.content)}function Ke(e){var t=e.firstElementChild,n=De(t.children);return{box:t,content:n.find((function(e){return e.classList.contains(ge)})),arrow:n.find((function(e){return e.classList.contains(ye)||e.classList.contains(be)})),backdrop:n.find((function(e){return e.classList.contains(we)}))}}function Qe(e){var t=Ie(),n=Ie();n.className="tippy-box",n.setAttribute("data-state","hidden"),n.setAttribute("tabindex","-1");var i=Ie();function r(n,i){var r=Ke(t),o=r.box,a=r.content,s=r.arrow;i.theme?o.setAttribute("data-theme",i.theme):o.removeAttribute("data-theme"),"string"==typeof i.animation?o.setAttribute("data-animation",i.animation):o.removeAttribute("data-animation"),i.inertia?o.setAttribute("data-inertia",""):o.removeAttribute("data-inertia"),o.style.maxWidth="number"==typeof i.maxWidth?i.maxWidth+"px":i.maxWidth,i.role?o.setAttribute("role",i.role):o.removeAttribute("role"),n.content===i.content&&n.allowHTML===i.allowHTML||Ge(a,e.props),i.arrow?s?n.arrow!==i.arrow&&(o.removeChild(s),o.appendChild(Je(i.arrow))):o.appendChild(Je(i.arrow)):s&&o.removeChild(s)}return i.className=ge,i.setAttribute("data-state","hidden"),Ge(i,e.props),t.appendChild(n),n.appendChild(i),r(e.props,e.props),{popper:t,onUpdate:r}}Qe.$$tippy=!0;var Ze=1,et=[],tt=[];function nt(e,t){var n,i,r,o,a,s,c,l,d=ze(e,Object.assign({},Ve,Ue(Me(t)))),p=!1,u=!1,f=!1,h=!1,m=[],v=Ae(X,d.interactiveDebounce),g=Ze++,w=(l=d.plugins).filter((function(e,t){return l.indexOf(e)===t})),y={id:g,reference:e,popper:Ie(),popperInstance:null,props:d,state:{isEnabled:!0,isVisible:!1,isDestroyed:!1,isMounted:!1,isShown:!1},plugins:w,clearDelayTimeouts:function(){clearTimeout(n),clearTimeout(i),cancelAnimationFrame(r)},setProps:function(t){if(!y.state.isDestroyed){R("onBeforeUpdate",[y,t]),U();var n=y.props,i=ze(e,Object.assign({},n,Me(t),{ignoreAttributes:!0}));y.props=i,$(),n.interactiveDebounce!==i.interactiveDebounce&&(H(),v=Ae(X,i.interactiveDebounce)),n.triggerTarget&&!i.triggerTarget?Se(n.triggerTarget).forEach((function(e){e.removeAttribute("aria-expanded")})):i.triggerTarget&&e.removeAttribute("aria-expanded"),j(),k(),x&&x(n,i),y.popperInstance&&(K(),Z().forEach((function(e){requestAnimationFrame(e._tippy.popperInstance.forceUpdate)}))),R("onAfterUpdate",[y,t])}},setContent:function(e){y.setProps({content:e})},show:function(){var e=y.state.isVisible,t=y.state.isDestroyed,n=!y.state.isEnabled,i=Ne.isTouch&&!y.props.touch,r=Oe(y.props.duration,0,Ve.duration);if(!(e||t||n||i||C().hasAttribute("disabled")||(R("onShow",[y],!1),!1===y.props.onShow(y)))){if(y.state.isVisible=!0,S()&&(E.style.visibility="visible"),k(),q(),y.state.isMounted||(E.style.transition="none"),S()){var o=M();Re([o.box,o.content],0)}var a,c,l;s=function(){var e;if(y.state.isVisible&&!h){if(h=!0,E.offsetHeight,E.style.transition=y.props.moveTransition,S()&&y.props.animation){var t=M(),n=t.box,i=t.content;Re([n,i],r),Pe([n,i],"visible")}P(),j(),Ce(tt,y),null==(e=y.popperInstance)||e.forceUpdate(),R("onMount",[y]),y.props.animation&&S()&&function(e,t){_(e,(function(){y.state.isShown=!0,R("onShown",[y])}))}(r)}},c=y.props.appendTo,l=C(),(a=y.props.interactive&&c===xe||"parent"===c?l.parentNode:Te(c,[l])).contains(E)||a.appendChild(E),y.state.isMounted=!0,K()}},hide:function(){var e=!y.state.isVisible,t=y.state.isDestroyed,n=!y.state.isEnabled,i=Oe(y.props.duration,1,Ve.duration);if(!(e||t||n)&&(R("onHide",[y],!1),!1!==y.props.onHide(y))){if(y.state.isVisible=!1,y.state.isShown=!1,h=!1,p=!1,S()&&(E.style.visibility="hidden"),H(),B(),k(!0),S()){var r=M(),o=r.box,a=r.content;y.props.animation&&(Re([o,a],i),Pe([o,a],"hidden"))}P(),j(),y.props.animation?S()&&function(e,t){_(e,(function(){!y.state.isVisible&&E.parentNode&&E.parentNode.contains(E)&&t()}))}(i,y.unmount):y.unmount()}},hideWithInteractivity:function(e){D().addEventListener("mousemove",v),Ce(et,v),v(e)},enable:function(){y.state.isEnabled=!0},disable:function(){y.hide(),y.state.isEnabled=!1},unmount:function(){y.state.isVisible&&y.hide(),y.state.isMounted&&(Q(),Z().forEach((function(e){e._tippy.unmount()})),E.parentNode&&E.parentNode.removeChild(E),tt=tt.filter((function(e){return e!==y})),y.state.isMounted=!1,R("onHidden",[y]))},destroy:function(){y.state.isDestroyed||(y.clearDelayTimeouts(),y.unmount(),U(),delete e._tippy,y.state.isDestroyed=!0,R("onDestroy",[y]))}};if(!d.render)return y;var b=d.render(y),E=b.popper,x=b.onUpdate;E.setAttribute("data-tippy-root",""),E.id="tippy-"+y.id,y.popper=E,e._tippy=y,E._tippy=y;var O=w.map((function(e){return e.fn(y)})),L=e.hasAttribute("aria-expanded");return $(),j(),k(),R("onCreate",[y]),d.showOnCreate&&ee(),E.addEventListener("mouseenter",(function(){y.props.interactive&&y.state.isVisible&&y.clearDelayTimeouts()})),E.addEventListener("mouseleave",(function(){y.props.interactive&&y.props.trigger.indexOf("mouseenter")>=0&&D().addEventListener("mousemove",v)})),y;function T(){var e=y.props.touch;return Array.isArray(e)?e:[e,0]}function A(){return"hold"===T()[0]}function S(){var e;return!(null==(e=y.props.render)||!e.$$tippy)}function C(){return c||e}function D(){var e,t,n=C().parentNode;return n?null!=(t=Se(n)[0])&&null!=(e=t.ownerDocument)&&e.body?t.ownerDocument:document:document}function M(){return Ke(E)}function I(e){return y.state.isMounted&&!y.state.isVisible||Ne.isTouch||o&&"focus"===o.type?0:Oe(y.props.delay,e?0:1,Ve.delay)}function k(e){void 0===e&&(e=!1),E.style.pointerEvents=y.props.interactive&&!e?"":"none",E.style.zIndex=""+y.props.zIndex}function R(e,t,n){var i;void 0===n&&(n=!0),O.forEach((function(n){n[e]&&n[e].apply(n,t)})),n&&(i=y.props)[e].apply(i,t)}function P(){var t=y.props.aria;if(t.content){var n="aria-"+t.content,i=E.id;Se(y.props.triggerTarget||e).forEach((function(e){var t=e.getAttribute(n);if(y.state.isVisible)e.setAttribute(n,t?t+" "+i:i);else{var r=t&&t.replace(i,"").trim();r?e.setAttribute(n,r):e.removeAttribute(n)}}))}}function j(){!L&&y.props.aria.expanded&&Se(y.props.triggerTarget||e).forEach((function(e){y.props.interactive?e.setAttribute("aria-expanded",y.state.isVisible&&e===C()?"true":"false"):e.removeAttribute("aria-expanded")}))}function H(){D().removeEventListener("mousemove",v),et=et.filter((function(e){return e!==v}))}function N(t){if(!Ne.isTouch||!f&&"mousedown"!==t.type){var n=t.composedPath&&t.composedPath()[0]||t.target;if(!y.props.interactive||!He(E,n)){if(Se(y.props.triggerTarget||e).some((function(e){return He(e,n)}))){if(Ne.isTouch)return;if(y.state.isVisible&&y.props.trigger.indexOf("click")>=0)return}else R("onClickOutside",[y,t]);!0===y.props.hideOnClick&&(y.clearDelayTimeouts(),y.hide(),u=!0,setTimeout((function(){u=!1})),y.state.isMounted||B())}}}function F(){f=!0}function W(){f=!1}function q(){var e=D();e.addEventListener("mousedown",N,!0),e.addEventListener("touchend",N,Ee),e.addEventListener("touchstart",W,Ee),e.addEventListener("touchmove",F,Ee)}function B(){var e=D();e.removeEventListener("mousedown",N,!0),e.removeEventListener("touchend",N,Ee),e.removeEventListener("touchstart",W,Ee),e.removeEventListener("touchmove",F,Ee)}function _(e,t){var n=M().box;function i(e){e.target===n&&(je(n,"remove",i),t())}if(0===e)return t();je(n,"remove",a),je(n,"add",i),a=i}function V(t,n,i){void 0===i&&(i=!1),Se(y.props.triggerTarget||e).forEach((function(e){e.addEventListener(t,n,i),m.push({node:e,eventType:t,handler:n,options:i})}))}function $(){var e;A()&&(V("touchstart",z,{passive:!0}),V("touchend",Y,{passive:!0})),(e=y.props.trigger,e.split(/\s+/).filter(Boolean)).forEach((function(e){if("manual"!==e)switch(V(e,z),e){case"mouseenter":V("mouseleave",Y);break;case"focus":V(_e?"focusout":"blur",J);break;case"focusin":V("focusout",J)}}))}function U(){m.forEach((function(e){var t=e.node,n=e.eventType,i=e.handler,r=e.options;t.removeEventListener(n,i,r)})),m=[]}function z(e){var t,n=!1;if(y.state.isEnabled&&!G(e)&&!u){var i="focus"===(null==(t=o)?void 0:t.type);o=e,c=e.currentTarget,j(),!y.state.isVisible&&Le(e,"MouseEvent")&&et.forEach((function(t){return t(e)})),"click"===e.type&&(y.props.trigger.indexOf("mouseenter")<0||p)&&!1!==y.props.hideOnClick&&y.state.isVisible?n=!0:ee(e),"click"===e.type&&(p=!n),n&&!i&&te(e)}}function X(e){var t=e.target,n=C().contains(t)||E.contains(t);if("mousemove"!==e.type||!n){var i=Z().concat(E).map((function(e){var t,n=null==(t=e._tippy.popperInstance)?void 0:t.state;return n?{popperRect:e.getBoundingClientRect(),popperState:n,props:d}:null})).filter(Boolean);(function(e,t){var n=t.clientX,i=t.clientY;return e.every((function(e){var t=e.popperRect,r=e.popperState,o=e.props.interactiveBorder,a=r.placement.split("-")[0],s=r.modifiersData.offset;if(!s)return!0;var c="bottom"===a?s.top.y:0,l="top"===a?s.bottom.y:0,d="right"===a?s.left.x:0,p="left"===a?s.right.x:0,u=t.top-i+c>o,f=i-t.bottom-l>o,h=t.left-n+d>o,m=n-t.right-p>o;return u||f||h||m}))})(i,e)&&(H(),te(e))}}function Y(e){G(e)||y.props.trigger.indexOf("click")>=0&&p||(y.props.interactive?y.hideWithInteractivity(e):te(e))}function J(e){y.props.trigger.indexOf("focusin")<0&&e.target!==C()||y.props.interactive&&e.relatedTarget&&E.contains(e.relatedTarget)||te(e)}function G(e){return!!Ne.isTouch&&A()!==e.type.indexOf("touch")>=0}function K(){Q();var t=y.props,n=t.popperOptions,i=t.placement,r=t.offset,o=t.getReferenceClientRect,a=t.moveTransition,c=S()?Ke(E).arrow:null,l=o?{getBoundingClientRect:o,contextElement:o.contextElement||C()}:e,d=[{name:"offset",options:{offset:r}},{name:"preventOverflow",options:{padding:{top:2,bottom:2,left:5,right:5}}},{name:"flip",options:{padding:5}},{name:"computeStyles",options:{adaptive:!a}},{name:"$$tippy",enabled:!0,phase:"beforeWrite",requires:["computeStyles"],fn:function(e){var t=e.state;if(S()){var n=M().box;["placement","reference-hidden","escaped"].forEach((function(e){"placement"===e?n.setAttribute("data-placement",t.placement):t.attributes.popper["data-popper-"+e]?n.setAttribute("data-"+e,""):n.removeAttribute("data-"+e)})),t.attributes.popper={}}}}];S()&&c&&d.push({name:"arrow",options:{element:c,padding:3}}),d.push.apply(d,(null==n?void 0:n.modifiers)||[]),y.popperInstance=ve(l,E,Object.assign({},n,{placement:i,onFirstUpdate:s,modifiers:d}))}function Q(){y.popperInstance&&(y.popperInstance.destroy(),y.popperInstance=null)}function Z(){return De(E.querySelectorAll("[data-tippy-root]"))}function ee(e){y.clearDelayTimeouts(),e&&R("onTrigger",[y,e]),q();var t=I(!0),i=T(),r=i[0],o=i[1];Ne.isTouch&&"hold"===r&&o&&(t=o),t?n=setTimeout((function(){y.show()}),t):y.show()}function te(e){if(y.clearDelayTimeouts(),R("onUntrigger",[y,e]),y.state.isVisible){if(!(y.props.trigger.indexOf("mouseenter")>=0&&y.props.trigger.indexOf("click")>=0&&["mouseleave","mousemove"].indexOf(e.type)>=0&&p)){var t=I(!1);t?i=setTimeout((function(){y.state.isVisible&&y.hide()}),t):r=requestAnimationFrame((function(){y.hide()}))}}else B()}}function it(e,t){void 0===t&&(t={});var n=Ve.plugins.concat(t.plugins||[]);document.addEventListener("touchstart",We,Ee),window.addEventListener("blur",Be);var i,r=Object.assign({},t,{plugins:n}),o=(i=e,ke(i)?[i]:function(e){return Le(e,"NodeList")}(i)?De(i):Array.isArray(i)?i:De(document.querySelectorAll(i))).reduce((function(e,t){var n=t&&nt(t,r);return n&&e.push(n),e}),[]);return ke(e)?o[0]:o}it.defaultProps=Ve,it.setDefaultProps=function(e){Object.keys(e).forEach((function(t){Ve[t]=e[t]}))},it.currentInput=Ne,Object.assign({},Q,{effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow)}}),it.setDefaultProps({render:Qe});const rt=it;var ot=n(72),at=n.n(ot),st=n(825),ct=n.n(st),lt=n(659),dt=n.n(lt),pt=n(56),ut=n.n(pt),ft=n(540),ht=n.n(ft),mt=n(113),vt=n.n(mt),gt=n(2),wt={};wt.styleTagTransform=vt(),wt.setAttributes=ut(),wt.insert=dt().bind(null,"head"),wt.domAPI=ct(),wt.insertStyleElement=ht(),at()(gt.A,wt),gt.A&&gt.A.locals&&gt.A.locals;class yt{constructor(e){this.element=e,this.tooltipConfig=this.makeConfig(),this.init()}init(){rt(this.element,this.tooltipConfig)}makeConfig(){const e={content:this.element.getAttribute("title")};for(let t=0;t<this.element.attributes.length;t++){const n=this.element.attributes[t];n.name.startsWith("data-tooltip-")&&(e[n.name.replace("data-tooltip-","")]=n.value)}return this.tooltipConfig=e,e}}function bt(e){const t=e.dataset.feditConstructor;if(t)return window.wagtailFedit.editors[t];throw new Error("No editor class found for element")}function Et(e=document){let t;t=e instanceof HTMLElement&&e.classList.contains("wagtail-fedit-adapter-wrapper")&&!e.classList.contains("wagtail-fedit-initialized")?[e]:e.querySelectorAll(".wagtail-fedit-adapter-wrapper");for(let n=0;n<t.length;n++){const i=t[n];if(!i.classList.contains("wagtail-fedit-initialized")){i.classList.add("wagtail-fedit-initialized");const e=bt(i);e?new e(i):console.error("No editor class found for element",i)}const r=e.querySelectorAll("[data-tooltip='true']");for(let e=0;e<r.length;e++){const t=r[e];"true"==t.dataset.tooltip&&(new yt(t),delete t.dataset.tooltip)}}}function xt(){let e=window.location.href,t=window.scrollY,n=window.scrollX,i=new URL(e);i.searchParams.set("scrollY",`${t}`),i.searchParams.set("scrollX",`${n}`),window.location.href=i.toString()}function Ot(e){if(!e)return;const t=new URL(e.href);window.scrollY>100&&t.searchParams.set("scrollY",`${window.scrollY}`),window.scrollX>100&&t.searchParams.set("scrollX",`${window.scrollX}`),e.href=t.toString()}class Lt{constructor(e){this.editor=e}openEditor(){this.editor.openEditor()}closeEditor(){this.editor.closeEditor()}executeEvent(e,t){this.editor.executeEvent(e,t)}addEventListener(e,t){this.editor.addEventListener(e,t)}removeEventListener(e,t,n){this.editor.removeEventListener(e,t,n)}updateHtml(e){return new Promise(((t,n)=>{const i=e=>{const n=this.editor.wrapperElement,i=document.createElement("div");i.innerHTML=e;const r=i.firstElementChild;return r.classList.add("wagtail-fedit-initialized"),n.parentNode.insertBefore(r,n),n.parentNode.removeChild(n),this.editor.wrapperElement=r,this.editor.initNewEditors(),this.editor.init(),t(r),n};if("string"!=typeof e)return"function"==typeof e?(this.editor.wrapperElement.editorAPI=this,void e(i)):void 0;i(e)}))}fetch(e,t,n){return i=this,r=void 0,a=function*(){let i=new Headers;return i.append("X-Requested-With","XMLHttpRequest"),i.append("X-CSRFToken",function(e){let t=null;if(document.cookie&&""!==document.cookie){const n=document.cookie.split(";");for(let i=0;i<n.length;i++){const r=n[i].trim();if(r.substring(0,10)===e+"="){t=decodeURIComponent(r.substring(10));break}}}return t}("csrftoken")),n instanceof FormData||(n=JSON.stringify(n)),fetch(e,{method:t,headers:i,body:n}).then((e=>e.json()))},new((o=void 0)||(o=Promise))((function(e,t){function n(e){try{c(a.next(e))}catch(e){t(e)}}function s(e){try{c(a.throw(e))}catch(e){t(e)}}function c(t){var i;t.done?e(t.value):(i=t.value,i instanceof o?i:new o((function(e){e(i)}))).then(n,s)}c((a=a.apply(i,r||[])).next())}));var i,r,o,a}refetch(){return this.editor.refetch()}execRelated(e){for(const t of this.editor.relatedWrappers)e(t.editorAPI)}}const Tt="wagtail-fedit-modal",At=`\n<div class="${Tt}-wrapper">\n    <div class="${Tt}" id="${Tt}-__ID__-modal">\n    </div>\n</div>`;class St{constructor(e){this.options=e,this.modalHtml=At.replace("__ID__",this.options.modalId)}static get modalWrapper(){var e=document.querySelector(`#${Tt}-wrapper`);return e||((e=document.createElement("div")).id=`${Tt}-wrapper`,e.classList.add(`${Tt}-wrapper`),document.body.appendChild(e),e)}get wrapper(){return this.constructor.modalWrapper}get modal(){var e=this.wrapper.querySelector(`.${Tt}`);e&&e.id!==`${Tt}-${this.options.modalId}-modal`&&(e.remove(),e=null),e||(e=this.buildModal());var t=e;return t.modal=this,t}get innerHTML(){return this.modal.innerHTML}set innerHTML(e){this.modal.innerHTML=e}get style(){return this.modal.style}get classList(){return this.modal.classList}get children(){return this.modal.children}buildModal(){var e=this.wrapper,t=e.querySelector(`.${Tt}`);return t||(e.innerHTML=this.modalHtml,t=e.querySelector(`.${Tt}`)),t.modal||(t.modal=this),t}addClass(e){this.modal.classList.add(e)}removeClass(e){this.modal.classList.remove(e)}openModal(){this.wrapper.classList.add("open"),this.options.onOpen&&this.options.onOpen()}closeModal(){this.wrapper.classList.remove("open"),this.wrapper.innerHTML="",this.options.onClose&&this.options.onClose()}destroy(){this.wrapper.remove(),this.options.onDestroy&&this.options.onDestroy()}appendChild(...e){if(0!==e.length)for(let t=0;t<e.length;t++)this.modal.appendChild(e[t])}removeChild(e){this.modal.removeChild(e)}dispatchEvent(e,t){t||(t={}),t.modal=this.modal;const n=new CustomEvent(e,{detail:t});this.modal.dispatchEvent(n)}addEventListener(e,t){this.modal.addEventListener(e,t)}removeEventListener(e,t){this.modal.removeEventListener(e,t)}}class Ct{constructor(e){this.executeOnloadImmediately=!1,this.url=e.url,this.srcdoc=e.srcdoc,this.iframe=null,this.id=e.id,this.className=e.className,this.onResize=e.onResize,this.executeOnloadImmediately=e.executeOnloadImmediately,this.onLoad=e.onLoad,this.onError=e.onError,this.onCancel=e.onCancel,this.render()}get element(){return this.iframe||(this.iframe=this._renderFrame(this.url,this.srcdoc,this.onLoad)),this.iframe}get document(){return this.window?this.window.document:null}get window(){var e;return null===(e=this.element)||void 0===e?void 0:e.contentWindow}get mainElement(){var e;return null===(e=this.document)||void 0===e?void 0:e.querySelector("#main")}get scrollableElement(){return this.document.body}destroy(){this.iframe.remove(),this.resizeInterval&&(clearInterval(this.resizeInterval),delete this.resizeInterval)}update(e,t){this.srcdoc=t,this.url=e,this._renderFrame(this.url,this.srcdoc,(({newFrame:e})=>{this.iframe.remove(),this.iframe=e,this.onLoad({newFrame:e})}),this.onError)}render(){return this.iframe||(this.iframe=this._renderFrame(this.url,this.srcdoc,this.onLoad)),this.iframe}_renderFrame(e,t,n,i=(()=>{})){const r=document.createElement("iframe");return t?r.srcdoc=t:r.src=e,r.id=this.id,r.className=this.className,r.onload=()=>{if(!this.scrollableElement)return void i();let e=this.scrollableElement,t=e.scrollHeight;this.onResize&&this.onResize(0,t),this.resizeInterval&&clearInterval(this.resizeInterval),this.onResize&&(this.resizeInterval=setInterval((()=>{if(e)try{t!==e.scrollHeight&&(this.onResize(t,e.scrollHeight),t=e.scrollHeight)}catch(e){clearInterval(this.resizeInterval),console.error(e),i()}else clearInterval(this.resizeInterval)}),25)),this._onLoad(r),n&&(this.executeOnloadImmediately||"complete"===this.document.readyState?n({newFrame:r}):r.contentWindow.addEventListener("DOMContentLoaded",(()=>{n({newFrame:r})})))},r.onerror=()=>{i()},r}_onLoad(e){}}class Dt extends Ct{get scrollableElement(){return this.document.querySelector(".wagtail-fedit-form-wrapper")}get formElement(){var e;return null===(e=this.document)||void 0===e?void 0:e.querySelector("#wagtail-fedit-form")}get formWrapper(){var e;return null===(e=this.document)||void 0===e?void 0:e.querySelector(".wagtail-fedit-form-wrapper")}_onLoad(e){super._onLoad(e);const t=this.document.querySelector(".wagtail-fedit-cancel-button");t&&t.addEventListener("click",(()=>{clearInterval(this.resizeInterval),this.onCancel&&this.onCancel()}))}}class Mt extends EventTarget{constructor(e){super(),this.api=new Lt(this),this.initialTitle=document.title,this.wrapperElement=e,this.sharedContext=null,this.editBtn=null,this.iframe=null,this.init();let t=this.wrapperElement.firstElementChild;if(!this.wrapperElement.querySelector(".wagtail-fedit-adapter-wrapper")){let e=this.wrapperElement.querySelector("img");e?e.addEventListener("load",(()=>{t.clientHeight-15>this.wrapperElement.clientHeight&&t.classList.add("wagtail-fedit-buttons--overflow")})):t.clientHeight-15>this.wrapperElement.clientHeight&&t.classList.add("wagtail-fedit-buttons--overflow")}window.location.hash===`#${this.wrapperElement.id}`&&(this.openEditor(),this.focus())}get editUrl(){return this.wrapperElement.dataset.editUrl}get refetchUrl(){return this.wrapperElement.dataset.refetchUrl}get relatedWrappers(){const e=this.wrapperElement.dataset.wrapperId,t=document.querySelectorAll(`[data-wrapper-id="${e}"]`);return Array.from(t).filter((e=>e!==this.wrapperElement))}init(){this.sharedContext=this.wrapperElement.dataset.sharedContext,this.wrapperElement.editorAPI=this.api,this.editBtn=this.wrapperElement.querySelector(".wagtail-fedit-edit-button"),this.editBtn.addEventListener("click",(e=>{return t=this,n=void 0,r=function*(){e.preventDefault(),e.stopPropagation(),this.opened||this.openEditor()},new((i=void 0)||(i=Promise))((function(e,o){function a(e){try{c(r.next(e))}catch(e){o(e)}}function s(e){try{c(r.throw(e))}catch(e){o(e)}}function c(t){var n;t.done?e(t.value):(n=t.value,n instanceof i?n:new i((function(e){e(n)}))).then(a,s)}c((r=r.apply(t,n||[])).next())}));var t,n,i,r}))}initNewEditors(){Et(this.wrapperElement)}focus(){this.wrapperElement.focus()}refetch(){return new Promise(((e,t)=>{fetch(this.refetchUrl).then((e=>e.json())).then((t=>{t.success?(this.onResponse(t),e(t)):console.error("Errors rendering response, failed to refetch",t)})).catch((e=>{console.error("Failed to refetch",e),t(e)}))}))}refetchParent(e){let t=document.body,n=this.wrapperElement.parentElement;for(;n&&n!==t;){if(n.classList.contains("wagtail-fedit-initialized"))return void n.editorAPI.refetch().then((()=>{Et(n)}));n=n.parentElement}e&&e()}onResponse(e){throw new Error("onResponse not implemented, cannot call super")}get frameOptions(){return{}}openIframe(e,t){if(this.iframe)return e.appendChild(this.iframe.element),void t(this.iframe);this.iframe=new Dt(Object.assign(Object.assign({url:this.editUrl,id:"wagtail-fedit-iframe",className:null,executeOnloadImmediately:!0},this.frameOptions),{onLoad:()=>{const t=e=>{e.preventDefault();const n=new FormData(this.iframe.formElement);this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT,{element:this.wrapperElement,formData:n}),fetch(this.editUrl,{method:"POST",body:n}).then((e=>e.json())).then((e=>{if(!e.success){console.error("Errors rendering response",e);let n=document.createElement("div");n.innerHTML=e.html,this.iframe.mainElement.innerHTML=n.querySelector("#main").innerHTML,this.iframe.formElement.onsubmit=t;const i=this.iframe.mainElement.querySelector("#value[data-block]");i&&this.iframe.window.initBlockWidget(i.id);const r=this.iframe.document.querySelector(".wagtail-fedit-cancel-button"),o=this.closeEditor.bind(this);return r.addEventListener("click",o),this.iframe.onCancel=o,void this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT_ERROR,{element:this.wrapperElement,response:e})}const n=this.onResponse(e),i=()=>{this.closeEditor(),this.executeEvent(window.wagtailFedit.EVENTS.CHANGE,{element:this.wrapperElement})};n instanceof Promise?n.then(i):i()}))};this.iframe.formElement.onsubmit=t,this.iframe.onCancel=this.closeEditor.bind(this);const n=this.iframe.formWrapper,i=["large","full"];for(const t of i)if(n&&(n.classList.contains(`fedit-${t}`)||(this.iframe.formElement.dataset.editorSize||"").toLowerCase()===t)){e.classList.add(`fedit-${t}`);break}const r=window.location.href.split("#")[0];window.history.pushState(null,this.iframe.document.title,r+`#${this.wrapperElement.id}`),document.title=this.iframe.document.title,this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_LOAD,{iframe:this.iframe})},onError:()=>{this.closeEditor()},onCancel:()=>{this.closeEditor()}})),e.appendChild(this.iframe.element),t(this.iframe)}openEditor(){this.modal||(this.modal=new St({modalId:`${this.wrapperElement.id}-modal`})),this.opened=!0,this.openIframe(this.modal,(e=>{this.modal.appendChild(It(this.closeEditor.bind(this))),this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_OPEN,{iframe:this.iframe,modal:this.modal}),this.modal.openModal()}))}closeEditor(){this.opened=!1,window.history.pushState(null,this.initialTitle,window.location.href.split("#")[0]),document.title=this.initialTitle,this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_CLOSE),this.modal.closeModal()}executeEvent(e,t){t||(t={element:this.wrapperElement}),t.editor=this,t.api=this.api,e.startsWith(`${window.wagtailFedit.NAMESPACE}:`)||(e=`${window.wagtailFedit.NAMESPACE}:${e}`);const n=new CustomEvent(e,{detail:t});super.dispatchEvent(n),this.wrapperElement.dispatchEvent(n),document.dispatchEvent(n)}}function It(e){const t=document.createElement("button");return t.innerHTML="&times;",t.classList.add("wagtail-fedit-close-button"),t.addEventListener("click",e),t}class kt{constructor(e){this.publishButton=e,this.publishButtonsWrapper=e.parentElement.querySelector(".wagtail-fedit-form-buttons"),this.publishButtonsWrapper.querySelectorAll(".wagtail-fedit-userbar-button"),this.init()}init(){this.publishButton.addEventListener("click",(e=>{this.publishButtonsWrapper.classList.contains("open")?this.publishButtonsWrapper.animate([{opacity:1,height:`${this.publishButtonsWrapper.scrollHeight}px`},{opacity:0,height:"0px"}],{duration:500,easing:"ease-in-out"}).onfinish=()=>{this.publishButtonsWrapper.classList.remove("open")}:(e.preventDefault(),e.stopPropagation(),this.publishButtonsWrapper.animate([{opacity:0,height:"0px"},{opacity:1,height:`${this.publishButtonsWrapper.scrollHeight}px`}],{duration:500,easing:"ease-in-out"}).onfinish=()=>{this.publishButtonsWrapper.classList.add("open")})}))}}class Rt extends Mt{static get funcMap(){return window}onResponse(e){const t=e.func.name,n=e.func.target;if(!t||!n)return void console.error("Invalid response",e);const i=document.querySelector(n);if(!i)return void console.error("Target element not found",n);const r=this.constructor.funcMap[t];if(r)return r(i,e);console.error("Function not found",t)}}class Pt extends Mt{onResponse(e){return this.api.updateHtml((t=>{this.wrapperElement.animate([{opacity:1},{opacity:0}],{duration:350,easing:"ease-in-out"}).onfinish=()=>{const n=t(e.html);e.refetch||this.api.execRelated((e=>{e.refetch()})),n.animate([{opacity:0},{opacity:1}],{duration:350,easing:"ease-in-out"}).onfinish=()=>{n.style.opacity="1"}}}))}}function jt(e){return class extends e{constructor(...e){super(...e);let t=this.wrapperElement.querySelectorAll("[data-direction]");for(let e=0;e<t.length;e++){let n=t[e],i=n.dataset.url;n.addEventListener("click",(e=>{e.preventDefault(),this.api.fetch(i,"POST",{}).then((e=>{e.success?this.refetchParent(xt):e.error?alert("Failed to move block: "+e.error):alert("Failed to move block")})).catch((e=>{console.error("Failed to move block",e),alert("Failed to move block")}))}))}}}}function Ht(e){return class extends e{constructor(...e){super(...e);let t=this.wrapperElement.querySelector("[data-add]");if(!t)return void console.error('"Add" button not found, cannot further initialize AddableMixin');const n=t.dataset.url,i=new St({modalId:`${this.wrapperElement.id}-modal`});t.addEventListener("click",(e=>{e.preventDefault(),i.openModal();const t=new Dt({id:"wagtail-fedit-iframe",className:null,url:n,onLoad:({newFrame:e})=>{t.formElement.onsubmit=e=>{e.preventDefault();const r=new FormData(t.formElement);this.api.fetch(n,"POST",r).then((e=>{e.success?(i.closeModal(),this.refetchParent(xt)):e.error?alert("Failed to add block: "+e.error):alert("Failed to add block")})).catch((e=>{console.error("Failed to add block",e),alert("Failed to add block")}))}}});t.destroy(),i.appendChild(t.element),i.appendChild(It(i.closeModal.bind(i)))}))}}}class Nt extends(Ht(jt(Pt))){}class Ft extends Pt{get buttonsElement(){return this.wrapperElement.querySelector(".wagtail-fedit-buttons")}get formElement(){return this.wrapperElement.querySelector(".wagtail-fedit-adapter-form")}get contentElement(){return this.wrapperElement.querySelector(".wagtail-fedit-adapter-content")}get frameOptions(){return{onResize:(e,t)=>{this.iframe.element.style.height=`${t}px`}}}openEditor(){this.openIframe(this.formElement,(e=>{this.contentElement.style.display="none"}))}closeEditor(){this.opened=!1,window.history.pushState(null,this.initialTitle,window.location.href.split("#")[0]),document.title=this.initialTitle,this.contentElement.style.display="block",this.iframe.destroy(),this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_CLOSE),delete this.iframe}}class Wt extends(Ht(jt(Ft))){}function qt(){Et(),new MutationObserver((e=>{for(const t of e)for(let e=0;e<t.addedNodes.length;e++){const n=t.addedNodes[e];1===n.nodeType&&Et(n)}})).observe(document.body,{childList:!0,subtree:!0});const e=new URL(window.location.href),t=e.searchParams.get("scrollY")||0,n=e.searchParams.get("scrollX")||0;(t>0||n>0)&&window.scrollTo(n,t);const i=document.querySelector("wagtail-userbar");if(i){const e=i.shadowRoot.querySelector("#wagtail-fedit-editor-button"),t=i.shadowRoot.querySelector("#wagtail-fedit-live-button"),n=i.shadowRoot.querySelector("#wagtail-fedit-publish-menu");if(e||t){let n;window.addEventListener("scroll",(()=>{n&&clearTimeout(n),n=setTimeout((()=>{Ot(e),Ot(t);const n=new URL(window.location.href);n.searchParams.set("scrollY",`${window.scrollY}`),n.searchParams.set("scrollX",`${window.scrollX}`),window.history.replaceState(null,"",n.toString())}),50)}))}n&&new kt(n)}}window.wagtailFedit={NAMESPACE:"wagtail-fedit",EVENTS:{SUBMIT:"wagtail-fedit:submit",CHANGE:"wagtail-fedit:change",EDITOR_OPEN:"wagtail-fedit:editorOpen",EDITOR_LOAD:"wagtail-fedit:editorLoad",EDITOR_CLOSE:"wagtail-fedit:editorClose",SUBMIT_ERROR:"wagtail-fedit:submitError"},editors:{"wagtail_fedit.editors.BaseFuncEditor":Rt,"wagtail_fedit.editors.FieldEditor":Pt,"wagtail_fedit.editors.BlockEditor":Nt,"wagtail_fedit.editors.DomPositionedFieldEditor":Ft,"wagtail_fedit.editors.DomPositionedBlockEditor":Wt,"wagtail_fedit.editors.WagtailFeditFuncEditor":class extends Rt{static get funcMap(){return window.wagtailFedit.funcs}}},funcs:{"wagtail_fedit.funcs.backgroundImageFunc":function(e,t){const n=t.url,i=t.css_variable_name;i?(i.startsWith("--"),e.style.setProperty(i,`url(${n})`)):e.style.backgroundImage=`url(${n})`}},register:function(e,t){this.editors[e]=t},registerFunc:function(e,t){this.funcs[e]=t}},"loading"===document.readyState?document.addEventListener("DOMContentLoaded",qt):qt()})()})();
\ No newline at end of file
+(()=>{"use strict";var e={2:(e,t,n)=>{n.d(t,{A:()=>s});var i=n(601),r=n.n(i),o=n(314),a=n.n(o)()(r());a.push([e.id,'.tippy-box[data-animation=fade][data-state=hidden]{opacity:0}[data-tippy-root]{max-width:calc(100vw - 10px)}.tippy-box{position:relative;background-color:#333;color:#fff;border-radius:4px;font-size:14px;line-height:1.4;white-space:normal;outline:0;transition-property:transform,visibility,opacity}.tippy-box[data-placement^=top]>.tippy-arrow{bottom:0}.tippy-box[data-placement^=top]>.tippy-arrow:before{bottom:-7px;left:0;border-width:8px 8px 0;border-top-color:initial;transform-origin:center top}.tippy-box[data-placement^=bottom]>.tippy-arrow{top:0}.tippy-box[data-placement^=bottom]>.tippy-arrow:before{top:-7px;left:0;border-width:0 8px 8px;border-bottom-color:initial;transform-origin:center bottom}.tippy-box[data-placement^=left]>.tippy-arrow{right:0}.tippy-box[data-placement^=left]>.tippy-arrow:before{border-width:8px 0 8px 8px;border-left-color:initial;right:-7px;transform-origin:center left}.tippy-box[data-placement^=right]>.tippy-arrow{left:0}.tippy-box[data-placement^=right]>.tippy-arrow:before{left:-7px;border-width:8px 8px 8px 0;border-right-color:initial;transform-origin:center right}.tippy-box[data-inertia][data-state=visible]{transition-timing-function:cubic-bezier(.54,1.5,.38,1.11)}.tippy-arrow{width:16px;height:16px;color:#333}.tippy-arrow:before{content:"";position:absolute;border-color:transparent;border-style:solid}.tippy-content{position:relative;padding:5px 9px;z-index:1}',""]);const s=a},314:e=>{e.exports=function(e){var t=[];return t.toString=function(){return this.map((function(t){var n="",i=void 0!==t[5];return t[4]&&(n+="@supports (".concat(t[4],") {")),t[2]&&(n+="@media ".concat(t[2]," {")),i&&(n+="@layer".concat(t[5].length>0?" ".concat(t[5]):""," {")),n+=e(t),i&&(n+="}"),t[2]&&(n+="}"),t[4]&&(n+="}"),n})).join("")},t.i=function(e,n,i,r,o){"string"==typeof e&&(e=[[null,e,void 0]]);var a={};if(i)for(var s=0;s<this.length;s++){var c=this[s][0];null!=c&&(a[c]=!0)}for(var l=0;l<e.length;l++){var d=[].concat(e[l]);i&&a[d[0]]||(void 0!==o&&(void 0===d[5]||(d[1]="@layer".concat(d[5].length>0?" ".concat(d[5]):""," {").concat(d[1],"}")),d[5]=o),n&&(d[2]?(d[1]="@media ".concat(d[2]," {").concat(d[1],"}"),d[2]=n):d[2]=n),r&&(d[4]?(d[1]="@supports (".concat(d[4],") {").concat(d[1],"}"),d[4]=r):d[4]="".concat(r)),t.push(d))}},t}},601:e=>{e.exports=function(e){return e[1]}},72:e=>{var t=[];function n(e){for(var n=-1,i=0;i<t.length;i++)if(t[i].identifier===e){n=i;break}return n}function i(e,i){for(var o={},a=[],s=0;s<e.length;s++){var c=e[s],l=i.base?c[0]+i.base:c[0],d=o[l]||0,p="".concat(l," ").concat(d);o[l]=d+1;var u=n(p),f={css:c[1],media:c[2],sourceMap:c[3],supports:c[4],layer:c[5]};if(-1!==u)t[u].references++,t[u].updater(f);else{var h=r(f,i);i.byIndex=s,t.splice(s,0,{identifier:p,updater:h,references:1})}a.push(p)}return a}function r(e,t){var n=t.domAPI(t);return n.update(e),function(t){if(t){if(t.css===e.css&&t.media===e.media&&t.sourceMap===e.sourceMap&&t.supports===e.supports&&t.layer===e.layer)return;n.update(e=t)}else n.remove()}}e.exports=function(e,r){var o=i(e=e||[],r=r||{});return function(e){e=e||[];for(var a=0;a<o.length;a++){var s=n(o[a]);t[s].references--}for(var c=i(e,r),l=0;l<o.length;l++){var d=n(o[l]);0===t[d].references&&(t[d].updater(),t.splice(d,1))}o=c}}},659:e=>{var t={};e.exports=function(e,n){var i=function(e){if(void 0===t[e]){var n=document.querySelector(e);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(e){n=null}t[e]=n}return t[e]}(e);if(!i)throw new Error("Couldn't find a style target. This probably means that the value for the 'insert' parameter is invalid.");i.appendChild(n)}},540:e=>{e.exports=function(e){var t=document.createElement("style");return e.setAttributes(t,e.attributes),e.insert(t,e.options),t}},56:(e,t,n)=>{e.exports=function(e){var t=n.nc;t&&e.setAttribute("nonce",t)}},825:e=>{e.exports=function(e){if("undefined"==typeof document)return{update:function(){},remove:function(){}};var t=e.insertStyleElement(e);return{update:function(n){!function(e,t,n){var i="";n.supports&&(i+="@supports (".concat(n.supports,") {")),n.media&&(i+="@media ".concat(n.media," {"));var r=void 0!==n.layer;r&&(i+="@layer".concat(n.layer.length>0?" ".concat(n.layer):""," {")),i+=n.css,r&&(i+="}"),n.media&&(i+="}"),n.supports&&(i+="}");var o=n.sourceMap;o&&"undefined"!=typeof btoa&&(i+="\n/*# sourceMappingURL=data:application/json;base64,".concat(btoa(unescape(encodeURIComponent(JSON.stringify(o))))," */")),t.styleTagTransform(i,e,t.options)}(t,e,n)},remove:function(){!function(e){if(null===e.parentNode)return!1;e.parentNode.removeChild(e)}(t)}}}},113:e=>{e.exports=function(e,t){if(t.styleSheet)t.styleSheet.cssText=e;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(e))}}}},t={};function n(i){var r=t[i];if(void 0!==r)return r.exports;var o=t[i]={id:i,exports:{}};return e[i](o,o.exports,n),o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var i in t)n.o(t,i)&&!n.o(e,i)&&Object.defineProperty(e,i,{enumerable:!0,get:t[i]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.nc=void 0;var i={};(()=>{function e(e){if(null==e)return window;if("[object Window]"!==e.toString()){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function t(t){return t instanceof e(t).Element||t instanceof Element}function r(t){return t instanceof e(t).HTMLElement||t instanceof HTMLElement}function o(t){return"undefined"!=typeof ShadowRoot&&(t instanceof e(t).ShadowRoot||t instanceof ShadowRoot)}var a=Math.max,s=Math.min,c=Math.round;function l(){var e=navigator.userAgentData;return null!=e&&e.brands&&Array.isArray(e.brands)?e.brands.map((function(e){return e.brand+"/"+e.version})).join(" "):navigator.userAgent}function d(){return!/^((?!chrome|android).)*safari/i.test(l())}function p(n,i,o){void 0===i&&(i=!1),void 0===o&&(o=!1);var a=n.getBoundingClientRect(),s=1,l=1;i&&r(n)&&(s=n.offsetWidth>0&&c(a.width)/n.offsetWidth||1,l=n.offsetHeight>0&&c(a.height)/n.offsetHeight||1);var p=(t(n)?e(n):window).visualViewport,u=!d()&&o,f=(a.left+(u&&p?p.offsetLeft:0))/s,h=(a.top+(u&&p?p.offsetTop:0))/l,m=a.width/s,v=a.height/l;return{width:m,height:v,top:h,right:f+m,bottom:h+v,left:f,x:f,y:h}}function u(t){var n=e(t);return{scrollLeft:n.pageXOffset,scrollTop:n.pageYOffset}}function f(e){return e?(e.nodeName||"").toLowerCase():null}function h(e){return((t(e)?e.ownerDocument:e.document)||window.document).documentElement}function m(e){return p(h(e)).left+u(e).scrollLeft}function v(t){return e(t).getComputedStyle(t)}function g(e){var t=v(e),n=t.overflow,i=t.overflowX,r=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+i)}function w(t,n,i){void 0===i&&(i=!1);var o,a,s=r(n),l=r(n)&&function(e){var t=e.getBoundingClientRect(),n=c(t.width)/e.offsetWidth||1,i=c(t.height)/e.offsetHeight||1;return 1!==n||1!==i}(n),d=h(n),v=p(t,l,i),w={scrollLeft:0,scrollTop:0},y={x:0,y:0};return(s||!s&&!i)&&(("body"!==f(n)||g(d))&&(w=(o=n)!==e(o)&&r(o)?{scrollLeft:(a=o).scrollLeft,scrollTop:a.scrollTop}:u(o)),r(n)?((y=p(n,!0)).x+=n.clientLeft,y.y+=n.clientTop):d&&(y.x=m(d))),{x:v.left+w.scrollLeft-y.x,y:v.top+w.scrollTop-y.y,width:v.width,height:v.height}}function y(e){var t=p(e),n=e.offsetWidth,i=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-i)<=1&&(i=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:i}}function b(e){return"html"===f(e)?e:e.assignedSlot||e.parentNode||(o(e)?e.host:null)||h(e)}function E(e){return["html","body","#document"].indexOf(f(e))>=0?e.ownerDocument.body:r(e)&&g(e)?e:E(b(e))}function x(t,n){var i;void 0===n&&(n=[]);var r=E(t),o=r===(null==(i=t.ownerDocument)?void 0:i.body),a=e(r),s=o?[a].concat(a.visualViewport||[],g(r)?r:[]):r,c=n.concat(s);return o?c:c.concat(x(b(s)))}function O(e){return["table","td","th"].indexOf(f(e))>=0}function L(e){return r(e)&&"fixed"!==v(e).position?e.offsetParent:null}function T(t){for(var n=e(t),i=L(t);i&&O(i)&&"static"===v(i).position;)i=L(i);return i&&("html"===f(i)||"body"===f(i)&&"static"===v(i).position)?n:i||function(e){var t=/firefox/i.test(l());if(/Trident/i.test(l())&&r(e)&&"fixed"===v(e).position)return null;var n=b(e);for(o(n)&&(n=n.host);r(n)&&["html","body"].indexOf(f(n))<0;){var i=v(n);if("none"!==i.transform||"none"!==i.perspective||"paint"===i.contain||-1!==["transform","perspective"].indexOf(i.willChange)||t&&"filter"===i.willChange||t&&i.filter&&"none"!==i.filter)return n;n=n.parentNode}return null}(t)||n}var A="top",S="bottom",C="right",D="left",M="auto",I=[A,S,C,D],k="start",R="end",P="viewport",j="popper",H=I.reduce((function(e,t){return e.concat([t+"-"+k,t+"-"+R])}),[]),N=[].concat(I,[M]).reduce((function(e,t){return e.concat([t,t+"-"+k,t+"-"+R])}),[]),F=["beforeRead","read","afterRead","beforeMain","main","afterMain","beforeWrite","write","afterWrite"];function W(e){var t=new Map,n=new Set,i=[];function r(e){n.add(e.name),[].concat(e.requires||[],e.requiresIfExists||[]).forEach((function(e){if(!n.has(e)){var i=t.get(e);i&&r(i)}})),i.push(e)}return e.forEach((function(e){t.set(e.name,e)})),e.forEach((function(e){n.has(e.name)||r(e)})),i}var q={placement:"bottom",modifiers:[],strategy:"absolute"};function B(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some((function(e){return!(e&&"function"==typeof e.getBoundingClientRect)}))}function _(e){void 0===e&&(e={});var n=e,i=n.defaultModifiers,r=void 0===i?[]:i,o=n.defaultOptions,a=void 0===o?q:o;return function(e,n,i){void 0===i&&(i=a);var o,s,c={placement:"bottom",orderedModifiers:[],options:Object.assign({},q,a),modifiersData:{},elements:{reference:e,popper:n},attributes:{},styles:{}},l=[],d=!1,p={state:c,setOptions:function(i){var o="function"==typeof i?i(c.options):i;u(),c.options=Object.assign({},a,c.options,o),c.scrollParents={reference:t(e)?x(e):e.contextElement?x(e.contextElement):[],popper:x(n)};var s,d,f=function(e){var t=W(e);return F.reduce((function(e,n){return e.concat(t.filter((function(e){return e.phase===n})))}),[])}((s=[].concat(r,c.options.modifiers),d=s.reduce((function(e,t){var n=e[t.name];return e[t.name]=n?Object.assign({},n,t,{options:Object.assign({},n.options,t.options),data:Object.assign({},n.data,t.data)}):t,e}),{}),Object.keys(d).map((function(e){return d[e]}))));return c.orderedModifiers=f.filter((function(e){return e.enabled})),c.orderedModifiers.forEach((function(e){var t=e.name,n=e.options,i=void 0===n?{}:n,r=e.effect;if("function"==typeof r){var o=r({state:c,name:t,instance:p,options:i});l.push(o||function(){})}})),p.update()},forceUpdate:function(){if(!d){var e=c.elements,t=e.reference,n=e.popper;if(B(t,n)){c.rects={reference:w(t,T(n),"fixed"===c.options.strategy),popper:y(n)},c.reset=!1,c.placement=c.options.placement,c.orderedModifiers.forEach((function(e){return c.modifiersData[e.name]=Object.assign({},e.data)}));for(var i=0;i<c.orderedModifiers.length;i++)if(!0!==c.reset){var r=c.orderedModifiers[i],o=r.fn,a=r.options,s=void 0===a?{}:a,l=r.name;"function"==typeof o&&(c=o({state:c,options:s,name:l,instance:p})||c)}else c.reset=!1,i=-1}}},update:(o=function(){return new Promise((function(e){p.forceUpdate(),e(c)}))},function(){return s||(s=new Promise((function(e){Promise.resolve().then((function(){s=void 0,e(o())}))}))),s}),destroy:function(){u(),d=!0}};if(!B(e,n))return p;function u(){l.forEach((function(e){return e()})),l=[]}return p.setOptions(i).then((function(e){!d&&i.onFirstUpdate&&i.onFirstUpdate(e)})),p}}var V={passive:!0};const $={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(t){var n=t.state,i=t.instance,r=t.options,o=r.scroll,a=void 0===o||o,s=r.resize,c=void 0===s||s,l=e(n.elements.popper),d=[].concat(n.scrollParents.reference,n.scrollParents.popper);return a&&d.forEach((function(e){e.addEventListener("scroll",i.update,V)})),c&&l.addEventListener("resize",i.update,V),function(){a&&d.forEach((function(e){e.removeEventListener("scroll",i.update,V)})),c&&l.removeEventListener("resize",i.update,V)}},data:{}};function U(e){return e.split("-")[0]}function z(e){return e.split("-")[1]}function X(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function Y(e){var t,n=e.reference,i=e.element,r=e.placement,o=r?U(r):null,a=r?z(r):null,s=n.x+n.width/2-i.width/2,c=n.y+n.height/2-i.height/2;switch(o){case A:t={x:s,y:n.y-i.height};break;case S:t={x:s,y:n.y+n.height};break;case C:t={x:n.x+n.width,y:c};break;case D:t={x:n.x-i.width,y:c};break;default:t={x:n.x,y:n.y}}var l=o?X(o):null;if(null!=l){var d="y"===l?"height":"width";switch(a){case k:t[l]=t[l]-(n[d]/2-i[d]/2);break;case R:t[l]=t[l]+(n[d]/2-i[d]/2)}}return t}var J={top:"auto",right:"auto",bottom:"auto",left:"auto"};function G(t){var n,i=t.popper,r=t.popperRect,o=t.placement,a=t.variation,s=t.offsets,l=t.position,d=t.gpuAcceleration,p=t.adaptive,u=t.roundOffsets,f=t.isFixed,m=s.x,g=void 0===m?0:m,w=s.y,y=void 0===w?0:w,b="function"==typeof u?u({x:g,y}):{x:g,y};g=b.x,y=b.y;var E=s.hasOwnProperty("x"),x=s.hasOwnProperty("y"),O=D,L=A,M=window;if(p){var I=T(i),k="clientHeight",P="clientWidth";I===e(i)&&"static"!==v(I=h(i)).position&&"absolute"===l&&(k="scrollHeight",P="scrollWidth"),(o===A||(o===D||o===C)&&a===R)&&(L=S,y-=(f&&I===M&&M.visualViewport?M.visualViewport.height:I[k])-r.height,y*=d?1:-1),o!==D&&(o!==A&&o!==S||a!==R)||(O=C,g-=(f&&I===M&&M.visualViewport?M.visualViewport.width:I[P])-r.width,g*=d?1:-1)}var j,H=Object.assign({position:l},p&&J),N=!0===u?function(e,t){var n=e.x,i=e.y,r=t.devicePixelRatio||1;return{x:c(n*r)/r||0,y:c(i*r)/r||0}}({x:g,y},e(i)):{x:g,y};return g=N.x,y=N.y,d?Object.assign({},H,((j={})[L]=x?"0":"",j[O]=E?"0":"",j.transform=(M.devicePixelRatio||1)<=1?"translate("+g+"px, "+y+"px)":"translate3d("+g+"px, "+y+"px, 0)",j)):Object.assign({},H,((n={})[L]=x?y+"px":"",n[O]=E?g+"px":"",n.transform="",n))}const K={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(e){var t=e.state,n=e.options,i=n.gpuAcceleration,r=void 0===i||i,o=n.adaptive,a=void 0===o||o,s=n.roundOffsets,c=void 0===s||s,l={placement:U(t.placement),variation:z(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:r,isFixed:"fixed"===t.options.strategy};null!=t.modifiersData.popperOffsets&&(t.styles.popper=Object.assign({},t.styles.popper,G(Object.assign({},l,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:a,roundOffsets:c})))),null!=t.modifiersData.arrow&&(t.styles.arrow=Object.assign({},t.styles.arrow,G(Object.assign({},l,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:c})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})},data:{}},Q={name:"applyStyles",enabled:!0,phase:"write",fn:function(e){var t=e.state;Object.keys(t.elements).forEach((function(e){var n=t.styles[e]||{},i=t.attributes[e]||{},o=t.elements[e];r(o)&&f(o)&&(Object.assign(o.style,n),Object.keys(i).forEach((function(e){var t=i[e];!1===t?o.removeAttribute(e):o.setAttribute(e,!0===t?"":t)})))}))},effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach((function(e){var i=t.elements[e],o=t.attributes[e]||{},a=Object.keys(t.styles.hasOwnProperty(e)?t.styles[e]:n[e]).reduce((function(e,t){return e[t]="",e}),{});r(i)&&f(i)&&(Object.assign(i.style,a),Object.keys(o).forEach((function(e){i.removeAttribute(e)})))}))}},requires:["computeStyles"]},Z={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(e){var t=e.state,n=e.options,i=e.name,r=n.offset,o=void 0===r?[0,0]:r,a=N.reduce((function(e,n){return e[n]=function(e,t,n){var i=U(e),r=[D,A].indexOf(i)>=0?-1:1,o="function"==typeof n?n(Object.assign({},t,{placement:e})):n,a=o[0],s=o[1];return a=a||0,s=(s||0)*r,[D,C].indexOf(i)>=0?{x:s,y:a}:{x:a,y:s}}(n,t.rects,o),e}),{}),s=a[t.placement],c=s.x,l=s.y;null!=t.modifiersData.popperOffsets&&(t.modifiersData.popperOffsets.x+=c,t.modifiersData.popperOffsets.y+=l),t.modifiersData[i]=a}};var ee={left:"right",right:"left",bottom:"top",top:"bottom"};function te(e){return e.replace(/left|right|bottom|top/g,(function(e){return ee[e]}))}var ne={start:"end",end:"start"};function ie(e){return e.replace(/start|end/g,(function(e){return ne[e]}))}function re(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&o(n)){var i=t;do{if(i&&e.isSameNode(i))return!0;i=i.parentNode||i.host}while(i)}return!1}function oe(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function ae(n,i,r){return i===P?oe(function(t,n){var i=e(t),r=h(t),o=i.visualViewport,a=r.clientWidth,s=r.clientHeight,c=0,l=0;if(o){a=o.width,s=o.height;var p=d();(p||!p&&"fixed"===n)&&(c=o.offsetLeft,l=o.offsetTop)}return{width:a,height:s,x:c+m(t),y:l}}(n,r)):t(i)?function(e,t){var n=p(e,!1,"fixed"===t);return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}(i,r):oe(function(e){var t,n=h(e),i=u(e),r=null==(t=e.ownerDocument)?void 0:t.body,o=a(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),s=a(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),c=-i.scrollLeft+m(e),l=-i.scrollTop;return"rtl"===v(r||n).direction&&(c+=a(n.clientWidth,r?r.clientWidth:0)-o),{width:o,height:s,x:c,y:l}}(h(n)))}function se(e){return Object.assign({},{top:0,right:0,bottom:0,left:0},e)}function ce(e,t){return t.reduce((function(t,n){return t[n]=e,t}),{})}function le(e,n){void 0===n&&(n={});var i=n,o=i.placement,c=void 0===o?e.placement:o,l=i.strategy,d=void 0===l?e.strategy:l,u=i.boundary,m=void 0===u?"clippingParents":u,g=i.rootBoundary,w=void 0===g?P:g,y=i.elementContext,E=void 0===y?j:y,O=i.altBoundary,L=void 0!==O&&O,D=i.padding,M=void 0===D?0:D,k=se("number"!=typeof M?M:ce(M,I)),R=E===j?"reference":j,H=e.rects.popper,N=e.elements[L?R:E],F=function(e,n,i,o){var c="clippingParents"===n?function(e){var n=x(b(e)),i=["absolute","fixed"].indexOf(v(e).position)>=0&&r(e)?T(e):e;return t(i)?n.filter((function(e){return t(e)&&re(e,i)&&"body"!==f(e)})):[]}(e):[].concat(n),l=[].concat(c,[i]),d=l[0],p=l.reduce((function(t,n){var i=ae(e,n,o);return t.top=a(i.top,t.top),t.right=s(i.right,t.right),t.bottom=s(i.bottom,t.bottom),t.left=a(i.left,t.left),t}),ae(e,d,o));return p.width=p.right-p.left,p.height=p.bottom-p.top,p.x=p.left,p.y=p.top,p}(t(N)?N:N.contextElement||h(e.elements.popper),m,w,d),W=p(e.elements.reference),q=Y({reference:W,element:H,strategy:"absolute",placement:c}),B=oe(Object.assign({},H,q)),_=E===j?B:W,V={top:F.top-_.top+k.top,bottom:_.bottom-F.bottom+k.bottom,left:F.left-_.left+k.left,right:_.right-F.right+k.right},$=e.modifiersData.offset;if(E===j&&$){var U=$[c];Object.keys(V).forEach((function(e){var t=[C,S].indexOf(e)>=0?1:-1,n=[A,S].indexOf(e)>=0?"y":"x";V[e]+=U[n]*t}))}return V}const de={name:"flip",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,i=e.name;if(!t.modifiersData[i]._skip){for(var r=n.mainAxis,o=void 0===r||r,a=n.altAxis,s=void 0===a||a,c=n.fallbackPlacements,l=n.padding,d=n.boundary,p=n.rootBoundary,u=n.altBoundary,f=n.flipVariations,h=void 0===f||f,m=n.allowedAutoPlacements,v=t.options.placement,g=U(v),w=c||(g!==v&&h?function(e){if(U(e)===M)return[];var t=te(e);return[ie(e),t,ie(t)]}(v):[te(v)]),y=[v].concat(w).reduce((function(e,n){return e.concat(U(n)===M?function(e,t){void 0===t&&(t={});var n=t,i=n.placement,r=n.boundary,o=n.rootBoundary,a=n.padding,s=n.flipVariations,c=n.allowedAutoPlacements,l=void 0===c?N:c,d=z(i),p=d?s?H:H.filter((function(e){return z(e)===d})):I,u=p.filter((function(e){return l.indexOf(e)>=0}));0===u.length&&(u=p);var f=u.reduce((function(t,n){return t[n]=le(e,{placement:n,boundary:r,rootBoundary:o,padding:a})[U(n)],t}),{});return Object.keys(f).sort((function(e,t){return f[e]-f[t]}))}(t,{placement:n,boundary:d,rootBoundary:p,padding:l,flipVariations:h,allowedAutoPlacements:m}):n)}),[]),b=t.rects.reference,E=t.rects.popper,x=new Map,O=!0,L=y[0],T=0;T<y.length;T++){var R=y[T],P=U(R),j=z(R)===k,F=[A,S].indexOf(P)>=0,W=F?"width":"height",q=le(t,{placement:R,boundary:d,rootBoundary:p,altBoundary:u,padding:l}),B=F?j?C:D:j?S:A;b[W]>E[W]&&(B=te(B));var _=te(B),V=[];if(o&&V.push(q[P]<=0),s&&V.push(q[B]<=0,q[_]<=0),V.every((function(e){return e}))){L=R,O=!1;break}x.set(R,V)}if(O)for(var $=function(e){var t=y.find((function(t){var n=x.get(t);if(n)return n.slice(0,e).every((function(e){return e}))}));if(t)return L=t,"break"},X=h?3:1;X>0&&"break"!==$(X);X--);t.placement!==L&&(t.modifiersData[i]._skip=!0,t.placement=L,t.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}};function pe(e,t,n){return a(e,s(t,n))}const ue={name:"preventOverflow",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,i=e.name,r=n.mainAxis,o=void 0===r||r,c=n.altAxis,l=void 0!==c&&c,d=n.boundary,p=n.rootBoundary,u=n.altBoundary,f=n.padding,h=n.tether,m=void 0===h||h,v=n.tetherOffset,g=void 0===v?0:v,w=le(t,{boundary:d,rootBoundary:p,padding:f,altBoundary:u}),b=U(t.placement),E=z(t.placement),x=!E,O=X(b),L="x"===O?"y":"x",M=t.modifiersData.popperOffsets,I=t.rects.reference,R=t.rects.popper,P="function"==typeof g?g(Object.assign({},t.rects,{placement:t.placement})):g,j="number"==typeof P?{mainAxis:P,altAxis:P}:Object.assign({mainAxis:0,altAxis:0},P),H=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,N={x:0,y:0};if(M){if(o){var F,W="y"===O?A:D,q="y"===O?S:C,B="y"===O?"height":"width",_=M[O],V=_+w[W],$=_-w[q],Y=m?-R[B]/2:0,J=E===k?I[B]:R[B],G=E===k?-R[B]:-I[B],K=t.elements.arrow,Q=m&&K?y(K):{width:0,height:0},Z=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},ee=Z[W],te=Z[q],ne=pe(0,I[B],Q[B]),ie=x?I[B]/2-Y-ne-ee-j.mainAxis:J-ne-ee-j.mainAxis,re=x?-I[B]/2+Y+ne+te+j.mainAxis:G+ne+te+j.mainAxis,oe=t.elements.arrow&&T(t.elements.arrow),ae=oe?"y"===O?oe.clientTop||0:oe.clientLeft||0:0,se=null!=(F=null==H?void 0:H[O])?F:0,ce=_+re-se,de=pe(m?s(V,_+ie-se-ae):V,_,m?a($,ce):$);M[O]=de,N[O]=de-_}if(l){var ue,fe="x"===O?A:D,he="x"===O?S:C,me=M[L],ve="y"===L?"height":"width",ge=me+w[fe],we=me-w[he],ye=-1!==[A,D].indexOf(b),be=null!=(ue=null==H?void 0:H[L])?ue:0,Ee=ye?ge:me-I[ve]-R[ve]-be+j.altAxis,xe=ye?me+I[ve]+R[ve]-be-j.altAxis:we,Oe=m&&ye?function(e,t,n){var i=pe(e,t,n);return i>n?n:i}(Ee,me,xe):pe(m?Ee:ge,me,m?xe:we);M[L]=Oe,N[L]=Oe-me}t.modifiersData[i]=N}},requiresIfExists:["offset"]},fe={name:"arrow",enabled:!0,phase:"main",fn:function(e){var t,n=e.state,i=e.name,r=e.options,o=n.elements.arrow,a=n.modifiersData.popperOffsets,s=U(n.placement),c=X(s),l=[D,C].indexOf(s)>=0?"height":"width";if(o&&a){var d=function(e,t){return se("number"!=typeof(e="function"==typeof e?e(Object.assign({},t.rects,{placement:t.placement})):e)?e:ce(e,I))}(r.padding,n),p=y(o),u="y"===c?A:D,f="y"===c?S:C,h=n.rects.reference[l]+n.rects.reference[c]-a[c]-n.rects.popper[l],m=a[c]-n.rects.reference[c],v=T(o),g=v?"y"===c?v.clientHeight||0:v.clientWidth||0:0,w=h/2-m/2,b=d[u],E=g-p[l]-d[f],x=g/2-p[l]/2+w,O=pe(b,x,E),L=c;n.modifiersData[i]=((t={})[L]=O,t.centerOffset=O-x,t)}},effect:function(e){var t=e.state,n=e.options.element,i=void 0===n?"[data-popper-arrow]":n;null!=i&&("string"!=typeof i||(i=t.elements.popper.querySelector(i)))&&re(t.elements.popper,i)&&(t.elements.arrow=i)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function he(e,t,n){return void 0===n&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function me(e){return[A,C,S,D].some((function(t){return e[t]>=0}))}var ve=_({defaultModifiers:[$,{name:"popperOffsets",enabled:!0,phase:"read",fn:function(e){var t=e.state,n=e.name;t.modifiersData[n]=Y({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})},data:{}},K,Q,Z,de,ue,fe,{name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(e){var t=e.state,n=e.name,i=t.rects.reference,r=t.rects.popper,o=t.modifiersData.preventOverflow,a=le(t,{elementContext:"reference"}),s=le(t,{altBoundary:!0}),c=he(a,i),l=he(s,r,o),d=me(c),p=me(l);t.modifiersData[n]={referenceClippingOffsets:c,popperEscapeOffsets:l,isReferenceHidden:d,hasPopperEscaped:p},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":d,"data-popper-escaped":p})}}]}),ge="tippy-content",we="tippy-backdrop",ye="tippy-arrow",be="tippy-svg-arrow",Ee={passive:!0,capture:!0},xe=function(){return document.body};function Oe(e,t,n){if(Array.isArray(e)){var i=e[t];return null==i?Array.isArray(n)?n[t]:n:i}return e}function Le(e,t){var n={}.toString.call(e);return 0===n.indexOf("[object")&&n.indexOf(t+"]")>-1}function Te(e,t){return"function"==typeof e?e.apply(void 0,t):e}function Ae(e,t){return 0===t?e:function(i){clearTimeout(n),n=setTimeout((function(){e(i)}),t)};var n}function Se(e){return[].concat(e)}function Ce(e,t){-1===e.indexOf(t)&&e.push(t)}function De(e){return[].slice.call(e)}function Me(e){return Object.keys(e).reduce((function(t,n){return void 0!==e[n]&&(t[n]=e[n]),t}),{})}function Ie(){return document.createElement("div")}function ke(e){return["Element","Fragment"].some((function(t){return Le(e,t)}))}function Re(e,t){e.forEach((function(e){e&&(e.style.transitionDuration=t+"ms")}))}function Pe(e,t){e.forEach((function(e){e&&e.setAttribute("data-state",t)}))}function je(e,t,n){var i=t+"EventListener";["transitionend","webkitTransitionEnd"].forEach((function(t){e[i](t,n)}))}function He(e,t){for(var n=t;n;){var i;if(e.contains(n))return!0;n=null==n.getRootNode||null==(i=n.getRootNode())?void 0:i.host}return!1}var Ne={isTouch:!1},Fe=0;function We(){Ne.isTouch||(Ne.isTouch=!0,window.performance&&document.addEventListener("mousemove",qe))}function qe(){var e=performance.now();e-Fe<20&&(Ne.isTouch=!1,document.removeEventListener("mousemove",qe)),Fe=e}function Be(){var e,t=document.activeElement;if((e=t)&&e._tippy&&e._tippy.reference===e){var n=t._tippy;t.blur&&!n.state.isVisible&&t.blur()}}var _e=!("undefined"==typeof window||"undefined"==typeof document||!window.msCrypto),Ve=Object.assign({appendTo:xe,aria:{content:"auto",expanded:"auto"},delay:0,duration:[300,250],getReferenceClientRect:null,hideOnClick:!0,ignoreAttributes:!1,interactive:!1,interactiveBorder:2,interactiveDebounce:0,moveTransition:"",offset:[0,10],onAfterUpdate:function(){},onBeforeUpdate:function(){},onCreate:function(){},onDestroy:function(){},onHidden:function(){},onHide:function(){},onMount:function(){},onShow:function(){},onShown:function(){},onTrigger:function(){},onUntrigger:function(){},onClickOutside:function(){},placement:"top",plugins:[],popperOptions:{},render:null,showOnCreate:!1,touch:!0,trigger:"mouseenter focus",triggerTarget:null},{animateFill:!1,followCursor:!1,inlinePositioning:!1,sticky:!1},{allowHTML:!1,animation:"fade",arrow:!0,content:"",inertia:!1,maxWidth:350,role:"tooltip",theme:"",zIndex:9999}),$e=Object.keys(Ve);function Ue(e){var t=(e.plugins||[]).reduce((function(t,n){var i,r=n.name,o=n.defaultValue;return r&&(t[r]=void 0!==e[r]?e[r]:null!=(i=Ve[r])?i:o),t}),{});return Object.assign({},e,t)}function ze(e,t){var n=Object.assign({},t,{content:Te(t.content,[e])},t.ignoreAttributes?{}:function(e,t){return(t?Object.keys(Ue(Object.assign({},Ve,{plugins:t}))):$e).reduce((function(t,n){var i=(e.getAttribute("data-tippy-"+n)||"").trim();if(!i)return t;if("content"===n)t[n]=i;else try{t[n]=JSON.parse(i)}catch(e){t[n]=i}return t}),{})}(e,t.plugins));return n.aria=Object.assign({},Ve.aria,n.aria),n.aria={expanded:"auto"===n.aria.expanded?t.interactive:n.aria.expanded,content:"auto"===n.aria.content?t.interactive?null:"describedby":n.aria.content},n}var Xe=function(){return"innerHTML"};function Ye(e,t){e[Xe()]=t}function Je(e){var t=Ie();return!0===e?t.className=ye:(t.className=be,ke(e)?t.appendChild(e):Ye(t,e)),t}function Ge(e,t){ke(t.content)?(Ye(e,""),e.appendChild(t.content)):"function"!=typeof t.content&&(t.allowHTML?Ye(e,t.content):e.textContent=t.content)}function Ke(e){var t=e.firstElementChild,n=De(t.children);return{box:t,content:n.find((function(e){return e.classList.contains(ge)})),arrow:n.find((function(e){return e.classList.contains(ye)||e.classList.contains(be)})),backdrop:n.find((function(e){return e.classList.contains(we)}))}}function Qe(e){var t=Ie(),n=Ie();n.className="tippy-box",n.setAttribute("data-state","hidden"),n.setAttribute("tabindex","-1");var i=Ie();function r(n,i){var r=Ke(t),o=r.box,a=r.content,s=r.arrow;i.theme?o.setAttribute("data-theme",i.theme):o.removeAttribute("data-theme"),"string"==typeof i.animation?o.setAttribute("data-animation",i.animation):o.removeAttribute("data-animation"),i.inertia?o.setAttribute("data-inertia",""):o.removeAttribute("data-inertia"),o.style.maxWidth="number"==typeof i.maxWidth?i.maxWidth+"px":i.maxWidth,i.role?o.setAttribute("role",i.role):o.removeAttribute("role"),n.content===i.content&&n.allowHTML===i.allowHTML||Ge(a,e.props),i.arrow?s?n.arrow!==i.arrow&&(o.removeChild(s),o.appendChild(Je(i.arrow))):o.appendChild(Je(i.arrow)):s&&o.removeChild(s)}return i.className=ge,i.setAttribute("data-state","hidden"),Ge(i,e.props),t.appendChild(n),n.appendChild(i),r(e.props,e.props),{popper:t,onUpdate:r}}Qe.$$tippy=!0;var Ze=1,et=[],tt=[];function nt(e,t){var n,i,r,o,a,s,c,l,d=ze(e,Object.assign({},Ve,Ue(Me(t)))),p=!1,u=!1,f=!1,h=!1,m=[],v=Ae(X,d.interactiveDebounce),g=Ze++,w=(l=d.plugins).filter((function(e,t){return l.indexOf(e)===t})),y={id:g,reference:e,popper:Ie(),popperInstance:null,props:d,state:{isEnabled:!0,isVisible:!1,isDestroyed:!1,isMounted:!1,isShown:!1},plugins:w,clearDelayTimeouts:function(){clearTimeout(n),clearTimeout(i),cancelAnimationFrame(r)},setProps:function(t){if(!y.state.isDestroyed){R("onBeforeUpdate",[y,t]),U();var n=y.props,i=ze(e,Object.assign({},n,Me(t),{ignoreAttributes:!0}));y.props=i,$(),n.interactiveDebounce!==i.interactiveDebounce&&(H(),v=Ae(X,i.interactiveDebounce)),n.triggerTarget&&!i.triggerTarget?Se(n.triggerTarget).forEach((function(e){e.removeAttribute("aria-expanded")})):i.triggerTarget&&e.removeAttribute("aria-expanded"),j(),k(),x&&x(n,i),y.popperInstance&&(K(),Z().forEach((function(e){requestAnimationFrame(e._tippy.popperInstance.forceUpdate)}))),R("onAfterUpdate",[y,t])}},setContent:function(e){y.setProps({content:e})},show:function(){var e=y.state.isVisible,t=y.state.isDestroyed,n=!y.state.isEnabled,i=Ne.isTouch&&!y.props.touch,r=Oe(y.props.duration,0,Ve.duration);if(!(e||t||n||i||C().hasAttribute("disabled")||(R("onShow",[y],!1),!1===y.props.onShow(y)))){if(y.state.isVisible=!0,S()&&(E.style.visibility="visible"),k(),q(),y.state.isMounted||(E.style.transition="none"),S()){var o=M();Re([o.box,o.content],0)}var a,c,l;s=function(){var e;if(y.state.isVisible&&!h){if(h=!0,E.offsetHeight,E.style.transition=y.props.moveTransition,S()&&y.props.animation){var t=M(),n=t.box,i=t.content;Re([n,i],r),Pe([n,i],"visible")}P(),j(),Ce(tt,y),null==(e=y.popperInstance)||e.forceUpdate(),R("onMount",[y]),y.props.animation&&S()&&function(e,t){_(e,(function(){y.state.isShown=!0,R("onShown",[y])}))}(r)}},c=y.props.appendTo,l=C(),(a=y.props.interactive&&c===xe||"parent"===c?l.parentNode:Te(c,[l])).contains(E)||a.appendChild(E),y.state.isMounted=!0,K()}},hide:function(){var e=!y.state.isVisible,t=y.state.isDestroyed,n=!y.state.isEnabled,i=Oe(y.props.duration,1,Ve.duration);if(!(e||t||n)&&(R("onHide",[y],!1),!1!==y.props.onHide(y))){if(y.state.isVisible=!1,y.state.isShown=!1,h=!1,p=!1,S()&&(E.style.visibility="hidden"),H(),B(),k(!0),S()){var r=M(),o=r.box,a=r.content;y.props.animation&&(Re([o,a],i),Pe([o,a],"hidden"))}P(),j(),y.props.animation?S()&&function(e,t){_(e,(function(){!y.state.isVisible&&E.parentNode&&E.parentNode.contains(E)&&t()}))}(i,y.unmount):y.unmount()}},hideWithInteractivity:function(e){D().addEventListener("mousemove",v),Ce(et,v),v(e)},enable:function(){y.state.isEnabled=!0},disable:function(){y.hide(),y.state.isEnabled=!1},unmount:function(){y.state.isVisible&&y.hide(),y.state.isMounted&&(Q(),Z().forEach((function(e){e._tippy.unmount()})),E.parentNode&&E.parentNode.removeChild(E),tt=tt.filter((function(e){return e!==y})),y.state.isMounted=!1,R("onHidden",[y]))},destroy:function(){y.state.isDestroyed||(y.clearDelayTimeouts(),y.unmount(),U(),delete e._tippy,y.state.isDestroyed=!0,R("onDestroy",[y]))}};if(!d.render)return y;var b=d.render(y),E=b.popper,x=b.onUpdate;E.setAttribute("data-tippy-root",""),E.id="tippy-"+y.id,y.popper=E,e._tippy=y,E._tippy=y;var O=w.map((function(e){return e.fn(y)})),L=e.hasAttribute("aria-expanded");return $(),j(),k(),R("onCreate",[y]),d.showOnCreate&&ee(),E.addEventListener("mouseenter",(function(){y.props.interactive&&y.state.isVisible&&y.clearDelayTimeouts()})),E.addEventListener("mouseleave",(function(){y.props.interactive&&y.props.trigger.indexOf("mouseenter")>=0&&D().addEventListener("mousemove",v)})),y;function T(){var e=y.props.touch;return Array.isArray(e)?e:[e,0]}function A(){return"hold"===T()[0]}function S(){var e;return!(null==(e=y.props.render)||!e.$$tippy)}function C(){return c||e}function D(){var e,t,n=C().parentNode;return n?null!=(t=Se(n)[0])&&null!=(e=t.ownerDocument)&&e.body?t.ownerDocument:document:document}function M(){return Ke(E)}function I(e){return y.state.isMounted&&!y.state.isVisible||Ne.isTouch||o&&"focus"===o.type?0:Oe(y.props.delay,e?0:1,Ve.delay)}function k(e){void 0===e&&(e=!1),E.style.pointerEvents=y.props.interactive&&!e?"":"none",E.style.zIndex=""+y.props.zIndex}function R(e,t,n){var i;void 0===n&&(n=!0),O.forEach((function(n){n[e]&&n[e].apply(n,t)})),n&&(i=y.props)[e].apply(i,t)}function P(){var t=y.props.aria;if(t.content){var n="aria-"+t.content,i=E.id;Se(y.props.triggerTarget||e).forEach((function(e){var t=e.getAttribute(n);if(y.state.isVisible)e.setAttribute(n,t?t+" "+i:i);else{var r=t&&t.replace(i,"").trim();r?e.setAttribute(n,r):e.removeAttribute(n)}}))}}function j(){!L&&y.props.aria.expanded&&Se(y.props.triggerTarget||e).forEach((function(e){y.props.interactive?e.setAttribute("aria-expanded",y.state.isVisible&&e===C()?"true":"false"):e.removeAttribute("aria-expanded")}))}function H(){D().removeEventListener("mousemove",v),et=et.filter((function(e){return e!==v}))}function N(t){if(!Ne.isTouch||!f&&"mousedown"!==t.type){var n=t.composedPath&&t.composedPath()[0]||t.target;if(!y.props.interactive||!He(E,n)){if(Se(y.props.triggerTarget||e).some((function(e){return He(e,n)}))){if(Ne.isTouch)return;if(y.state.isVisible&&y.props.trigger.indexOf("click")>=0)return}else R("onClickOutside",[y,t]);!0===y.props.hideOnClick&&(y.clearDelayTimeouts(),y.hide(),u=!0,setTimeout((function(){u=!1})),y.state.isMounted||B())}}}function F(){f=!0}function W(){f=!1}function q(){var e=D();e.addEventListener("mousedown",N,!0),e.addEventListener("touchend",N,Ee),e.addEventListener("touchstart",W,Ee),e.addEventListener("touchmove",F,Ee)}function B(){var e=D();e.removeEventListener("mousedown",N,!0),e.removeEventListener("touchend",N,Ee),e.removeEventListener("touchstart",W,Ee),e.removeEventListener("touchmove",F,Ee)}function _(e,t){var n=M().box;function i(e){e.target===n&&(je(n,"remove",i),t())}if(0===e)return t();je(n,"remove",a),je(n,"add",i),a=i}function V(t,n,i){void 0===i&&(i=!1),Se(y.props.triggerTarget||e).forEach((function(e){e.addEventListener(t,n,i),m.push({node:e,eventType:t,handler:n,options:i})}))}function $(){var e;A()&&(V("touchstart",z,{passive:!0}),V("touchend",Y,{passive:!0})),(e=y.props.trigger,e.split(/\s+/).filter(Boolean)).forEach((function(e){if("manual"!==e)switch(V(e,z),e){case"mouseenter":V("mouseleave",Y);break;case"focus":V(_e?"focusout":"blur",J);break;case"focusin":V("focusout",J)}}))}function U(){m.forEach((function(e){var t=e.node,n=e.eventType,i=e.handler,r=e.options;t.removeEventListener(n,i,r)})),m=[]}function z(e){var t,n=!1;if(y.state.isEnabled&&!G(e)&&!u){var i="focus"===(null==(t=o)?void 0:t.type);o=e,c=e.currentTarget,j(),!y.state.isVisible&&Le(e,"MouseEvent")&&et.forEach((function(t){return t(e)})),"click"===e.type&&(y.props.trigger.indexOf("mouseenter")<0||p)&&!1!==y.props.hideOnClick&&y.state.isVisible?n=!0:ee(e),"click"===e.type&&(p=!n),n&&!i&&te(e)}}function X(e){var t=e.target,n=C().contains(t)||E.contains(t);if("mousemove"!==e.type||!n){var i=Z().concat(E).map((function(e){var t,n=null==(t=e._tippy.popperInstance)?void 0:t.state;return n?{popperRect:e.getBoundingClientRect(),popperState:n,props:d}:null})).filter(Boolean);(function(e,t){var n=t.clientX,i=t.clientY;return e.every((function(e){var t=e.popperRect,r=e.popperState,o=e.props.interactiveBorder,a=r.placement.split("-")[0],s=r.modifiersData.offset;if(!s)return!0;var c="bottom"===a?s.top.y:0,l="top"===a?s.bottom.y:0,d="right"===a?s.left.x:0,p="left"===a?s.right.x:0,u=t.top-i+c>o,f=i-t.bottom-l>o,h=t.left-n+d>o,m=n-t.right-p>o;return u||f||h||m}))})(i,e)&&(H(),te(e))}}function Y(e){G(e)||y.props.trigger.indexOf("click")>=0&&p||(y.props.interactive?y.hideWithInteractivity(e):te(e))}function J(e){y.props.trigger.indexOf("focusin")<0&&e.target!==C()||y.props.interactive&&e.relatedTarget&&E.contains(e.relatedTarget)||te(e)}function G(e){return!!Ne.isTouch&&A()!==e.type.indexOf("touch")>=0}function K(){Q();var t=y.props,n=t.popperOptions,i=t.placement,r=t.offset,o=t.getReferenceClientRect,a=t.moveTransition,c=S()?Ke(E).arrow:null,l=o?{getBoundingClientRect:o,contextElement:o.contextElement||C()}:e,d=[{name:"offset",options:{offset:r}},{name:"preventOverflow",options:{padding:{top:2,bottom:2,left:5,right:5}}},{name:"flip",options:{padding:5}},{name:"computeStyles",options:{adaptive:!a}},{name:"$$tippy",enabled:!0,phase:"beforeWrite",requires:["computeStyles"],fn:function(e){var t=e.state;if(S()){var n=M().box;["placement","reference-hidden","escaped"].forEach((function(e){"placement"===e?n.setAttribute("data-placement",t.placement):t.attributes.popper["data-popper-"+e]?n.setAttribute("data-"+e,""):n.removeAttribute("data-"+e)})),t.attributes.popper={}}}}];S()&&c&&d.push({name:"arrow",options:{element:c,padding:3}}),d.push.apply(d,(null==n?void 0:n.modifiers)||[]),y.popperInstance=ve(l,E,Object.assign({},n,{placement:i,onFirstUpdate:s,modifiers:d}))}function Q(){y.popperInstance&&(y.popperInstance.destroy(),y.popperInstance=null)}function Z(){return De(E.querySelectorAll("[data-tippy-root]"))}function ee(e){y.clearDelayTimeouts(),e&&R("onTrigger",[y,e]),q();var t=I(!0),i=T(),r=i[0],o=i[1];Ne.isTouch&&"hold"===r&&o&&(t=o),t?n=setTimeout((function(){y.show()}),t):y.show()}function te(e){if(y.clearDelayTimeouts(),R("onUntrigger",[y,e]),y.state.isVisible){if(!(y.props.trigger.indexOf("mouseenter")>=0&&y.props.trigger.indexOf("click")>=0&&["mouseleave","mousemove"].indexOf(e.type)>=0&&p)){var t=I(!1);t?i=setTimeout((function(){y.state.isVisible&&y.hide()}),t):r=requestAnimationFrame((function(){y.hide()}))}}else B()}}function it(e,t){void 0===t&&(t={});var n=Ve.plugins.concat(t.plugins||[]);document.addEventListener("touchstart",We,Ee),window.addEventListener("blur",Be);var i,r=Object.assign({},t,{plugins:n}),o=(i=e,ke(i)?[i]:function(e){return Le(e,"NodeList")}(i)?De(i):Array.isArray(i)?i:De(document.querySelectorAll(i))).reduce((function(e,t){var n=t&&nt(t,r);return n&&e.push(n),e}),[]);return ke(e)?o[0]:o}it.defaultProps=Ve,it.setDefaultProps=function(e){Object.keys(e).forEach((function(t){Ve[t]=e[t]}))},it.currentInput=Ne,Object.assign({},Q,{effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow)}}),it.setDefaultProps({render:Qe});const rt=it;var ot=n(72),at=n.n(ot),st=n(825),ct=n.n(st),lt=n(659),dt=n.n(lt),pt=n(56),ut=n.n(pt),ft=n(540),ht=n.n(ft),mt=n(113),vt=n.n(mt),gt=n(2),wt={};wt.styleTagTransform=vt(),wt.setAttributes=ut(),wt.insert=dt().bind(null,"head"),wt.domAPI=ct(),wt.insertStyleElement=ht(),at()(gt.A,wt),gt.A&&gt.A.locals&&gt.A.locals;(__fedit_tippy__=>{let tippy=__fedit_tippy__;class Tooltip{constructor(element){this.element=element,this.tooltipConfig=this.makeConfig(),this.init()}init(){tippy(this.element,this.tooltipConfig)}makeConfig(){let cfg={content:this.element.getAttribute(`title`)};for(let i=0;i<this.element.attributes.length;i++){let attr=this.element.attributes[i];if(attr.name.startsWith(`data-tooltip-`)){let key=attr.name.replace(`data-tooltip-`,``);cfg[key]=attr.value}}return this.tooltipConfig=cfg,cfg}}let HYDRATE_ROOT_MARGIN=`200px`,HYDRATE_IDLE_BATCH=25,wrapperSelector=`.wagtail-fedit-adapter-wrapper`,initializedClass=`wagtail-fedit-initialized`,pendingClass=`wagtail-fedit-pending`,pendingEditors=/* @__PURE__ */ new Set,hydrationObserver=null,idleScheduled=!1,listening=!1;function getEditorClass(element){let editorClass=element.dataset.feditConstructor;if(editorClass)return window.wagtailFedit.editors[editorClass];throw Error(`No editor class found for element`)}function canDefer(){return`IntersectionObserver`in window}function requestIdle(callback){`requestIdleCallback`in window?window.requestIdleCallback(callback,{timeout:2e3}):setTimeout(()=>callback(null),50)}function initTooltips(root,owner){let buttons=root.querySelectorAll(`[data-tooltip='true']`);for(let i=0;i<buttons.length;i++){let button=buttons[i];button.closest(wrapperSelector)===owner&&(new Tooltip(button),delete button.dataset.tooltip)}}function hydrateEditor(element){if(element.classList.contains(initializedClass))return!1;let editor=element;pendingEditors.delete(editor),hydrationObserver&&hydrationObserver.unobserve(editor),editor.classList.remove(pendingClass),editor.classList.add(initializedClass);let editorClass=getEditorClass(editor);return editorClass?new editorClass(editor):console.error(`No editor class found for element`,editor),initTooltips(editor,editor),!0}function hydrateAll(){for(let editor of pendingEditors)hydrateEditor(editor)}function onInteraction(event){if(!pendingEditors.size||!(event.target instanceof Element))return;let editors=[],editor=event.target.closest(`.${pendingClass}`);for(;editor;)editors.unshift(editor),editor=editor.parentElement?.closest(`.${pendingClass}`);for(let i=0;i<editors.length;i++)hydrateEditor(editors[i])}function onIdle(deadline){idleScheduled=!1;let hydrated=0;for(let editor of pendingEditors){if(hydrated>=25||deadline&&deadline.timeRemaining()<1)break;if(!editor.isConnected){pendingEditors.delete(editor),hydrationObserver.unobserve(editor);continue}hydrateEditor(editor),hydrated++}scheduleIdle()}function scheduleIdle(){idleScheduled||!pendingEditors.size||(idleScheduled=!0,requestIdle(onIdle))}function deferEditor(editor){hydrationObserver||=new IntersectionObserver(entries=>{for(let i=0;i<entries.length;i++)entries[i].isIntersecting&&hydrateEditor(entries[i].target)},{rootMargin:`200px`}),listening||(listening=!0,document.addEventListener(`pointerover`,onInteraction,{capture:!0,passive:!0}),document.addEventListener(`focusin`,onInteraction,{capture:!0,passive:!0})),editor.classList.add(pendingClass),pendingEditors.add(editor),hydrationObserver.observe(editor)}function initNewEditors(wrapper=document){let wagtailFeditBlockEditors;wagtailFeditBlockEditors=wrapper instanceof HTMLElement&&wrapper.classList.contains(`wagtail-fedit-adapter-wrapper`)&&!wrapper.classList.contains(initializedClass)?[wrapper]:wrapper.querySelectorAll(wrapperSelector);let defer=canDefer(),hash=window.location.hash.slice(1);for(let i=0;i<wagtailFeditBlockEditors.length;i++){let editor=wagtailFeditBlockEditors[i];editor.classList.contains(initializedClass)||editor.classList.contains(pendingClass)||(!defer||hash&&editor.id===hash?hydrateEditor(editor):deferEditor(editor))}let owner=wrapper instanceof HTMLElement?wrapper.closest(wrapperSelector):null;(!owner||owner.classList.contains(initializedClass))&&initTooltips(wrapper,owner),scheduleIdle()}function refreshPage(){let url=window.location.href,scrollY=window.scrollY,scrollX=window.scrollX,urlObj=new URL(url);urlObj.searchParams.set(`scrollY`,`${scrollY}`),urlObj.searchParams.set(`scrollX`,`${scrollX}`),window.location.href=urlObj.toString()}function setScrollParams(button){if(!button)return;let url=new URL(button.href);window.scrollY>100&&url.searchParams.set(`scrollY`,`${window.scrollY}`),window.scrollX>100&&url.searchParams.set(`scrollX`,`${window.scrollX}`),button.href=url.toString()}function getCookie(name){let cookieValue=null;if(document.cookie&&document.cookie!==``){let cookies=document.cookie.split(`;`);for(let i=0;i<cookies.length;i++){let cookie=cookies[i].trim();if(cookie.substring(0,name.length+1)===name+`=`){cookieValue=decodeURIComponent(cookie.substring(name.length+1));break}}}return cookieValue}class WagtailFeditorAPI{constructor(editor){this.editor=editor}openEditor(){this.editor.openEditor()}closeEditor(){this.editor.closeEditor()}executeEvent(name,detail){this.editor.executeEvent(name,detail)}addEventListener(name,callback){this.editor.addEventListener(name,callback)}removeEventListener(name,callback,options){this.editor.removeEventListener(name,callback,options)}updateHtml(html){return new Promise((resolve,reject)=>{let update=innerHtml=>{let blockWrapper=this.editor.wrapperElement,element=document.createElement(`div`);element.innerHTML=innerHtml;let newBlockWrapper=element.firstElementChild;return newBlockWrapper.classList.add(`wagtail-fedit-initialized`),blockWrapper.parentNode.insertBefore(newBlockWrapper,blockWrapper),blockWrapper.parentNode.removeChild(blockWrapper),this.editor.wrapperElement=newBlockWrapper,this.editor.initNewEditors(),this.editor.init(),resolve(newBlockWrapper),blockWrapper};if(typeof html==`string`){update(html);return}if(typeof html==`function`){this.editor.wrapperElement.editorAPI=this,html(update);return}})}async fetch(url,method,body){let headers=new Headers;return headers.append(`X-Requested-With`,`XMLHttpRequest`),headers.append(`X-CSRFToken`,getCookie(`csrftoken`)),body instanceof FormData||(body=JSON.stringify(body)),fetch(url,{method,headers,body}).then(response=>response.json())}refetch(){return this.editor.refetch()}execRelated(func){for(let wrapper of this.editor.relatedWrappers)hydrateEditor(wrapper),func(wrapper.editorAPI)}}let modalIdentifier=`wagtail-fedit-modal`,modalHtml=`
+<div class="${modalIdentifier}-wrapper">
+    <div class="${modalIdentifier}" id="${modalIdentifier}-__ID__-modal">
+    </div>
+</div>`;class EditorModal{constructor(options){this.options=options,this.modalHtml=modalHtml.replace(`__ID__`,this.options.modalId)}static get modalWrapper(){var wrapper=document.querySelector(`#${modalIdentifier}-wrapper`);return wrapper||(wrapper=document.createElement(`div`),wrapper.id=`${modalIdentifier}-wrapper`,wrapper.classList.add(`${modalIdentifier}-wrapper`),document.body.appendChild(wrapper),wrapper)}get wrapper(){return this.constructor.modalWrapper}get modal(){var modal=this.wrapper.querySelector(`.${modalIdentifier}`);modal&&modal.id!==`${modalIdentifier}-${this.options.modalId}-modal`&&(modal.remove(),modal=null),modal||=this.buildModal();var md=modal;return md.modal=this,md}get innerHTML(){return this.modal.innerHTML}set innerHTML(html){this.modal.innerHTML=html}get style(){return this.modal.style}get classList(){return this.modal.classList}get children(){return this.modal.children}buildModal(){var wrapper=this.wrapper,modal=wrapper.querySelector(`.${modalIdentifier}`);return modal||=(wrapper.innerHTML=this.modalHtml,wrapper.querySelector(`.${modalIdentifier}`)),modal.modal||=this,modal}addClass(className){this.modal.classList.add(className)}removeClass(className){this.modal.classList.remove(className)}openModal(){this.wrapper.classList.add(`open`),this.options.onOpen&&this.options.onOpen()}closeModal(){this.wrapper.classList.remove(`open`),this.wrapper.innerHTML=``,this.options.onClose&&this.options.onClose()}destroy(){this.wrapper.remove(),this.options.onDestroy&&this.options.onDestroy()}appendChild(...children){if(children.length!==0)for(let i=0;i<children.length;i++)this.modal.appendChild(children[i])}removeChild(child){this.modal.removeChild(child)}dispatchEvent(event,options){options||={},options.modal=this.modal;let customEvent=new CustomEvent(event,{detail:options});this.modal.dispatchEvent(customEvent)}addEventListener(event,listener){this.modal.addEventListener(event,listener)}removeEventListener(event,listener){this.modal.removeEventListener(event,listener)}}class BaseIFrame{executeOnloadImmediately=!1;constructor(options){this.url=options.url,this.srcdoc=options.srcdoc,this.iframe=null,this.id=options.id,this.className=options.className,this.onResize=options.onResize,this.executeOnloadImmediately=options.executeOnloadImmediately,this.onLoad=options.onLoad,this.onError=options.onError,this.onCancel=options.onCancel,this.render()}get element(){return this.iframe||=this._renderFrame(this.url,this.srcdoc,this.onLoad),this.iframe}get document(){return this.window?this.window.document:null}get window(){return this.element?.contentWindow}get mainElement(){return this.document?.querySelector(`#main`)}get scrollableElement(){return this.document.body}destroy(){this.iframe.remove(),this.resizeInterval&&(clearInterval(this.resizeInterval),delete this.resizeInterval)}update(url,srcdoc){this.srcdoc=srcdoc,this.url=url,this._renderFrame(this.url,this.srcdoc,({newFrame})=>{this.iframe.remove(),this.iframe=newFrame,this.onLoad({newFrame})},this.onError)}render(){return this.iframe||=this._renderFrame(this.url,this.srcdoc,this.onLoad),this.iframe}_renderFrame(url,srcDoc,onLoad,onError=()=>{}){let iframe=document.createElement(`iframe`);return srcDoc?iframe.srcdoc=srcDoc:iframe.src=url,iframe.id=this.id,iframe.className=this.className,iframe.onload=()=>{if(!this.scrollableElement){onError();return}this.watchResize(onError),this._onLoad(iframe),onLoad&&(this.executeOnloadImmediately||this.document.readyState===`complete`?onLoad({newFrame:iframe}):iframe.contentWindow.addEventListener(`DOMContentLoaded`,()=>{onLoad({newFrame:iframe})}))},iframe.onerror=()=>{onError()},iframe}watchResize(onError=()=>{}){this.resizeInterval&&(clearInterval(this.resizeInterval),delete this.resizeInterval);let scrollableElement=this.scrollableElement;if(!this.onResize||!scrollableElement)return;let lastHeight=scrollableElement.scrollHeight;this.onResize(0,lastHeight),this.resizeInterval=setInterval(()=>{if(!scrollableElement){clearInterval(this.resizeInterval);return}try{lastHeight!==scrollableElement.scrollHeight&&(this.onResize(lastHeight,scrollableElement.scrollHeight),lastHeight=scrollableElement.scrollHeight)}catch(e){clearInterval(this.resizeInterval),console.error(e),onError()}},25)}setOptions(options){options.id&&(this.id=options.id,this.element.id=options.id),this.className=options.className||null,this.element.className=this.className||``,this.onResize=options.onResize,this.watchResize()}_onLoad(iframe){}}class FormIFrame extends BaseIFrame{get scrollableElement(){return this.document.querySelector(`.wagtail-fedit-form-wrapper`)}get formElement(){return this.document?.querySelector(`#wagtail-fedit-form`)}get formWrapper(){return this.document?.querySelector(`.wagtail-fedit-form-wrapper`)}initWidgets(){let uninitializedBlock=this.mainElement.querySelector(`#value[data-block]`);uninitializedBlock&&this.window.initBlockWidget(uninitializedBlock.id)}async swapFragment(html){let doc=this.document,template=doc.createElement(`template`);template.innerHTML=html;let title=template.content.querySelector(`title`);title&&(doc.title=title.textContent,title.remove());let stylesheets=template.content.querySelectorAll(`link[rel='stylesheet']`);for(let i=0;i<stylesheets.length;i++){let link=stylesheets[i];link.remove(),doc.querySelector(`link[href="${link.getAttribute(`href`)}"]`)||doc.head.appendChild(link)}let furniture=doc.querySelector(`body > .wrapper`);furniture.replaceChildren(template.content);let scripts=Array.from(furniture.querySelectorAll(`script`));for(let script of scripts){if(!isExecutable(script))continue;let src=script.getAttribute(`src`);if(src&&doc.querySelectorAll(`script[src="${src}"]`).length>1){script.remove();continue}let newScript=doc.createElement(`script`);for(let i=0;i<script.attributes.length;i++)newScript.setAttribute(script.attributes[i].name,script.attributes[i].value);newScript.textContent=script.textContent,src?await new Promise(resolve=>{newScript.onload=newScript.onerror=resolve,script.replaceWith(newScript)}):script.replaceWith(newScript)}this.initWidgets(),this._onLoad(this.iframe)}_onLoad(iframe){super._onLoad(iframe);let cancelButton=this.document.querySelector(`.wagtail-fedit-cancel-button`);cancelButton&&cancelButton.addEventListener(`click`,()=>{clearInterval(this.resizeInterval),this.onCancel&&this.onCancel()})}}function isExecutable(script){let type=(script.type||``).toLowerCase();return!type||type===`text/javascript`||type===`module`}class FramePool{static instance=null;static frameOptions={id:`wagtail-fedit-iframe`,className:null};constructor(){this.container=null,this.modalElement=null,this.frame=null,this.loaded=null,this.url=null,this.inUse=!1}static get pool(){return this.instance||=new FramePool,this.instance}static warm(url){let pool=this.pool;if(pool.loaded||!url)return;let preload=()=>pool.preload(url).catch(()=>{});`requestIdleCallback`in window?window.requestIdleCallback(preload,{timeout:5e3}):setTimeout(preload,200)}preload(url){return this.loaded?this.loaded:(this.container=document.createElement(`div`),this.container.classList.add(`wagtail-fedit-frame-pool`),this.container.style.display=`none`,this.modalElement=document.createElement(`div`),this.container.appendChild(this.modalElement),document.body.appendChild(this.container),this.url=url,this.loaded=new Promise((resolve,reject)=>{this.frame=new FormIFrame({...FramePool.frameOptions,url,executeOnloadImmediately:!0,onLoad:()=>{resolve(this.frame)},onError:()=>{this.discard(),reject(/* @__PURE__ */ Error(`Failed to load the editor frame`))}}),this.modalElement.appendChild(this.frame.element)}),this.loaded)}async acquire(url,options={}){if(this.inUse)throw Error(`The editor frame is already in use`);this.inUse=!0;try{let frame=await this.preload(url);if(this.url!==url){let fragmentUrl=new URL(url,window.location.href);fragmentUrl.searchParams.set(`fragment`,`1`);let response=await fetch(fragmentUrl.toString());if(!response.ok)throw Error(`Failed to load the form fragment: ${response.status}`);await frame.swapFragment(await response.text())}return frame.setOptions(options),this.url=null,frame}catch(e){throw this.inUse=!1,e}}show(){this.container.classList.add(`wagtail-fedit-modal-wrapper`),this.modalElement.classList.add(`wagtail-fedit-modal`),this.container.style.display=``}release(){this.container.style.display=`none`,this.container.classList.remove(`wagtail-fedit-modal-wrapper`),this.modalElement.className=``;for(let child of Array.from(this.modalElement.children))child!==this.frame.element&&child.remove();this.frame.setOptions(FramePool.frameOptions),this.frame.onCancel=null,this.inUse=!1}discard(){this.container&&this.container.remove(),this.frame&&this.frame.destroy(),FramePool.instance=null}}let pending=[],scheduled=!1,batchRefetchUrl;function getBatchRefetchUrl(){if(batchRefetchUrl!==void 0)return batchRefetchUrl;batchRefetchUrl=null;let config=document.getElementById(`wagtail-fedit-config`);if(config)try{batchRefetchUrl=JSON.parse(config.textContent).refetchBatchUrl||null}catch(e){console.error(`Failed to parse wagtail-fedit config`,e)}return batchRefetchUrl}function fetchSingle(item){fetch(item.url).then(response=>response.json()).then(item.resolve).catch(item.reject)}function flush(){let items=pending;pending=[],scheduled=!1;let url=getBatchRefetchUrl();if(!url||items.length===1){items.forEach(fetchSingle);return}let headers=new Headers;headers.append(`X-Requested-With`,`XMLHttpRequest`),headers.append(`X-CSRFToken`,getCookie(`csrftoken`)),headers.append(`Content-Type`,`application/json`),fetch(url,{method:`POST`,headers,body:JSON.stringify({adapters:items.map((item,i)=>({id:String(i),url:item.url}))})}).then(response=>{if(!response.ok)throw Error(`Batch refetch failed with status ${response.status}`);return response.json()}).then(response=>{items.forEach((item,i)=>{let result=response.results[String(i)];if(!result||result.error){fetchSingle(item);return}item.resolve(result)})}).catch(e=>{console.error(`Failed to batch refetch, falling back to single requests`,e),items.forEach(fetchSingle)})}function queueRefetch(url){return new Promise((resolve,reject)=>{pending.push({url,resolve,reject}),scheduled||(scheduled=!0,setTimeout(flush,0))})}class BaseWagtailFeditEditor extends EventTarget{constructor(element){super(),this.api=new WagtailFeditorAPI(this),this.initialTitle=document.title,this.wrapperElement=element,this.sharedContext=null,this.editBtn=null,this.iframe=null,this.framePool=null,this.init();let buttonWrapper=this.wrapperElement.firstElementChild;if(!this.wrapperElement.querySelector(`.wagtail-fedit-adapter-wrapper`)){let imgTag=this.wrapperElement.querySelector(`img`);imgTag?imgTag.addEventListener(`load`,()=>{buttonWrapper.clientHeight-15>this.wrapperElement.clientHeight&&buttonWrapper.classList.add(`wagtail-fedit-buttons--overflow`)}):buttonWrapper.clientHeight-15>this.wrapperElement.clientHeight&&buttonWrapper.classList.add(`wagtail-fedit-buttons--overflow`)}this.usesFramePool&&FramePool.warm(this.editUrl),window.location.hash===`#${this.wrapperElement.id}`&&(this.openEditor(),this.focus())}get editUrl(){return this.wrapperElement.dataset.editUrl}get refetchUrl(){return this.wrapperElement.dataset.refetchUrl}get relatedWrappers(){let wrapperId=this.wrapperElement.dataset.wrapperId,filterFn=el=>el!==this.wrapperElement,elements=document.querySelectorAll(`[data-wrapper-id="${wrapperId}"]`);return Array.from(elements).filter(filterFn)}init(){this.sharedContext=this.wrapperElement.dataset.sharedContext,this.wrapperElement.editorAPI=this.api,this.editBtn=this.wrapperElement.querySelector(`.wagtail-fedit-edit-button`),this.editBtn.addEventListener(`click`,async e=>{e.preventDefault(),e.stopPropagation(),!this.opened&&this.openEditor()})}initNewEditors(){initNewEditors(this.wrapperElement)}focus(){this.wrapperElement.focus()}refetch(){return new Promise((resolve,reject)=>{queueRefetch(this.refetchUrl).then(response=>{if(!response.success){console.error(`Errors rendering response, failed to refetch`,response);return}this.onResponse(response),resolve(response)}).catch(e=>{console.error(`Failed to refetch`,e),reject(e)})})}refetchParent(fallback){let body=document.body,parent=this.wrapperElement.parentElement;for(;parent&&parent!==body;){if(parent.classList.contains(`wagtail-fedit-initialized`)||parent.classList.contains(`wagtail-fedit-pending`)){hydrateEditor(parent),parent.editorAPI.refetch().then(()=>{initNewEditors(parent)});return}parent=parent.parentElement}fallback&&fallback()}onResponse(response){throw Error(`onResponse not implemented, cannot call super`)}get frameOptions(){return{}}get usesFramePool(){return!0}bindIframe(wrapper){let onSubmit=e=>{e.preventDefault();let formData=new FormData(this.iframe.formElement);this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT,{element:this.wrapperElement,formData}),fetch(this.editUrl,{method:`POST`,body:formData}).then(response=>response.json()).then(response=>{if(!response.success){console.error(`Errors rendering response`,response),this.iframe.swapFragment(response.html).then(()=>{this.iframe.formElement.onsubmit=onSubmit,this.iframe.onCancel=this.closeEditor.bind(this),this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT_ERROR,{element:this.wrapperElement,response})});return}let ret=this.onResponse(response),success=()=>{this.closeEditor(),this.executeEvent(window.wagtailFedit.EVENTS.CHANGE,{element:this.wrapperElement})};ret instanceof Promise?ret.then(success):success()})};this.iframe.formElement.onsubmit=onSubmit,this.iframe.onCancel=this.closeEditor.bind(this);let formWrapper=this.iframe.formWrapper;for(let option of[`large`,`full`])if(formWrapper&&(formWrapper.classList.contains(`fedit-${option}`)||(this.iframe.formElement.dataset.editorSize||``).toLowerCase()===option)){wrapper.classList.add(`fedit-${option}`);break}let url=window.location.href.split(`#`)[0];window.history.pushState(null,this.iframe.document.title,url+`#${this.wrapperElement.id}`),document.title=this.iframe.document.title,this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_LOAD,{iframe:this.iframe})}openIframe(wrapper,fn){if(this.iframe){wrapper.appendChild(this.iframe.element),fn(this.iframe);return}this.iframe=new FormIFrame({url:this.editUrl,id:`wagtail-fedit-iframe`,className:null,executeOnloadImmediately:!0,...this.frameOptions,onLoad:()=>{this.bindIframe(wrapper)},onError:()=>{this.closeEditor()},onCancel:()=>{this.closeEditor()}}),wrapper.appendChild(this.iframe.element),fn(this.iframe)}openPooledEditor(){let pool=FramePool.pool;return pool.acquire(this.editUrl,this.frameOptions).then(iframe=>{this.framePool=pool,this.iframe=iframe,this.bindIframe(pool.modalElement),pool.modalElement.appendChild(newCloseButton(this.closeEditor.bind(this))),this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_OPEN,{iframe:this.iframe,modal:this.modal}),pool.show()})}openEditor(){if(this.opened=!0,this.usesFramePool&&!this.iframe){this.openPooledEditor().catch(e=>{console.error(`Failed to open the editor in the shared frame`,e),this.openModalEditor()});return}this.openModalEditor()}openModalEditor(){this.modal||=new EditorModal({modalId:`${this.wrapperElement.id}-modal`}),this.opened=!0,this.openIframe(this.modal,iframe=>{this.modal.appendChild(newCloseButton(this.closeEditor.bind(this))),this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_OPEN,{iframe:this.iframe,modal:this.modal}),this.modal.openModal()})}closeEditor(){if(this.opened=!1,window.history.pushState(null,this.initialTitle,window.location.href.split(`#`)[0]),document.title=this.initialTitle,this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_CLOSE),this.framePool){this.framePool.release(),this.framePool=null,this.iframe=null;return}this.modal.closeModal()}executeEvent(name,detail){detail||={element:this.wrapperElement},detail.editor=this,detail.api=this.api,name.startsWith(`${window.wagtailFedit.NAMESPACE}:`)||(name=`${window.wagtailFedit.NAMESPACE}:${name}`);let event=new CustomEvent(name,{detail});super.dispatchEvent(event),this.wrapperElement.dispatchEvent(event),document.dispatchEvent(event)}}function newCloseButton(closeFn){let button=document.createElement(`button`);return button.innerHTML=`&times;`,button.classList.add(`wagtail-fedit-close-button`),button.addEventListener(`click`,closeFn),button}class WagtailFeditPublishMenu{constructor(publishButton){this.publishButton=publishButton,this.publishButtonsWrapper=publishButton.parentElement.querySelector(`.wagtail-fedit-form-buttons`);let buttons=this.publishButtonsWrapper.querySelectorAll(`.wagtail-fedit-userbar-button`);this.init()}init(){this.publishButton.addEventListener(`click`,e=>{if(this.publishButtonsWrapper.classList.contains(`open`)){let anim=this.publishButtonsWrapper.animate([{opacity:1,height:`${this.publishButtonsWrapper.scrollHeight}px`},{opacity:0,height:`0px`}],{duration:500,easing:`ease-in-out`});anim.onfinish=()=>{this.publishButtonsWrapper.classList.remove(`open`)};return}e.preventDefault(),e.stopPropagation();let anim=this.publishButtonsWrapper.animate([{opacity:0,height:`0px`},{opacity:1,height:`${this.publishButtonsWrapper.scrollHeight}px`}],{duration:500,easing:`ease-in-out`});anim.onfinish=()=>{this.publishButtonsWrapper.classList.add(`open`)}})}}class BaseFuncEditor extends BaseWagtailFeditEditor{static get funcMap(){return window}onResponse(response){let name=response.func.name,targetElementSelector=response.func.target;if(!name||!targetElementSelector){console.error(`Invalid response`,response);return}let targetElement=document.querySelector(targetElementSelector);if(!targetElement){console.error(`Target element not found`,targetElementSelector);return}let func=this.constructor.funcMap[name];if(!func){console.error(`Function not found`,name);return}return func(targetElement,response)}}class WagtailFeditFuncEditor extends BaseFuncEditor{static get funcMap(){return window.wagtailFedit.funcs}}class FieldEditor extends BaseWagtailFeditEditor{onResponse(response){return this.api.updateHtml(update=>{let anim=this.wrapperElement.animate([{opacity:1},{opacity:0}],{duration:350,easing:`ease-in-out`});anim.onfinish=()=>{let blockWrapper=update(response.html);response.refetch||this.api.execRelated(relatedAPI=>{relatedAPI.refetch()});let anim=blockWrapper.animate([{opacity:0},{opacity:1}],{duration:350,easing:`ease-in-out`});anim.onfinish=()=>{blockWrapper.style.opacity=`1`}}})}}let MOVE_DEBOUNCE_MS=400;function MovableMixin(base){return class extends base{pendingMoves=[];moveTimer=null;moveUrl=null;constructor(...args){super(...args);let directionButtons=this.wrapperElement.querySelectorAll(`[data-direction]`);for(let i=0;i<directionButtons.length;i++){let button=directionButtons[i];button.addEventListener(`click`,e=>{e.preventDefault(),this.queueMove(button.dataset.url,button.dataset.direction)})}}queueMove(url,direction){this.moveUrl=url,this.pendingMoves.push(direction),this.moveTimer&&clearTimeout(this.moveTimer),this.moveTimer=window.setTimeout(()=>this.flushMoves(),400)}flushMoves(){let moves=this.pendingMoves.map(action=>({action}));this.pendingMoves=[],this.moveTimer=null,this.api.fetch(this.moveUrl,`POST`,{moves}).then(response=>{response.success?this.refetchParent(refreshPage):response.error?alert(`Failed to move block: `+response.error):alert(`Failed to move block`)}).catch(error=>{console.error(`Failed to move block`,error),alert(`Failed to move block`)})}}}function AddableMixin(base){return class extends base{constructor(...args){super(...args);let addButton=this.wrapperElement.querySelector(`[data-add]`);if(!addButton){console.error(`"Add" button not found, cannot further initialize AddableMixin`);return}let url=addButton.dataset.url,addModal=new EditorModal({modalId:`${this.wrapperElement.id}-modal`});addButton.addEventListener(`click`,e=>{e.preventDefault(),addModal.openModal();let addiFrame=new FormIFrame({id:`wagtail-fedit-iframe`,className:null,url,onLoad:({newFrame:HTMLIFrameElement})=>{addiFrame.formElement.onsubmit=e=>{e.preventDefault();let formData=new FormData(addiFrame.formElement);this.api.fetch(url,`POST`,formData).then(response=>{response.success?(addModal.closeModal(),this.refetchParent(refreshPage)):response.error?alert(`Failed to add block: `+response.error):alert(`Failed to add block`)}).catch(error=>{console.error(`Failed to add block`,error),alert(`Failed to add block`)})}}});addiFrame.destroy(),addModal.appendChild(addiFrame.element),addModal.appendChild(newCloseButton(addModal.closeModal.bind(addModal)))})}}}class BlockEditor extends AddableMixin(MovableMixin(FieldEditor)){}class DomPositionedFieldEditor extends FieldEditor{get usesFramePool(){return!1}get buttonsElement(){return this.wrapperElement.querySelector(`.wagtail-fedit-buttons`)}get formElement(){return this.wrapperElement.querySelector(`.wagtail-fedit-adapter-form`)}get contentElement(){return this.wrapperElement.querySelector(`.wagtail-fedit-adapter-content`)}get frameOptions(){return{onResize:(oldHeight,newHeight)=>{this.iframe.element.style.height=`${newHeight}px`}}}openEditor(){this.openIframe(this.formElement,iframe=>{this.contentElement.style.display=`none`})}closeEditor(){this.opened=!1,window.history.pushState(null,this.initialTitle,window.location.href.split(`#`)[0]),document.title=this.initialTitle,this.contentElement.style.display=`block`,this.iframe.destroy(),this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_CLOSE),delete this.iframe}}class DomPositionedBlockEditor extends AddableMixin(MovableMixin(DomPositionedFieldEditor)){}function backgroundImageAdapter(element,response){let value=response.css_value||`url(${response.url})`,cssVar=response.css_variable_name;cssVar?element.style.setProperty(cssVar,value):element.style.backgroundImage=value}window.wagtailFedit={NAMESPACE:`wagtail-fedit`,EVENTS:{SUBMIT:`wagtail-fedit:submit`,CHANGE:`wagtail-fedit:change`,EDITOR_OPEN:`wagtail-fedit:editorOpen`,EDITOR_LOAD:`wagtail-fedit:editorLoad`,EDITOR_CLOSE:`wagtail-fedit:editorClose`,SUBMIT_ERROR:`wagtail-fedit:submitError`},editors:{"wagtail_fedit.editors.BaseFuncEditor":BaseFuncEditor,"wagtail_fedit.editors.FieldEditor":FieldEditor,"wagtail_fedit.editors.BlockEditor":BlockEditor,"wagtail_fedit.editors.DomPositionedFieldEditor":DomPositionedFieldEditor,"wagtail_fedit.editors.DomPositionedBlockEditor":DomPositionedBlockEditor,"wagtail_fedit.editors.WagtailFeditFuncEditor":WagtailFeditFuncEditor},funcs:{"wagtail_fedit.funcs.backgroundImageFunc":backgroundImageAdapter},register:function(name,editor){this.editors[name]=editor},registerFunc:function(name,func){this.funcs[name]=func}};function initFEditors(){initNewEditors(),new MutationObserver(mutations=>{for(let mutation of mutations)for(let i=0;i<mutation.addedNodes.length;i++){let node=mutation.addedNodes[i];node.nodeType===1&&initNewEditors(node)}}).observe(document.body,{childList:!0,subtree:!0});let url=new URL(window.location.href),scrollY=url.searchParams.get(`scrollY`)||0,scrollX=url.searchParams.get(`scrollX`)||0;(scrollY>0||scrollX>0)&&window.scrollTo(scrollX,scrollY);let userbar=document.querySelector(`wagtail-userbar`);if(userbar){let editButton=userbar.shadowRoot.querySelector(`#wagtail-fedit-editor-button`),liveButton=userbar.shadowRoot.querySelector(`#wagtail-fedit-live-button`),publishMenu=userbar.shadowRoot.querySelector(`#wagtail-fedit-publish-menu`);if(editButton||liveButton){let timer;window.addEventListener(`scroll`,()=>{timer&&clearTimeout(timer),timer=setTimeout(()=>{setScrollParams(editButton),setScrollParams(liveButton);let windowURL=new URL(window.location.href);windowURL.searchParams.set(`scrollY`,`${window.scrollY}`),windowURL.searchParams.set(`scrollX`,`${window.scrollX}`),window.history.replaceState(null,``,windowURL.toString())},50)})}publishMenu&&new WagtailFeditPublishMenu(publishMenu)}}document.readyState===`loading`?document.addEventListener(`DOMContentLoaded`,initFEditors):initFEditors()})(rt);})()})();
\ No newline at end of file
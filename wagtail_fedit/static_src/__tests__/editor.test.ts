@@ -0,0 +1,106 @@
+jest.mock("tippy.js/dist/tippy.css", () => ({}));
+
+import { BaseWagtailFeditEditor, WrapperElement } from "../editors/base/base";
+import { FramePool } from "../editors/base/iframe";
+
+
+const FORM = '<form id="wagtail-fedit-form"><input name="value" value="invalid"></form>';
+
+
+function newIframe() {
+    const doc = document.implementation.createHTMLDocument("Edit");
+    doc.body.innerHTML = FORM;
+    return {
+        document: doc,
+        formWrapper: null as HTMLElement,
+        onCancel: null as () => void,
+        get formElement() {
+            return doc.querySelector("#wagtail-fedit-form") as HTMLFormElement;
+        },
+        swapFragment: jest.fn((html: string) => {
+            doc.body.innerHTML = html;
+            return Promise.resolve();
+        }),
+    };
+}
+
+
+function newEditor() {
+    document.body.innerHTML = `
+        <div class="wagtail-fedit-adapter-wrapper" id="wrapper" data-edit-url="/edit/1/">
+            <div class="wagtail-fedit-buttons">
+                <button class="wagtail-fedit-edit-button">Edit</button>
+            </div>
+        </div>
+    `;
+    return new BaseWagtailFeditEditor(
+        document.getElementById("wrapper") as WrapperElement,
+    );
+}
+
+
+async function flush() {
+    for (let i = 0; i < 3; i++) {
+        await new Promise((resolve) => setTimeout(resolve, 0));
+    }
+}
+
+
+beforeEach(() => {
+    jest.spyOn(FramePool, "warm").mockImplementation(() => {});
+    jest.spyOn(console, "error").mockImplementation(() => {});
+    (window as any).wagtailFedit = {
+        NAMESPACE: "wagtail-fedit",
+        EVENTS: {
+            SUBMIT: "wagtail-fedit:submit",
+            CHANGE: "wagtail-fedit:change",
+            EDITOR_OPEN: "wagtail-fedit:editorOpen",
+            EDITOR_LOAD: "wagtail-fedit:editorLoad",
+            EDITOR_CLOSE: "wagtail-fedit:editorClose",
+            SUBMIT_ERROR: "wagtail-fedit:submitError",
+        },
+    };
+});
+
+
+afterEach(() => {
+    document.body.innerHTML = "";
+    delete (global as any).fetch;
+    jest.restoreAllMocks();
+});
+
+
+describe("BaseWagtailFeditEditor.bindIframe", () => {
+    test("swaps in the form with errors", async () => {
+        const html = '<form id="wagtail-fedit-form"><p class="error">Invalid</p></form>';
+        const fetchMock = jest.fn(() => Promise.resolve({
+            json: () => Promise.resolve({ success: false, html: html }),
+        }));
+        (global as any).fetch = fetchMock;
+
+        const editor = newEditor();
+        const iframe = newIframe();
+        const onResponse = jest.spyOn(editor, "onResponse");
+        const errors: CustomEvent[] = [];
+        editor.addEventListener("wagtail-fedit:submitError", (e) => errors.push(e as CustomEvent));
+
+        editor.iframe = iframe as any;
+        editor.bindIframe(document.createElement("div"));
+        const form = iframe.formElement;
+        form.onsubmit(new Event("submit", { cancelable: true }) as SubmitEvent);
+        await flush();
+
+        expect(fetchMock).toHaveBeenCalledWith("/edit/1/", expect.objectContaining({ method: "POST" }));
+        expect(iframe.swapFragment).toHaveBeenCalledWith(html);
+        expect(onResponse).not.toHaveBeenCalled();
+
+        // The old form was replaced; the new one must submit through the editor.
+        expect(iframe.formElement).not.toBe(form);
+        expect(iframe.formElement.querySelector(".error")).not.toBe(null);
+        expect(iframe.formElement.onsubmit).toBe(form.onsubmit);
+        expect(iframe.onCancel).toEqual(expect.any(Function));
+
+        expect(errors.length).toBe(1);
+        expect(errors[0].detail.response.html).toBe(html);
+    });
+});
@@ -0,0 +1,241 @@
+jest.mock("tippy.js/dist/tippy.css", () => ({}));
+
+import { FormIFrame, FramePool } from "../editors/base/iframe";
+import { BaseWagtailFeditEditor, WrapperElement } from "../editors/base/base";
+
+
+function newFrame(): FormIFrame {
+    // Skip the constructor; it renders a frame which loads a URL.
+    const frame = Object.create(FormIFrame.prototype) as FormIFrame;
+    frame.iframe = document.createElement("iframe");
+    document.body.appendChild(frame.iframe);
+    frame.document.body.innerHTML = '<div class="wrapper"><div id="main"></div></div>';
+    return frame;
+}
+
+
+function newPool(url: string) {
+    const element = document.createElement("iframe");
+    const frame = {
+        element: element,
+        onCancel: () => {},
+        setOptions: jest.fn(),
+        swapFragment: jest.fn(() => Promise.resolve()),
+    };
+
+    const pool = new FramePool();
+    pool.container = document.createElement("div");
+    pool.modalElement = document.createElement("div");
+    pool.container.appendChild(pool.modalElement);
+    pool.modalElement.appendChild(element);
+    document.body.appendChild(pool.container);
+    pool.frame = frame as any;
+    pool.loaded = Promise.resolve(frame as any);
+    pool.url = url;
+    return { pool, frame };
+}
+
+
+function mockFetch(ok: boolean, text: string = "") {
+    const fetchMock = jest.fn(() => Promise.resolve({
+        ok: ok,
+        status: ok ? 200 : 500,
+        text: () => Promise.resolve(text),
+    }));
+    (global as any).fetch = fetchMock;
+    return fetchMock;
+}
+
+
+afterEach(() => {
+    document.head.innerHTML = "";
+    document.body.innerHTML = "";
+    delete (global as any).fetch;
+    jest.restoreAllMocks();
+});
+
+
+describe("FormIFrame.swapFragment", () => {
+    test("replaces the form", async () => {
+        const frame = newFrame();
+        frame.initWidgets = jest.fn();
+
+        await frame.swapFragment(
+            '<title>Edit title</title><div id="main"><form id="wagtail-fedit-form"></form></div>',
+        );
+
+        expect(frame.document.title).toBe("Edit title");
+        expect(frame.document.querySelector("body > .wrapper title")).toBe(null);
+        expect(frame.formElement).toBeInstanceOf(frame.window.HTMLFormElement);
+        expect(frame.document.querySelectorAll("#main").length).toBe(1);
+        expect(frame.initWidgets).toHaveBeenCalled();
+    });
+
+    test("re-executes inline scripts", async () => {
+        const frame = newFrame();
+        frame.initWidgets = jest.fn();
+        const createElement = jest.spyOn(frame.document, "createElement");
+
+        await frame.swapFragment(
+            '<div id="main">' +
+            '<script id="inline" data-widget="1">window.swapped = true;</script>' +
+            '<script id="data" type="application/json">{"a": 1}</script>' +
+            '</div>',
+        );
+
+        const created = createElement.mock.results.filter(
+            (_result, i) => createElement.mock.calls[i][0] === "script",
+        );
+        expect(created.length).toBe(1);
+
+        const inline = frame.document.getElementById("inline") as HTMLScriptElement;
+        expect(inline.isConnected).toBe(true);
+        expect(inline).toBe(created[0].value);
+        expect(inline.dataset.widget).toBe("1");
+        expect(inline.textContent).toBe("window.swapped = true;");
+
+        const data = frame.document.getElementById("data");
+        expect(data.textContent).toBe('{"a": 1}');
+    });
+
+    test("does not load media twice", async () => {
+        const frame = newFrame();
+        frame.initWidgets = jest.fn();
+        frame.document.head.innerHTML = (
+            '<link rel="stylesheet" href="/static/loaded.css">' +
+            '<script src="/static/loaded.js"></script>'
+        );
+
+        await frame.swapFragment(
+            '<link rel="stylesheet" href="/static/loaded.css">' +
+            '<link rel="stylesheet" href="/static/new.css">' +
+            '<div id="main"><script src="/static/loaded.js"></script></div>',
+        );
+
+        const doc = frame.document;
+        expect(doc.querySelectorAll('link[href="/static/loaded.css"]').length).toBe(1);
+        expect(doc.head.querySelectorAll('link[href="/static/new.css"]').length).toBe(1);
+        expect(doc.querySelectorAll('script[src="/static/loaded.js"]').length).toBe(1);
+        expect(doc.querySelector("body > .wrapper script")).toBe(null);
+    });
+});
+
+
+describe("FormIFrame.setOptions", () => {
+    test("applies the class and resize handler", () => {
+        jest.useFakeTimers();
+        const frame = newFrame();
+        frame.document.body.innerHTML = '<div class="wagtail-fedit-form-wrapper"></div>';
+        const onResize = jest.fn();
+
+        frame.setOptions({ id: "related-frame", className: "fedit-related", onResize: onResize });
+        expect(frame.element.id).toBe("related-frame");
+        expect(frame.element.className).toBe("fedit-related");
+        expect(onResize).toHaveBeenCalledWith(0, 0);
+        expect(frame.resizeInterval).toBeDefined();
+
+        frame.setOptions({});
+        expect(frame.element.className).toBe("");
+        expect(frame.resizeInterval).toBeUndefined();
+        jest.useRealTimers();
+    });
+});
+
+
+describe("FramePool", () => {
+    test("acquires the preloaded form", async () => {
+        const fetchMock = mockFetch(true);
+        const { pool, frame } = newPool("/edit/1/");
+
+        expect(await pool.acquire("/edit/1/")).toBe(frame);
+        expect(fetchMock).not.toHaveBeenCalled();
+        expect(frame.swapFragment).not.toHaveBeenCalled();
+        expect(pool.inUse).toBe(true);
+        expect(pool.url).toBe(null);
+    });
+
+    test("rejects while in use", async () => {
+        mockFetch(true);
+        const { pool } = newPool("/edit/1/");
+
+        await pool.acquire("/edit/1/");
+        await expect(pool.acquire("/edit/2/")).rejects.toThrow("already in use");
+        expect(pool.inUse).toBe(true);
+    });
+
+    test("swaps in the form fragment", async () => {
+        const fetchMock = mockFetch(true, "<form></form>");
+        const { pool, frame } = newPool("/edit/1/");
+
+        await pool.acquire("/edit/2/");
+
+        const url = new URL((fetchMock.mock.calls[0] as any)[0]);
+        expect(url.pathname).toBe("/edit/2/");
+        expect(url.searchParams.get("fragment")).toBe("1");
+        expect(frame.swapFragment).toHaveBeenCalledWith("<form></form>");
+    });
+
+    test("releases the frame when the fragment fails", async () => {
+        mockFetch(false);
+        const { pool, frame } = newPool("/edit/1/");
+
+        await expect(pool.acquire("/edit/2/")).rejects.toThrow("500");
+        expect(frame.swapFragment).not.toHaveBeenCalled();
+        expect(pool.inUse).toBe(false);
+    });
+
+    test("applies the frame options of the editor", async () => {
+        mockFetch(true);
+        const { pool, frame } = newPool("/edit/1/");
+        const options = { className: "fedit-related", onResize: () => {} };
+
+        await pool.acquire("/edit/1/", options);
+        expect(frame.setOptions).toHaveBeenLastCalledWith(options);
+
+        pool.release();
+        expect(frame.setOptions).toHaveBeenLastCalledWith(FramePool.frameOptions);
+    });
+
+    test("release", async () => {
+        mockFetch(true);
+        const { pool, frame } = newPool("/edit/1/");
+
+        await pool.acquire("/edit/1/");
+        pool.show();
+        pool.modalElement.appendChild(document.createElement("button"));
+        pool.release();
+
+        expect(pool.inUse).toBe(false);
+        expect(pool.frame.onCancel).toBe(null);
+        expect(pool.container.style.display).toBe("none");
+        expect(Array.from(pool.modalElement.children)).toEqual([frame.element]);
+    });
+});
+
+
+describe("BaseWagtailFeditEditor.openEditor", () => {
+    test("falls back to the modal editor", async () => {
+        jest.spyOn(FramePool, "warm").mockImplementation(() => {});
+        const acquire = jest.spyOn(FramePool.pool, "acquire").mockRejectedValue(new Error("in use"));
+        jest.spyOn(console, "error").mockImplementation(() => {});
+
+        document.body.innerHTML = `
+            <div class="wagtail-fedit-adapter-wrapper" id="wrapper" data-edit-url="/edit/1/">
+                <div class="wagtail-fedit-buttons">
+                    <button class="wagtail-fedit-edit-button">Edit</button>
+                </div>
+            </div>
+        `;
+        const editor = new BaseWagtailFeditEditor(
+            document.getElementById("wrapper") as WrapperElement,
+        );
+        const openModalEditor = jest.spyOn(editor, "openModalEditor").mockImplementation(() => {});
+
+        editor.openEditor();
+        await new Promise((resolve) => setTimeout(resolve, 0));
+
+        expect(acquire).toHaveBeenCalledWith("/edit/1/", {});
+        expect(openModalEditor).toHaveBeenCalled();
+        expect(editor.opened).toBe(true);
+    });
+});
@@ -0,0 +1,162 @@
+jest.mock("tippy.js/dist/tippy.css", () => ({}));
+
+import { initNewEditors, hydrateAll } from "../editors/base/init";
+
+const WRAPPER_COUNT = 1000;
+
+let constructed: HTMLElement[] = [];
+
+class TestEditor {
+    constructor(element: HTMLElement) {
+        constructed.push(element);
+        // Roughly what an editor does when it is constructed.
+        element.querySelector(".wagtail-fedit-edit-button")!.addEventListener("click", () => {});
+    }
+}
+
+class TestIntersectionObserver {
+    static instance: TestIntersectionObserver;
+    callback: IntersectionObserverCallback;
+    elements: Set<Element> = new Set();
+
+    constructor(callback: IntersectionObserverCallback) {
+        this.callback = callback;
+        TestIntersectionObserver.instance = this;
+    }
+
+    observe(element: Element) {
+        this.elements.add(element);
+    }
+
+    unobserve(element: Element) {
+        this.elements.delete(element);
+    }
+
+    disconnect() {
+        this.elements.clear();
+    }
+
+    intersect(element: Element) {
+        this.callback([{ target: element, isIntersecting: true } as any], this as any);
+    }
+}
+
+function renderWrappers(count: number) {
+    const html = [];
+    for (let i = 0; i < count; i++) {
+        html.push(`
+            <div class="wagtail-fedit-adapter-wrapper" id="wrapper-${i}" data-fedit-constructor="test.Editor">
+                <div class="wagtail-fedit-buttons">
+                    <button class="wagtail-fedit-edit-button" data-tooltip="true" title="Edit">Edit</button>
+                </div>
+                <p>Content ${i}</p>
+            </div>
+        `);
+    }
+    document.body.innerHTML = html.join("");
+}
+
+function getWrapper(i: number) {
+    return document.getElementById(`wrapper-${i}`) as HTMLElement;
+}
+
+
+describe("initNewEditors", () => {
+    beforeEach(() => {
+        // The timing test below measures with the real clock.
+        jest.useFakeTimers({ doNotFake: ["performance"] });
+        constructed = [];
+        window.location.hash = "";
+        (window as any).IntersectionObserver = TestIntersectionObserver;
+        (window as any).wagtailFedit = {
+            editors: { "test.Editor": TestEditor },
+        };
+    });
+
+    afterEach(() => {
+        hydrateAll();
+        jest.runOnlyPendingTimers();
+        document.body.innerHTML = "";
+        jest.useRealTimers();
+    });
+
+    test("defers hydration", () => {
+        renderWrappers(10);
+        initNewEditors();
+
+        expect(constructed.length).toBe(0);
+        for (let i = 0; i < 10; i++) {
+            expect(getWrapper(i).classList.contains("wagtail-fedit-pending")).toBe(true);
+        }
+    });
+
+    test("hydrates near the viewport", () => {
+        renderWrappers(10);
+        initNewEditors();
+
+        const wrapper = getWrapper(3);
+        TestIntersectionObserver.instance.intersect(wrapper);
+
+        expect(constructed).toEqual([wrapper]);
+        expect(wrapper.classList.contains("wagtail-fedit-initialized")).toBe(true);
+        expect(wrapper.classList.contains("wagtail-fedit-pending")).toBe(false);
+        expect(TestIntersectionObserver.instance.elements.has(wrapper)).toBe(false);
+    });
+
+    test("hydrates on hover", () => {
+        renderWrappers(10);
+        initNewEditors();
+
+        const wrapper = getWrapper(5);
+        const button = wrapper.querySelector(".wagtail-fedit-edit-button") as HTMLElement;
+        button.dispatchEvent(new Event("pointerover", { bubbles: true }));
+
+        expect(constructed).toEqual([wrapper]);
+        expect(button.dataset.tooltip).toBeUndefined();
+        expect(getWrapper(4).querySelector("button").dataset.tooltip).toBe("true");
+    });
+
+    test("hydrates the editor in the URL hash", () => {
+        renderWrappers(10);
+        window.location.hash = "#wrapper-2";
+        initNewEditors();
+
+        expect(constructed).toEqual([getWrapper(2)]);
+    });
+
+    test("hydrates when idle", () => {
+        renderWrappers(100);
+        initNewEditors();
+        expect(constructed.length).toBe(0);
+
+        jest.runAllTimers();
+        expect(constructed.length).toBe(100);
+    });
+
+    test("hydrates eagerly without IntersectionObserver", () => {
+        delete (window as any).IntersectionObserver;
+        renderWrappers(10);
+        initNewEditors();
+
+        expect(constructed.length).toBe(10);
+    });
+
+    test(`initializes ${WRAPPER_COUNT} wrappers`, () => {
+        renderWrappers(WRAPPER_COUNT);
+        let start = performance.now();
+        initNewEditors();
+        const deferred = performance.now() - start;
+        expect(constructed.length).toBe(0);
+
+        start = performance.now();
+        hydrateAll();
+        const hydrated = performance.now() - start;
+        expect(constructed.length).toBe(WRAPPER_COUNT);
+
+        console.log(
+            `initNewEditors (${WRAPPER_COUNT} wrappers): ` +
+            `${deferred.toFixed(1)}ms deferred, ${hydrated.toFixed(1)}ms to hydrate all`,
+        );
+        expect(deferred).toBeLessThan(hydrated);
+    });
+});
@@ -0,0 +1,138 @@
+let queueRefetch: (url: string) => Promise<any>;
+
+
+function setConfig(refetchBatchUrl: string | null) {
+    document.body.innerHTML = refetchBatchUrl
+        ? `<script id="wagtail-fedit-config" type="application/json">${JSON.stringify({ refetchBatchUrl })}</script>`
+        : "";
+}
+
+
+function response(ok: boolean, data: any) {
+    return Promise.resolve({
+        ok: ok,
+        status: ok ? 200 : 500,
+        json: () => Promise.resolve(data),
+    });
+}
+
+
+beforeEach(() => {
+    // The batch URL is read once per module.
+    jest.resetModules();
+    queueRefetch = require("../editors/base/refetch").queueRefetch;
+});
+
+
+afterEach(() => {
+    document.body.innerHTML = "";
+    delete (global as any).fetch;
+    jest.restoreAllMocks();
+});
+
+
+describe("queueRefetch", () => {
+    test("batches refetches queued together", async () => {
+        setConfig("/refetch-batch/");
+        const fetchMock = jest.fn((url: string, options?: any) => response(true, {
+            results: {
+                "0": { success: true, html: "a" },
+                "1": { success: true, html: "b" },
+            },
+        }));
+        (global as any).fetch = fetchMock;
+
+        const results = await Promise.all([
+            queueRefetch("/refetch/a/"),
+            queueRefetch("/refetch/b/"),
+        ]);
+
+        expect(fetchMock).toHaveBeenCalledTimes(1);
+        const [url, options] = fetchMock.mock.calls[0];
+        expect(url).toBe("/refetch-batch/");
+        expect(options.method).toBe("POST");
+        expect(JSON.parse(options.body)).toEqual({
+            adapters: [
+                { id: "0", url: "/refetch/a/" },
+                { id: "1", url: "/refetch/b/" },
+            ],
+        });
+        expect(results.map((result) => result.html)).toEqual(["a", "b"]);
+    });
+
+    test("fetches a single refetch directly", async () => {
+        setConfig("/refetch-batch/");
+        const fetchMock = jest.fn((url: string) => response(true, { success: true, html: url }));
+        (global as any).fetch = fetchMock;
+
+        const result = await queueRefetch("/refetch/a/");
+
+        expect(fetchMock.mock.calls.map(([url]) => url)).toEqual(["/refetch/a/"]);
+        expect(result.html).toBe("/refetch/a/");
+    });
+
+    test("fetches separately without a batch URL", async () => {
+        setConfig(null);
+        const fetchMock = jest.fn((url: string) => response(true, { success: true, html: url }));
+        (global as any).fetch = fetchMock;
+
+        await Promise.all([
+            queueRefetch("/refetch/a/"),
+            queueRefetch("/refetch/b/"),
+        ]);
+
+        expect(fetchMock.mock.calls.map(([url]) => url)).toEqual(["/refetch/a/", "/refetch/b/"]);
+    });
+
+    test("refetches failed batch items on their own", async () => {
+        setConfig("/refetch-batch/");
+        const fetchMock = jest.fn((url: string, options?: any) => {
+            if (url === "/refetch-batch/") {
+                return response(true, {
+                    success: true,
+                    results: {
+                        "0": { success: true, html: "batched" },
+                        "1": { success: false, error: "Invalid refetch URL" },
+                    },
+                });
+            }
+            return response(true, { success: true, html: url });
+        });
+        (global as any).fetch = fetchMock;
+
+        const results = await Promise.all([
+            queueRefetch("/refetch/a/"),
+            queueRefetch("/refetch/b/"),
+            queueRefetch("/refetch/c/"),
+        ]);
+
+        expect(fetchMock.mock.calls.map(([url]) => url)).toEqual([
+            "/refetch-batch/", "/refetch/b/", "/refetch/c/",
+        ]);
+        expect(results.map((result) => result.html)).toEqual([
+            "batched", "/refetch/b/", "/refetch/c/",
+        ]);
+    });
+
+    test("falls back to single refetches when the batch fails", async () => {
+        setConfig("/refetch-batch/");
+        jest.spyOn(console, "error").mockImplementation(() => {});
+        const fetchMock = jest.fn((url: string, options?: any) => {
+            if (url === "/refetch-batch/") {
+                return response(false, {});
+            }
+            return response(true, { success: true, html: url });
+        });
+        (global as any).fetch = fetchMock;
+
+        const results = await Promise.all([
+            queueRefetch("/refetch/a/"),
+            queueRefetch("/refetch/b/"),
+        ]);
+
+        expect(fetchMock.mock.calls.map(([url]) => url)).toEqual([
+            "/refetch-batch/", "/refetch/a/", "/refetch/b/",
+        ]);
+        expect(results.map((result) => result.html)).toEqual(["/refetch/a/", "/refetch/b/"]);
+    });
+});
@@ -1,5 +1,6 @@
 import { getCookie } from "../../utils";
 import { BaseWagtailFeditEditor, WrapperElement } from "./base";
+import { hydrateEditor } from "./init";
 
 export {
     WagtailFeditorAPI,
@@ -91,6 +92,7 @@ class WagtailFeditorAPI {
 
     execRelated(func: (editorAPI: WagtailFeditorAPI) => void) {
         for (const wrapper of this.editor.relatedWrappers) {
+            hydrateEditor(wrapper);
             func(wrapper.editorAPI);
         }
     }
@@ -1,7 +1,8 @@
-import { initNewEditors } from "./init";
+import { initNewEditors, hydrateEditor } from "./init";
 import { WagtailFeditorAPI } from "./api";
 import { EditorModal } from "../../components/modal";
-import { FormIFrame } from "./iframe";
+import { FormIFrame, FramePool } from "./iframe";
+import { queueRefetch } from "./refetch";
 
 export {
     BaseWagtailFeditEditor,
@@ -31,6 +32,7 @@ class BaseWagtailFeditEditor extends EventTarget {
     sharedContext: string;
     editBtn: HTMLElement;
     iframe: FormIFrame;
+    framePool: FramePool;
     modal: EditorModal;
     opened: boolean;
 
@@ -42,6 +44,7 @@ class BaseWagtailFeditEditor extends EventTarget {
         this.sharedContext = null;
         this.editBtn = null;
         this.iframe = null;
+        this.framePool = null;
         this.init();
 
         let buttonWrapper = this.wrapperElement.firstElementChild as HTMLElement;
@@ -60,6 +63,10 @@ class BaseWagtailFeditEditor extends EventTarget {
             }
         }
 
+        if (this.usesFramePool) {
+            FramePool.warm(this.editUrl);
+        }
+
         if (window.location.hash === `#${this.wrapperElement.id}`) {
             this.openEditor();
             this.focus();
@@ -106,9 +113,7 @@ class BaseWagtailFeditEditor extends EventTarget {
 
     refetch(): Promise<any> {
         return new Promise((resolve, reject) => {
-            fetch(this.refetchUrl).then((response) => {
-                return response.json();
-            }).then((response) => {
+            queueRefetch(this.refetchUrl).then((response) => {
                 if (!response.success) {
                     console.error("Errors rendering response, failed to refetch", response);
                     return;
@@ -126,7 +131,11 @@ class BaseWagtailFeditEditor extends EventTarget {
         let body = document.body;
         let parent = this.wrapperElement.parentElement;
         while (parent && parent !== body) {
-            if (parent.classList.contains("wagtail-fedit-initialized")) {
+            if (
+                parent.classList.contains("wagtail-fedit-initialized")
+                || parent.classList.contains("wagtail-fedit-pending")
+            ) {
+                hydrateEditor(parent);
                 (parent as WrapperElement).editorAPI.refetch().then(() => {
                     initNewEditors(parent as HTMLElement);
                 });
@@ -148,6 +157,79 @@ class BaseWagtailFeditEditor extends EventTarget {
         return {}
     }
 
+    get usesFramePool() {
+        return true;
+    }
+
+    bindIframe(wrapper: HTMLElement) {
+        const onSubmit = (e: Event) => {
+            e.preventDefault();
+            const formData = new FormData(this.iframe.formElement);
+
+            this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT, {
+                element: this.wrapperElement,
+                formData: formData,
+            });
+
+            fetch(this.editUrl, {
+                method: "POST",
+                body: formData,
+            }).then((response) => {
+                return response.json();
+            }).then((response) => {
+                if (!response.success) {
+                    console.error("Errors rendering response", response);
+                    // The response contains the form as a fragment; see `?fragment=1`.
+                    this.iframe.swapFragment(response.html).then(() => {
+                        this.iframe.formElement.onsubmit = onSubmit;
+                        this.iframe.onCancel = this.closeEditor.bind(this);
+                        this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT_ERROR, {
+                            element: this.wrapperElement,
+                            response: response,
+                        });
+                    });
+                    return;
+                }
+                const ret = this.onResponse(response);
+                const success = () => {
+                    this.closeEditor();
+                    this.executeEvent(window.wagtailFedit.EVENTS.CHANGE, {
+                        element: this.wrapperElement,
+                    });
+                }
+                if (ret instanceof Promise) {
+                    ret.then(success);
+                } else {
+                    success();
+                }
+            });
+        };
+        this.iframe.formElement.onsubmit = onSubmit;
+        this.iframe.onCancel = this.closeEditor.bind(this);
+        
+        // Check if we need to apply the fedit-full class to the iframe wrapper
+        const formWrapper = this.iframe.formWrapper;
+        const options = ["large", "full"]
+
+        for (const option of options) {
+            if (formWrapper && (
+                formWrapper.classList.contains(`fedit-${option}`) ||
+                (this.iframe.formElement.dataset.editorSize || "").toLowerCase() === option
+            )) {
+                wrapper.classList.add(`fedit-${option}`);
+                break;
+            }
+        }
+
+        const url = window.location.href.split("#")[0];
+        window.history.pushState(null, this.iframe.document.title, url + `#${this.wrapperElement.id}`);
+        document.title = this.iframe.document.title;
+
+        this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_LOAD, {
+            iframe: this.iframe,
+        });
+    }
+
     openIframe(wrapper: HTMLElement, fn: (iframe: FormIFrame) => void) {
 
         if (this.iframe) {
@@ -163,81 +245,7 @@ class BaseWagtailFeditEditor extends EventTarget {
             executeOnloadImmediately: true,
             ...this.frameOptions,
             onLoad: () => {
-                const onSubmit = (e: Event) => {
-                    e.preventDefault();
-                    const formData = new FormData(this.iframe.formElement);
-
-                    this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT, {
-                        element: this.wrapperElement,
-                        formData: formData,
-                    });
-
-                    fetch(this.editUrl, {
-                        method: "POST",
-                        body: formData,
-                    }).then((response) => {
-                        return response.json();
-                    }).then((response) => {
-                        if (!response.success) {
-                            console.error("Errors rendering response", response);
-                            let newElement = document.createElement("div");
-                            newElement.innerHTML = response.html;
-                            this.iframe.mainElement.innerHTML = newElement.querySelector("#main").innerHTML;
-                            this.iframe.formElement.onsubmit = onSubmit;
-
-                            const uninitializedBlock = this.iframe.mainElement.querySelector("#value[data-block]");
-                            if (uninitializedBlock) {
-                                this.iframe.window.initBlockWidget(uninitializedBlock.id);
-                            }
-
-                            const cancelButton = this.iframe.document.querySelector(".wagtail-fedit-cancel-button");
-                            const closeFn = this.closeEditor.bind(this);
-                            cancelButton.addEventListener("click", closeFn);
-                            this.iframe.onCancel = closeFn;
-                            this.executeEvent(window.wagtailFedit.EVENTS.SUBMIT_ERROR, {
-                                element: this.wrapperElement,
-                                response: response,
-                            });
-                            return;
-                        }
-                        const ret = this.onResponse(response);
-                        const success = () => {
-                            this.closeEditor();
-                            this.executeEvent(window.wagtailFedit.EVENTS.CHANGE, {
-                                element: this.wrapperElement,
-                            });
-                        }
-                        if (ret instanceof Promise) {
-                            ret.then(success);
-                        } else {
-                            success();
-                        }
-                    });
-                };
-                this.iframe.formElement.onsubmit = onSubmit;
-                this.iframe.onCancel = this.closeEditor.bind(this);
-                
-                // Check if we need to apply the fedit-full class to the iframe wrapper
-                const formWrapper = this.iframe.formWrapper;
-                const options = ["large", "full"]
-
-                for (const option of options) {
-                    if (formWrapper && (
-                        formWrapper.classList.contains(`fedit-${option}`) ||
-                        (this.iframe.formElement.dataset.editorSize || "").toLowerCase() === option
-                    )) {
-                        wrapper.classList.add(`fedit-${option}`);
-                        break;
-                    }
-                }
-
-                const url = window.location.href.split("#")[0];
-                window.history.pushState(null, this.iframe.document.title, url + `#${this.wrapperElement.id}`);
-                document.title = this.iframe.document.title;
-
-                this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_LOAD, {
-                    iframe: this.iframe,
-                });
+                this.bindIframe(wrapper);
             },
             onError: () => {
                 this.closeEditor();
@@ -253,7 +261,40 @@ class BaseWagtailFeditEditor extends EventTarget {
         fn(this.iframe);
     }
 
+    openPooledEditor(): Promise<void> {
+        const pool = FramePool.pool;
+        return pool.acquire(this.editUrl, this.frameOptions).then((iframe) => {
+            this.framePool = pool;
+            this.iframe = iframe;
+            this.bindIframe(pool.modalElement);
+            pool.modalElement.appendChild(
+                newCloseButton(this.closeEditor.bind(this))
+            );
+
+            this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_OPEN, {
+                iframe: this.iframe,
+                modal: this.modal,
+            });
+
+            pool.show();
+        });
+    }
+
     openEditor() {
+        this.opened = true;
+
+        if (this.usesFramePool && !this.iframe) {
+            this.openPooledEditor().catch((e) => {
+                console.error("Failed to open the editor in the shared frame", e);
+                this.openModalEditor();
+            });
+            return;
+        }
+
+        this.openModalEditor();
+    }
+
+    openModalEditor() {
         if (!this.modal) {
             this.modal = new EditorModal({
                 modalId: `${this.wrapperElement.id}-modal`,
@@ -281,6 +322,14 @@ class BaseWagtailFeditEditor extends EventTarget {
         window.history.pushState(null, this.initialTitle, window.location.href.split("#")[0]);
         document.title = this.initialTitle;
         this.executeEvent(window.wagtailFedit.EVENTS.EDITOR_CLOSE);
+
+        if (this.framePool) {
+            this.framePool.release();
+            this.framePool = null;
+            this.iframe = null;
+            return;
+        }
+
         this.modal.closeModal();
     }
 
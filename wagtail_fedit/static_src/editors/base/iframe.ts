@@ -1,6 +1,7 @@
 export {
     BaseIFrame,
     FormIFrame,
+    FramePool,
     FrameOptions,
 };
 
@@ -117,35 +118,8 @@ class BaseIFrame {
                 onError();
                 return;
             }
-            
-            let scrollableElement = this.scrollableElement;
-            let lastHeight = scrollableElement.scrollHeight;
-            if (this.onResize) {
-                this.onResize(0, lastHeight);
-            }
-
-            if (this.resizeInterval) {
-                clearInterval(this.resizeInterval);
-            }
 
-            if (this.onResize) {
-                this.resizeInterval = setInterval(() => {
-                    if (!scrollableElement) {
-                        clearInterval(this.resizeInterval);
-                        return;
-                    }
-                    try {
-                        if (lastHeight !== scrollableElement.scrollHeight) {
-                            this.onResize(lastHeight, scrollableElement.scrollHeight);
-                            lastHeight = scrollableElement.scrollHeight;
-                        }
-                    } catch (e) {
-                        clearInterval(this.resizeInterval);
-                        console.error(e);
-                        onError();
-                    }
-                }, 25);
-            }
+            this.watchResize(onError);
 
             this._onLoad(iframe);
             
@@ -167,6 +141,52 @@ class BaseIFrame {
         return iframe;
     }
 
+    watchResize(onError = () => {}) {
+        if (this.resizeInterval) {
+            clearInterval(this.resizeInterval);
+            delete this.resizeInterval;
+        }
+
+        let scrollableElement = this.scrollableElement;
+        if (!this.onResize || !scrollableElement) {
+            return;
+        }
+
+        let lastHeight = scrollableElement.scrollHeight;
+        this.onResize(0, lastHeight);
+
+        this.resizeInterval = setInterval(() => {
+            if (!scrollableElement) {
+                clearInterval(this.resizeInterval);
+                return;
+            }
+            try {
+                if (lastHeight !== scrollableElement.scrollHeight) {
+                    this.onResize(lastHeight, scrollableElement.scrollHeight);
+                    lastHeight = scrollableElement.scrollHeight;
+                }
+            } catch (e) {
+                clearInterval(this.resizeInterval);
+                console.error(e);
+                onError();
+            }
+        }, 25);
+    }
+
+    /**
+     * Apply the frame options of the editor using an already loaded frame.
+     */
+    setOptions(options: Partial<FrameOptions>) {
+        if (options.id) {
+            this.id = options.id;
+            this.element.id = options.id;
+        }
+        this.className = options.className || null;
+        this.element.className = this.className || "";
+        this.onResize = options.onResize;
+        this.watchResize();
+    }
+
     _onLoad(iframe: HTMLIFrameElement) {
 
     }
@@ -185,6 +205,75 @@ class FormIFrame extends BaseIFrame {
         return this.document?.querySelector(".wagtail-fedit-form-wrapper");
     }
 
+    initWidgets() {
+        const uninitializedBlock = this.mainElement.querySelector("#value[data-block]");
+        if (uninitializedBlock) {
+            this.window.initBlockWidget(uninitializedBlock.id);
+        }
+    }
+
+    /**
+     * Replace the form in the loaded document with a fragment
+     * rendered by the edit view (`?fragment=1`).
+     * The admin assets stay loaded; only the media of the form which
+     * is missing from the document is loaded.
+     */
+    async swapFragment(html: string) {
+        const doc = this.document;
+        const template = doc.createElement("template");
+        template.innerHTML = html;
+
+        const title = template.content.querySelector("title");
+        if (title) {
+            doc.title = title.textContent;
+            title.remove();
+        }
+
+        const stylesheets = template.content.querySelectorAll("link[rel='stylesheet']");
+        for (let i = 0; i < stylesheets.length; i++) {
+            const link = stylesheets[i] as HTMLLinkElement;
+            link.remove();
+            if (!doc.querySelector(`link[href="${link.getAttribute("href")}"]`)) {
+                doc.head.appendChild(link);
+            }
+        }
+
+        const furniture = doc.querySelector("body > .wrapper");
+        furniture.replaceChildren(template.content);
+
+        // Scripts inserted with innerHTML do not run; replace them with new elements.
+        const scripts = Array.from(furniture.querySelectorAll("script")) as HTMLScriptElement[];
+        for (const script of scripts) {
+            if (!isExecutable(script)) {
+                continue;
+            }
+
+            const src = script.getAttribute("src");
+            if (src && doc.querySelectorAll(`script[src="${src}"]`).length > 1) {
+                script.remove();
+                continue;
+            }
+
+            const newScript = doc.createElement("script");
+            for (let i = 0; i < script.attributes.length; i++) {
+                newScript.setAttribute(script.attributes[i].name, script.attributes[i].value);
+            }
+            newScript.textContent = script.textContent;
+
+            if (src) {
+                await new Promise((resolve) => {
+                    newScript.onload = newScript.onerror = resolve;
+                    script.replaceWith(newScript);
+                });
+            } else {
+                script.replaceWith(newScript);
+            }
+        }
+
+        this.initWidgets();
+        this._onLoad(this.iframe);
+    }
+
     _onLoad(iframe: HTMLIFrameElement) {
         super._onLoad(iframe);
         
@@ -198,4 +287,160 @@ class FormIFrame extends BaseIFrame {
             });
         }
     }
-}
\ No newline at end of file
+}
+
+function isExecutable(script: HTMLScriptElement) {
+    const type = (script.type || "").toLowerCase();
+    return !type || type === "text/javascript" || type === "module";
+}
+
+
+/**
+ * A hidden, preloaded editor frame shared by all modal editors.
+ *
+ * The frame loads the full admin document once; forms of other editors
+ * are swapped in as fragments so opening an editor does not reload the admin assets.
+ * The frame is never moved in the DOM; moving an iframe reloads it.
+ */
+class FramePool {
+    static instance: FramePool = null;
+    // The options of the frame while no editor uses it.
+    static frameOptions = {
+        id: "wagtail-fedit-iframe",
+        className: null as string,
+    };
+
+    container: HTMLElement;
+    modalElement: HTMLElement;
+    frame: FormIFrame;
+    loaded: Promise<FormIFrame>;
+    // The edit URL of the unused form in the frame.
+    url: string;
+    inUse: boolean;
+
+    constructor() {
+        this.container = null;
+        this.modalElement = null;
+        this.frame = null;
+        this.loaded = null;
+        this.url = null;
+        this.inUse = false;
+    }
+
+    static get pool(): FramePool {
+        if (!this.instance) {
+            this.instance = new FramePool();
+        }
+        return this.instance;
+    }
+
+    /**
+     * Preload the frame with the given edit URL once the browser is idle.
+     */
+    static warm(url: string) {
+        const pool = this.pool;
+        if (pool.loaded || !url) {
+            return;
+        }
+
+        const preload = () => pool.preload(url).catch(() => {});
+        if ("requestIdleCallback" in window) {
+            window.requestIdleCallback(preload, { timeout: 5000 });
+        } else {
+            setTimeout(preload, 200);
+        }
+    }
+
+    preload(url: string): Promise<FormIFrame> {
+        if (this.loaded) {
+            return this.loaded;
+        }
+
+        this.container = document.createElement("div");
+        this.container.classList.add("wagtail-fedit-frame-pool");
+        this.container.style.display = "none";
+        this.modalElement = document.createElement("div");
+        this.container.appendChild(this.modalElement);
+        document.body.appendChild(this.container);
+
+        this.url = url;
+        this.loaded = new Promise((resolve, reject) => {
+            this.frame = new FormIFrame({
+                ...FramePool.frameOptions,
+                url: url,
+                executeOnloadImmediately: true,
+                onLoad: () => {
+                    resolve(this.frame);
+                },
+                onError: () => {
+                    this.discard();
+                    reject(new Error("Failed to load the editor frame"));
+                },
+            });
+            this.modalElement.appendChild(this.frame.element);
+        });
+        return this.loaded;
+    }
+
+    /**
+     * Claim the frame and load the form for the edit URL into it;
+     * the editor's frame options are applied to the frame.
+     * Rejects if the frame is in use or could not be loaded.
+     */
+    async acquire(url: string, options: Partial<FrameOptions> = {}): Promise<FormIFrame> {
+        if (this.inUse) {
+            throw new Error("The editor frame is already in use");
+        }
+        this.inUse = true;
+
+        try {
+            const frame = await this.preload(url);
+            if (this.url !== url) {
+                const fragmentUrl = new URL(url, window.location.href);
+                fragmentUrl.searchParams.set("fragment", "1");
+                const response = await fetch(fragmentUrl.toString());
+                if (!response.ok) {
+                    throw new Error(`Failed to load the form fragment: ${response.status}`);
+                }
+                await frame.swapFragment(await response.text());
+            }
+            frame.setOptions(options);
+            // The form is about to be used; the next editor loads a new one.
+            this.url = null;
+            return frame;
+        } catch (e) {
+            this.inUse = false;
+            throw e;
+        }
+    }
+
+    show() {
+        this.container.classList.add("wagtail-fedit-modal-wrapper");
+        this.modalElement.classList.add("wagtail-fedit-modal");
+        this.container.style.display = "";
+    }
+
+    release() {
+        this.container.style.display = "none";
+        this.container.classList.remove("wagtail-fedit-modal-wrapper");
+        this.modalElement.className = "";
+        for (const child of Array.from(this.modalElement.children)) {
+            if (child !== this.frame.element) {
+                child.remove();
+            }
+        }
+        this.frame.setOptions(FramePool.frameOptions);
+        this.frame.onCancel = null;
+        this.inUse = false;
+    }
+
+    discard() {
+        if (this.container) {
+            this.container.remove();
+        }
+        if (this.frame) {
+            this.frame.destroy();
+        }
+        FramePool.instance = null;
+    }
+}
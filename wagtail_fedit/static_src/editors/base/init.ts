@@ -3,11 +3,27 @@ import { Tooltip } from "../../components/tooltips";
 
 export {
     initNewEditors,
+    hydrateEditor,
+    hydrateAll,
     getEditorClass,
     setScrollParams,
     refreshPage,
 };
 
+// Editors are hydrated once they come within this margin of the viewport.
+const HYDRATE_ROOT_MARGIN = "200px";
+// Maximum amount of editors hydrated in a single idle callback.
+const HYDRATE_IDLE_BATCH = 25;
+
+const wrapperSelector = ".wagtail-fedit-adapter-wrapper";
+const initializedClass = "wagtail-fedit-initialized";
+const pendingClass = "wagtail-fedit-pending";
+
+const pendingEditors: Set<WrapperElement> = new Set();
+let hydrationObserver: IntersectionObserver | null = null;
+let idleScheduled = false;
+let listening = false;
+
 function getEditorClass(element: HTMLElement) {
     const editorClass = element.dataset.feditConstructor;
     if (editorClass) {
@@ -16,39 +32,183 @@ function getEditorClass(element: HTMLElement) {
     throw new Error("No editor class found for element");
 }
 
+function canDefer() {
+    return "IntersectionObserver" in window;
+}
+
+function requestIdle(callback: (deadline: IdleDeadline | null) => void) {
+    if ("requestIdleCallback" in window) {
+        window.requestIdleCallback(callback, { timeout: 2000 });
+    } else {
+        setTimeout(() => callback(null), 50);
+    }
+}
+
+function initTooltips(root: HTMLElement | Document, owner: HTMLElement | null) {
+    // Only initialize tooltips which belong to the owner;
+    // nested editors initialize their own when they are hydrated.
+    const buttons = root.querySelectorAll("[data-tooltip='true']") as NodeListOf<HTMLElement>;
+    for (let i = 0; i < buttons.length; i++) {
+        const button = buttons[i];
+        if (button.closest(wrapperSelector) !== owner) {
+            continue;
+        }
+        new Tooltip(button);
+        delete button.dataset.tooltip;
+    }
+}
+
+/**
+ * Construct the editor for the wrapper element if this has not happened yet.
+ * Returns true if the editor was constructed.
+ */
+function hydrateEditor(element: HTMLElement): boolean {
+    if (element.classList.contains(initializedClass)) {
+        return false;
+    }
+
+    const editor = element as WrapperElement;
+    pendingEditors.delete(editor);
+    if (hydrationObserver) {
+        hydrationObserver.unobserve(editor);
+    }
+
+    editor.classList.remove(pendingClass);
+    editor.classList.add(initializedClass);
+    const editorClass = getEditorClass(editor);
+    if (editorClass) {
+        new editorClass(editor);
+    } else {
+        console.error("No editor class found for element", editor);
+    }
+
+    initTooltips(editor, editor);
+    return true;
+}
+
+/**
+ * Construct all editors which are still waiting to be hydrated.
+ */
+function hydrateAll() {
+    for (const editor of pendingEditors) {
+        hydrateEditor(editor);
+    }
+}
+
+function onInteraction(event: Event) {
+    if (!pendingEditors.size || !(event.target instanceof Element)) {
+        return;
+    }
+
+    // Hydrate outer editors first; they might be refetched by the inner ones.
+    const editors: HTMLElement[] = [];
+    let editor = event.target.closest(`.${pendingClass}`) as HTMLElement;
+    while (editor) {
+        editors.unshift(editor);
+        editor = editor.parentElement?.closest(`.${pendingClass}`) as HTMLElement;
+    }
+    for (let i = 0; i < editors.length; i++) {
+        hydrateEditor(editors[i]);
+    }
+}
+
+function onIdle(deadline: IdleDeadline | null) {
+    idleScheduled = false;
+
+    let hydrated = 0;
+    for (const editor of pendingEditors) {
+        if (hydrated >= HYDRATE_IDLE_BATCH || (deadline && deadline.timeRemaining() < 1)) {
+            break;
+        }
+
+        if (!editor.isConnected) {
+            pendingEditors.delete(editor);
+            hydrationObserver.unobserve(editor);
+            continue;
+        }
 
+        hydrateEditor(editor);
+        hydrated++;
+    }
+
+    scheduleIdle();
+}
+
+function scheduleIdle() {
+    if (idleScheduled || !pendingEditors.size) {
+        return;
+    }
+    idleScheduled = true;
+    requestIdle(onIdle);
+}
+
+function deferEditor(editor: WrapperElement) {
+    if (!hydrationObserver) {
+        hydrationObserver = new IntersectionObserver((entries) => {
+            for (let i = 0; i < entries.length; i++) {
+                if (entries[i].isIntersecting) {
+                    hydrateEditor(entries[i].target as HTMLElement);
+                }
+            }
+        }, { rootMargin: HYDRATE_ROOT_MARGIN });
+    }
+
+    if (!listening) {
+        listening = true;
+        document.addEventListener("pointerover", onInteraction, { capture: true, passive: true });
+        document.addEventListener("focusin", onInteraction, { capture: true, passive: true });
+    }
+
+    editor.classList.add(pendingClass);
+    pendingEditors.add(editor);
+    hydrationObserver.observe(editor);
+}
+
+/**
+ * Prepare all new editors inside of the wrapper.
+ * Editors are hydrated when they come near the viewport,
+ * when they are hovered or focused, or when the browser is idle.
+ */
 function initNewEditors(wrapper: HTMLElement | Document = document) {
     let wagtailFeditBlockEditors;
     if (
         wrapper instanceof HTMLElement
         && wrapper.classList.contains("wagtail-fedit-adapter-wrapper")
-        && !wrapper.classList.contains("wagtail-fedit-initialized")
+        && !wrapper.classList.contains(initializedClass)
     ) {
         wagtailFeditBlockEditors = [wrapper];
     } else {
-        wagtailFeditBlockEditors = wrapper.querySelectorAll(".wagtail-fedit-adapter-wrapper");
+        wagtailFeditBlockEditors = wrapper.querySelectorAll(wrapperSelector);
     }
+
+    const defer = canDefer();
+    const hash = window.location.hash.slice(1);
     for (let i = 0; i < wagtailFeditBlockEditors.length; i++) {
         const editor = wagtailFeditBlockEditors[i] as WrapperElement;
-        if (!editor.classList.contains("wagtail-fedit-initialized")) {
-            editor.classList.add("wagtail-fedit-initialized");
-            const editorClass = getEditorClass(editor);
-            if (editorClass) {
-                new editorClass(editor);
-            } else {
-                console.error("No editor class found for element", editor);
-            }
+        if (
+            editor.classList.contains(initializedClass)
+            || editor.classList.contains(pendingClass)
+        ) {
+            continue;
         }
 
-        const editButtons = wrapper.querySelectorAll("[data-tooltip='true']") as NodeListOf<HTMLElement>;
-        for (let i = 0; i < editButtons.length; i++) {
-            const button = editButtons[i];
-            if (button.dataset.tooltip == "true") {
-                new Tooltip(button);
-                delete button.dataset.tooltip;
-            }
+        // The editor linked to in the URL opens immediately.
+        if (!defer || (hash && editor.id === hash)) {
+            hydrateEditor(editor);
+        } else {
+            deferEditor(editor);
         }
     }
+
+    // Tooltips of the (already hydrated) wrapper itself, or outside of any editor.
+    const owner = wrapper instanceof HTMLElement
+        ? wrapper.closest(wrapperSelector) as HTMLElement
+        : null;
+    if (!owner || owner.classList.contains(initializedClass)) {
+        initTooltips(wrapper, owner);
+    }
+
+    scheduleIdle();
 }
 
 function refreshPage() {
@@ -0,0 +1,106 @@
+import { getCookie } from "../../utils";
+
+export {
+    queueRefetch,
+    getBatchRefetchUrl,
+};
+
+
+type PendingRefetch = {
+    url: string;
+    resolve: (response: any) => void;
+    reject: (reason?: any) => void;
+};
+
+
+let pending: PendingRefetch[] = [];
+let scheduled = false;
+let batchRefetchUrl: string | null | undefined = undefined;
+
+
+function getBatchRefetchUrl(): string | null {
+    if (batchRefetchUrl !== undefined) {
+        return batchRefetchUrl;
+    }
+
+    batchRefetchUrl = null;
+    const config = document.getElementById("wagtail-fedit-config");
+    if (config) {
+        try {
+            batchRefetchUrl = JSON.parse(config.textContent).refetchBatchUrl || null;
+        } catch (e) {
+            console.error("Failed to parse wagtail-fedit config", e);
+        }
+    }
+
+    return batchRefetchUrl;
+}
+
+
+function fetchSingle(item: PendingRefetch) {
+    fetch(item.url).then((response) => {
+        return response.json();
+    }).then(item.resolve).catch(item.reject);
+}
+
+
+function flush() {
+    const items = pending;
+    pending = [];
+    scheduled = false;
+
+    const url = getBatchRefetchUrl();
+    if (!url || items.length === 1) {
+        items.forEach(fetchSingle);
+        return;
+    }
+
+    let headers = new Headers();
+    headers.append("X-Requested-With", "XMLHttpRequest");
+    headers.append("X-CSRFToken", getCookie("csrftoken"));
+    headers.append("Content-Type", "application/json");
+
+    fetch(url, {
+        method: "POST",
+        headers: headers,
+        body: JSON.stringify({
+            adapters: items.map((item, i) => ({
+                id: String(i),
+                url: item.url,
+            })),
+        }),
+    }).then((response) => {
+        if (!response.ok) {
+            throw new Error(`Batch refetch failed with status ${response.status}`);
+        }
+        return response.json();
+    }).then((response) => {
+        items.forEach((item, i) => {
+            const result = response.results[String(i)];
+            if (!result || result.error) {
+                // The adapter could not be refetched in the batch; try it on its own.
+                fetchSingle(item);
+                return;
+            }
+            item.resolve(result);
+        });
+    }).catch((e) => {
+        console.error("Failed to batch refetch, falling back to single requests", e);
+        items.forEach(fetchSingle);
+    });
+}
+
+
+/**
+ * Queue a refetch of an adapter.
+ * All refetches queued in the same task are sent to the server in a single request.
+ */
+function queueRefetch(url: string): Promise<any> {
+    return new Promise((resolve, reject) => {
+        pending.push({ url, resolve, reject });
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(flush, 0);
+        }
+    });
+}
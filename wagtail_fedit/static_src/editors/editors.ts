@@ -22,6 +22,8 @@ type FuncResponseObject = ResponseObject & {
 
 type BackgroundImageResponse = FuncResponseObject & {
     url: string;
+    // `url()` or `image-set()` of the renditions.
+    css_value?: string;
     css_variable_name: string;
 };
     
@@ -107,32 +109,55 @@ class FieldEditor extends BaseWagtailFeditEditor {
 type Constructor<T = BaseWagtailFeditEditor> = new (...args: any[]) => T;
 
 
+// Clicks on the move buttons within this time are sent as a single batch.
+const MOVE_DEBOUNCE_MS = 400;
+
+
 function MovableMixin<T extends Constructor>(base: T) {
     return class extends base {
+        pendingMoves: string[] = [];
+        moveTimer: number | null = null;
+        moveUrl: string | null = null;
+
         constructor(...args: any[]) {
             super(...args);
             
             let directionButtons = this.wrapperElement.querySelectorAll("[data-direction]");
             for (let i = 0; i < directionButtons.length; i++) {
                 let button = directionButtons[i] as HTMLElement;
-                let url = button.dataset.url;
                 button.addEventListener("click", (e) => {
-                    
                     e.preventDefault();
-                    
-                    this.api.fetch(url, "POST", {}).then((response: any) => {
-                        if (response.success) {
-                            this.refetchParent(refreshPage);
-                        } else {
-                            response.error ? alert("Failed to move block: " + response.error) : alert("Failed to move block");
-                        }
-                    }).catch((error: any) => {
-                        console.error("Failed to move block", error);
-                        alert("Failed to move block");
-                    });
+                    this.queueMove(button.dataset.url, button.dataset.direction);
                 });
             }
         }
+
+        queueMove(url: string, direction: string) {
+            this.moveUrl = url;
+            this.pendingMoves.push(direction);
+
+            if (this.moveTimer) {
+                clearTimeout(this.moveTimer);
+            }
+            this.moveTimer = window.setTimeout(() => this.flushMoves(), MOVE_DEBOUNCE_MS);
+        }
+
+        flushMoves() {
+            const moves = this.pendingMoves.map((action) => ({ action: action }));
+            this.pendingMoves = [];
+            this.moveTimer = null;
+
+            this.api.fetch(this.moveUrl, "POST", { moves: moves }).then((response: any) => {
+                if (response.success) {
+                    this.refetchParent(refreshPage);
+                } else {
+                    response.error ? alert("Failed to move block: " + response.error) : alert("Failed to move block");
+                }
+            }).catch((error: any) => {
+                console.error("Failed to move block", error);
+                alert("Failed to move block");
+            });
+        }
     }
 }
 
@@ -201,6 +226,11 @@ class BlockEditor extends AddableMixin(MovableMixin(FieldEditor)) {
 
 
 class DomPositionedFieldEditor extends FieldEditor {
+    get usesFramePool() {
+        // The form is opened inline.
+        return false;
+    }
+
     get buttonsElement() {
         let elem = this.wrapperElement.querySelector(".wagtail-fedit-buttons")
         return elem  as HTMLElement
@@ -247,15 +277,11 @@ class DomPositionedBlockEditor extends AddableMixin(MovableMixin(DomPositionedFi
 
 
 function backgroundImageAdapter(element: HTMLElement, response: BackgroundImageResponse) {
-    const url = response.url;
+    const value = response.css_value || `url(${response.url})`;
     const cssVar = response.css_variable_name;
     if (cssVar) {
-        if (cssVar.startsWith("--")) {
-            element.style.setProperty(cssVar, `url(${url})`);
-        } else {
-            element.style.setProperty(cssVar, `url(${url})`);
-        }
+        element.style.setProperty(cssVar, value);
     } else {
-        element.style.backgroundImage = `url(${url})`;
+        element.style.backgroundImage = value;
     }
 }
@@ -0,0 +1,156 @@
+"""
+Stream the editable preview of an object to the browser while it is rendered.
+
+Template responses are rendered node by node; the output of every top-level node
+(following `{% extends %}` into the parent templates) is sent as soon as it is rendered.
+The `<head>`, including `{% fedit_scripts "css" %}`, reaches the browser before the
+adapters in the body are rendered.
+
+Like any streaming response, the body is rendered after the middleware has processed
+the response; middleware which rewrites the content does not apply to it.
+"""
+from typing import Iterator
+import django
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.template.backends.django import Template as BackendTemplate
+from django.template.base import (
+    NodeList,
+    TextNode,
+)
+from django.template.context import (
+    Context,
+    make_context,
+)
+from django.template.loader_tags import (
+    BLOCK_CONTEXT_KEY,
+    BlockContext,
+    BlockNode,
+    ExtendsNode,
+)
+from django.template.response import SimpleTemplateResponse
+from django.utils import translation
+from django.utils.cache import patch_cache_control
+from wagtail.models import PreviewableMixin
+
+
+# Following `{% extends %}` mirrors `ExtendsNode.render`, which is not public API.
+# It is only done for the Django versions it was verified against; other versions
+# render the parent template as a single chunk. The streaming tests compare the
+# chunks with `render_to_string` for templates which extend several levels deep.
+STREAM_EXTENDS = (4, 2) <= django.VERSION[:2] <= (5, 2)
+
+
+def _iter_extends(node: ExtendsNode, context: Context) -> Iterator[str]:
+    """
+    Render an `{% extends %}` node; see `ExtendsNode.render`.
+    """
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    # The root template's blocks also need to be added to the block context.
+    for parent_node in compiled_parent.nodelist:
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                block_context.add_blocks({
+                    n.name: n
+                    for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)
+                })
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from _iter_nodelist(compiled_parent.nodelist, context)
+
+
+def _iter_nodelist(nodelist: NodeList, context: Context) -> Iterator[str]:
+    for node in nodelist:
+        if STREAM_EXTENDS and isinstance(node, ExtendsNode):
+            yield from _iter_extends(node, context)
+        else:
+            # Skip nodes without output, such as `{% load %}`.
+            chunk = node.render_annotated(context)
+            if chunk:
+                yield chunk
+
+
+def stream_template(template, context: dict = None, request: HttpRequest = None) -> Iterator[str]:
+    """
+    Render the template in chunks.
+    Templates of other backends than the Django template engine are rendered as a single chunk.
+    """
+    if not isinstance(template, BackendTemplate):
+        yield template.render(context, request)
+        return
+
+    template = template.template
+    context = make_context(context, request, autoescape=template.engine.autoescape)
+
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            yield from _iter_nodelist(template.nodelist, context)
+
+
+def streaming_template_response(response: SimpleTemplateResponse, request: HttpRequest) -> HttpResponse:
+    """
+    Return a streaming response for an unrendered template response.
+    Responses with post-render callbacks are rendered as usual.
+    """
+    if response._post_render_callbacks:
+        return response.render()
+
+    template = response.resolve_template(response.template_name)
+    context = response.resolve_context(response.context_data)
+    language = translation.get_language()
+
+    def content():
+        # Rendering starts after the view has returned.
+        with translation.override(language):
+            yield from stream_template(template, context, request)
+
+    streaming = StreamingHttpResponse(
+        content(),
+        status=response.status_code,
+    )
+    for header, value in response.items():
+        streaming[header] = value
+    streaming.cookies = response.cookies
+    return streaming
+
+
+def make_streaming_preview_request(obj: PreviewableMixin, original_request: HttpRequest = None, preview_mode: str = None, extra_request_attrs: dict = None) -> HttpResponse:
+    """
+    Like `PreviewableMixin.make_preview_request`;
+    template responses are streamed instead of rendered in the handler.
+    """
+    request = WSGIRequest(obj._get_dummy_headers(original_request))
+    request.is_dummy = True
+
+    if extra_request_attrs:
+        for k, v in extra_request_attrs.items():
+            setattr(request, k, v)
+
+    class Handler(BaseHandler):
+        def _get_response(self, request):
+            request.is_preview = True
+            request.preview_mode = preview_mode
+            response = obj.serve_preview(request, preview_mode)
+            if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+                response = streaming_template_response(response, request)
+            elif hasattr(response, "render") and callable(response.render):
+                response = response.render()
+            patch_cache_control(response, private=True)
+            return response
+
+    handler = Handler()
+    handler.load_middleware()
+    return handler.get_response(request)
@@ -1,4 +1,5 @@
 from typing import Type, Any
+from operator import attrgetter
 from django.template import (
     library, Node, TemplateSyntaxError,
 )
@@ -9,6 +10,7 @@ from django.template.base import (
     Parser, Token,
     FilterExpression,
 )
+from django.utils.functional import SimpleLazyObject
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from django.core import signing
@@ -36,7 +38,11 @@ from ..utils import (
     wrap_adapter,
     with_userbar_model,
     base_adapter_context,
-    _flatten_context,
+    read_only_adapter_context,
+    get_render_cache,
+    render_context,
+    AdapterRenderCache,
+    ContextView,
     _can_edit,
     FEDIT_PREVIEW_VAR,
     TEMPLATE_TAG_NAME,
@@ -44,6 +50,9 @@ from ..utils import (
     FIELD_TEMPLATE_VAR,
     INSTANCE_TEMPLATE_VAR,
 )
+from ..instrumentation import (
+    instrument,
+)
 from ..hooks import (
     REGISTER_CSS,
     REGISTER_JS,
@@ -64,6 +73,34 @@ def as_var(var: str, context: Context, value: str) -> str:
     context[var] = value
     return ""
 
+
+_NOT_CONSTANT = object()
+
+
+def constant_value(expression: Any) -> Any:
+    """
+    Return the value of a keyword argument which does not depend on the context;
+    string and number literals without filters and absolute (`True`) arguments.
+    Returns `_NOT_CONSTANT` for anything which must be resolved when rendering.
+    """
+    if not isinstance(expression, FilterExpression):
+        return expression
+
+    if expression.filters:
+        return _NOT_CONSTANT
+
+    if not expression.is_var:
+        # String literal, resolved by the parser.
+        return expression.var
+
+    var = expression.var
+    if var.lookups is None and not var.translate:
+        # Number literal.
+        return var.literal
+
+    return _NOT_CONSTANT
+
+
 class AdapterNode(Node):
     signer = signing.TimestampSigner()
 
@@ -74,23 +111,102 @@ class AdapterNode(Node):
         self.kwargs = kwargs
         self.as_var = as_var
 
-    def _resolve_expressions(self, context, model, **kwargs):
+        # Literal kwargs are resolved once, when the template is compiled;
+        # only the variables are resolved on every render.
+        self.constants = {}
+        self.variables = {}
         for k, v in kwargs.items():
-            if isinstance(v, FilterExpression):
-                kwargs[k] = v.resolve(context)
-        
-        if isinstance(model, FilterExpression):
-            model = model.resolve(context)
+            value = constant_value(v)
+            if value is _NOT_CONSTANT:
+                self.variables[k] = v
+            else:
+                self.constants[k] = value
+
+        self.read_only_constants = adapter._defaults | self.constants
+        self.frozen_constants = AdapterRenderCache.freeze_kwargs(self.constants)
+
+        # mymodel.related.field: `related` is looked up with a single getter.
+        self.field_name = None
+        self.get_parent = None
+        if getters:
+            self.field_name = getters[len(getters) - 1]
+            if len(getters) > 1:
+                self.get_parent = attrgetter(".".join(getters[:-1]))
+
+    def _resolve_parent(self, model):
+        if self.get_parent is None:
+            return model
+
+        try:
+            return self.get_parent(model)
+        except AttributeError:
+            pass
+
+        # Find the attribute which is missing for the error.
+        obj = model
+        for getter in self.getters[:-1]:
+            try:
+                obj = getattr(obj, getter)
+            except AttributeError:
+                raise TemplateSyntaxError(f"Object {model.__class__.__name__} does not have attribute {getter}")
+
+        return obj
+
+    def get_adapter(self, request, obj, field_name, kwargs, frozen_kwargs: tuple = None) -> BaseAdapter:
+        """
+        Return the adapter for the object and field.
+        Adapters are re-used for the duration of the request
+        if the same object, field and kwargs were rendered before.
+        """
+        cache = get_render_cache(request)
+        if cache is None or not hasattr(obj, "_meta"):
+            return self.adapter(
+                object=obj,
+                field_name=field_name,
+                request=request,
+                **kwargs,
+            )
+
+        key = cache.make_key(
+            self.adapter.identifier,
+            obj,
+            field_name,
+            kwargs,
+            frozen_kwargs=frozen_kwargs,
+        )
 
-        return model, kwargs
+        adapter = cache.get_adapter(key)
+        if adapter is None:
+            adapter = self.adapter(
+                object=obj,
+                field_name=field_name,
+                request=request,
+                **kwargs,
+            )
+            cache.set_adapter(key, adapter)
+
+        return adapter
 
     def render(self, context):
+        with instrument(context.get("request"), f"tag:{self.adapter.identifier}", "tag"):
+            return self.render_adapter(context)
+
+    def render_adapter(self, context):
         model = self.model
-        getters = self.getters
+        if model is not None:
+            model = model.resolve(context)
 
-        model, kwargs = self._resolve_expressions(
-            context, model, **self.kwargs,
-        )
+        if self.variables:
+            variables = {
+                k: v.resolve(context) for k, v in self.variables.items()
+            }
+            kwargs = self.constants | variables
+            read_only_kwargs = self.read_only_constants | variables
+            frozen_kwargs = None
+        else:
+            kwargs = self.constants
+            read_only_kwargs = self.read_only_constants
+            frozen_kwargs = self.frozen_constants
 
         if FIELD_TEMPLATE_VAR in context\
             and INSTANCE_TEMPLATE_VAR in context\
@@ -115,54 +231,79 @@ class AdapterNode(Node):
                     RuntimeWarning,
                 )
 
-                context = context.flatten()
-
+                render_from_kwargs = self.adapter.render_from_kwargs
                 try:
-                    return as_var(self.as_var, context, self.adapter.render_from_kwargs(
-                        context, **kwargs,
+                    return as_var(self.as_var, context, render_from_kwargs(
+                        render_context(render_from_kwargs, context), **kwargs,
                     ))
                 except AdapterError as e:
                     raise TemplateSyntaxError(str(e))
 
-            field_name = None
-            obj = model
-            if getters:
-                field_name = getters[len(getters) - 1]
-
-                for i in range(len(getters) - 1):
-                    getter = getters[i]
-                    try:
-                        obj = getattr(obj, getter)
-                    except AttributeError:
-                        raise TemplateSyntaxError(f"Object {model.__class__.__name__} does not have attribute {getter}")
+            field_name = self.field_name
+            obj = self._resolve_parent(model)
                     
         request = context.get("request")
-        adapter = self.adapter(
-            object=obj,
-            field_name=field_name,
+        can_edit = _can_edit(request, obj)
+
+        # Visitors who cannot edit only need the content;
+        # the adapter is not constructed if it can render without an instance.
+        # The adapter context is a view on the template context;
+        # the template context is not copied or changed.
+        if not can_edit:
+            render_read_only = self.adapter.render_read_only
+            lazy_adapter = SimpleLazyObject(lambda: self.get_adapter(
+                request=request,
+                obj=obj,
+                field_name=field_name,
+                kwargs=kwargs,
+                frozen_kwargs=frozen_kwargs,
+            ))
+            content = render_read_only(
+                request,
+                obj,
+                field_name,
+                render_context(render_read_only, read_only_adapter_context(
+                    self.adapter,
+                    obj,
+                    field_name,
+                    self.adapter.resolve_kwargs(request, read_only_kwargs),
+                    ContextView.of(context),
+                    adapter=lazy_adapter,
+                )),
+                **read_only_kwargs,
+            )
+            if content is not None:
+                return as_var(
+                    self.as_var,
+                    context,
+                    content,
+                )
+
+        adapter = self.get_adapter(
             request=request,
-            **kwargs,
+            obj=obj,
+            field_name=field_name,
+            kwargs=kwargs,
+            frozen_kwargs=frozen_kwargs,
         )
 
-        context = base_adapter_context(
+        adapter_context = base_adapter_context(
             adapter,
-            context,
+            ContextView.of(context),
         )
 
         content = None
-        if adapter.check_permissions()\
-          and _can_edit(request, obj):
+        if can_edit and adapter.check_permissions():
             content = wrap_adapter(
                 request=request,
                 adapter=adapter,
-                context=context,
+                context=adapter_context,
                 run_context_processors=False,
             )
 
         else:
-            _flatten_context(context)
             content = adapter.render_content(
-                context,
+                render_context(adapter.render_content, adapter_context),
             )
 
         return as_var(
@@ -230,28 +371,14 @@ def do_render_fedit(parser: Parser, token: Token):
 
 @register.simple_tag(takes_context=True)
 def render_adapter(context: Context, adapter: BaseAdapter) -> str:
-    adapter_context = {}
-    
-    
-    if "adapter_context" in context:
-        adapter_context = context["adapter_context"]
-
-    context = _flatten_context(
-        context,
-    )
-    adapter_context = _flatten_context(
-        adapter_context,
-    )
-
-    if "adapter_context" in context:
-        del context["adapter_context"]
-
-    context.update(
-        adapter_context,
-    )
+    adapter_context = context.get("adapter_context")
 
+    # The adapter context takes priority over the context of the wrapper template.
     return adapter.render_content(
-        context,
+        render_context(
+            adapter.render_content,
+            ContextView.of(adapter_context, context),
+        ),
     )
 
 
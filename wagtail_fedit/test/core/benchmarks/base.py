@@ -0,0 +1,206 @@
+"""
+Helpers for measuring and comparing benchmarks against a baseline.
+
+Results are compared against `baseline.json` in this directory:
+
+- SQL query counts may not go up.
+- Allocations may not grow by more than `ALLOCATION_TOLERANCE`;
+  baselines below `ALLOCATION_FLOOR_KB` are compared against the floor.
+- Timings depend on the machine; they are only compared if
+  `WAGTAIL_FEDIT_BENCHMARK_TIME_TOLERANCE` is set (e.g. `1.5`).
+
+Run with `WAGTAIL_FEDIT_BENCHMARK_UPDATE=1` to write the current results to the baseline.
+
+Views are also checked against `QUERY_BUDGETS`, regardless of the baseline.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from wagtail_fedit.instrumentation import (
+    QueryLog,
+)
+
+import json
+import os
+import pathlib
+import timeit
+import tracemalloc
+
+
+BASELINE_FILE = pathlib.Path(__file__).with_name("baseline.json")
+
+UPDATE_BASELINE = os.environ.get("WAGTAIL_FEDIT_BENCHMARK_UPDATE", "").lower() in ("1", "true", "yes")
+
+ALLOCATION_TOLERANCE = 1.5
+
+# Cases which (almost) do not allocate would regress on any allocation.
+ALLOCATION_FLOOR_KB = 1.0
+
+# Maximum number of queries per view; queries made by middleware are not included.
+QUERY_BUDGETS = {
+    "EditAdapterView": 2,
+    "AdapterRefetchView": 1,
+    "FEditableView": 17,
+    "PublishView": 8,
+}
+
+TIME_TOLERANCE = os.environ.get("WAGTAIL_FEDIT_BENCHMARK_TIME_TOLERANCE")
+if TIME_TOLERANCE:
+    TIME_TOLERANCE = float(TIME_TOLERANCE)
+
+
+class Measurement:
+    """
+    The result of a single benchmark case.
+    `time_ms` is the best average time per call,
+    `queries` the number of SQL queries and `allocated_kb`
+    the peak memory allocated during a single call.
+    """
+    def __init__(self, time_ms: float, queries: int, allocated_kb: float):
+        self.time_ms = time_ms
+        self.queries = queries
+        self.allocated_kb = allocated_kb
+
+    def as_dict(self) -> dict:
+        return {
+            "time_ms": round(self.time_ms, 4),
+            "queries": self.queries,
+            "allocated_kb": round(self.allocated_kb, 1),
+        }
+
+
+def measure(fn, number: int = 5, repeat: int = 3) -> Measurement:
+    """
+    Measure `fn` after a single warm-up call.
+    Queries and allocations are measured on separate calls
+    so that tracing does not influence the timing.
+    """
+    fn()
+
+    with CaptureQueriesContext(connection) as captured:
+        fn()
+
+    # Read now; the test client resets the query log on every request.
+    queries = len(captured)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    seconds = min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+    return Measurement(
+        time_ms=seconds * 1000,
+        queries=queries,
+        allocated_kb=max(peak - start, 0) / 1024,
+    )
+
+
+def load_baseline() -> dict:
+    if not BASELINE_FILE.exists():
+        return {}
+
+    with open(BASELINE_FILE) as f:
+        return json.load(f)
+
+
+def write_baseline(results: dict[str, Measurement]):
+    baseline = load_baseline()
+    baseline.update({
+        name: measurement.as_dict()
+        for name, measurement in results.items()
+    })
+
+    with open(BASELINE_FILE, "w") as f:
+        json.dump(baseline, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+
+def compare(name: str, measurement: Measurement, baseline: dict) -> list[str]:
+    """
+    Return a list of regressions of the measurement compared to the baseline.
+    Cases without a baseline never regress.
+    """
+    expected = baseline.get(name)
+    if not expected:
+        return []
+
+    regressions = []
+    if measurement.queries > expected["queries"]:
+        regressions.append(
+            f"{name}: {measurement.queries} queries, baseline is {expected['queries']}"
+        )
+
+    if measurement.allocated_kb > max(expected["allocated_kb"], ALLOCATION_FLOOR_KB) * ALLOCATION_TOLERANCE:
+        regressions.append(
+            f"{name}: {measurement.allocated_kb:.2f} KiB allocated, baseline is {expected['allocated_kb']:.2f} KiB"
+        )
+
+    if TIME_TOLERANCE and measurement.time_ms > expected["time_ms"] * TIME_TOLERANCE:
+        regressions.append(
+            f"{name}: {measurement.time_ms:.3f} ms, baseline is {expected['time_ms']:.3f} ms"
+        )
+
+    return regressions
+
+
+class BaselineMixin:
+    """
+    Mixin for benchmark test cases.
+    Use `self.record(name, measurement)` to report a case and compare it against the baseline.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.baseline = load_baseline()
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_BASELINE and cls.results:
+            write_baseline(cls.results)
+        super().tearDownClass()
+
+    def record(self, name: str, measurement: Measurement, per: int = None):
+        line = (
+            f"{name:<32} {measurement.time_ms:10.3f} ms"
+            f" {measurement.queries:5d} queries"
+            f" {measurement.allocated_kb:10.1f} KiB"
+        )
+        if per:
+            line += f" ({measurement.time_ms / per * 1000:.1f} us each)"
+        print(line)
+
+        self.results[name] = measurement
+
+        if UPDATE_BASELINE:
+            return
+
+        regressions = compare(name, measurement, self.baseline)
+        self.assertFalse(regressions, "\n".join(regressions))
+
+    def check_query_budgets(self, log: QueryLog):
+        """
+        Fail if any view in the log executed more queries than its budget allows.
+        """
+        self.assertTrue(log and log.views, "No views were recorded")
+
+        for stats in log.views:
+            if not stats.over_budget(QUERY_BUDGETS):
+                continue
+
+            duplicates = "\n".join(
+                f"  {count}x {stats.statements[key]}"
+                for key, count in stats.duplicates.items()
+            )
+            self.fail(
+                f"{stats.name}: {stats.count} queries, budget is {QUERY_BUDGETS[stats.name]}\n"
+                f"Duplicate queries:\n{duplicates or '  none'}"
+            )
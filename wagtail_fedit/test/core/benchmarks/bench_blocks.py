@@ -0,0 +1,218 @@
+"""
+Benchmarks for block lookups and inserts in large StreamFields.
+
+These are not discovered by the regular test run; run them with:
+
+    python wagtail_fedit/test/manage.py test wagtail_fedit.test.core.benchmarks.bench_blocks
+"""
+from django.test import SimpleTestCase
+from wagtail import blocks
+from wagtail.blocks.stream_block import StreamValue
+from wagtail.blocks.list_block import ListValue
+from wagtail_fedit import utils
+from ..models import (
+    HeadingComponent,
+    FlatMenuComponent,
+)
+
+import timeit
+
+
+def _recursive_find_block(block_id, field, contentpath=None):
+    """
+    The recursive lookup used before the block index was introduced.
+    Kept here to compare against.
+    """
+    if contentpath is None:
+        contentpath = []
+
+    parent_block = field
+
+    if not isinstance(field, (StreamValue, ListValue)) and not hasattr(field, "__iter__"):
+        field = [field]
+
+    if isinstance(field, ListValue):
+        field = field.bound_blocks
+
+    for idx, block in enumerate(field):
+        block_name = utils.get_block_path(block)
+
+        if getattr(block, "id", None) == block_id:
+            return block, contentpath + [block_name], parent_block, idx
+
+        if isinstance(block.value, blocks.StructValue):
+            for value in block.value.bound_blocks.values():
+                found, found_path, parent, block_index = _recursive_find_block(block_id, value, contentpath + [block_name])
+                if found:
+                    return found, found_path, parent, block_index
+
+        elif isinstance(block.value, (StreamValue, StreamValue.StreamChild, ListValue)):
+            found, found_path, parent, block_index = _recursive_find_block(block_id, block.value, contentpath + [block_name])
+            if found:
+                return found, found_path, parent, block_index
+
+    return None, [], None, -1
+
+
+def _sequential_insert_many(parent, idx, blocks):
+    """
+    The one-by-one insert used before `insert_many` spliced children in at once.
+    Kept here to compare against.
+    """
+    utils.invalidate_block_index(parent)
+    if len(parent) == 0 or idx == len(parent) - 1:
+        parent.extend(blocks)
+    elif idx < len(parent) - 1:
+        if isinstance(parent, StreamValue):
+            for i, block in enumerate(blocks):
+                parent.insert(idx + i + 1, block)
+                parent._raw_data[idx + i + 1] = block.get_prep_value()
+        elif isinstance(parent, ListValue):
+            for i, block in enumerate(blocks):
+                parent.insert(idx + i + 1, block)
+
+
+def make_stream_data(headings: int, menus: int, items_per_menu: int) -> list[dict]:
+    data = []
+    for i in range(headings):
+        data.append({
+            "type": "heading_component",
+            "value": {
+                "heading": f"Heading {i}",
+                "subheading": f"Subheading {i}",
+            },
+            "id": f"heading-{i}",
+        })
+
+    for i in range(menus):
+        data.append({
+            "type": "flat_menu_component",
+            "value": {
+                "title": f"Menu {i}",
+                "subtitle": "<p>Subtitle</p>",
+                "items": [
+                    {
+                        "type": "item",
+                        "value": {"link": {"text": f"Item {i}-{j}"}},
+                        "id": f"item-{i}-{j}",
+                    }
+                    for j in range(items_per_menu)
+                ],
+            },
+            "id": f"menu-{i}",
+        })
+
+    return data
+
+
+class FindBlockBenchmark(SimpleTestCase):
+    HEADINGS = 5000
+    MENUS = 100
+    ITEMS_PER_MENU = 10
+    LOOKUPS = 50
+
+    def setUp(self):
+        self.stream_block = blocks.StreamBlock([
+            ("heading_component", HeadingComponent()),
+            ("flat_menu_component", FlatMenuComponent()),
+        ])
+        data = make_stream_data(self.HEADINGS, self.MENUS, self.ITEMS_PER_MENU)
+        self.stream_value = self.stream_block.to_python(data)
+
+        # Make sure all children are converted; both lookups then start from the same state.
+        list(self.stream_value)
+
+        self.block_ids = [
+            "heading-0",
+            f"heading-{self.HEADINGS - 1}",
+            f"item-{self.MENUS - 1}-{self.ITEMS_PER_MENU - 1}",
+        ]
+
+    def report(self, name: str, seconds: float, n: int):
+        print(f"\n{name}: {seconds / n * 1000:.4f} ms per lookup ({n} lookups)")
+
+    def test_lookup_results_equal(self):
+        for block_id in self.block_ids:
+            expected = _recursive_find_block(block_id, self.stream_value)
+            found = utils.find_block(block_id, self.stream_value)
+            self.assertIs(found[0], expected[0])
+            self.assertEqual(found[1], expected[1])
+            self.assertIs(found[2], expected[2])
+            self.assertEqual(found[3], expected[3])
+
+    def test_benchmark_find_block(self):
+        blocks_count = self.HEADINGS + self.MENUS * (self.ITEMS_PER_MENU + 1)
+        print(f"\nStream with {blocks_count} blocks")
+
+        for block_id in self.block_ids:
+            print(f"\nLooking up '{block_id}'")
+
+            seconds = timeit.timeit(
+                lambda: _recursive_find_block(block_id, self.stream_value),
+                number=self.LOOKUPS,
+            )
+            self.report("recursive", seconds, self.LOOKUPS)
+
+            utils.invalidate_block_index(self.stream_value)
+            seconds = timeit.timeit(
+                lambda: utils.find_block(block_id, self.stream_value),
+                number=1,
+            )
+            self.report("indexed (building index)", seconds, 1)
+
+            seconds = timeit.timeit(
+                lambda: utils.find_block(block_id, self.stream_value),
+                number=self.LOOKUPS,
+            )
+            self.report("indexed (cached index)", seconds, self.LOOKUPS)
+
+
+class InsertManyBenchmark(SimpleTestCase):
+    SIZES = (1000, 10000, 50000)
+    INSERTED = 200
+    ITERATIONS = 5
+
+    def setUp(self):
+        self.stream_block = blocks.StreamBlock([
+            ("heading_component", HeadingComponent()),
+            ("flat_menu_component", FlatMenuComponent()),
+        ])
+        self.inserted = self.stream_block.to_python([
+            {
+                "type": "heading_component",
+                "value": {"heading": f"New {i}", "subheading": f"New {i}"},
+                "id": f"new-{i}",
+            }
+            for i in range(self.INSERTED)
+        ])
+        list(self.inserted)
+
+    def make_stream_value(self, size: int) -> StreamValue:
+        stream_value = self.stream_block.to_python(make_stream_data(size, 0, 0))
+        list(stream_value)
+        return stream_value
+
+    def test_insert_results_equal(self):
+        sequential = self.make_stream_value(100)
+        spliced = self.make_stream_value(100)
+
+        _sequential_insert_many(sequential, 50, self.inserted)
+        utils.insert_many(spliced, 50, self.inserted)
+
+        self.assertEqual(
+            [block.id for block in spliced],
+            [block.id for block in sequential],
+        )
+        self.assertEqual(spliced.get_prep_value(), sequential.get_prep_value())
+
+    def test_benchmark_insert_many(self):
+        for size in self.SIZES:
+            print(f"\nInserting {self.INSERTED} blocks into the middle of {size} blocks")
+
+            for name, insert in (("sequential", _sequential_insert_many), ("spliced", utils.insert_many)):
+                values = [self.make_stream_value(size) for _ in range(self.ITERATIONS)]
+                seconds = timeit.timeit(
+                    lambda: insert(values.pop(), size // 2, self.inserted),
+                    number=self.ITERATIONS,
+                )
+                print(f"{name}: {seconds / self.ITERATIONS * 1000:.4f} ms per insert")
@@ -0,0 +1,466 @@
+"""
+Benchmarks for the rendering pipeline: `{% fedit %}` tags, `wrap_adapter`,
+`find_block`, the edit/refetch views, adding blocks to large streams and
+the time to first byte of the (streamed) editable view and `get_field_content`.
+
+Each case reports the time per call, the number of SQL queries and
+the memory allocated, and is compared against `baseline.json`; see `base.py`.
+
+These are not discovered by the regular test run; run them with:
+
+    python wagtail_fedit/test/manage.py test wagtail_fedit.test.core.benchmarks.bench_rendering
+"""
+from django.template import Template, Context
+from django.urls import reverse
+from unittest import mock
+from wagtail import blocks
+from wagtail.log_actions import log
+from wagtail.models import Page
+from wagtail_fedit.adapters import (
+    FieldAdapter,
+    BlockAdapter,
+    ModelAdapter,
+)
+from wagtail_fedit.instrumentation import (
+    get_query_log,
+)
+from wagtail_fedit.utils import (
+    FEDIT_PREVIEW_VAR,
+    base_adapter_context,
+    find_block,
+    get_field_content,
+    get_reverse_kwargs,
+    invalidate_block_index,
+    shared_context_url,
+    wrap_adapter,
+)
+from wagtail_fedit.views import (
+    FEditableView,
+)
+from ..models import (
+    BasicModel,
+    EditableFullModel,
+    HeadingComponent,
+    FlatMenuComponent,
+)
+from ..tests.base import BaseFEditTest
+from .base import (
+    BaselineMixin,
+    measure,
+)
+from .bench_blocks import make_stream_data
+
+
+FIELDS_TEMPLATE = (
+    "{% load fedit %}"
+    "{% for object in objects %}"
+    "{% fedit field object.title %}"
+    "{% endfor %}"
+)
+
+REPEATED_FIELD_TEMPLATE = (
+    "{% load fedit %}"
+    "{% for i in items %}"
+    "{% fedit field object.title %}"
+    "{% endfor %}"
+)
+
+LITERAL_KWARGS_TEMPLATE = (
+    "{% load fedit %}"
+    "{% for object in objects %}"
+    "{% fedit field object.title inline target='.hero' size=2 %}"
+    "{% endfor %}"
+)
+
+BLOCKS_TEMPLATE = (
+    "{% load fedit %}"
+    "{% for block in object.content %}"
+    "{% fedit block object.content block=block %}"
+    "{% endfor %}"
+)
+
+
+class RenderingBenchmark(BaselineMixin, BaseFEditTest):
+    # Number of fields (distinct objects) rendered on a synthetic page.
+    FIELDS = (1, 10, 50)
+    # Number of top-level blocks in a synthetic StreamField.
+    BLOCKS = (10, 100, 500)
+    # Number of blocks searched by `find_block`.
+    FIND_BLOCKS = (100, 1000, 5000)
+    # Number of top-level blocks in the stream blocks are added to.
+    ADD_BLOCKS_TO = (100, 1000)
+    # Number of blocks added in a single request.
+    ADD_BLOCKS = 50
+    # Number of blocks on the page rendered by the editable view.
+    EDITABLE_BLOCKS = 500
+    # Number of variables in the template context of a large page.
+    CONTEXT_SIZE = 500
+
+    def setUp(self):
+        super().setUp()
+        # Compiled here; adapters are registered once the app registry is ready.
+        self.templates = {
+            source: Template(source)
+            for source in (
+                FIELDS_TEMPLATE,
+                REPEATED_FIELD_TEMPLATE,
+                LITERAL_KWARGS_TEMPLATE,
+                BLOCKS_TEMPLATE,
+            )
+        }
+
+    def get_request(self, path="/", preview=True):
+        request = self.request_factory.get(path)
+        request.user = self.admin_user
+        if preview:
+            setattr(
+                request,
+                FEDIT_PREVIEW_VAR,
+                True,
+            )
+        return request
+
+    def make_objects(self, n: int) -> list[BasicModel]:
+        return [
+            BasicModel.objects.create(
+                title=f"Field {i}",
+                body=f"Body {i}",
+                content=[],
+            )
+            for i in range(n)
+        ]
+
+    def make_stream_object(self, n: int) -> EditableFullModel:
+        return EditableFullModel.objects.create(
+            title="Blocks",
+            body="Blocks",
+            content=make_stream_data(n, 0, 0),
+        )
+
+    def test_benchmark_field_tags(self):
+        for n in self.FIELDS:
+            objects = self.make_objects(n)
+
+            def render():
+                return self.templates[FIELDS_TEMPLATE].render(Context({
+                    "objects": objects,
+                    "request": self.get_request(),
+                }))
+
+            self.assertEqual(render().count('data-wrapper-id="'), n)
+            self.record(f"tag.field[{n}]", measure(render), per=n)
+
+    def test_benchmark_repeated_field_tags(self):
+        n = max(self.FIELDS)
+
+        def render():
+            return self.templates[REPEATED_FIELD_TEMPLATE].render(Context({
+                "object": self.basic_model,
+                "items": range(n),
+                "request": self.get_request(),
+            }))
+
+        self.record(f"tag.field.repeated[{n}]", measure(render), per=n)
+
+    def test_benchmark_literal_kwargs_tags(self):
+        n = max(self.FIELDS)
+        objects = self.make_objects(n)
+
+        def render(preview=True):
+            return self.templates[LITERAL_KWARGS_TEMPLATE].render(Context({
+                "objects": objects,
+                "request": self.get_request(preview=preview),
+            }))
+
+        self.assertEqual(render().count('data-wrapper-id="'), n)
+        self.record(f"tag.field.literals[{n}]", measure(render), per=n)
+        self.record(
+            f"tag.field.literals.public[{n}]",
+            measure(lambda: render(preview=False)),
+            per=n,
+        )
+
+    def test_benchmark_block_tags(self):
+        for n in self.BLOCKS:
+            obj = self.make_stream_object(n)
+
+            def render():
+                return self.templates[BLOCKS_TEMPLATE].render(Context({
+                    "object": obj,
+                    "request": self.get_request(),
+                }))
+
+            self.assertEqual(render().count('data-wrapper-id="'), n)
+            self.record(f"tag.block[{n}]", measure(render), per=n)
+
+    def test_benchmark_large_context_tags(self):
+        # Tags on a page with a large template context.
+        n = max(self.FIELDS)
+        objects = self.make_objects(n)
+        variables = {
+            f"variable_{i}": i
+            for i in range(self.CONTEXT_SIZE)
+        }
+
+        for name, preview in (("field", True), ("field.public", False)):
+            def render():
+                return self.templates[FIELDS_TEMPLATE].render(Context({
+                    **variables,
+                    "objects": objects,
+                    "request": self.get_request(preview=preview),
+                }))
+
+            self.record(f"tag.{name}.context[{n}]", measure(render), per=n)
+
+        n = max(self.BLOCKS)
+        obj = self.make_stream_object(n)
+
+        def render_blocks():
+            return self.templates[BLOCKS_TEMPLATE].render(Context({
+                **variables,
+                "object": obj,
+                "request": self.get_request(),
+            }))
+
+        self.record(f"tag.block.context[{n}]", measure(render_blocks), per=n)
+
+    def test_benchmark_public_tags(self):
+        # Visitors outside of the editor; adapters are not constructed.
+        n = max(self.FIELDS)
+        objects = self.make_objects(n)
+
+        def render_fields():
+            return self.templates[FIELDS_TEMPLATE].render(Context({
+                "objects": objects,
+                "request": self.get_request(preview=False),
+            }))
+
+        self.assertNotIn('data-wrapper-id="', render_fields())
+        self.record(f"tag.field.public[{n}]", measure(render_fields), per=n)
+
+        n = max(self.BLOCKS)
+        obj = self.make_stream_object(n)
+
+        def render_blocks():
+            return self.templates[BLOCKS_TEMPLATE].render(Context({
+                "object": obj,
+                "request": self.get_request(preview=False),
+            }))
+
+        self.assertNotIn('data-wrapper-id="', render_blocks())
+        self.record(f"tag.block.public[{n}]", measure(render_blocks), per=n)
+
+    def test_benchmark_field_content(self):
+        n = max(self.FIELDS)
+        objects = self.make_objects(n)
+        request = self.get_request(preview=False)
+
+        def render():
+            for obj in objects:
+                get_field_content(request, obj, "title", {})
+                get_field_content(request, obj, "body", {})
+
+        self.record(f"get_field_content[{n * 2}]", measure(render, number=20), per=n * 2)
+
+    def test_benchmark_wrap_adapter(self):
+        def wrap():
+            request = self.get_request()
+            adapter = FieldAdapter(self.basic_model, "title", request)
+            return wrap_adapter(request, adapter, base_adapter_context(
+                adapter=adapter,
+                context={},
+            ))
+
+        self.record("wrap_adapter.field", measure(wrap, number=20))
+
+        def wrap_block():
+            request = self.get_request()
+            adapter = BlockAdapter(
+                self.basic_model, "content", request,
+                block_id=self.BLOCK_ID,
+            )
+            return wrap_adapter(request, adapter, base_adapter_context(
+                adapter=adapter,
+                context={},
+            ))
+
+        self.record("wrap_adapter.block", measure(wrap_block, number=20))
+
+    def test_benchmark_find_block(self):
+        stream_block = blocks.StreamBlock([
+            ("heading_component", HeadingComponent()),
+            ("flat_menu_component", FlatMenuComponent()),
+        ])
+
+        for n in self.FIND_BLOCKS:
+            stream_value = stream_block.to_python(make_stream_data(n, 0, 0))
+            list(stream_value)
+            block_id = f"heading-{n - 1}"
+
+            def lookup():
+                invalidate_block_index(stream_value)
+                return find_block(block_id, stream_value)
+
+            self.assertEqual(lookup()[0].id, block_id)
+            self.record(f"find_block[{n}]", measure(lookup))
+
+    def get_adapter_urls(self, adapter) -> tuple[str, str]:
+        shared = adapter.encode_shared_context()
+        kwargs = get_reverse_kwargs(adapter)
+        return (
+            shared_context_url(shared, reverse("wagtail_fedit:edit", kwargs=kwargs)),
+            shared_context_url(shared, reverse("wagtail_fedit:refetch", kwargs=kwargs)),
+        )
+
+    def get_instrumented(self, url: str):
+        with mock.patch("wagtail_fedit.instrumentation.INSTRUMENT_QUERIES", True):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return get_query_log(response.wsgi_request)
+
+    def measure_view(self, name: str, url: str, check_budgets: bool = True):
+        def get():
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+        self.record(name, measure(get))
+        if check_budgets:
+            self.check_query_budgets(self.get_instrumented(url))
+
+    def test_benchmark_views(self):
+        self.client.force_login(self.admin_user)
+        request = self.get_request()
+
+        adapters = {
+            "field": FieldAdapter(self.full_model, "title", request),
+            "block": BlockAdapter(
+                self.full_model, "content", request,
+                block_id=self.BLOCK_ID,
+            ),
+            "model": ModelAdapter(self.full_model, None, request),
+            "model.page": ModelAdapter(self.page_model, None, request),
+        }
+
+        for name, adapter in adapters.items():
+            # Pages also load their locale, latest revision and workflow state;
+            # their query counts are only compared against the baseline.
+            check_budgets = not isinstance(adapter.object, Page)
+
+            edit_url, refetch_url = self.get_adapter_urls(adapter)
+            self.measure_view(f"view.edit.{name}", edit_url, check_budgets)
+            self.measure_view(
+                f"view.edit.{name}.fragment",
+                f"{edit_url}{'&' if '?' in edit_url else '?'}fragment=1",
+                check_budgets,
+            )
+            self.measure_view(f"view.refetch.{name}", refetch_url, check_budgets)
+
+    def test_benchmark_editable_views(self):
+        self.client.force_login(self.admin_user)
+
+        for i in range(5):
+            revision = self.page_model.save_revision(
+                user=self.admin_user,
+                clean=False,
+            )
+            log(
+                instance=self.page_model,
+                action="wagtail_fedit.edit_field",
+                user=self.admin_user,
+                revision=revision,
+                content_changed=True,
+            )
+
+        for name in ("editable", "publish"):
+            url = self.get_url_for(
+                name,
+                self.page_model._meta.app_label,
+                self.page_model._meta.model_name,
+                self.page_model.pk,
+            )
+            self.measure_view(f"view.{name}", url)
+
+    def get_block_add_data(self, n: int) -> dict:
+        prefix = "wagtail-fedit-block-add"
+        data = {
+            f"{prefix}-count": n,
+        }
+        for i in range(n):
+            data.update({
+                f"{prefix}-{i}-deleted": "",
+                f"{prefix}-{i}-order": i,
+                f"{prefix}-{i}-type": "heading_component",
+                f"{prefix}-{i}-value-heading": f"Added {i}",
+                f"{prefix}-{i}-value-subheading": f"Added {i}",
+            })
+        return data
+
+    def test_benchmark_block_add(self):
+        self.client.force_login(self.admin_user)
+        data = self.get_block_add_data(self.ADD_BLOCKS)
+
+        for n in self.ADD_BLOCKS_TO:
+            obj = self.make_stream_object(n)
+            adapter = BlockAdapter(
+                obj, "content", self.get_request(),
+                block_id=f"heading-{n // 2}",
+                addable=True,
+            )
+            url = shared_context_url(
+                adapter.encode_shared_context(),
+                reverse("wagtail_fedit:block-add", kwargs=get_reverse_kwargs(adapter)),
+            )
+
+            def post():
+                response = self.client.post(url, data)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), {"success": True})
+
+            self.record(
+                f"view.block_add[{n}+{self.ADD_BLOCKS}]",
+                measure(post, number=2, repeat=2),
+                per=self.ADD_BLOCKS,
+            )
+
+            obj.refresh_from_db()
+            latest = obj.get_latest_revision_as_object()
+            self.assertEqual(latest.content[n // 2 + 1].value["heading"], "Added 0")
+
+    def test_benchmark_editable_ttfb(self):
+        self.client.force_login(self.admin_user)
+
+        n = self.EDITABLE_BLOCKS
+        self.page_model.content = make_stream_data(n, 0, 0)
+        self.page_model.save_revision(user=self.admin_user, clean=False)
+
+        url = self.get_url_for(
+            "editable",
+            self.page_model._meta.app_label,
+            self.page_model._meta.model_name,
+            self.page_model.pk,
+        )
+
+        def get():
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return response
+
+        def first_chunk():
+            return next(iter(get().streaming_content))
+
+        def all_chunks():
+            return b"".join(get().streaming_content)
+
+        with mock.patch.object(FEditableView, "streaming", False):
+            buffered = measure(get, number=3)
+
+        with mock.patch.object(FEditableView, "streaming", True):
+            self.assertIn(b"<head>", first_chunk())
+            ttfb = measure(first_chunk, number=3)
+            total = measure(all_chunks, number=3)
+
+        # The buffered response is only sent once it is fully rendered.
+        self.record(f"view.editable.buffered[{n}]", buffered)
+        self.record(f"view.editable.stream.ttfb[{n}]", ttfb)
+        self.record(f"view.editable.stream.total[{n}]", total)
+        print(f"Time to first byte: {buffered.time_ms / ttfb.time_ms:.1f}x faster when streamed")
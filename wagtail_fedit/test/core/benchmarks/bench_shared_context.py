@@ -0,0 +1,84 @@
+"""
+Benchmarks for the shared context codecs.
+
+These are not discovered by the regular test run; run them with:
+
+    python wagtail_fedit/test/manage.py test wagtail_fedit.test.core.benchmarks.bench_shared_context
+"""
+from django.test import SimpleTestCase
+from wagtail_fedit.adapters import (
+    BlockAdapter,
+    FieldAdapter,
+    codecs,
+)
+
+import timeit
+
+
+CASES = (
+    (FieldAdapter, {
+        "inline": False,
+        "LANGUAGE_CODE": "en",
+    }),
+    (FieldAdapter, {
+        "inline": True,
+        "LANGUAGE_CODE": "en",
+    }),
+    (BlockAdapter, {
+        "inline": False,
+        "admin": True,
+        "movable": True,
+        "addable": False,
+        "block_id": "d543a6bf-34dc-4365-a3fa-d302561930ae",
+        "LANGUAGE_CODE": "en",
+    }),
+)
+
+
+class SharedContextCodecBenchmark(SimpleTestCase):
+    ITERATIONS = 2000
+
+    codecs = {
+        "signed json": codecs.SignedJSONCodec(),
+        "base85 json": codecs.Base85JSONCodec(),
+        "compact (signed)": codecs.CompactCodec(sign=True),
+        "compact (unsigned)": codecs.CompactCodec(sign=False),
+    }
+
+    def report(self, name: str, size: int, encode: float, decode: float = None):
+        line = f"{name:>20}: {size:4d} chars, encode {encode / self.ITERATIONS * 1e6:7.2f} us"
+        if decode is not None:
+            line += f", decode {decode / self.ITERATIONS * 1e6:7.2f} us"
+        print(line)
+
+    def test_codecs_roundtrip(self):
+        for adapter_class, kwargs in CASES:
+            kwargs = adapter_class._defaults | kwargs
+            for codec in self.codecs.values():
+                decoded = codec.loads(adapter_class, codec.dumps(adapter_class, kwargs))
+                self.assertEqual(adapter_class._defaults | decoded, kwargs)
+
+    def test_benchmark_codecs(self):
+        for adapter_class, kwargs in CASES:
+            kwargs = adapter_class._defaults | kwargs
+            print(f"\n{adapter_class.__name__} {kwargs}")
+
+            for name, codec in self.codecs.items():
+                encoded = codec.dumps(adapter_class, kwargs)
+                encode = timeit.timeit(
+                    lambda: codec.dumps(adapter_class, kwargs),
+                    number=self.ITERATIONS,
+                )
+                decode = timeit.timeit(
+                    lambda: codec.loads(adapter_class, encoded),
+                    number=self.ITERATIONS,
+                )
+                self.report(name, len(encoded), encode, decode)
+
+            codecs.clear_caches()
+            encoded = codecs.encode(adapter_class, kwargs)
+            encode = timeit.timeit(
+                lambda: codecs.encode(adapter_class, dict(kwargs)),
+                number=self.ITERATIONS,
+            )
+            self.report("cached encoding", len(encoded), encode)
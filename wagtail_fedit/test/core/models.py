@@ -103,6 +103,7 @@ class BasicModel(models.Model):
         ("flat_menu_component", FlatMenuComponent())
     ], use_json_field=True)
     related_field = models.ForeignKey("self", on_delete=models.CASCADE, null=True, blank=True)
+    image = models.ForeignKey("wagtailimages.Image", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
 
     panels = [
         FieldPanel("title"),
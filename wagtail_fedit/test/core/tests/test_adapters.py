@@ -1,6 +1,7 @@
 from django.db.models.base import Model as Model
+from django.core.signing import BadSignature
 from django.http import HttpRequest
-from django.urls import reverse
+from django.urls import reverse, set_script_prefix
 from django.template import (
     Context, Template,
     TemplateSyntaxError,
@@ -21,26 +22,74 @@ from wagtail_fedit.registry import (
 from wagtail_fedit.adapters.base import (
     BlockFieldReplacementAdapter,
 )
+from wagtail_fedit.adapters import (
+    codecs,
+)
 from wagtail_fedit.utils import (
     FEDIT_PREVIEW_VAR,
     FIELD_TEMPLATE_VAR,
     INSTANCE_TEMPLATE_VAR,
+    ADAPTER_TEMPLATE_VAR,
+    ContextView,
     base_adapter_context,
+    read_only_adapter_context,
     shared_context_url,
     get_reverse_kwargs,
+    get_render_cache,
     find_block,
+    FeditPermissionCheck,
+)
+from wagtail_fedit.permissions import (
+    get_permission_matrix,
 )
 from wagtail_fedit.templatetags.fedit import (
+    AdapterNode,
     wrap_adapter,
 )
+from wagtail_fedit.views import (
+    AdapterBatchRefetchView,
+)
+from wagtail_fedit.views.mixins import (
+    LocaleMixin,
+)
+from wagtail_fedit.errors import (
+    SHARED_CONTEXT_EXPIRED,
+)
+from wagtail_fedit.toolbar import (
+    FeditAdapterEditButton,
+    render_components,
+)
+from django.template.loader import render_to_string
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from wagtail.images.models import (
+    Filter,
+    Image,
+)
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail_fedit.adapters.misc import (
+    BackgroundImageFieldAdapter,
+)
+from wagtail_fedit.renditions import (
+    RenditionGenerator,
+    rendition_generator,
+)
 from ..models import (
+    BasicModel,
     MenuItemBlock,
 )
 from .base import (
     BaseFEditTest,
 )
 
+from bs4 import BeautifulSoup
+from django.utils import translation
+from django.utils.functional import SimpleLazyObject
+from unittest import mock
+from types import SimpleNamespace
 import json
+import tempfile
 
 adapters = {}
 
@@ -89,7 +138,27 @@ class TestFieldAdapter(FieldAdapter, TestAdapter):
 class TestModelAdapter(ModelAdapter, TestAdapter):
     identifier = "test_model"
 
+CONTEXT_TEMPLATE = Template(
+    '<p class="context">{{ block_id }}|{{ wagtail_fedit_field }}|'
+    '{{ wagtail_fedit_instance.pk }}|{{ wagtail_fedit_adapter.identifier }}</p>'
+)
+
+class TestReadOnlyContextAdapter(BlockFieldReplacementAdapter):
+    identifier = "test_read_only_context"
+    keywords = (
+        Keyword("block_id", help_text="A test keyword argument", type_hint="str"),
+    )
+    js_constructor = "wagtail_fedit.ThisDoesntGetUsedAnyways"
+
+    @classmethod
+    def render_read_only(cls, request, object, field_name, context, **kwargs):
+        return CONTEXT_TEMPLATE.render(Context(context))
+
+    def render_content(self, parent_context: dict = None) -> str:
+        return CONTEXT_TEMPLATE.render(Context(parent_context))
+
 adapter_registry.register(TestAdapter)
+adapter_registry.register(TestReadOnlyContextAdapter)
 adapter_registry.register(TestBlockAdapter)
 adapter_registry.register(TestFieldAdapter)
 adapter_registry.register(TestModelAdapter)
@@ -457,6 +526,189 @@ class TestBaseAdapter(BaseFEditTest):
             json_data["html"],
         )
 
+    def test_adapter_batch_refetch(self):
+        ids = [get_adapter_id(), get_adapter_id()]
+
+        tpl = Template(
+            "{% load fedit %}"
+            f"{{% fedit test object.title test='test' id='{ids[0]}' %}}"
+            f"{{% fedit test object.title test='other' id='{ids[1]}' %}}"
+        )
+
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        setattr(
+            request,
+            FEDIT_PREVIEW_VAR,
+            True,
+        )
+
+        tpl.render(
+            Context({
+                "request": request,
+                "object": self.basic_model,
+            })
+        )
+
+        url = self.get_refetch_url(
+            "test",
+            self.basic_model._meta.app_label,
+            self.basic_model._meta.model_name,
+            self.basic_model.pk,
+            "title",
+        )
+
+        self.client.force_login(self.admin_user)
+
+        descriptors = [
+            {
+                "id": uid,
+                "url": shared_context_url(
+                    adapters[uid].encode_shared_context(), url,
+                ),
+            }
+            for uid in ids
+        ]
+        descriptors.append({
+            "id": "invalid",
+            "url": "/not-a-refetch-url/",
+        })
+
+        response = self.client.post(
+            reverse("wagtail_fedit:refetch-batch"),
+            data=json.dumps({"adapters": descriptors}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        json_data = response.json()
+        self.assertTrue(json_data["success"])
+        self.assertFalse(json_data["results"]["invalid"]["success"])
+
+        for descriptor in descriptors[:2]:
+            result = json_data["results"][descriptor["id"]]
+            self.assertTrue(result["success"])
+            self.assertTrue(result["refetch"])
+
+            single = self.client.get(descriptor["url"]).json()
+            self.assertHTMLEqual(
+                single["html"],
+                result["html"],
+            )
+
+    def test_adapter_batch_refetch_permissions(self):
+        url = self.get_refetch_url(
+            "test",
+            self.basic_model._meta.app_label,
+            self.basic_model._meta.model_name,
+            self.basic_model.pk,
+            "title",
+        )
+
+        self.client.force_login(self.regular_user)
+
+        response = self.client.post(
+            reverse("wagtail_fedit:refetch-batch"),
+            data=json.dumps({"adapters": [{"id": "1", "url": url}]}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["results"]["1"]["success"])
+
+        response = self.client.post(
+            reverse("wagtail_fedit:refetch-batch"),
+            data="not json",
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_adapter_batch_refetch_script_prefix(self):
+        url = shared_context_url(
+            codecs.encode(TestAdapter, {"test": "test", "id": get_adapter_id()}),
+            self.get_refetch_url(
+                "test",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+                "title",
+            ),
+        )
+
+        self.client.force_login(self.admin_user)
+
+        # Deployed under a sub-path; the client sends the URL as rendered.
+        batch_url = reverse("wagtail_fedit:refetch-batch")
+        set_script_prefix("/sub/")
+        try:
+            response = self.client.post(
+                batch_url,
+                data=json.dumps({"adapters": [{"id": "1", "url": f"/sub{url}"}]}),
+                content_type="application/json",
+            )
+        finally:
+            set_script_prefix("/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["results"]["1"]["success"])
+
+    def test_adapter_batch_refetch_language(self):
+        uid = get_adapter_id()
+        url = shared_context_url(
+            codecs.encode(TestAdapter, {"test": "test", "id": uid}),
+            self.get_refetch_url(
+                "test",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+                "title",
+            ),
+        )
+
+        self.client.force_login(self.admin_user)
+
+        languages = []
+        refetch_adapter = AdapterBatchRefetchView.refetch_adapter
+
+        def record_language(view, instance, adapter):
+            languages.append(translation.get_language())
+            return refetch_adapter(view, instance, adapter)
+
+        with translation.override("en"),\
+                mock.patch.object(LocaleMixin, "setup_locale", side_effect=lambda instance: translation.activate("nl")),\
+                mock.patch.object(AdapterBatchRefetchView, "refetch_adapter", record_language):
+            response = self.client.post(
+                reverse("wagtail_fedit:refetch-batch"),
+                data=json.dumps({"adapters": [{"id": "1", "url": url}]}),
+                content_type="application/json",
+            )
+
+            # Each adapter is rendered in its own language; the request's is restored.
+            self.assertEqual(languages, ["nl"])
+            self.assertEqual(translation.get_language(), "en")
+
+        self.assertTrue(response.json()["results"]["1"]["success"])
+
+    def test_adapter_batch_refetch_adapter_errors(self):
+        url = self.get_refetch_url(
+            "test",
+            self.basic_model._meta.app_label,
+            self.basic_model._meta.model_name,
+            self.basic_model.pk,
+            "title",
+        )
+
+        self.client.force_login(self.admin_user)
+
+        # Errors raised by adapters are not turned into a result message.
+        with mock.patch.object(TestAdapter, "__init__", side_effect=ValueError("internal detail")):
+            with self.assertRaisesMessage(ValueError, "internal detail"):
+                self.client.post(
+                    reverse("wagtail_fedit:refetch-batch"),
+                    data=json.dumps({"adapters": [{"id": "1", "url": url}]}),
+                    content_type="application/json",
+                )
+
 
     def test_adapter_shared_context(self):
         uid = get_adapter_id()
@@ -1184,3 +1436,722 @@ class TestModelAdapter(BaseFEditTest):
                 tpl,
                 wrap_adapter(request, adapters[id], context)
             )
+
+
+class TestRenderCache(BaseFEditTest):
+
+    def get_request(self):
+        request = self.request_factory.get(
+            self.get_editable_url(
+                self.basic_model.pk, self.basic_model._meta.app_label, self.basic_model._meta.model_name,
+            )
+        )
+        request.user = self.admin_user
+        setattr(
+            request,
+            FEDIT_PREVIEW_VAR,
+            True,
+        )
+        return request
+
+    def test_repeated_adapter_is_cached(self):
+        id = get_adapter_id()
+        request = self.get_request()
+        template = Template(
+            "{% load fedit %}"
+            "{% for i in items %}"
+            f"{{% fedit test object.title test='test' id='{id}' %}}"
+            "{% endfor %}"
+        )
+
+        tpl = template.render(Context({
+            "object": self.basic_model,
+            "request": request,
+            "items": range(5),
+        }))
+
+        cache = get_render_cache(request)
+        self.assertEqual(len(cache.adapters), 1)
+        self.assertEqual(len(cache.toolbars), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 8)
+
+        single = wrap_adapter(request, adapters[id], base_adapter_context(
+            adapter=adapters[id],
+            context={},
+        ))
+
+        self.assertHTMLEqual(
+            tpl,
+            single * 5,
+        )
+
+    def test_different_kwargs_are_not_shared(self):
+        request = self.get_request()
+        ids = [get_adapter_id() for _ in range(3)]
+        template = Template(
+            "{% load fedit %}"
+            "{% for id in ids %}"
+            "{% fedit test object.title test='test' id=id %}"
+            "{% endfor %}"
+        )
+
+        template.render(Context({
+            "object": self.basic_model,
+            "request": request,
+            "ids": ids,
+        }))
+
+        cache = get_render_cache(request)
+        self.assertEqual(len(cache.adapters), 3)
+        self.assertEqual(len(cache.toolbars), 3)
+        self.assertEqual(cache.hits, 0)
+
+        for id in ids:
+            self.assertIn(id, adapters)
+
+    def test_permission_matrix(self):
+        request = self.get_request()
+        ids = [get_adapter_id() for _ in range(20)]
+        template = Template(
+            "{% load fedit %}"
+            "{% for id in ids %}"
+            "{% fedit test object.title test='test' id=id %}"
+            "{% endfor %}"
+        )
+
+        with mock.patch.object(
+            self.admin_user, "has_perm", wraps=self.admin_user.has_perm,
+        ) as has_perm:
+            template.render(Context({
+                "object": self.basic_model,
+                "request": request,
+                "ids": ids,
+            }))
+
+        matrix = get_permission_matrix(request)
+
+        # One check for the model, one for the edit button's permissions.
+        self.assertEqual(matrix.checks, 2)
+        self.assertEqual(matrix.lookups, 40)
+        self.assertEqual(has_perm.call_count, 3)
+
+        other_request = self.get_request()
+        other_request.user = self.regular_user
+        self.assertFalse(
+            FeditPermissionCheck.has_perms(other_request, self.basic_model),
+        )
+        self.assertIsNot(get_permission_matrix(other_request), matrix)
+
+
+class TestAdapterNode(BaseFEditTest):
+
+    def test_constant_kwargs(self):
+        template = Template(
+            "{% load fedit %}"
+            "{% fedit test_absolute_tokens object.title test='test' id=id number=3 absolute %}"
+        )
+        node = template.nodelist.get_nodes_by_type(AdapterNode)[0]
+
+        self.assertEqual(node.constants, {"test": "test", "number": 3, "absolute": True})
+        self.assertEqual(list(node.variables), ["id"])
+        self.assertEqual(node.field_name, "title")
+
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        setattr(request, FEDIT_PREVIEW_VAR, True)
+
+        id = get_adapter_id()
+        template.render(Context({
+            "object": self.basic_model,
+            "request": request,
+            "id": id,
+        }))
+
+        self.assertEqual(adapters[id].kwargs["test"], "test")
+        self.assertEqual(adapters[id].kwargs["number"], 3)
+        self.assertTrue(adapters[id].kwargs["absolute"])
+
+        # Only the variables are frozen when rendering.
+        cache = get_render_cache(request)
+        self.assertIn(
+            cache.make_key("test_absolute_tokens", self.basic_model, "title", node.constants | {"id": id}),
+            cache.adapters,
+        )
+
+    def test_getter_chain(self):
+        request = self.request_factory.get("/")
+        request.user = self.regular_user
+        holder = SimpleNamespace(inner=self.basic_model)
+
+        self.assertEqual(
+            Template(
+                "{% load fedit %}"
+                "{% fedit field holder.inner.title %}"
+            ).render(Context({
+                "holder": holder,
+                "request": request,
+            })),
+            self.basic_model.title,
+        )
+
+        with self.assertRaisesMessage(TemplateSyntaxError, "does not have attribute missing"):
+            Template(
+                "{% load fedit %}"
+                "{% fedit field holder.missing.title %}"
+            ).render(Context({
+                "holder": holder,
+                "request": request,
+            }))
+
+
+class TestToolbar(BaseFEditTest):
+
+    def test_render_components_equals_render_to_string(self):
+        streamfield = self.basic_model.content
+        block_value, _, parent, idx = find_block(self.BLOCK_ID, streamfield)
+        request = self.request_factory.get(
+            self.get_editable_url(
+                self.basic_model.pk, self.basic_model._meta.app_label, self.basic_model._meta.model_name,
+            )
+        )
+        request.user = self.admin_user
+
+        adapter = TestBlockAdapter(
+            self.basic_model,
+            "content",
+            request,
+            id=get_adapter_id(),
+            block=block_value,
+            block_id=self.BLOCK_ID,
+            admin=True,
+            movable=True,
+            addable=True,
+        )
+        adapter.shared_context_string = adapter.encode_shared_context()
+
+        items = [
+            *adapter.get_toolbar_buttons(),
+            FeditAdapterEditButton(request, adapter),
+        ]
+
+        expected = [
+            render_to_string(item.template_name, item.get_context_data())
+            for item in items
+            if item.is_shown()
+        ]
+
+        self.assertEqual(len(expected), 5)
+        self.assertEqual(
+            render_components(items),
+            expected,
+        )
+
+
+class TestSharedContextCodecs(BaseFEditTest):
+
+    def test_codecs_roundtrip(self):
+        kwargs = {
+            "test": "test",
+            "absolute": True,
+            "optional": "not default",
+            "id": get_adapter_id(),
+            "nested": {"numbers": [1, -2, 3.5], "empty": None, "flag": False},
+        }
+
+        for codec in (
+            codecs.SignedJSONCodec(),
+            codecs.Base85JSONCodec(),
+            codecs.CompactCodec(sign=True),
+            codecs.CompactCodec(sign=False),
+        ):
+            encoded = codec.dumps(TestAbsoluteTokensAdapter, kwargs)
+            self.assertEqual(
+                codec.loads(TestAbsoluteTokensAdapter, encoded),
+                kwargs,
+            )
+
+    def test_compact_codec_elides_defaults(self):
+        codec = codecs.CompactCodec(sign=True)
+        kwargs = TestAbsoluteTokensAdapter._defaults | {
+            "test": "test",
+        }
+
+        encoded = codec.dumps(TestAbsoluteTokensAdapter, kwargs)
+        self.assertEqual(
+            codec.loads(TestAbsoluteTokensAdapter, encoded),
+            {"test": "test"},
+        )
+
+        # Same value but another type is not a default.
+        encoded = codec.dumps(TestAbsoluteTokensAdapter, kwargs | {"absolute": 0})
+        self.assertEqual(
+            codec.loads(TestAbsoluteTokensAdapter, encoded),
+            {"test": "test", "absolute": 0},
+        )
+
+        self.assertLess(
+            len(encoded),
+            len(codecs.SignedJSONCodec().dumps(TestAbsoluteTokensAdapter, kwargs)),
+        )
+
+    def test_compact_codec_signed(self):
+        codec = codecs.CompactCodec(sign=True)
+        encoded = codec.dumps(TestAdapter, {"test": "test"})
+
+        with self.assertRaises(BadSignature):
+            codec.loads(TestAdapter, f"x{encoded}")
+
+    def test_compact_codec_malformed(self):
+        codec = codecs.CompactCodec(sign=False)
+        encoded = codec.dumps(TestAdapter, {"test": "test", "id": get_adapter_id()})
+
+        for data in (
+            "",
+            "not base64!",
+            "ü",
+            encoded[:-4],
+            codecs.b64_encode(bytes([0x20])).decode(),
+            codecs.b64_encode(bytes([0x11]) + b"not zlib").decode(),
+            codecs.b64_encode(bytes([0x10, 0x01, codecs._STR, 0x02, 0xff, 0xfe])).decode(),
+        ):
+            with self.subTest(data=data), self.assertRaises(BadSignature):
+                codec.loads(TestAdapter, data)
+
+        self.client.force_login(self.admin_user)
+        with mock.patch.object(codecs, "_codec", codec):
+            response = self.client.get(self.get_refetch_url(
+                "test",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+                "title",
+            ), {
+                "shared_context": encoded[:-4],
+            })
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_encoding_cache(self):
+        kwargs = {"test": "test", "id": get_adapter_id()}
+        codecs.clear_caches()
+
+        encoded = codecs.encode(TestAdapter, kwargs)
+        with mock.patch.object(codecs.SignedJSONCodec, "dumps") as dumps:
+            self.assertEqual(
+                codecs.encode(TestAdapter, dict(kwargs)),
+                encoded,
+            )
+            dumps.assert_not_called()
+
+            # Types are part of the key
+            codecs.encode(TestAdapter, kwargs | {"test": 1})
+            codecs.encode(TestAdapter, kwargs | {"test": True})
+            self.assertEqual(dumps.call_count, 2)
+
+        codecs.clear_caches()
+        self.assertEqual(
+            codecs.decode(TestAdapter, encoded),
+            kwargs,
+        )
+
+    def test_store_codec(self):
+        codec = codecs.CacheStoreCodec(alias="default", timeout=60)
+        kwargs = {"test": "test", "id": get_adapter_id()}
+
+        with mock.patch.object(codec.cache, "set", wraps=codec.cache.set) as cache_set:
+            key = codec.dumps(TestAdapter, kwargs)
+            self.assertEqual(codec.dumps(TestAdapter, dict(kwargs)), key)
+            # Written every time; the entry may have been evicted.
+            self.assertEqual(cache_set.call_count, 2)
+
+        self.assertEqual(len(key), codecs.CacheStoreCodec.key_length)
+        self.assertEqual(codec.loads(TestAdapter, key), kwargs)
+
+        self.assertNotEqual(codec.dumps(TestAdapter, kwargs | {"test": "other"}), key)
+        self.assertNotEqual(codec.dumps(TestAbsoluteTokensAdapter, kwargs), key)
+
+        with self.assertRaises(codecs.SharedContextExpired):
+            codec.loads(TestAdapter, "0" * codec.key_length)
+        with self.assertRaises(BadSignature):
+            codec.loads(TestAdapter, "not-a-key")
+
+        codec.cache.delete(f"{codec.key_prefix}{key}")
+        with self.assertRaises(codecs.SharedContextExpired):
+            codec.loads(TestAdapter, key)
+        self.assertEqual(codec.dumps(TestAdapter, kwargs), key)
+        self.assertEqual(codec.loads(TestAdapter, key), kwargs)
+
+    def test_store_codec_refetch(self):
+        uid = get_adapter_id()
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+
+        with mock.patch.object(codecs, "_codec", codecs.CacheStoreCodec()):
+            adapter = TestAdapter(
+                self.basic_model, "title", request, test="test", id=uid,
+            )
+            shared_context = adapter.encode_shared_context()
+            self.assertEqual(len(shared_context), codecs.CacheStoreCodec.key_length)
+
+            self.client.force_login(self.admin_user)
+            response = self.client.get(self.get_refetch_url(
+                "test",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+                "title",
+            ), {
+                "shared_context": shared_context,
+            })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(adapters[uid].kwargs["test"], "test")
+        self.assertNotIn(uid, self.client.session.keys())
+
+    def test_store_codec_expired(self):
+        codec = codecs.CacheStoreCodec()
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+
+        with mock.patch.object(codecs, "_codec", codec):
+            adapter = TestAdapter(
+                self.basic_model, "title", request, test="test", id=get_adapter_id(),
+            )
+            shared_context = adapter.encode_shared_context()
+            codec.cache.delete(f"{codec.key_prefix}{shared_context}")
+
+            self.client.force_login(self.admin_user)
+            response = self.client.get(self.get_refetch_url(
+                "test",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+                "title",
+            ), {
+                "shared_context": shared_context,
+            })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.content.decode(), str(SHARED_CONTEXT_EXPIRED))
+
+
+class TestReadOnlyRendering(BaseFEditTest):
+
+    def get_request(self, preview=False):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        if preview:
+            setattr(
+                request,
+                FEDIT_PREVIEW_VAR,
+                True,
+            )
+        return request
+
+    def render(self, source, **context):
+        return Template("{% load fedit %}" + source).render(Context(context))
+
+    def test_field_read_only(self):
+        with mock.patch.object(FieldAdapter, "__init__", side_effect=AssertionError("Adapter was constructed")):
+            content = self.render(
+                "{% fedit field object.title %}",
+                object=self.basic_model,
+                request=self.get_request(),
+            )
+
+        self.assertHTMLEqual(content, self.basic_model.title)
+
+    def test_block_read_only(self):
+        block, _, _, _ = find_block(self.BLOCK_ID, self.basic_model.content)
+
+        with mock.patch.object(BlockAdapter, "__init__", side_effect=AssertionError("Adapter was constructed")):
+            content = self.render(
+                "{% fedit block object.content block=block %}",
+                object=self.basic_model,
+                block=block,
+                request=self.get_request(),
+            )
+
+        self.assertHTMLEqual(content, block.render({}))
+
+    def test_read_only_context(self):
+        block, _, _, _ = find_block(self.BLOCK_ID, self.basic_model.content)
+        context = Context({"block": "page block"})
+
+        with mock.patch.object(BlockAdapter, "__init__", side_effect=AssertionError("Adapter was constructed")):
+            adapter_context = read_only_adapter_context(
+                BlockAdapter,
+                self.basic_model,
+                "content",
+                {"block": block},
+                ContextView.of(context),
+                adapter=SimpleLazyObject(lambda: BlockAdapter(self.basic_model, "content", None)),
+            )
+
+        # The same variables as `base_adapter_context`.
+        self.assertIs(adapter_context["block"], block)
+        self.assertEqual(adapter_context[FIELD_TEMPLATE_VAR], "content")
+        self.assertIs(adapter_context[INSTANCE_TEMPLATE_VAR], self.basic_model)
+        self.assertIn(ADAPTER_TEMPLATE_VAR, adapter_context)
+        self.assertEqual(context["block"], "page block")
+
+    def test_read_only_context_matches_editors(self):
+        source = "{% fedit test_read_only_context object.title block_id='block-1' %}"
+        request = self.get_request()
+        request.user = self.anonymous_user
+
+        content = self.render(source, object=self.basic_model, request=request)
+        editor_content = self.render(
+            source,
+            object=self.basic_model,
+            request=self.get_request(preview=True),
+        )
+
+        self.assertIn("data-wrapper-id", editor_content)
+        read_only = BeautifulSoup(content, "html.parser").select_one("p.context")
+        editor = BeautifulSoup(editor_content, "html.parser").select_one("p.context")
+        self.assertEqual(str(read_only), str(editor))
+        self.assertEqual(
+            read_only.text,
+            f"block-1|title|{self.basic_model.pk}|test_read_only_context",
+        )
+
+    def test_model_read_only(self):
+        with mock.patch.object(ModelAdapter, "__init__", side_effect=AssertionError("Adapter was constructed")):
+            content = self.render(
+                "{% fedit model object %}",
+                object=self.basic_model,
+                request=self.get_request(),
+            )
+
+        self.assertHTMLEqual(content, self.basic_model.render_as_content(None))
+
+    def test_read_only_without_request(self):
+        content = self.render(
+            "{% fedit field object.title %}",
+            object=self.basic_model,
+        )
+
+        self.assertHTMLEqual(content, self.basic_model.title)
+
+    def test_overridden_render_content_constructs_adapter(self):
+        class CustomFieldAdapter(FieldAdapter):
+            def render_content(self, parent_context=None):
+                return "custom"
+
+        self.assertIsNone(CustomFieldAdapter.render_read_only(
+            self.get_request(), self.basic_model, "title", {},
+        ))
+
+        id = get_adapter_id()
+        content = self.render(
+            f"{{% fedit test object.title test='test' id='{id}' %}}",
+            object=self.basic_model,
+            request=self.get_request(),
+        )
+
+        self.assertIn(id, adapters)
+        self.assertHTMLEqual(content, f"TestAdapter: {self.basic_model.title} (test) ({id})")
+
+    def test_editors_get_adapter(self):
+        request = self.get_request(preview=True)
+        content = self.render(
+            "{% fedit field object.title %}",
+            object=self.basic_model,
+            request=request,
+        )
+
+        self.assertIn("data-wrapper-id", content)
+
+
+class TestBackgroundImageAdapter(BaseFEditTest):
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        # Renditions are cached by image id, which is re-used between tests.
+        Image.get_rendition_model().cache_backend.clear()
+
+        self.objects = []
+        for i in range(3):
+            self.objects.append(BasicModel.objects.create(
+                title=f"Image {i}",
+                body="",
+                content=[],
+                image=Image.objects.create(
+                    title=f"Image {i}",
+                    file=get_test_image_file(f"image-{i}.png"),
+                ),
+            ))
+
+    def get_url(self, view: str, obj, **kwargs) -> str:
+        adapter = BackgroundImageFieldAdapter(
+            obj, "image", self.get_request(),
+            target=".hero", **(kwargs or {"filter_spec": "fill-10x10"}),
+        )
+        return shared_context_url(
+            adapter.encode_shared_context(),
+            reverse(f"wagtail_fedit:{view}", kwargs={
+                "adapter_id": adapter.identifier,
+                "app_label": obj._meta.app_label,
+                "model_name": obj._meta.model_name,
+                "model_id": obj.pk,
+                "field_name": "image",
+            }),
+        )
+
+    def get_descriptor(self, obj) -> dict:
+        return {
+            "id": str(obj.pk),
+            "url": self.get_url("refetch", obj),
+        }
+
+    def get_request(self):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        return request
+
+    def test_batch_refetch_prefetches_renditions(self):
+        # The first two images already have their rendition.
+        renditions = [
+            obj.image.get_rendition("fill-10x10") for obj in self.objects[:2]
+        ]
+        Image.get_rendition_model().cache_backend.clear()
+
+        self.client.force_login(self.admin_user)
+        with mock.patch.object(rendition_generator, "workers", 2),\
+                mock.patch.object(rendition_generator, "submit") as submit,\
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("wagtail_fedit:refetch-batch"),
+                data=json.dumps({"adapters": [
+                    self.get_descriptor(obj) for obj in self.objects
+                ]}),
+                content_type="application/json",
+            )
+
+        results = response.json()["results"]
+        for obj, rendition in zip(self.objects, renditions):
+            self.assertEqual(results[str(obj.pk)]["url"], rendition.url)
+
+        # The missing rendition is generated in the background.
+        missing = self.objects[2]
+        self.assertEqual(results[str(missing.pk)]["url"], missing.image.file.url)
+        submit.assert_called_once()
+        self.assertEqual(submit.call_args.args[0].pk, missing.image.pk)
+
+        # Renditions of all images are loaded with a single query.
+        self.assertEqual(len([
+            query for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "wagtailimages_rendition"')
+        ]), 1)
+
+    def test_refetch_without_workers(self):
+        self.client.force_login(self.admin_user)
+        obj = self.objects[0]
+        with mock.patch.object(rendition_generator, "workers", 0):
+            response = self.client.get(self.get_descriptor(obj)["url"])
+
+        self.assertEqual(
+            response.json()["url"],
+            obj.image.get_rendition("fill-10x10").url,
+        )
+
+    def test_rendition_generator(self):
+        generator = RenditionGenerator(workers=1)
+        generator._executor = mock.Mock()
+        image = self.objects[0].image
+        filters = [Filter("fill-10x10"), Filter("fill-20x20")]
+
+        generator.submit(image, filters)
+        # Queued renditions are not queued again.
+        self.assertIsNone(generator.submit(image, filters[:1]))
+        generator.submit(image, [Filter("fill-30x30")])
+        self.assertEqual(generator._executor.submit.call_count, 2)
+
+        _generate, model, pk, specs = generator._executor.submit.call_args_list[0].args
+        self.assertEqual(specs, ["fill-10x10", "fill-20x20"])
+
+        # Worker threads close their own database connections.
+        with mock.patch("wagtail_fedit.renditions.connections"):
+            generator.generate(model, pk, specs)
+        generator.done(model, pk, specs)
+
+        self.assertEqual(
+            set(image.renditions.values_list("filter_spec", flat=True)),
+            {"fill-10x10", "fill-20x20"},
+        )
+        self.assertEqual(generator.pending, {(model, pk, "fill-30x30")})
+
+    def test_filter_specs_image_set(self):
+        self.client.force_login(self.admin_user)
+        obj = self.objects[0]
+        url = self.get_url("refetch", obj, filter_specs="width-{5,10}")
+
+        with mock.patch.object(rendition_generator, "workers", 0):
+            data = self.client.get(url).json()
+
+        small = obj.image.get_rendition("width-5")
+        large = obj.image.get_rendition("width-10")
+        self.assertEqual(data["url"], small.url)
+        self.assertEqual(
+            data["css_value"],
+            f'image-set(url("{small.url}") 1x, url("{large.url}") 2x)',
+        )
+
+        # The original image is used until all renditions are ready.
+        url = self.get_url("refetch", obj, filter_specs=["width-5", "width-20"])
+        with mock.patch.object(rendition_generator, "workers", 2),\
+                mock.patch.object(rendition_generator, "submit") as submit:
+            data = self.client.get(url).json()
+
+        self.assertEqual(data["css_value"], f'url("{obj.image.file.url}")')
+        self.assertEqual(
+            [filter.spec for filter in submit.call_args.args[1]],
+            ["width-20"],
+        )
+
+    def test_renditions_queued_on_save(self):
+        self.client.force_login(self.admin_user)
+        obj = self.objects[0]
+        image = self.objects[1].image
+        url = self.get_url("edit", obj, filter_specs="width-{5,10}")
+
+        # Generated off the request path; the original image is used until then.
+        with mock.patch.object(rendition_generator, "workers", 2),\
+                mock.patch.object(rendition_generator, "submit") as submit:
+            data = self.client.post(url, {"image": image.pk}).json()
+
+        self.assertTrue(data["success"])
+        self.assertEqual(
+            [filter.spec for filter in submit.call_args.args[1]],
+            ["width-5", "width-10"],
+        )
+        self.assertFalse(image.renditions.exists())
+        self.assertEqual(data["css_value"], f'url("{image.file.url}")')
+
+    def test_renditions_warmed_on_save(self):
+        self.client.force_login(self.admin_user)
+        obj = self.objects[0]
+        image = self.objects[1].image
+        url = self.get_url("edit", obj, filter_specs="width-{5,10}")
+
+        with mock.patch("wagtail_fedit.adapters.misc.WARM_RENDITIONS_ON_SAVE", True),\
+                mock.patch.object(rendition_generator, "workers", 2),\
+                mock.patch.object(rendition_generator, "submit") as submit:
+            data = self.client.post(url, {"image": image.pk}).json()
+
+        self.assertTrue(data["success"])
+        submit.assert_not_called()
+        small = image.get_rendition("width-5")
+        large = image.get_rendition("width-10")
+        self.assertEqual(
+            data["css_value"],
+            f'image-set(url("{small.url}") 1x, url("{large.url}") 2x)',
+        )
@@ -1,16 +1,47 @@
+from django.urls import reverse
 from wagtail.models import (
     RevisionMixin,
+    ModelLogEntry,
+)
+from wagtail_fedit import (
+    utils,
+)
+from wagtail_fedit.adapters import (
+    BlockAdapter,
 )
 from wagtail_fedit.utils import (
     find_block,
+    get_reverse_kwargs,
+    shared_context_url,
 )
 from .base import (
     BaseFEditTest,
+    TEST_BLOCK_DATA,
 )
 
+from unittest import mock
 import json
 
 class TestBlockEdit(BaseFEditTest):
+    def test_block_edit_fragment(self):
+        self.client.force_login(self.admin_user)
+
+        url = self.get_block_url(
+            self.BLOCK_ID,
+            "content",
+            self.basic_model._meta.app_label,
+            self.basic_model._meta.model_name,
+            self.basic_model.pk,
+        )
+
+        response = self.client.get(f"{url}&fragment=1")
+        self.assertEqual(response.status_code, 200)
+        fragment = response.content.decode()
+
+        self.assertNotIn("<!doctype html>", fragment)
+        self.assertIn('id="wagtail-fedit-form"', fragment)
+        self.assertIn('data-block', fragment)
+
     def test_block_edited(self):
 
         self.client.force_login(self.admin_user)
@@ -119,3 +150,109 @@ class TestBlockEdit(BaseFEditTest):
         self.assertTrue(response_content.get("locked", False))
         self.assertEqual(self.lock_model.locked_by, self.admin_user)
         self.assertEqual(self.lock_model.content.get_prep_value(), initial_content.get_prep_value())
+
+
+class TestBlockMove(BaseFEditTest):
+    def get_move_url(self, model, block_id, **kwargs):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        adapter = BlockAdapter(
+            model, "content", request,
+            block_id=block_id,
+            movable=True,
+        )
+        return shared_context_url(
+            adapter.encode_shared_context(),
+            reverse("wagtail_fedit:block-move", kwargs=get_reverse_kwargs(adapter)),
+            **kwargs,
+        )
+
+    def post_moves(self, model, moves):
+        return self.client.post(
+            self.get_move_url(model, self.BLOCK_ID),
+            json.dumps({"moves": moves}),
+            content_type="application/json",
+        )
+
+    def test_move_single(self):
+        self.client.force_login(self.admin_user)
+        response = self.client.post(
+            self.get_move_url(self.draft_model, self.BLOCK_ID, action="down"),
+        )
+        self.assertEqual(response.json(), {"success": True})
+
+        self.draft_model.refresh_from_db()
+        self.assertEqual(self.draft_model.revisions.count(), 1)
+
+        chk = self.draft_model.latest_revision.as_object()
+        self.assertEqual(find_block(self.BLOCK_ID, chk.content)[3], 1)
+
+    def test_move_batch(self):
+        self.client.force_login(self.admin_user)
+
+        url = self.get_move_url(self.draft_model, self.BLOCK_ID)
+
+        with mock.patch("wagtail_fedit.utils._index_blocks", wraps=utils._index_blocks) as index_blocks:
+            response = self.client.post(url, json.dumps({"moves": [
+                {"action": "down"},
+                {"action": "down"},
+                {"action": "up"},
+                {"action": "down", "block_id": self.BLOCK_ID},
+            ]}), content_type="application/json")
+        self.assertEqual(response.json(), {"success": True})
+
+        # The index is built once and updated for the swapped blocks.
+        builds = {id(call.args[2]) for call in index_blocks.call_args_list}
+        self.assertEqual(len(builds), 1)
+
+        self.draft_model.refresh_from_db()
+        self.assertEqual(self.draft_model.revisions.count(), 1)
+
+        chk = self.draft_model.latest_revision.as_object()
+        self.assertEqual(find_block(self.BLOCK_ID, chk.content)[3], 2)
+
+        entries = ModelLogEntry.objects.filter(action="wagtail_fedit.move_block")
+        self.assertEqual(
+            [(entry.data["block_id"], entry.data["direction"], entry.data["steps"]) for entry in entries],
+            [(self.BLOCK_ID, "down", 2)],
+        )
+
+    def test_move_batch_cancels_out(self):
+        self.client.force_login(self.admin_user)
+
+        # The block is the first item; it moves down and back up.
+        response = self.post_moves(self.draft_model, [
+            {"action": "down"},
+            {"action": "up"},
+        ])
+        self.assertEqual(response.json(), {"success": True})
+
+        self.draft_model.refresh_from_db()
+        self.assertEqual(self.draft_model.revisions.count(), 0)
+        self.assertFalse(ModelLogEntry.objects.filter(action="wagtail_fedit.move_block").exists())
+
+    def test_move_other_block(self):
+        self.client.force_login(self.admin_user)
+
+        response = self.post_moves(self.draft_model, [
+            {"action": "down"},
+            {"action": "up", "block_id": TEST_BLOCK_DATA[1]["id"]},
+        ])
+        self.assertEqual(response.json(), {"error": "Only this block can be moved"})
+
+        self.draft_model.refresh_from_db()
+        self.assertEqual(self.draft_model.revisions.count(), 0)
+
+    def test_move_batch_invalid(self):
+        self.client.force_login(self.admin_user)
+
+        # The block is the first of four items; the fourth move fails.
+        response = self.post_moves(self.draft_model, [{"action": "down"}] * 4)
+        self.assertEqual(response.json(), {"error": "Cannot move block down"})
+
+        for moves in ([], [{"action": "left"}], ["up"]):
+            response = self.post_moves(self.draft_model, moves)
+            self.assertEqual(response.json(), {"error": "Invalid action"})
+
+        self.draft_model.refresh_from_db()
+        self.assertEqual(self.draft_model.revisions.count(), 0)
@@ -80,6 +80,90 @@ class TestBlocks(TestCase):
         self.assertEqual(idx, 2)
         self.assertEqual(parent.bound_blocks[idx].value["link"]["text"], "Test Item 3")
     
+    def test_block_index_cached(self):
+        utils.find_block("d543a6bf-34dc-4365-a3fa-d302561930ae", self.stream_value)
+        index = getattr(self.stream_value, utils.BLOCK_INDEX_ATTR)
+
+        block, contentpath, parent, idx = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)
+        self.assertIs(getattr(self.stream_value, utils.BLOCK_INDEX_ATTR), index)
+        self.assertIs(index["a98a19c6-2ead-4e69-9ea2-3158c7e82976"][0], block)
+        self.assertEqual(len(index), 10)
+
+        utils.invalidate_block_index(self.stream_value)
+        self.assertFalse(hasattr(self.stream_value, utils.BLOCK_INDEX_ATTR))
+
+    def test_block_index_stale(self):
+        block, contentpath, parent, idx = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)
+        self.assertEqual(idx, 2)
+
+        # Mutate without invalidating the index
+        parent.bound_blocks[idx], parent.bound_blocks[idx - 1] = parent.bound_blocks[idx - 1], parent.bound_blocks[idx]
+
+        block, contentpath, parent, idx = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)
+        self.assertEqual(idx, 1)
+        self.assertEqual(parent.bound_blocks[idx].value["link"]["text"], "Test Item 3")
+
+    def test_insert_many_invalidates_index(self):
+        block, contentpath, parent, idx = utils.find_block("d543a6bf-34dc-4365-a3fa-d302561930ae", self.stream_value)
+        self.assertEqual(idx, 1)
+
+        new_value = self.stream_block.to_python([
+            {
+                "type": "heading_component",
+                "value": {"heading": "Inserted", "subheading": "Inserted"},
+                "id": "inserted-block-id",
+            },
+        ])
+
+        utils.insert_many(self.stream_value, 0, new_value)
+        self.assertFalse(hasattr(self.stream_value, utils.BLOCK_INDEX_ATTR))
+
+        block, contentpath, parent, idx = utils.find_block("inserted-block-id", self.stream_value)
+        self.assertEqual(idx, 1)
+        self.assertEqual(block.value["heading"], "Inserted")
+
+        block, contentpath, parent, idx = utils.find_block("d543a6bf-34dc-4365-a3fa-d302561930ae", self.stream_value)
+        self.assertEqual(idx, 2)
+
+    def test_insert_many(self):
+        def new_blocks(*ids):
+            return self.stream_block.to_python([
+                {
+                    "type": "heading_component",
+                    "value": {"heading": id, "subheading": id},
+                    "id": id,
+                }
+                for id in ids
+            ])
+
+        ids = [block.id for block in self.stream_value]
+
+        utils.insert_many(self.stream_value, 1, new_blocks("a", "b", "c"))
+        utils.insert_many(self.stream_value, len(self.stream_value) - 1, new_blocks("z"))
+        expected = ids[:2] + ["a", "b", "c"] + ids[2:] + ["z"]
+
+        self.assertEqual([block.id for block in self.stream_value], expected)
+        self.assertEqual(
+            [item["id"] for item in self.stream_value.get_prep_value()],
+            expected,
+        )
+        self.assertEqual(self.stream_value[2].value["heading"], "a")
+        self.assertEqual(self.stream_value.raw_data[2]["value"]["heading"], "a")
+
+        empty = self.stream_block.to_python([])
+        utils.insert_many(empty, 0, new_blocks("a", "b"))
+        self.assertEqual([block.id for block in empty], ["a", "b"])
+
+        with self.assertRaises(IndexError):
+            utils.insert_many(self.stream_value, len(self.stream_value), new_blocks("x"))
+
+        _, _, items, idx = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)
+        utils.insert_many(items, idx, [{"link": {"text": "New 1"}}, {"link": {"text": "New 2"}}])
+        self.assertEqual(
+            [item["link"]["text"] for item in items],
+            ["Test Item 1", "Test Item 2", "Test Item 3", "New 1", "New 2", "Test Item 4"],
+        )
+
     def test_move_block_down(self):
         block, contentpath, parent, idx = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)
         self.assertEqual(idx, 2)
@@ -127,6 +211,17 @@ class TestBlocks(TestCase):
         invalid_form = form_class(data=INVALID_DATA, block=block, parent_instance=FakeModel())
         self.assertFalse(invalid_form.is_valid())
 
+    def test_block_form_class_cached(self):
+        block = utils.find_block("d543a6bf-34dc-4365-a3fa-d302561930ae", self.stream_value)[0]
+        form_class = block_forms.get_block_form_class(block.block)
+        self.assertIs(block_forms.get_block_form_class(block), form_class)
+
+        other = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)[0]
+        self.assertIsNot(block_forms.get_block_form_class(other.block), form_class)
+
+        block_forms.clear_form_class_cache()
+        self.assertIsNot(block_forms.get_block_form_class(block.block), form_class)
+
     def test_get_subblock_form_class(self):
         block = utils.find_block("a98a19c6-2ead-4e69-9ea2-3158c7e82976", self.stream_value)[0]
         form_class = block_forms.get_block_form_class(block.block)
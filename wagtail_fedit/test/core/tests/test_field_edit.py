@@ -46,6 +46,55 @@ class TestFieldEdit(BaseFEditTest):
 
             self.assertEqual(chk.title, f"{initial_title} test case {i + 1}")
 
+    def test_edit_fragment(self):
+        self.client.force_login(self.admin_user)
+
+        url = self.get_field_url(
+            "title",
+            self.basic_model._meta.app_label,
+            self.basic_model._meta.model_name,
+            self.basic_model.pk,
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        document = response.content.decode()
+        self.assertIn("<!doctype html>", document)
+
+        response = self.client.get(f"{url}?fragment=1")
+        self.assertEqual(response.status_code, 200)
+        fragment = response.content.decode()
+
+        self.assertNotIn("<!doctype html>", fragment)
+        self.assertNotIn("<head>", fragment)
+        self.assertIn('id="wagtail-fedit-form"', fragment)
+        self.assertIn('id="main"', fragment)
+        self.assertIn("<title>", fragment)
+        self.assertLess(len(fragment), len(document))
+
+    def test_invalid_returns_fragment(self):
+        self.client.force_login(self.admin_user)
+
+        response = self.client.post(
+            self.get_field_url(
+                "title",
+                self.basic_model._meta.app_label,
+                self.basic_model._meta.model_name,
+                self.basic_model.pk,
+            ),
+            {
+                "title": "",
+            }
+        )
+
+        self.assertEqual(response.status_code, 400)
+        data = response.json()
+        self.assertFalse(data["success"])
+        self.assertIn("title", data["errors"])
+        self.assertNotIn("<!doctype html>", data["html"])
+        self.assertIn('id="main"', data["html"])
+        self.assertIn('id="wagtail-fedit-form"', data["html"])
+
     def test_unauthorized_unchanged(self):
         self.client.force_login(self.regular_user)
         
@@ -1,12 +1,31 @@
 from django.db import models
+from django.template import Template, Context, engines
 from wagtail import hooks
 
+from django.template.loader import get_template, render_to_string
+from django.test import override_settings
+from unittest import mock
 import copy
 
 from wagtail_fedit import (
     hooks as fedit_hooks,
+    forms,
     utils,
 )
+from wagtail_fedit.permissions import (
+    get_permission_matrix,
+)
+from wagtail_fedit.instrumentation import (
+    get_query_log,
+    record_queries,
+)
+from wagtail_fedit import streaming
+from wagtail_fedit.streaming import (
+    stream_template,
+)
+from wagtail_fedit.views import (
+    FEditableView,
+)
 
 from .base import BaseFEditTest
 
@@ -18,6 +37,7 @@ class TestUtils(BaseFEditTest):
         utils._field_renderer_map[models.TextField] =\
             lambda request, context, instance, value:\
                 f"<p class=\"text-field\">{value}</p>"
+        utils.clear_renderer_cache()
         
         @hooks.register(fedit_hooks.EXCLUDE_FROM_RELATED_FORMS)
         def exclude_related_forms(field: models.Field):
@@ -34,6 +54,49 @@ class TestUtils(BaseFEditTest):
             f"<p class=\"text-field\">{self.basic_model.body}</p>"
         )
 
+    def test_field_content_dispatch(self):
+        request = self.request_factory.get("/")
+
+        class Value(str):
+            pass
+
+        utils._renderer_map[str] = lambda request, context, instance, value: f"str:{value}"
+        utils._renderer_map[Value] = lambda request, context, instance, value: f"value:{value}"
+        self.addCleanup(utils._renderer_map.pop, str)
+        self.addCleanup(utils._renderer_map.pop, Value)
+        self.addCleanup(utils.clear_renderer_cache)
+        utils.clear_renderer_cache()
+
+        # The closest class in the MRO wins.
+        self.assertEqual(
+            utils.get_field_content(request, self.basic_model, "title", {}, content=Value("test")),
+            "value:test",
+        )
+        self.assertEqual(
+            utils.get_field_content(request, self.basic_model, "title", {}),
+            f"str:{self.basic_model.title}",
+        )
+
+        # Resolved once per model class, field name and content type.
+        self.assertIn((self.basic_model.__class__, "title"), utils._field_dispatch_cache)
+        self.assertIn(Value, utils._type_dispatch_cache)
+
+        # `render_fedit_{field_name}` is looked up once per model class.
+        with mock.patch.object(
+            self.basic_model.__class__, "render_fedit_title",
+            create=True,
+            new=lambda self, request, context=None: "method",
+        ):
+            self.assertEqual(
+                utils.get_field_content(request, self.basic_model, "title", {}),
+                f"str:{self.basic_model.title}",
+            )
+            utils.clear_renderer_cache()
+            self.assertEqual(
+                utils.get_field_content(request, self.basic_model, "title", {}),
+                "str:method",
+            )
+
     def test_permission_check(self):
         self.assertTrue(
             utils.FeditPermissionCheck.has_perms(self.admin_user, self.basic_model)
@@ -123,3 +186,252 @@ class TestUtils(BaseFEditTest):
                 outcome,
             )
 
+    def test_form_classes_cached(self):
+        model = self.basic_model.__class__
+        form_class = forms.get_form_class_for_fields(model, ["title"])
+
+        self.assertIs(forms.get_form_class_for_fields(model, ("title",)), form_class)
+        self.assertIsNot(forms.get_form_class_for_fields(model, ["body"]), form_class)
+        self.assertEqual(list(form_class.base_fields), ["title"])
+
+        forms.clear_form_class_cache()
+        self.assertIsNot(forms.get_form_class_for_fields(model, ["title"]), form_class)
+
+    def test_context_view(self):
+        context = Context({"a": 1, "b": 1})
+        context.push({"b": 2})
+
+        view = utils.ContextView.of({"c": 3}, context)
+        self.assertEqual(view.flatten(), {"a": 1, "b": 2, "c": 3, "True": True, "False": False, "None": None})
+
+        # Writes go to the view's own layer.
+        view["a"] = 4
+        self.assertEqual(view["a"], 4)
+        self.assertEqual(context["a"], 1)
+
+        # Views of views share the underlying layers.
+        self.assertEqual(utils.ContextView.of(view)["a"], 4)
+
+    def test_tags_leave_context_unchanged(self):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        setattr(request, utils.FEDIT_PREVIEW_VAR, True)
+
+        context = Context({
+            "object": self.basic_model,
+            "request": request,
+        })
+        depth = len(context.dicts)
+
+        Template(
+            "{% load fedit %}"
+            "{% fedit field object.title %}"
+            "{% fedit field object.body %}"
+        ).render(context)
+
+        self.assertEqual(len(context.dicts), depth)
+
+    def test_lock_info_cached_per_request(self):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+
+        first = utils.lock_info(self.lock_model, self.admin_user, request=request)
+        second = utils.lock_info(self.lock_model, self.admin_user, request=request)
+        self.assertIs(first, second)
+        self.assertFalse(first.locked_for_user)
+
+        matrix = get_permission_matrix(request)
+        self.assertEqual(matrix.checks, 1)
+        self.assertEqual(matrix.lookups, 2)
+
+        # Other users are not served from the matrix.
+        self.assertIsNot(
+            utils.lock_info(self.lock_model, self.regular_user, request=request),
+            first,
+        )
+
+
+@mock.patch("wagtail_fedit.instrumentation.INSTRUMENT_QUERIES", True)
+class TestQueryInstrumentation(BaseFEditTest):
+
+    def get_edit_url(self):
+        return self.get_field_url(
+            "title",
+            self.full_model._meta.app_label,
+            self.full_model._meta.model_name,
+            self.full_model.pk,
+        )
+
+    def test_record_queries(self):
+        model = self.basic_model.__class__
+        with record_queries("test") as stats:
+            list(model.objects.filter(pk=self.basic_model.pk))
+            list(model.objects.filter(pk=self.basic_model.related_field.pk))
+            model.objects.count()
+
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(len(stats.fingerprints), 2)
+        self.assertEqual(list(stats.duplicates.values()), [2])
+
+    def test_view_server_timing(self):
+        self.client.force_login(self.admin_user)
+        response = self.client.get(self.get_edit_url())
+        self.assertEqual(response.status_code, 200)
+
+        log = get_query_log(response.wsgi_request)
+        self.assertEqual(len(log.views), 1)
+        self.assertEqual(log.views[0].name, "EditAdapterView")
+        self.assertGreater(log.views[0].count, 0)
+
+        self.assertIn("fedit-view-EditAdapterView;", response["Server-Timing"])
+        self.assertIn(f"{log.views[0].count} queries", response["Server-Timing"])
+
+    def test_view_over_budget(self):
+        self.client.force_login(self.admin_user)
+        with mock.patch.dict("wagtail_fedit.instrumentation.QUERY_BUDGETS", {"EditAdapterView": 0}):
+            with self.assertLogs("wagtail_fedit.instrumentation", "WARNING"):
+                self.client.get(self.get_edit_url())
+
+    def test_streamed_view(self):
+        self.client.force_login(self.admin_user)
+        url = self.get_editable_url(
+            self.page_model.pk,
+            self.page_model._meta.app_label,
+            self.page_model._meta.model_name,
+        )
+
+        with mock.patch.object(FEditableView, "streaming", True):
+            response = self.client.get(url)
+
+        log = get_query_log(response.wsgi_request)
+        before = log.views[0].count
+
+        with self.assertLogs("wagtail_fedit.instrumentation", "WARNING"):
+            with mock.patch.dict("wagtail_fedit.instrumentation.QUERY_BUDGETS", {"FEditableView": 0}):
+                b"".join(response.streaming_content)
+
+        # Queries made while the body is rendered count for the view.
+        self.assertGreater(log.views[0].count, before)
+
+    def test_disabled(self):
+        self.client.force_login(self.admin_user)
+        with mock.patch("wagtail_fedit.instrumentation.INSTRUMENT_QUERIES", False):
+            response = self.client.get(self.get_edit_url())
+
+        self.assertFalse(response.has_header("Server-Timing"))
+        self.assertIsNone(get_query_log(response.wsgi_request))
+
+    def test_template_tags(self):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        setattr(request, utils.FEDIT_PREVIEW_VAR, True)
+
+        Template(
+            "{% load fedit %}"
+            "{% fedit field object.title %}"
+            "{% fedit field object.body %}"
+        ).render(Context({
+            "object": self.basic_model,
+            "request": request,
+        }))
+
+        log = get_query_log(request)
+        self.assertEqual(
+            [stats.name for stats in log.tags],
+            ["tag:field", "tag:field"],
+        )
+        self.assertEqual(log.summary()[("tag", "tag:field")]["calls"], 2)
+
+
+class TestStreamingPreview(BaseFEditTest):
+
+    def test_stream_template(self):
+        template = engines["django"].from_string(
+            "<head>{{ title }}</head>"
+            "{% for i in items %}<p>{{ i }}</p>{% endfor %}"
+        )
+        context = {"title": "Title", "items": range(3)}
+
+        chunks = list(stream_template(template, context))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(chunks[0], "<head>")
+        self.assertEqual("".join(chunks), template.render(context))
+
+    def test_stream_template_extends(self):
+        base = engines["django"].from_string(
+            "<head>{% block head %}{% endblock %}</head>"
+            "<body>{% block body %}Default{% endblock %}</body>"
+        )
+        template = engines["django"].from_string(
+            "{% extends base %}"
+            "{% block body %}{{ block.super }} {{ title }}{% endblock %}"
+        )
+        context = {"base": base.template, "title": "Title"}
+
+        chunks = list(stream_template(template, context))
+        self.assertEqual(chunks[0], "<head>")
+        self.assertEqual("".join(chunks), template.render(context))
+        self.assertEqual("".join(chunks), "<head></head><body>Default Title</body>")
+
+        # Other Django versions render the parent template in one chunk.
+        with mock.patch.object(streaming, "STREAM_EXTENDS", False):
+            self.assertEqual(
+                list(stream_template(template, context)),
+                [template.render(context)],
+            )
+
+    @override_settings(TEMPLATES=[{
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [("django.template.loaders.locmem.Loader", {
+                "base.html": (
+                    "<head>{% block head %}<title>{% block title %}Base{% endblock %}</title>{% endblock %}</head>"
+                    "<body>{% block body %}<main>{% block main %}Base main{% endblock %}</main>{% endblock %}"
+                    "{% block footer %}Footer{% endblock %}</body>"
+                ),
+                "middle.html": (
+                    "{% extends 'base.html' %}"
+                    "{% block title %}Middle {{ block.super }}{% endblock %}"
+                    "{% block main %}{{ block.super }} | Middle main {% block aside %}Aside{% endblock %}{% endblock %}"
+                ),
+                "child.html": (
+                    "{% extends 'middle.html' %}{% load i18n %}"
+                    "{% block title %}{{ title }} - {{ block.super }}{% endblock %}"
+                    "{% block aside %}{{ block.super }} {% for i in items %}<p>{{ i }}</p>{% endfor %}{% endblock %}"
+                    "{% block footer %}{{ block.super }} | Child footer{% endblock %}"
+                ),
+            })],
+        },
+    }])
+    def test_stream_template_extends_levels(self):
+        template = get_template("child.html")
+        context = {"title": "Title", "items": range(3)}
+
+        chunks = list(stream_template(template, context))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), render_to_string("child.html", context))
+
+    def test_editable_view_streamed(self):
+        self.client.force_login(self.admin_user)
+        url = self.get_editable_url(
+            self.page_model.pk,
+            self.page_model._meta.app_label,
+            self.page_model._meta.model_name,
+        )
+
+        response = self.client.get(url)
+        self.assertFalse(response.streaming)
+
+        with mock.patch.object(FEditableView, "streaming", True):
+            streamed = self.client.get(url)
+
+        self.assertEqual(streamed.status_code, 200)
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed["Content-Type"], response["Content-Type"])
+
+        content = b"".join(streamed.streaming_content).decode()
+        self.assertEqual(
+            content.count("data-wrapper-id="),
+            response.content.decode().count("data-wrapper-id="),
+        )
+        self.assertIn(self.page_model.title, content)
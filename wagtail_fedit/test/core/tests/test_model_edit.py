@@ -6,10 +6,14 @@ from wagtail.admin.panels import (
 from wagtail.models import (
     RevisionMixin,
 )
+from wagtail_fedit.adapters import (
+    ModelAdapter,
+)
 from .base import (
     BaseFEditTest,
 )
 
+from unittest import mock
 import json
 
 class TestModelEdit(BaseFEditTest):
@@ -136,3 +140,29 @@ class TestModelEdit(BaseFEditTest):
         
         
 
+
+class TestModelAdapterEditHandler(BaseFEditTest):
+    def get_adapter(self, model):
+        request = self.request_factory.get("/")
+        request.user = self.admin_user
+        return ModelAdapter(model, None, request)
+
+    def test_edit_handler_resolved_lazily(self):
+        with mock.patch.object(ModelAdapter, "get_edit_handler") as get_edit_handler:
+            adapter = self.get_adapter(self.basic_model)
+            get_edit_handler.assert_not_called()
+
+            adapter.edit_handler
+            adapter.edit_handler
+            get_edit_handler.assert_called_once_with(self.basic_model.__class__)
+
+    def test_edit_handler_shared_per_model(self):
+        for model in (self.basic_model, self.page_model):
+            self.assertIs(
+                self.get_adapter(model).edit_handler,
+                self.get_adapter(model).edit_handler,
+            )
+            self.assertIs(
+                self.get_adapter(model).form_class,
+                self.get_adapter(model).form_class,
+            )
@@ -1,6 +1,10 @@
 from wagtail.models import (
     RevisionMixin,
 )
+from wagtail_fedit.revisions import (
+    revision_cache,
+    get_revision_as_object,
+)
 from ..models import (
     EditableFullModel,
     EditableDraftModel,
@@ -53,3 +57,65 @@ class TestRevisions(BaseFEditTest):
 
 
 
+
+
+class TestRevisionCache(BaseFEditTest):
+    def setUp(self):
+        super().setUp()
+        revision_cache.clear()
+
+    def test_revision_object_cached(self):
+        model: EditableDraftModel = self.draft_model
+        model.title = "Cached Title"
+        model.save_revision()
+
+        model = EditableDraftModel.objects.get(pk=model.pk)
+
+        first = get_revision_as_object(model)
+
+        # Revision and content object are no longer queried
+        model = EditableDraftModel.objects.get(pk=model.pk)
+        with self.assertNumQueries(0):
+            second = get_revision_as_object(model)
+
+        self.assertEqual(first.title, "Cached Title")
+        self.assertEqual(second.title, "Cached Title")
+        self.assertIsNot(first, second)
+
+        # Changes to the returned object are not shared
+        second.title = "Changed"
+        self.assertEqual(get_revision_as_object(model).title, "Cached Title")
+
+    def test_revision_cache_invalidated(self):
+        model: EditableDraftModel = self.draft_model
+        model.title = "First Revision"
+        model.save_revision()
+        model = EditableDraftModel.objects.get(pk=model.pk)
+        self.assertEqual(get_revision_as_object(model).title, "First Revision")
+
+        key = revision_cache.make_key(model)
+        self.assertIsNotNone(revision_cache.backend.get(key))
+
+        model.title = "Second Revision"
+        revision = model.save_revision()
+        self.assertIsNone(revision_cache.backend.get(key))
+
+        model = EditableDraftModel.objects.get(pk=model.pk)
+        self.assertEqual(get_revision_as_object(model).title, "Second Revision")
+
+        key = revision_cache.make_key(model)
+        self.assertIsNotNone(revision_cache.backend.get(key))
+        revision.publish()
+        self.assertIsNone(revision_cache.backend.get(key))
+
+    def test_revision_cache_live_fields(self):
+        model: EditableDraftModel = self.draft_model
+        model.title = "Live Revision"
+        model.save_revision()
+        model = EditableDraftModel.objects.get(pk=model.pk)
+        self.assertTrue(get_revision_as_object(model).live)
+
+        # Fields preserved from the live object are part of the key
+        EditableDraftModel.objects.filter(pk=model.pk).update(live=False)
+        model = EditableDraftModel.objects.get(pk=model.pk)
+        self.assertFalse(get_revision_as_object(model).live)
@@ -1,6 +1,7 @@
 from django.contrib.contenttypes.models import (
     ContentType,
 )
+from django.utils import timezone
 from wagtail.log_actions import (
     registry,
     log,
@@ -19,6 +20,9 @@ from .base import (
 from ..models import (
     EditableFullModel,
 )
+from wagtail_fedit.views.editable import (
+    MAX_LOG_ENTRIES_DISPLAYED,
+)
 from wagtail_fedit.views import (
     PublishView,
     SubmitView,
@@ -48,6 +52,49 @@ class TestSubmitViews(BaseFEditTest):
             self.assertEqual(response.status_code, check_status, msg=f"Request failed for {url_name}")
         return response
     
+    def test_publish_log_entries(self):
+        now = timezone.now()
+
+        def log_entries(model, action, count, offset):
+            for i in range(count):
+                log(
+                    instance=model,
+                    action=action,
+                    user=self.admin_user,
+                    content_changed=True,
+                    timestamp=now + timezone.timedelta(minutes=offset + i),
+                )
+
+        for model in [self.page_model, self.full_model]:
+            view = PublishView()
+            view.object = model
+
+            with self.assertNumQueries(1):
+                _, initial_count = view.get_log_entries()
+
+            # Never published; all entries are shown.
+            log_entries(model, "wagtail_fedit.edit_field", 3, 0)
+            with self.assertNumQueries(1):
+                entries, count = view.get_log_entries()
+            self.assertEqual(count, initial_count + 3)
+            self.assertEqual(len(entries), initial_count + 3)
+
+            # Only entries since the last publish are shown.
+            log_entries(model, "wagtail.publish", 1, 10)
+            log_entries(model, "wagtail_fedit.edit_field", MAX_LOG_ENTRIES_DISPLAYED + 2, 20)
+            with self.assertNumQueries(1):
+                entries, count = view.get_log_entries()
+
+            self.assertEqual(count, MAX_LOG_ENTRIES_DISPLAYED + 2)
+            self.assertEqual(len(entries), MAX_LOG_ENTRIES_DISPLAYED)
+            self.assertTrue(all(
+                entry.action == "wagtail_fedit.edit_field" for entry in entries
+            ))
+            self.assertEqual(
+                [entry.timestamp for entry in entries],
+                sorted([entry.timestamp for entry in entries], reverse=True),
+            )
+
     def test_get_publish(self):
         self.client.force_login(self.admin_user)
 
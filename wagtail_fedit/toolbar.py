@@ -1,10 +1,60 @@
-from django.template.loader import render_to_string
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from django.template import Context
+from django.template.loader import get_template, select_template
+from django.template.backends.django import Template as DjangoTemplate
+from django.utils.autoreload import file_changed
 from django.utils.safestring import mark_safe
 from typing import TYPE_CHECKING
+from .permissions import (
+    get_permission_matrix,
+)
 
 if TYPE_CHECKING:
     from .adapters import BaseAdapter
 
+
+_compiled_templates = {}
+
+
+def get_compiled_template(template_name: str):
+    """
+    Return the compiled template for a toolbar component.
+    Templates are looked up and compiled once;
+    the cache is cleared when templates or settings change.
+    """
+    if isinstance(template_name, (list, tuple)):
+        template_name = tuple(template_name)
+
+    try:
+        return _compiled_templates[template_name]
+    except KeyError:
+        pass
+
+    if isinstance(template_name, tuple):
+        template = select_template(template_name)
+    else:
+        template = get_template(template_name)
+
+    _compiled_templates[template_name] = template
+    return template
+
+
+def clear_compiled_templates():
+    _compiled_templates.clear()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(*, setting, **kwargs):
+    if setting in ("TEMPLATES", "INSTALLED_APPS"):
+        clear_compiled_templates()
+
+
+@receiver(file_changed, dispatch_uid="wagtail_fedit_toolbar_templates_changed")
+def _reset_on_file_changed(sender, file_path, **kwargs):
+    clear_compiled_templates()
+
+
 class FeditToolbarComponent:
     template_name = None
     permissions: list[str] = []
@@ -17,26 +67,68 @@ class FeditToolbarComponent:
             "self": self,
             "request": self.request,
         }
-    
+
+    def get_template(self):
+        return get_compiled_template(self.template_name)
+
     def is_shown(self):
         if not all([self.request, self.request.user.is_authenticated]):
             return False
-        
+
         if not self.permissions:
             return True
-        
+
+        matrix = get_permission_matrix(self.request)
+        if matrix is not None:
+            return matrix.has_perms(self.permissions)
+
         return self.request.user.has_perms(self.permissions)
-    
+
     def render(self):
         if not self.is_shown():
             return ""
 
-        return mark_safe(render_to_string(
-            self.template_name,
+        return mark_safe(self.get_template().render(
             self.get_context_data(),
         ))
 
 
+def render_components(components: list[FeditToolbarComponent]) -> list[str]:
+    """
+    Render a list of toolbar components; leaving out any empty output.
+    Components which do not override `render` and use a Django template
+    are all rendered in a single template context; the output is
+    the same as calling `render` on each component.
+    """
+    context = None
+    rendered = []
+    for component in components:
+        if type(component).render is not FeditToolbarComponent.render:
+            html = component.render()
+            if html:
+                rendered.append(html)
+            continue
+
+        if not component.is_shown():
+            continue
+
+        template = component.get_template()
+        if not isinstance(template, DjangoTemplate):
+            html = template.render(component.get_context_data())
+        else:
+            if context is None:
+                context = Context(
+                    autoescape=template.backend.engine.autoescape,
+                )
+            with context.push(component.get_context_data()):
+                html = template.template.render(context)
+
+        if html:
+            rendered.append(mark_safe(html))
+
+    return rendered
+
+
 class FeditAdapterComponent(FeditToolbarComponent):
     def __init__(self, request, adapter: "BaseAdapter"):
         super().__init__(request)
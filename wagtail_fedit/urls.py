@@ -21,6 +21,11 @@ for name, view in adapter_based_views:
         path(view.url_pattern, view.as_view(), name=name)
     )
 
+views.AdapterBatchRefetchView.url_name = "wagtail_fedit:refetch-batch"
+urlpatterns.append(
+    path("refetch-batch/", views.AdapterBatchRefetchView.as_view(), name="refetch-batch")
+)
+
 # Model based views
 model_based_views = (
     ("editable", views.FEditableView),
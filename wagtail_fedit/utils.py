@@ -1,7 +1,7 @@
 from typing import (
-    Any, TYPE_CHECKING, Union,
+    Any, Callable, TYPE_CHECKING, Type, Union,
 )
-from collections import namedtuple
+from collections import ChainMap, namedtuple, OrderedDict
 from urllib.parse import urlencode
 from django.db import models
 from django.http import HttpRequest
@@ -9,6 +9,7 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from django.template.loader import render_to_string
 from django.template import Context
+from django.template.context import BaseContext
 from django.conf import settings
 from django.urls import reverse
 
@@ -31,6 +32,13 @@ from wagtail import (
 from .toolbar import (
     FeditAdapterComponent,
     FeditAdapterEditButton,
+    render_components,
+)
+from .settings import (
+    USE_RENDER_CACHE,
+)
+from .permissions import (
+    get_permission_matrix,
 )
 from .hooks import (
     EXCLUDE_FROM_RELATED_FORMS,
@@ -43,6 +51,8 @@ from .hooks import (
 if TYPE_CHECKING:
     from .adapters.base import BaseAdapter
 
+import threading
+
 
 # Name of the template tag
 # Example: `{% fedit adapter_identifier instance.field %}
@@ -56,6 +66,7 @@ ADAPTER_TEMPLATE_VAR = "wagtail_fedit_adapter"
 # Request variables
 FEDIT_PREVIEW_VAR = "_wagtail_fedit_preview"
 USERBAR_MODEL_VAR = "_wagtail_fedit_userbar_model"
+RENDER_CACHE_VAR = "_wagtail_fedit_render_cache"
 
 # Include log actions in the userbar
 # Breaks in Wagtail 6.1.0
@@ -66,10 +77,19 @@ class FeditPermissionCheck:
     @staticmethod
     def has_perms(request: HttpRequest, model: Any) -> bool:
 
-        user = request
         if isinstance(request, HttpRequest):
-            user = request.user
-        
+            matrix = get_permission_matrix(request)
+            if matrix is not None:
+                return matrix.model_check(
+                    "has_perms", model,
+                    lambda: FeditPermissionCheck.user_has_perms(request.user, model),
+                )
+            return FeditPermissionCheck.user_has_perms(request.user, model)
+
+        return FeditPermissionCheck.user_has_perms(request, model)
+
+    @staticmethod
+    def user_has_perms(user: Any, model: Any) -> bool:
         if (
             not user.is_authenticated\
             or not user.has_perm("wagtailadmin.access_admin")\
@@ -185,6 +205,96 @@ def get_block_path(block):
     else:
         raise ValueError("Unknown block type: %s" % type(block))
 
+BLOCK_INDEX_ATTR = "_wagtail_fedit_block_index"
+
+
+def _index_blocks(field, contentpath: list, index: dict):
+    """
+    Walk the stream in the same (depth-first) order as the original lookup;
+    the first block found for an ID wins.
+    """
+    parent_block = field
+
+    if not isinstance(field, (StreamValue, ListValue)) and not hasattr(field, "__iter__"):
+        field = [field]
+
+    if isinstance(field, ListValue):
+        field = field.bound_blocks
+
+    for idx, block in enumerate(field):
+        contentpath.append(get_block_path(block))
+
+        block_id = getattr(block, "id", None)
+        if block_id is not None and block_id not in index:
+            index[block_id] = (block, tuple(contentpath), parent_block, idx)
+
+        if isinstance(block.value, blocks.StructValue):
+            for value in block.value.bound_blocks.values():
+                _index_blocks(value, contentpath, index)
+
+        elif isinstance(block.value, (StreamValue, StreamValue.StreamChild, ListValue)):
+            _index_blocks(block.value, contentpath, index)
+
+        contentpath.pop()
+
+
+def get_block_index(field) -> dict:
+    """
+    Return an index of all blocks in a StreamField or ListBlock value.
+    The index maps a block ID to a tuple of (block, contentpath, parent_block, block_index).
+    It is built once and cached on the value itself.
+    """
+    index = getattr(field, BLOCK_INDEX_ATTR, None)
+    if index is not None:
+        return index
+
+    index = {}
+    _index_blocks(field, [], index)
+
+    try:
+        setattr(field, BLOCK_INDEX_ATTR, index)
+    except AttributeError:
+        pass
+
+    return index
+
+
+def invalidate_block_index(field):
+    """
+    Remove the cached block index from a StreamField or ListBlock value.
+    Must be called after the stream has been mutated.
+    """
+    if field is not None and BLOCK_INDEX_ATTR in getattr(field, "__dict__", {}):
+        delattr(field, BLOCK_INDEX_ATTR)
+
+
+def reindex_blocks(field, parent, *positions: int):
+    """
+    Update the cached index of `field` for the children of `parent` at `positions`
+    after they were moved inside `parent`, instead of rebuilding the whole index.
+    Their contentpaths do not change; only their position in the parent does.
+    """
+    index = getattr(field, BLOCK_INDEX_ATTR, None)
+    if index is None:
+        return
+
+    children = parent.bound_blocks if isinstance(parent, ListValue) else parent
+    for position in positions:
+        block = children[position]
+        entry = index.get(getattr(block, "id", None))
+        if entry is not None and entry[0] is block:
+            index[block.id] = (block, entry[1], parent, position)
+
+
+def _index_entry_valid(entry) -> bool:
+    block, _, parent, idx = entry
+    if isinstance(parent, StreamValue):
+        return idx < len(parent) and parent[idx] is block
+    if isinstance(parent, ListValue):
+        return idx < len(parent) and parent.bound_blocks[idx] is block
+    return True
+
+
 def find_block(block_id, field, contentpath=None):
     """
     Find a block in a StreamField or ListBlock by its ID.
@@ -198,38 +308,23 @@ def find_block(block_id, field, contentpath=None):
     if contentpath is None:
         contentpath = []
 
-    parent_block = field
+    index = getattr(field, BLOCK_INDEX_ATTR, None)
+    is_cached = index is not None
+    if not is_cached:
+        index = get_block_index(field)
 
-    # Check and cast field to iterable if necessary, but do not append non-StreamValue names to contentpath here.    
-    if not isinstance(field, (StreamValue, ListValue)) and not hasattr(field, "__iter__"):
-        field = [field]
-
-    # Adjust for ListValue to get the iterable bound_blocks.
-    if isinstance(field, ListValue):
-        field = field.bound_blocks
+    entry = index.get(block_id)
 
-    for idx, block in enumerate(field):
-        # Determine the block's name only if needed to avoid premature addition to contentpath.
-        block_name = get_block_path(block)
-        
-        if getattr(block, "id", None) == block_id:
-            # Append the block name here as it directly leads to the target.
-            return block, contentpath + [block_name], parent_block, idx
-        
-        # Prepare to check children without altering the current path yet.
-        if isinstance(block.value, blocks.StructValue):
-            for value in block.value.bound_blocks.values():
-                found, found_path, parent, block_index = find_block(block_id, value, contentpath + [block_name])
-                if found:
-                    return found, found_path, parent, block_index
+    # The stream might have been changed without invalidating the index.
+    if is_cached and (entry is None or not _index_entry_valid(entry)):
+        invalidate_block_index(field)
+        entry = get_block_index(field).get(block_id)
 
-        elif isinstance(block.value, (StreamValue, StreamValue.StreamChild, ListValue)):
-            found, found_path, parent, block_index = find_block(block_id, block.value, contentpath + [block_name])
-            if found:
-                return found, found_path, parent, block_index
+    if entry is None:
+        return None, [], None, -1
 
-    # Return None and the current path if no block is found at this level.
-    return None, [], None, -1
+    block, path, parent_block, block_index = entry
+    return block, contentpath + list(path), parent_block, block_index
 
 
 
@@ -250,6 +345,63 @@ def _look_for_renderers():
         _looked_for_renderers = True
 
 
+# Renderers resolved for a (model class, field name) pair and for a content type.
+# Built on first use; call `clear_renderer_cache` after changing the renderer maps.
+_field_dispatch_cache: dict[tuple[type, str], tuple[models.Field, str | None, Callable | None]] = {}
+_type_dispatch_cache: dict[type, Callable | None] = {}
+
+
+def clear_renderer_cache():
+    _field_dispatch_cache.clear()
+    _type_dispatch_cache.clear()
+
+
+def _resolve_renderer(renderer_map: dict, cls: type) -> Callable | None:
+    """
+    Return the renderer registered for the closest class in the MRO of `cls`.
+    """
+    for base in cls.__mro__:
+        renderer = renderer_map.get(base)
+        if renderer is not None:
+            return renderer
+
+    # Abstract base classes are not part of the MRO.
+    for k, v in renderer_map.items():
+        if issubclass(cls, k):
+            return v
+
+    return None
+
+
+def _get_field_dispatch(model: type, field_name: str) -> tuple[models.Field, str | None, Callable | None]:
+    key = (model, field_name)
+    dispatch = _field_dispatch_cache.get(key)
+    if dispatch is None:
+        _look_for_renderers()
+
+        meta_field = model._meta.get_field(field_name)
+        method_name = f"render_fedit_{field_name}"
+        if not hasattr(model, method_name):
+            method_name = None
+
+        dispatch = (
+            meta_field,
+            method_name,
+            _resolve_renderer(_field_renderer_map, type(meta_field)),
+        )
+        _field_dispatch_cache[key] = dispatch
+    return dispatch
+
+
+def _get_type_renderer(cls: type) -> Callable | None:
+    try:
+        return _type_dispatch_cache[cls]
+    except KeyError:
+        _look_for_renderers()
+        renderer = _type_dispatch_cache[cls] = _resolve_renderer(_renderer_map, cls)
+        return renderer
+
+
 def get_field_content(request, instance, meta_field: models.Field, context, content=None):
     """
     Return the content for a field on a model.
@@ -257,29 +409,34 @@ def get_field_content(request, instance, meta_field: models.Field, context, cont
     The method should be named `render_fedit_{field_name}`.
     We wil also check for any hooks which may convert the content.
     """
-    _look_for_renderers()
-
-    if isinstance(meta_field, str):
-        meta_field = instance._meta.get_field(meta_field)
+    field_name = meta_field if isinstance(meta_field, str) else meta_field.name
+    meta_field, method_name, field_renderer = _get_field_dispatch(
+        instance.__class__, field_name,
+    )
 
-    context = _flatten_context(context)
+    # Rendering APIs accept any mapping; the context is only
+    # flattened if it is passed to a render method or renderer.
+    context = as_context_view(context)
+    flat_context = None
 
     if not content:
         # Check for a rendering method if it exists
-        if hasattr(instance, f"render_fedit_{meta_field.name}"):
-            content = getattr(instance, f"render_fedit_{meta_field.name}")(request, context=context)
+        if method_name:
+            flat_context = _flatten_context(context)
+            content = getattr(instance, method_name)(request, context=flat_context)
         else:
-            content = getattr(instance, meta_field.name)
+            content = getattr(instance, field_name)
 
-    for k, v in _field_renderer_map.items():
-        if isinstance(meta_field, k):
-            content = v(request, context, instance, content)
-            break
+    if field_renderer:
+        if flat_context is None:
+            flat_context = _flatten_context(context)
+        content = field_renderer(request, flat_context, instance, content)
 
-    for k, v in _renderer_map.items():
-        if isinstance(content, k):
-            content = v(request, context, instance, content)
-            break
+    type_renderer = _get_type_renderer(content.__class__)
+    if type_renderer:
+        if flat_context is None:
+            flat_context = _flatten_context(context)
+        content = type_renderer(request, flat_context, instance, content)
 
     # The content might be a streamblock etc, we can render it as a block
     # if isinstance(content, (blocks.BoundBlock, blocks.StructValue)):
@@ -405,9 +562,10 @@ def _can_edit(request, obj: models.Model):
     if not request or not obj:
         return False
     
+    # The preview flag is checked first; it is cheap and not set for most visitors.
     return (
-        FeditPermissionCheck.has_perms(request, obj)\
-        and getattr(request, FEDIT_PREVIEW_VAR, False)
+        getattr(request, FEDIT_PREVIEW_VAR, False)\
+        and FeditPermissionCheck.has_perms(request, obj)
     )
 
 def user_can_publish(instance, user, check_for_changes: bool = True):
@@ -466,10 +624,18 @@ def user_can_submit_for_moderation(instance, user, check_for_changes: bool = Tru
 
 _lock_info = namedtuple("lock_info", ["lock", "locked_for_user"])
 
-def lock_info(object, user) -> _lock_info:
+def lock_info(object, user, request: HttpRequest = None) -> _lock_info:
     """
         Returns the Lock instance (if any) and whether it is locked for the given user.
+        If a request is passed; the result is kept for the rest of the request.
     """
+    matrix = get_permission_matrix(request)
+    if matrix is not None and matrix.user is user and isinstance(object, LockableMixin):
+        return matrix.instance_check(
+            "lock_info", object,
+            lambda: lock_info(object, user),
+        )
+
     if isinstance(object, LockableMixin):
         lock = object.get_lock()
         locked_for_user = lock is not None and lock.for_user(
@@ -482,19 +648,30 @@ def lock_info(object, user) -> _lock_info:
     return _lock_info(lock, locked_for_user)
     
 def insert_many(parent: Union[StreamValue, ListValue], idx, blocks):
-    if len(parent) == 0 or idx == len(parent) - 1:
-        parent.extend(blocks)
-    elif idx < len(parent) - 1:
-        if isinstance(parent, StreamValue):
-            for i, block in enumerate(blocks):
-                parent.insert(idx + i + 1, block)
-                parent._raw_data[idx + i + 1] = block.get_prep_value()
-        elif isinstance(parent, ListValue):
-            for i, block in enumerate(blocks):
-                parent.insert(idx + i + 1, block)
-    else:
+    """
+    Insert the blocks into the parent, after the block at `idx`.
+    The new children are spliced in at once; like `StreamValue.insert`,
+    the raw data of new stream children is only prepared when the value is saved.
+    """
+    if len(parent) > 0 and idx > len(parent) - 1:
         raise IndexError("Cannot add block, index out of range ({} > {})".format(idx, len(parent) - 1))
 
+    invalidate_block_index(parent)
+
+    position = idx + 1 if len(parent) > 0 else 0
+    if isinstance(parent, StreamValue):
+        children = [parent._construct_stream_child(block) for block in blocks]
+        parent._bound_blocks[position:position] = children
+        parent._raw_data[position:position] = [None] * len(children)
+    elif isinstance(parent, ListValue):
+        child_block = parent.list_block.child_block
+        parent.bound_blocks[position:position] = [
+            ListValue.ListChild(child_block, block) for block in blocks
+        ]
+    else:
+        for i, block in enumerate(blocks):
+            parent.insert(position + i, block)
+
 def save_revision(instance: models.Model, user: Any) -> models.Model:
     """
     Save a revision for a model instance.
@@ -513,6 +690,58 @@ def _flatten_context(context: dict) -> dict:
         return context.flatten()
     return context
 
+
+class ContextView(ChainMap):
+    """
+    A read-through view of one or more (template) contexts; earlier contexts take priority.
+    Keys set on the view are stored in its own layer; the contexts themselves are neither
+    copied nor changed. `flatten()` returns a dict, like `Context.flatten()`.
+    """
+    @classmethod
+    def of(cls, *contexts: Union[Context, dict, None]) -> "ContextView":
+        maps = [{}]
+        for context in contexts:
+            if context is None:
+                continue
+            if isinstance(context, ChainMap):
+                maps.extend(context.maps)
+            elif isinstance(context, BaseContext):
+                maps.extend(reversed(context.dicts))
+            else:
+                maps.append(context)
+        return cls(*maps)
+
+    def flatten(self) -> dict:
+        return dict(self)
+
+
+def as_context_view(context: Union[Context, dict, None]):
+    """
+    Wrap a template context in a `ContextView` instead of flattening it.
+    Other mappings are returned as they are.
+    """
+    if isinstance(context, BaseContext):
+        return ContextView.of(context)
+    return context
+
+
+def accepts_context_view(func):
+    """
+    Mark a `render_content`, `render_read_only` or `render_from_kwargs` implementation
+    as accepting any mapping as the context; others receive a (flattened) dict.
+    """
+    func.accepts_context_view = True
+    return func
+
+
+def render_context(render: Callable, context: Union[Context, dict, None]):
+    """
+    Return the context to pass to an adapter's render method; see `accepts_context_view`.
+    """
+    if getattr(render, "accepts_context_view", False):
+        return as_context_view(context)
+    return _flatten_context(context)
+
 def base_adapter_context(adapter: "BaseAdapter", context: Union[Context, dict]) -> dict:
     """
     Return the base context for an adapter.
@@ -529,6 +758,25 @@ def base_adapter_context(adapter: "BaseAdapter", context: Union[Context, dict])
 
     return context
 
+def read_only_adapter_context(adapter_class: Type["BaseAdapter"], object: models.Model, field_name: str, kwargs: dict, context: Union[Context, dict], adapter: "BaseAdapter" = None) -> dict:
+    """
+    Return the base context for an adapter which is rendered
+    read-only, before (or without) an adapter being constructed.
+    The context is the same as `base_adapter_context`; pass the adapter
+    lazily (`SimpleLazyObject`) so it is only constructed if it is used.
+    """
+
+    if not context:
+        context = {}
+
+    context.update(kwargs)
+
+    context[FIELD_TEMPLATE_VAR]    = field_name if adapter_class.field_required else None
+    context[INSTANCE_TEMPLATE_VAR] = object
+    context[ADAPTER_TEMPLATE_VAR]  = adapter
+
+    return context
+
 def shared_context_url(shared_context: str, base_url: str, hash: str = None, **kwargs) -> str:
     """
     Append the shared context to a URL.
@@ -553,10 +801,171 @@ def get_reverse_kwargs(adapter: "BaseAdapter") -> dict:
 
     return reverse_kwargs
 
-def wrap_adapter(request: HttpRequest, adapter: "BaseAdapter", context: dict, run_context_processors: bool = False) -> str:
-    if not context:
-        context = {}
+class LRUCache:
+    """
+    A small thread-safe LRU cache.
+    Holds at most `size` entries; the least recently used entry is dropped first.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self.entries[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class _Identity:
+    """
+    Hashes and compares an unhashable value by identity.
+    The wrapped value is kept alive for as long as the key exists,
+    so the id can never be re-used by another object.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _freeze(value):
+    if type(value) is dict:
+        return tuple(
+            (k, _freeze(v)) for k, v in value.items()
+        )
+
+    if type(value) in (list, tuple):
+        return tuple(_freeze(v) for v in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+
+    return value
+
 
+class AdapterRenderCache:
+    """
+    Request-scoped cache used when rendering adapters.
+    Keeps track of constructed adapters and the context-independent
+    parts of their wrapper (shared context, URLs and toolbar buttons).
+    The `hits` and `misses` counters can be used to verify
+    how much work a page actually does.
+    """
+    def __init__(self):
+        self.adapters = {}
+        self.toolbars = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(identifier: str, object: models.Model, field_name: str, kwargs: dict, frozen_kwargs: tuple = None) -> tuple:
+        """
+        Return a key for the adapter identifier, model, primary key, field and resolved kwargs.
+        Kwargs which were already frozen with `freeze_kwargs` can be passed as `frozen_kwargs`.
+        """
+        if frozen_kwargs is None:
+            frozen_kwargs = _freeze(kwargs)
+
+        return (
+            identifier,
+            object._meta.label_lower,
+            object.pk,
+            field_name,
+            frozen_kwargs,
+        )
+
+    @staticmethod
+    def freeze_kwargs(kwargs: dict) -> tuple:
+        """
+        Return the hashable form of the kwargs used in keys.
+        For dicts without common keys, adding the frozen forms equals freezing the merged dict.
+        """
+        return _freeze(kwargs)
+
+    @classmethod
+    def adapter_key(cls, adapter: "BaseAdapter") -> tuple:
+        return cls.make_key(
+            adapter.identifier,
+            adapter.object,
+            adapter.field_name,
+            adapter.kwargs,
+        )
+
+    def _get(self, store: dict, key: tuple):
+        try:
+            value = store[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def get_adapter(self, key: tuple) -> "BaseAdapter":
+        return self._get(self.adapters, key)
+
+    def set_adapter(self, key: tuple, adapter: "BaseAdapter"):
+        self.adapters[key] = adapter
+
+    def get_toolbar(self, key: tuple) -> dict:
+        return self._get(self.toolbars, key)
+
+    def set_toolbar(self, key: tuple, toolbar: dict):
+        self.toolbars[key] = toolbar
+
+    def clear(self):
+        self.adapters.clear()
+        self.toolbars.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def get_render_cache(request: HttpRequest) -> AdapterRenderCache:
+    """
+    Return the render cache for the request.
+    Returns None if there is no request or the cache is disabled.
+    """
+    if not USE_RENDER_CACHE or request is None:
+        return None
+
+    cache = getattr(request, RENDER_CACHE_VAR, None)
+    if cache is None:
+        cache = AdapterRenderCache()
+        setattr(request, RENDER_CACHE_VAR, cache)
+
+    return cache
+
+
+def render_toolbar(request: HttpRequest, adapter: "BaseAdapter") -> dict:
+    """
+    Render the context-independent parts of the adapter's wrapper.
+    """
     shared = adapter.encode_shared_context()
     adapter.shared_context_string = shared
 
@@ -568,10 +977,7 @@ def wrap_adapter(request: HttpRequest, adapter: "BaseAdapter", context: dict, ru
     for hook in hooks.get_hooks(CONSTRUCT_ADAPTER_TOOLBAR):
         hook(items=items, adapter=adapter)
 
-    items = [item.render() for item in items]
-    items = list(filter(None, items))
-
-    js_constructor = adapter.get_js_constructor()
+    items = render_components(items)
 
     reverse_kwargs = get_reverse_kwargs(adapter)
     edit_url = shared_context_url(shared, reverse(
@@ -584,20 +990,44 @@ def wrap_adapter(request: HttpRequest, adapter: "BaseAdapter", context: dict, ru
         kwargs=reverse_kwargs,
     ))
 
+    return {
+        "buttons": items,
+        "shared": shared,
+        "edit_url": edit_url,
+        "refetch_url": refetch_url,
+    }
+
+
+def wrap_adapter(request: HttpRequest, adapter: "BaseAdapter", context: dict, run_context_processors: bool = False) -> str:
+    if not context:
+        context = {}
+
+    cache = get_render_cache(request)
+    toolbar = None
+    if cache is not None:
+        key = cache.adapter_key(adapter)
+        toolbar = cache.get_toolbar(key)
+
+    if toolbar is None:
+        toolbar = render_toolbar(request, adapter)
+        if cache is not None:
+            cache.set_toolbar(key, toolbar)
+    else:
+        adapter.shared_context_string = toolbar["shared"]
+
+    js_constructor = adapter.get_js_constructor()
+
     return render_to_string(
         adapter.get_editable_template_names(),
         {
             **adapter.wrapped_context(),
+            **toolbar,
             "identifier": adapter.identifier,
             "adapter": adapter,
-            "buttons": items,
-            "shared": shared,
             "unique_id": adapter.get_element_id(),
             "js_constructor": js_constructor,
             "shared_context": adapter.kwargs,
             "adapter_context": context,
-            "edit_url": edit_url,
-            "refetch_url": refetch_url,
         },
         request=request if run_context_processors else None,
     )
@@ -2,6 +2,8 @@ from .adapters import (
     BaseAdapterView,
     EditAdapterView,
     AdapterRefetchView,
+    AdapterBatchRefetchView,
+    get_latest_instance,
 )
 from .editable import (
     FEditableView,
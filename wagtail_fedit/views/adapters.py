@@ -1,7 +1,14 @@
 from typing import Any, TYPE_CHECKING
+from urllib.parse import urlsplit, parse_qs
 from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.signing import BadSignature
+from django.db import models
+from django.urls import get_script_prefix, resolve, Resolver404
+from django.utils import translation
 from django.utils.translation import gettext as _
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 from django.template.loader import render_to_string
 from django.views.decorators.clickjacking import (
     xframe_options_sameorigin,
@@ -42,14 +49,39 @@ from ..errors import (
     NO_PERMISSION_ACTION,
     INVALID,
     REQUIRED,
+    MODEL_NOT_FOUND,
+    SHARED_CONTEXT_EXPIRED,
+    SharedContextExpired,
+)
+from ..revisions import (
+    get_revision_as_object,
+)
+from ..instrumentation import (
+    QueryInstrumentationMixin,
 )
 from .mixins import (
     LocaleMixin,
 )
 
+import json
+
+
+def get_latest_instance(model_instance: models.Model) -> models.Model:
+    """
+    Return the object as it is in its latest revision.
+    If the object has no revisions; the object itself is returned;
+    a revision will be automatically created by the form.
+    """
+    if isinstance(model_instance, RevisionMixin) and model_instance.latest_revision_id:
+        return get_revision_as_object(model_instance)
+    return model_instance
+
+
 @method_decorator(xframe_options_sameorigin, name="dispatch")
-class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTemplateMixin, View):
+class BaseAdapterView(QueryInstrumentationMixin, FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTemplateMixin, View):
     ERROR_TITLE = _("Validation Errors")
+    FRAGMENT_PARAM = "fragment"
+    fragment_template_name = "wagtail_fedit/editor/base_fragment.html"
 
     def dispatch(self, 
             request:    HttpRequest,
@@ -88,11 +120,9 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
 
         # Only fetch latest reivision if it exists
         # If not; it will be automatically created by the form.
-        model_instance = self.model._default_manager.get(pk=model_id)
-        if isinstance(model_instance, RevisionMixin) and model_instance.latest_revision_id:
-            self.instance = model_instance.latest_revision.as_object()
-        else:
-            self.instance = model_instance
+        self.instance = get_latest_instance(
+            self.model._default_manager.get(pk=model_id),
+        )
 
         LocaleMixin.setup_locale(
             self.instance,
@@ -116,12 +146,23 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
 
         shared_context_str: dict = request.GET.get("shared_context")
         if shared_context_str:
-            self.shared_context = self.adapter_class.decode_shared_context(
-                request,
-                self.instance,
-                field_name,
-                shared_context_str,
-            )
+            try:
+                self.shared_context = self.adapter_class.decode_shared_context(
+                    request,
+                    self.instance,
+                    field_name,
+                    shared_context_str,
+                )
+            except BadSignature:
+                return HttpResponseBadRequest(
+                    INVALID.format(
+                        _("shared context"),
+                    )
+                )
+            except SharedContextExpired:
+                return HttpResponseBadRequest(
+                    SHARED_CONTEXT_EXPIRED,
+                )
         else:
             self.shared_context = {}
 
@@ -140,7 +181,7 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
             )
 
         self.lock, self.locked_for_user = lock_info(
-            self.adapter.object, request.user,
+            self.adapter.object, request.user, request=request,
         )
 
         setattr(
@@ -180,6 +221,14 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
     @property
     def template_name(self):
         return self.adapter.get_template_names()
+
+    @cached_property
+    def fragment(self) -> bool:
+        """
+        Only render the form and its media instead of the full admin document.
+        Used by the frontend to swap forms into an already loaded editor frame.
+        """
+        return self.request.GET.get(self.FRAGMENT_PARAM) == "1"
     
     def render_to_response(self, context: dict[str, Any], success: bool = True, extra: dict = None, **response_kwargs: Any) -> HttpResponse:
         if not extra:
@@ -189,6 +238,9 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
             "success": success,
         })
 
+        if self.fragment:
+            extra["fedit_base_template"] = self.fragment_template_name
+
         context.update(extra)
 
         return render(
@@ -196,6 +248,17 @@ class BaseAdapterView(FeditIFrameMixin, FeditPermissionCheck, WagtailAdminTempla
             self.template_name,
             context,
         )
+
+    def render_fragment(self, context: dict[str, Any]) -> str:
+        """
+        Render only the form and its media; see `fragment`.
+        """
+        context["fedit_base_template"] = self.fragment_template_name
+        return render_to_string(
+            self.template_name,
+            context=context,
+            request=self.request,
+        )
             
     def get_header_title(self):
         return self.adapter.get_header_title()
@@ -279,13 +342,12 @@ class EditAdapterView(BaseAdapterView):
                 "success": False,
                 "errors": form.errors,
                 "locked": self.locked_for_user,
-                "html": render_to_string(
-                    self.template_name,
-                    context=self.get_context_data(
+                # The frontend only swaps the form; never render the full document.
+                "html": self.render_fragment(
+                    self.get_context_data(
                         form=form,
                     ),
-                    request=request,
-                )
+                ),
             }, status=423 if self.locked_for_user else 400)
 
         
@@ -299,3 +361,273 @@ class EditAdapterView(BaseAdapterView):
               .get_response_data(context),
         })
 
+
+class RefetchError(Exception):
+    """
+    A descriptor of a batch refetch cannot be refetched;
+    the message is returned for that descriptor.
+    """
+
+
+class AdapterBatchRefetchView(QueryInstrumentationMixin, FeditPermissionCheck, View):
+    """
+    Refetch many adapters in a single request.
+
+    Expects a JSON body with a list of descriptors:
+
+        {"adapters": [{"id": "...", "url": "<refetch url>"}, ...]}
+
+    The refetch URL is the one rendered in the adapter wrapper's `data-refetch-url`.
+    Descriptors are grouped by object; each object and its latest revision are
+    loaded only once. Results are keyed by the descriptor id.
+    """
+    http_method_names = ["post"]
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        try:
+            descriptors = json.loads(request.body)["adapters"]
+        except (ValueError, KeyError, TypeError):
+            return HttpResponseBadRequest(
+                INVALID.format(
+                    _("request body"),
+                )
+            )
+
+        if not isinstance(descriptors, list):
+            return HttpResponseBadRequest(
+                INVALID.format(
+                    _("adapters"),
+                )
+            )
+
+        setattr(
+            request,
+            FEDIT_PREVIEW_VAR,
+            True,
+        )
+
+        results = {}
+        groups: dict[tuple, list[tuple[str, dict]]] = {}
+        for descriptor in descriptors:
+            if not isinstance(descriptor, dict) or "id" not in descriptor:
+                return HttpResponseBadRequest(
+                    INVALID.format(
+                        _("adapter descriptor"),
+                    )
+                )
+
+            key = str(descriptor["id"])
+            try:
+                refetch_kwargs = self.parse_descriptor(descriptor)
+            except RefetchError as e:
+                results[key] = self.error(str(e))
+                continue
+
+            object_key = (
+                refetch_kwargs["app_label"],
+                refetch_kwargs["model_name"],
+                refetch_kwargs["model_id"],
+            )
+            groups.setdefault(object_key, []).append(
+                (key, refetch_kwargs),
+            )
+
+        # All adapters are constructed before any of them is rendered;
+        # adapter classes can then load what their adapters share in bulk.
+        adapters: list[tuple[str, models.Model, "BaseAdapter", str]] = []
+        for (app_label, model_name, model_id), items in groups.items():
+            try:
+                instance = self.get_instance(app_label, model_name, model_id)
+            except RefetchError as e:
+                for key, _kwargs in items:
+                    results[key] = self.error(str(e))
+                continue
+
+            # The language of the request is restored after each object.
+            with translation.override(translation.get_language()):
+                LocaleMixin.setup_locale(
+                    instance,
+                )
+
+                for key, refetch_kwargs in items:
+                    try:
+                        adapter = self.get_adapter(
+                            instance, **refetch_kwargs,
+                        )
+                    except RefetchError as e:
+                        results[key] = self.error(str(e))
+                        continue
+
+                    # The language activated for the object (or by the adapter).
+                    adapters.append((key, instance, adapter, translation.get_language()))
+
+        by_class: dict[type, list["BaseAdapter"]] = {}
+        for _key, _instance, adapter, _language in adapters:
+            by_class.setdefault(type(adapter), []).append(adapter)
+
+        for adapter_class, class_adapters in by_class.items():
+            adapter_class.prefetch_response_data(
+                request, class_adapters,
+            )
+
+        for key, instance, adapter, language in adapters:
+            with translation.override(language):
+                results[key] = self.refetch_adapter(instance, adapter)
+
+        return JsonResponse({
+            "success": True,
+            "results": results,
+        })
+
+    @staticmethod
+    def error(message: str) -> dict:
+        return {
+            "success": False,
+            "error": message,
+        }
+
+    def parse_descriptor(self, descriptor: dict) -> dict:
+        """
+        Resolve the refetch URL of a descriptor to the refetch view's arguments.
+        The URL is resolved like a request to it would be: without the script prefix,
+        in the URLconf of this request and in the language of its path (`i18n_patterns`).
+        """
+        url = urlsplit(str(descriptor.get("url", "")))
+        path = url.path
+        script_prefix = get_script_prefix()
+        if path.startswith(script_prefix):
+            path = "/" + path[len(script_prefix):]
+
+        urlconf = getattr(self.request, "urlconf", None)
+        try:
+            match = resolve(path, urlconf)
+        except Resolver404:
+            match = None
+
+        if match is None:
+            language = translation.get_language_from_path(path)
+            if language:
+                with translation.override(language):
+                    try:
+                        match = resolve(path, urlconf)
+                    except Resolver404:
+                        pass
+
+        if match is None or match.view_name != AdapterRefetchView.url_name:
+            raise RefetchError(INVALID.format(
+                _("refetch URL"),
+            ))
+
+        shared_context = parse_qs(url.query).get("shared_context")
+
+        return {
+            "adapter_id": match.kwargs["adapter_id"],
+            "app_label": match.kwargs["app_label"],
+            "model_name": match.kwargs["model_name"],
+            "model_id": match.kwargs["model_id"],
+            "field_name": match.kwargs.get("field_name"),
+            "shared_context": shared_context[0] if shared_context else None,
+        }
+
+    def get_instance(self, app_label: str, model_name: str, model_id: str) -> models.Model:
+        try:
+            model = apps.get_model(app_label, model_name)
+        except LookupError:
+            raise RefetchError(INVALID.format(
+                _("Model"),
+            ))
+
+        # Checked once per model class through the request's permission matrix.
+        if not self.has_perms(self.request, model):
+            raise RefetchError(NO_PERMISSION_ACTION.format(
+                _("view this page")
+            ))
+
+        try:
+            model_instance = model._default_manager.get(pk=model_id)
+        except (model.DoesNotExist, ValidationError, ValueError):
+            raise RefetchError(MODEL_NOT_FOUND)
+
+        return get_latest_instance(model_instance)
+
+    def get_adapter(self,
+            instance:       models.Model,
+            adapter_id:     str = None,
+            app_label:      str = None,
+            model_name:     str = None,
+            model_id:       Any = None,
+            field_name:     str = None,
+            shared_context: str = None,
+        ) -> "BaseAdapter":
+        """
+        Construct the adapter for a parsed descriptor.
+        Raises a `RefetchError` with the error message if this is not possible.
+        """
+
+        try:
+            adapter_class: "BaseAdapter" = adapter_registry[adapter_id]
+        except RegistryLookUpError:
+            raise RefetchError(INVALID.format(
+                _("Adapter ID"),
+            ))
+
+        if not field_name and adapter_class.field_required:
+            raise RefetchError(REQUIRED.format(
+                _("Field name"),
+                instance,
+            ))
+
+        if field_name and not hasattr(instance, field_name) and adapter_class.field_required:
+            raise RefetchError(INVALID.format(
+                _("field name"),
+                instance,
+            ))
+
+        if shared_context:
+            try:
+                shared_context = adapter_class.decode_shared_context(
+                    self.request,
+                    instance,
+                    field_name,
+                    shared_context,
+                )
+            except BadSignature:
+                raise RefetchError(INVALID.format(
+                    _("shared context"),
+                ))
+            except SharedContextExpired:
+                raise RefetchError(SHARED_CONTEXT_EXPIRED)
+        else:
+            shared_context = {}
+
+        adapter: "BaseAdapter" = adapter_class(
+            request=self.request,
+            object=instance,
+            field_name=field_name,
+            **shared_context,
+        )
+
+        if not adapter.check_permissions():
+            raise RefetchError(NO_PERMISSION_ACTION.format(
+                _("edit this field")
+            ))
+
+        return adapter
+
+    def refetch_adapter(self, instance: models.Model, adapter: "BaseAdapter") -> dict:
+        extra = {}
+        if isinstance(instance, Page):
+            extra[PAGE_TEMPLATE_VAR] = instance
+
+        context = base_adapter_context(
+            adapter,
+            extra,
+        )
+
+        return {
+            "success": True,
+            "refetch": True,
+            **adapter.get_response_data(
+                context,
+            ),
+        }
@@ -54,6 +54,20 @@ from ..errors import (
     MISSING_REQUIRED_SUPERCLASSES,
     NO_UNPUBLISHED_CHANGES,
 )
+from ..revisions import (
+    get_latest_revision_as_object,
+)
+from ..settings import (
+    STREAM_PREVIEW,
+)
+from ..streaming import (
+    make_streaming_preview_request,
+)
+from ..instrumentation import (
+    QUERY_LOG_VAR,
+    QueryInstrumentationMixin,
+    get_query_log,
+)
 from .mixins import (
     ObjectViewMixin,
     LockViewMixin,
@@ -77,7 +91,7 @@ def get_publish_action(object):
 
 
 
-class BaseFeditView(LocaleMixin, ObjectViewMixin, FeditPermissionCheck, TemplateView):
+class BaseFeditView(QueryInstrumentationMixin, LocaleMixin, ObjectViewMixin, FeditPermissionCheck, TemplateView):
     def dispatch(self, request: HttpRequest, object_id: Any, app_label: str, model_name: str) -> HttpResponse:
         if self.error_response:
             return self.error_response
@@ -87,7 +101,7 @@ class BaseFeditView(LocaleMixin, ObjectViewMixin, FeditPermissionCheck, Template
 
         if issubclass(self.model, RevisionMixin) and self.object.latest_revision_id:
             instance: RevisionMixin  = self.object
-            self.object = instance.get_latest_revision_as_object()
+            self.object = get_latest_revision_as_object(instance)
             self.is_preview = True
         else:
             self.is_preview = False
@@ -110,6 +124,8 @@ class BaseFeditView(LocaleMixin, ObjectViewMixin, FeditPermissionCheck, Template
 
 
 class FEditableView(BaseFeditView):
+    # Stream the preview to the browser while it is rendered.
+    streaming = STREAM_PREVIEW
 
     def checks(self, request: HttpRequest, object: Any) -> None:
         super().checks(request, object)
@@ -122,10 +138,24 @@ class FEditableView(BaseFeditView):
         self.request = with_userbar_model(self.request, self.object)
 
         object: PreviewableMixin = self.object
-        return object.make_preview_request(original_request=self.request, extra_request_attrs={
+        extra_request_attrs = {
             FEDIT_PREVIEW_VAR: True,
             USERBAR_MODEL_VAR: self.object,
-        })
+            # Template tags on the preview request record into the view's query log.
+            QUERY_LOG_VAR: get_query_log(self.request),
+        }
+
+        if self.streaming:
+            return make_streaming_preview_request(
+                object,
+                original_request=self.request,
+                extra_request_attrs=extra_request_attrs,
+            )
+
+        return object.make_preview_request(
+            original_request=self.request,
+            extra_request_attrs=extra_request_attrs,
+        )
     
 
 class BaseActionView(LockViewMixin, BaseFeditView):
@@ -267,56 +297,63 @@ class PublishView(BaseActionView):
 
         return s
     
-    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-
-        log_entry_count = 0
+    def get_log_entries(self) -> tuple[list, int]:
+        """
+        Return the log entries made since the object was last published
+        (or all of them if it was never published), newest first, and their total count.
+        At most `MAX_LOG_ENTRIES_DISPLAYED` entries are returned.
+
+        The entries, the last publish and the count are fetched in a single query;
+        entries from before the last publish are never read.
+        """
         log_entry_model = registry.get_log_model_for_model(self.object.__class__)
         if issubclass(log_entry_model, PageLogEntry):
             log_entries = log_entry_model.objects\
                 .filter(page=self.object)\
-                .order_by("-timestamp")
-            
-            context["view_more_url"] = reverse(
-                "wagtailadmin_pages:history",
-                args=[self.object.pk],
-            )
-                
+                .select_related("page")
+
         elif issubclass(log_entry_model, ModelLogEntry):
             log_entries = log_entry_model.objects\
                 .filter(object_id=self.object.pk)\
                 .filter(content_type=ContentType.objects.get_for_model(self.object))\
-                .order_by("-timestamp")
-                
+                .select_related("content_type")
+
         else:
-            log_entries = None
-
-        has_existing_published = log_entries.filter(action="wagtail.publish").exists()
-        if log_entries and has_existing_published:
-            log_entries = log_entries.filter(
-                timestamp__gt=models.Subquery(
-                    log_entries.filter(action="wagtail.publish")\
-                               .values("timestamp")\
-                               .order_by("-timestamp")[:1]
-                )
-            )
+            return [], 0
 
-            log_entries = log_entries.select_related(
-                "revision", "user", "user__wagtail_userprofile",
-            )
+        last_published = log_entries\
+            .filter(action="wagtail.publish")\
+            .order_by("-timestamp")\
+            .values("timestamp")[:1]
+
+        log_entries = log_entries\
+            .filter(
+                models.Q(timestamp__gt=models.Subquery(last_published)) |\
+                ~models.Exists(last_published)
+            )\
+            .select_related("revision", "user", "user__wagtail_userprofile")\
+            .annotate(total_count=models.Window(models.Count("pk")))\
+            .order_by("-timestamp")
 
-            # if not self.request.user.is_superuser or\
-            #    not self.request.user.is_staff:
-            #     log_entries = log_entries.filter(user=self.request.user)
+        # if not self.request.user.is_superuser or\
+        #    not self.request.user.is_staff:
+        #     log_entries = log_entries.filter(user=self.request.user)
 
-            if isinstance(self.object, Page):
-                log_entries = log_entries.select_related("page")
-            else:
-                log_entries = log_entries.select_related("content_type")
+        log_entries = list(log_entries[:MAX_LOG_ENTRIES_DISPLAYED])
+        if not log_entries:
+            return [], 0
 
-            log_entry_count = log_entries.count()
-            log_entries = log_entries[:MAX_LOG_ENTRIES_DISPLAYED]
+        return log_entries, log_entries[0].total_count
 
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        log_entries, log_entry_count = self.get_log_entries()
+        if isinstance(self.object, Page):
+            context["view_more_url"] = reverse(
+                "wagtailadmin_pages:history",
+                args=[self.object.pk],
+            )
 
         context.update({
             "log_entries": log_entries,
@@ -1,4 +1,5 @@
-from django.utils.html import format_html
+from django.urls import reverse
+from django.utils.html import format_html, json_script
 from django.templatetags.static import static
 from wagtail import hooks
 from wagtail.models import Page
@@ -79,6 +80,9 @@ def register_css(request):
 @hooks.register(REGISTER_JS, order=-1)
 def register_js(request):
     scripts = [
+        json_script({
+            "refetchBatchUrl": reverse("wagtail_fedit:refetch-batch"),
+        }, "wagtail-fedit-config"),
         format_html(
             '<script src="{0}"></script>',
             static('wagtail_fedit/js/edit.js')
@@ -102,6 +102,16 @@ def register_core_log_actions(actions):
             if not all([key in data for key in self.must]):
                 return _("Moved block on field (Frontend)")
 
+            steps = data.get("steps", 1)
+            if steps > 1:
+                return _("Moved block \"%(block)s\" on field \"%(field)s\" %(direction)s %(steps)s times (%(block_id)s, Frontend)") % {
+                    "block": gettext(data["block_label"]),
+                    "field": gettext(data["field_name"]),
+                    "direction": gettext(data["direction"]),
+                    "steps": steps,
+                    "block_id": data["block_id"],
+                }
+
             return _("Moved block \"%(block)s\" on field \"%(field)s\" %(direction)s (%(block_id)s, Frontend)") % {
                 "block": gettext(data["block_label"]),
                 "field": gettext(data["field_name"]),
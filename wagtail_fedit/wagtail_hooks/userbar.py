@@ -16,6 +16,7 @@ from wagtail.admin.userbar import (
 from wagtail import hooks
 from ..toolbar import (
     FeditToolbarComponent,
+    render_components,
 )
 from ..utils import (
     FEDIT_PREVIEW_VAR,
@@ -181,9 +182,7 @@ class WagtailFeditPublishItem(BaseWagtailFeditItem):
         ]
 
         return super().get_context_data(request) | {
-            "buttons": list(
-                filter(None, map(lambda x: x.render(), buttons))
-            ),
+            "buttons": render_components(buttons),
         }
 
 def retrieve_page_model(items):